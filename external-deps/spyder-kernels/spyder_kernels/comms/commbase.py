@@ -47,9 +47,12 @@
                         exception to be raised.
             'call_id': The uuid from above,
             'call_name': The function name (mostly for debugging),
-            'call_return_value': The return value of the function
+            'call_return_value': The return value of the function,
+            'buffered_return': The return value index that are in the
+                               buffers, if the return value is a list
            }
-        - The buffer contains the return value if it is bytes
+        - The buffer contains the return value if it is bytes, or the
+          bytes and memoryviews in it if it is a list
 """
 import logging
 import sys
@@ -399,9 +402,23 @@ def _set_call_return_value(self, call_dict, return_value, is_error=False):
             return
 
         buffers = None
+        buffered_return = None
         if isinstance(return_value, bytes):
             buffers = [return_value]
             return_value = None
+        elif isinstance(return_value, list):
+            # Send bytes and memoryviews in lists as buffers, so that large
+            # blocks of memory don't need to be copied to be sent
+            buffered_return = [
+                idx for idx, item in enumerate(return_value)
+                if isinstance(item, (bytes, memoryview))
+            ]
+            if buffered_return:
+                return_value = return_value.copy()
+                buffers = []
+                for idx in buffered_return:
+                    buffers.append(return_value[idx])
+                    return_value[idx] = None
 
         content = {
             'is_error': is_error,
@@ -409,6 +426,8 @@ def _set_call_return_value(self, call_dict, return_value, is_error=False):
             'call_name': call_dict['call_name'],
             'call_return_value': return_value
         }
+        if buffered_return:
+            content['buffered_return'] = buffered_return
 
         self._send_message(
             'remote_call_reply',
@@ -492,6 +511,9 @@ def _handle_remote_call_reply(self, msg_dict, buffers):
         # Prepare return value
         if is_error:
             return_value = CommsErrorWrapper.from_json(return_value)
+        elif 'buffered_return' in content:
+            for idx, buffer in zip(content['buffered_return'], buffers):
+                return_value[idx] = buffer
         elif buffers:
             assert len(buffers) == 1
             return_value = buffers[0]
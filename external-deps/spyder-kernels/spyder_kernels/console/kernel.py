@@ -20,6 +20,7 @@
 import traceback
 import tempfile
 import threading
+import uuid
 import inspect
 import cloudpickle
 
@@ -45,6 +46,7 @@
     PythonEnvInfo,
     PythonEnvType,
 )
+from spyder_kernels.utils.arraybuffers import to_buffers
 from spyder_kernels.utils.iofuncs import iofunctions
 from spyder_kernels.utils.mpl import automatic_backend, MPL_BACKENDS_TO_SPYDER
 from spyder_kernels.utils.nsview import (
@@ -81,6 +83,10 @@ def __init__(self, *args, **kwargs):
         self.faulthandler_handle = None
         self._cwd_initialised = False
 
+        # Sorted, filtered or column-selected DataFrames shown in the
+        # Variable Explorer, by view id
+        self._data_frame_views = {}
+
         # Add handlers to control to process messages while debugging
         self.control_handlers['comm_msg'] = self.control_comm_msg
         self.control_handlers['complete_request'] = self.shell_handlers[
@@ -388,6 +394,18 @@ def get_value(self, name, encoded=False):
             value = cloudpickle.dumps(value)
         return value
 
+    @comm_handler
+    def get_value_buffers(self, name):
+        """
+        Get the value of a numeric array or DataFrame without pickling it.
+
+        Return a list with a header for the value followed by the buffers
+        that hold its memory, which are sent as comm buffers.
+        """
+        ns = self.shell._get_current_namespace()
+        header, buffers = to_buffers(ns[name])
+        return [header] + buffers
+
     @comm_handler
     def set_value(self, name, value, encoded=False):
         """Set the value of a variable"""
@@ -411,6 +429,136 @@ def copy_value(self, orig_name, new_name):
         ns = self.shell._get_reference_namespace(orig_name)
         ns[new_name] = ns[orig_name]
 
+    @comm_handler
+    def get_data_frame_info(self, name, view=None):
+        """
+        Get the shape, dtypes and header levels of a DataFrame.
+
+        This and the handlers below allow to display a DataFrame in the
+        Variable Explorer without sending all its data to Spyder. If view is
+        given, only its rows and columns are taken into account.
+        """
+        df, rows, columns = self._get_data_frame_view(name, view)
+        return self._get_data_frame_info(df, rows, columns)
+
+    @comm_handler
+    def get_data_frame_window(self, name, rows, columns, view=None):
+        """
+        Get the values of a DataFrame in a range of rows and columns.
+
+        The ranges are [start, stop] lists and the result is encoded with
+        cloudpickle.
+        """
+        df, row_positions, column_positions = self._get_data_frame_view(
+            name, view
+        )
+        rows = slice(*rows)
+        columns = slice(*columns)
+        if row_positions is not None:
+            rows = row_positions[rows]
+        if column_positions is not None:
+            columns = column_positions[columns]
+
+        window = df.iloc[rows, columns]
+        return cloudpickle.dumps(window)
+
+    @comm_handler
+    def get_data_frame_header(self, name, axis, start, stop, view=None):
+        """
+        Get the column (axis 0) or row (axis 1) labels of a DataFrame.
+
+        The result is encoded with cloudpickle.
+        """
+        df, rows, columns = self._get_data_frame_view(name, view)
+        labels = df.columns if axis == 0 else df.index
+        positions = columns if axis == 0 else rows
+        if positions is None:
+            return cloudpickle.dumps(labels[start:stop])
+        return cloudpickle.dumps(labels[positions[start:stop]])
+
+    @comm_handler
+    def set_data_frame_view(self, name, sort=None, filter=None, columns=None,
+                            view=None):
+        """
+        Sort, filter and select the columns of a DataFrame.
+
+        The result is kept as the positions of its rows and columns in the
+        DataFrame, so that it's not copied, and the handlers above give
+        parts of it when passed the returned view id.
+
+        Parameters
+        ----------
+        name: str
+            Name of the DataFrame.
+        sort: list, optional
+            The position of the column to sort by, or -1 for the index, and
+            whether the order is ascending.
+        filter: str, optional
+            Boolean expression to filter rows with, which is evaluated with
+            DataFrame.eval. Other variables can be referred to with '@'.
+        columns: list, optional
+            Positions of the columns to select.
+        view: str, optional
+            Id of a previous view to replace.
+
+        Returns
+        -------
+        dict
+            The info given by get_data_frame_info for the new view, and its
+            id in 'view'.
+        """
+        import numpy as np
+        import pandas as pd
+
+        df = self._get_data_frame(name)
+
+        rows = None
+        if filter:
+            mask = df.eval(
+                filter, local_dict=self.shell._get_current_namespace()
+            )
+            if not (
+                isinstance(mask, pd.Series)
+                and pd.api.types.is_bool_dtype(mask)
+            ):
+                raise TypeError(
+                    "The filter must be an expression that gives True or "
+                    "False for each row"
+                )
+            rows = np.flatnonzero(mask.to_numpy(dtype=bool, na_value=False))
+
+        if sort is not None:
+            column, ascending = sort
+            positions = np.arange(len(df))
+            if column < 0:
+                keys = pd.Series(positions, index=df.index)
+                if rows is not None:
+                    keys = keys.iloc[rows]
+                keys = keys.sort_index(ascending=ascending, kind='mergesort')
+                rows = keys.to_numpy()
+            else:
+                keys = df.iloc[:, column].set_axis(positions)
+                if rows is not None:
+                    keys = keys.iloc[rows]
+                keys = keys.sort_values(ascending=ascending, kind='mergesort')
+                rows = keys.index.to_numpy()
+
+        if columns is not None:
+            columns = np.asarray(columns, dtype=np.intp)
+
+        self._data_frame_views.pop(view, None)
+        view = str(uuid.uuid4())
+        self._data_frame_views[view] = (name, rows, columns)
+
+        info = self._get_data_frame_info(df, rows, columns)
+        info['view'] = view
+        return info
+
+    @comm_handler
+    def close_data_frame_view(self, view):
+        """Forget a view created by set_data_frame_view."""
+        self._data_frame_views.pop(view, None)
+
     @comm_handler
     def load_data(self, filename, ext, overwrite=False):
         """
@@ -903,6 +1051,41 @@ def _is_data_frame(self, var):
         except:
             return False
 
+    def _get_data_frame(self, name):
+        """Get the DataFrame called name in the current namespace."""
+        ns = self.shell._get_current_namespace()
+        value = ns[name]
+        if not self._is_data_frame(value):
+            raise TypeError("{} is not a DataFrame".format(name))
+        return value
+
+    def _get_data_frame_view(self, name, view=None):
+        """
+        Get the DataFrame called name and the positions of the rows and
+        columns in view, or None if view doesn't change them.
+        """
+        df = self._get_data_frame(name)
+        if view is None:
+            return df, None, None
+
+        view_name, rows, columns = self._data_frame_views[view]
+        if view_name != name:
+            raise KeyError("View {} is not for {}".format(view, name))
+        return df, rows, columns
+
+    def _get_data_frame_info(self, df, rows=None, columns=None):
+        """Get the info of the rows and columns of df at some positions."""
+        def get_names(axis):
+            return [None if n is None else str(n) for n in axis.names]
+
+        dtypes = df.dtypes if columns is None else df.dtypes.iloc[columns]
+        return {
+            'shape': [len(df) if rows is None else len(rows), len(dtypes)],
+            'dtypes': [str(dtype) for dtype in dtypes],
+            'header_shape': [df.columns.nlevels, df.index.nlevels],
+            'names': [get_names(df.columns), get_names(df.index)],
+        }
+
     def _is_series(self, var):
         """Return True if variable is a Series"""
         try:
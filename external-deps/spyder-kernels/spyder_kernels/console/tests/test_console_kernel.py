@@ -361,6 +361,141 @@ def test_get_value_with_polars(kernel):
     assert_series_equal(kernel.get_value('polars_s'), pandas_s)
 
 
+def test_get_data_frame_parts(kernel):
+    """Test getting the info, values and labels of parts of a DataFrame."""
+    import cloudpickle
+    import pandas
+    from pandas.testing import assert_frame_equal, assert_index_equal
+
+    command = (
+        "import numpy as np, pandas as pd; "
+        "df = pd.DataFrame("
+        "    np.arange(60).reshape(10, 6),"
+        "    columns=pd.MultiIndex.from_product("
+        "        [['a', 'b'], [1, 2, 3]], names=['x', None]"
+        "    )"
+        "); "
+        "df['a', 1] = df['a', 1].astype(float); "
+        "s = pd.Series([1, 2])"
+    )
+    asyncio.run(kernel.do_execute(command, True))
+    df = kernel.get_value('df')
+
+    assert kernel.get_data_frame_info('df') == {
+        'shape': [10, 6],
+        'dtypes': ['float64'] + ['int64'] * 5,
+        'header_shape': [2, 1],
+        'names': [['x', None], [None]],
+    }
+
+    window = cloudpickle.loads(
+        kernel.get_data_frame_window('df', [2, 5], [4, 10])
+    )
+    assert_frame_equal(window, df.iloc[2:5, 4:6])
+
+    labels = cloudpickle.loads(kernel.get_data_frame_header('df', 0, 1, 3))
+    assert_index_equal(labels, df.columns[1:3])
+    labels = cloudpickle.loads(kernel.get_data_frame_header('df', 1, 8, 20))
+    assert_index_equal(labels, pandas.RangeIndex(8, 10))
+
+    # Only DataFrames are supported
+    with pytest.raises(TypeError):
+        kernel.get_data_frame_info('s')
+
+
+def test_data_frame_views(kernel):
+    """Test sorting, filtering and selecting columns of a DataFrame."""
+    import cloudpickle
+    from pandas.testing import assert_frame_equal, assert_index_equal
+
+    command = (
+        "import pandas as pd; "
+        "df = pd.DataFrame("
+        "    {'a': [3, 1, 2, 1, 5], 'b': list('vwxyz'), 'c': range(5)},"
+        "    index=[10, 40, 30, 20, 0]"
+        "); "
+        "limit = 4"
+    )
+    asyncio.run(kernel.do_execute(command, True))
+    df = kernel.get_value('df')
+
+    # Sort by a column, with a stable order
+    info = kernel.set_data_frame_view('df', sort=[0, True])
+    view = info.pop('view')
+    assert info['shape'] == [5, 3]
+    window = cloudpickle.loads(
+        kernel.get_data_frame_window('df', [0, 5], [0, 3], view=view)
+    )
+    assert_frame_equal(window, df.iloc[[1, 3, 2, 0, 4]])
+    labels = cloudpickle.loads(
+        kernel.get_data_frame_header('df', 1, 1, 3, view=view)
+    )
+    assert_index_equal(labels, df.index[[3, 2]])
+
+    # Filter, sort by the index and select columns, replacing the first view
+    info = kernel.set_data_frame_view(
+        'df', sort=[-1, False], filter='a < @limit', columns=[2, 1],
+        view=view
+    )
+    new_view = info.pop('view')
+    assert info == {
+        'shape': [4, 2],
+        'dtypes': ['int64', str(df.dtypes.iloc[1])],
+        'header_shape': [1, 1],
+        'names': [[None], [None]],
+    }
+    window = cloudpickle.loads(
+        kernel.get_data_frame_window('df', [1, 4], [0, 2], view=new_view)
+    )
+    assert_frame_equal(window, df.iloc[[2, 3, 0], [2, 1]])
+    labels = cloudpickle.loads(
+        kernel.get_data_frame_header('df', 0, 0, 2, view=new_view)
+    )
+    assert_index_equal(labels, df.columns[[2, 1]])
+
+    with pytest.raises(KeyError):
+        kernel.get_data_frame_info('df', view=view)
+
+    # Filters need to give booleans
+    with pytest.raises(TypeError):
+        kernel.set_data_frame_view('df', filter='a + 1')
+
+    kernel.close_data_frame_view(new_view)
+    with pytest.raises(KeyError):
+        kernel.get_data_frame_info('df', view=new_view)
+
+
+def test_get_value_buffers(kernel):
+    """Test getting arrays and DataFrames as a header and memory buffers."""
+    import numpy as np
+    from pandas.testing import assert_frame_equal
+    from spyder_kernels.utils.arraybuffers import from_buffers
+
+    command = (
+        "import numpy as np, pandas as pd; "
+        "a = np.arange(12.).reshape(3, 4); "
+        "df = pd.DataFrame({'x': [1, 2], 'y': [0.5, 1.5]}, index=['a', 'b']); "
+        "l = [1, 2]"
+    )
+    asyncio.run(kernel.do_execute(command, True))
+
+    header, *buffers = kernel.get_value_buffers('a')
+    assert header == {
+        'type': 'ndarray', 'dtype': '<f8', 'shape': [3, 4], 'order': 'C'
+    }
+    assert all(isinstance(buffer, memoryview) for buffer in buffers)
+    assert np.shares_memory(np.asarray(buffers[0]), kernel.get_value('a'))
+    assert (from_buffers(header, buffers) == kernel.get_value('a')).all()
+
+    header, *buffers = kernel.get_value_buffers('df')
+    assert len(header['blocks']) == 2
+    assert_frame_equal(from_buffers(header, buffers), kernel.get_value('df'))
+
+    # Other values need to be pickled
+    with pytest.raises(TypeError):
+        kernel.get_value_buffers('l')
+
+
 def test_set_value(kernel):
     """Test setting the value of a variable."""
     name = 'a'
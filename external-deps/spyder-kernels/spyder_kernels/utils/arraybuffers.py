@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Transfer of numeric arrays and DataFrames as raw memory buffers.
+
+The dtype and shape of arrays are sent in a json-able header and their memory
+is sent as is in the comm buffers, so they don't need to be pickled in the
+kernel nor unpickled in the frontend.
+"""
+
+import weakref
+
+import cloudpickle
+
+from spyder_kernels.utils.lazymodules import (
+    numpy as np, pandas as pd)
+
+
+# Kinds of dtypes that can be rebuilt from their dtype string and memory:
+# booleans, integers, floats, complex numbers, dates, timedeltas and strings.
+SUPPORTED_KINDS = 'biufcmMSU'
+
+# DataFrame columns are restricted to numbers, booleans, dates and timedeltas
+DATA_FRAME_KINDS = 'biufcmM'
+
+# Arrays rebuilt by from_buffers, by their id. Arrays are not hashable, so
+# they can't be kept in a WeakSet.
+_arrays_from_buffers = weakref.WeakValueDictionary()
+
+
+# =============================================================================
+# Auxiliary functions
+# =============================================================================
+def _is_supported_dtype(dtype, kinds):
+    """Check if dtype is a NumPy dtype whose values can be sent as memory."""
+    return (
+        isinstance(dtype, np.dtype)
+        and dtype.kind in kinds
+        and dtype.names is None
+        and dtype.itemsize > 0
+    )
+
+
+def _array_to_buffer(array):
+    """
+    Get the header and the memory of array.
+
+    Arrays that are not contiguous in memory are copied, the rest are sent
+    without copies.
+    """
+    if array.flags.c_contiguous:
+        order = 'C'
+    elif array.flags.f_contiguous:
+        order = 'F'
+    else:
+        array = np.ascontiguousarray(array)
+        order = 'C'
+
+    header = {
+        'dtype': array.dtype.str,
+        'shape': list(array.shape),
+        'order': order,
+    }
+
+    # Arrays of dates and timedeltas can't be exported with the buffer
+    # protocol, so their memory is viewed as bytes instead.
+    buffer = memoryview(np.ravel(array, order=order).view(np.uint8))
+
+    return header, buffer
+
+
+def _buffer_to_array(header, buffer):
+    """Create an array over buffer without copying it."""
+    dtype = np.dtype(header['dtype'])
+    if len(buffer) == 0:
+        array = np.empty(0, dtype=dtype)
+    else:
+        array = np.frombuffer(buffer, dtype=dtype)
+    return array.reshape(header['shape'], order=header['order'])
+
+
+# =============================================================================
+# Public API
+# =============================================================================
+def is_bufferable(value):
+    """Check if value can be sent with to_buffers."""
+    if type(value) is np.ndarray:
+        # Subclasses like masked arrays and matrices need to be pickled
+        return _is_supported_dtype(value.dtype, SUPPORTED_KINDS)
+    elif type(value) is pd.DataFrame:
+        return all(
+            _is_supported_dtype(dtype, DATA_FRAME_KINDS)
+            for dtype in value.dtypes
+        )
+    return False
+
+
+def to_buffers(value):
+    """
+    Get a json-able header for value and the buffers with its memory.
+
+    Arrays are sent as a single buffer, and DataFrames as a buffer with their
+    index and columns and one buffer per group of columns of the same dtype.
+
+    Returns
+    -------
+    header: dict
+        The information necessary to rebuild value with from_buffers.
+    buffers: list
+        The memoryviews and bytes to send.
+    """
+    if not is_bufferable(value):
+        raise TypeError(
+            "{} can't be sent as buffers".format(type(value).__name__)
+        )
+
+    if isinstance(value, np.ndarray):
+        header, buffer = _array_to_buffer(value)
+        header['type'] = 'ndarray'
+        return header, [buffer]
+
+    # Group columns by dtype, which is how pandas keeps them in memory
+    positions = {}
+    for position, dtype in enumerate(value.dtypes):
+        positions.setdefault(dtype, []).append(position)
+
+    header = {'type': 'DataFrame', 'blocks': []}
+    buffers = [cloudpickle.dumps((value.index, value.columns))]
+    for block_positions in positions.values():
+        if len(positions) == 1:
+            # This is a view if the DataFrame has a single block
+            values = value.to_numpy()
+        else:
+            values = value.iloc[:, block_positions].to_numpy()
+        block_header, buffer = _array_to_buffer(values)
+        block_header['columns'] = block_positions
+        header['blocks'].append(block_header)
+        buffers.append(buffer)
+
+    return header, buffers
+
+
+def from_buffers(header, buffers):
+    """
+    Rebuild a value sent with to_buffers.
+
+    The memory in buffers is used without copying it, so the result is
+    read-only if buffers are.
+    """
+    if header['type'] == 'ndarray':
+        array = _buffer_to_array(header, buffers[0])
+        _arrays_from_buffers[id(array)] = array
+        return array
+
+    index, columns = cloudpickle.loads(buffers[0])
+    blocks = [
+        (block_header['columns'], _buffer_to_array(block_header, buffer))
+        for block_header, buffer in zip(header['blocks'], buffers[1:])
+    ]
+
+    if len(blocks) == 1:
+        df = pd.DataFrame(blocks[0][1], copy=False)
+    else:
+        data = {}
+        for block_positions, values in blocks:
+            for idx, position in enumerate(block_positions):
+                data[position] = values[:, idx]
+        df = pd.DataFrame(
+            {position: data[position] for position in sorted(data)},
+            copy=False
+        )
+
+    df.index = index
+    df.columns = columns
+    return df
+
+
+def is_from_buffers(value):
+    """
+    Check if value is an array rebuilt by from_buffers.
+
+    These arrays can be read-only just because the memory of their buffers
+    is, so a copy of them can be edited.
+    """
+    return _arrays_from_buffers.get(id(value)) is value
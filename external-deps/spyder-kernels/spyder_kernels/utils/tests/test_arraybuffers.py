@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright (c) 2009- Spyder Kernels Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder_kernels/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""
+Tests for arraybuffers.py
+"""
+
+# Third party imports
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+import pytest
+
+# Local imports
+from spyder_kernels.utils.arraybuffers import (
+    from_buffers, is_bufferable, is_from_buffers, to_buffers)
+
+
+def send(value):
+    """Simulate sending value through a comm, which gives bytes back."""
+    header, buffers = to_buffers(value)
+    return from_buffers(header, [bytes(buffer) for buffer in buffers])
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(12.).reshape(3, 4),
+        np.arange(12).reshape(3, 4).T,
+        np.arange(24, dtype=np.int8)[::2],
+        np.zeros((0, 3)),
+        np.array(5 + 1j),
+        np.array([True, False]),
+        np.array(['a', 'bc']),
+        np.array(['2020-01-01', '2021-06-30'], dtype='datetime64[D]'),
+    ]
+)
+def test_arrays(array):
+    """Test sending arrays of the supported dtypes and memory layouts."""
+    value = send(array)
+    assert value.dtype == array.dtype
+    assert value.shape == array.shape
+    assert (value == array).all()
+
+
+def test_arrays_without_copies():
+    """Test that contiguous arrays are sent and received without copies."""
+    array = np.arange(12.).reshape(3, 4)
+    header, buffers = to_buffers(array.T)
+    assert header['order'] == 'F'
+    assert np.shares_memory(np.asarray(buffers[0]), array)
+
+    value = from_buffers(header, buffers)
+    assert np.shares_memory(value, array)
+    assert (value == array.T).all()
+
+
+def test_data_frames():
+    """Test sending DataFrames grouping their columns by dtype."""
+    df = pd.DataFrame(
+        {
+            'a': [1, 2, 3],
+            'b': [0.5, 1.5, 2.5],
+            'c': [4, 5, 6],
+            'd': pd.date_range('2020', periods=3),
+        },
+        index=['x', 'y', 'z']
+    )
+    header, buffers = to_buffers(df)
+    assert [block['columns'] for block in header['blocks']] == [
+        [0, 2], [1], [3]
+    ]
+    assert len(buffers) == 4
+    assert_frame_equal(send(df), df)
+
+    # DataFrames with a single dtype are sent without copies
+    df = pd.DataFrame(np.arange(6.).reshape(3, 2), columns=['a', 'b'])
+    header, buffers = to_buffers(df)
+    assert np.shares_memory(np.asarray(buffers[1]), df.to_numpy())
+    assert_frame_equal(send(df), df)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        np.array([None, 1]),
+        np.ma.array([1, 2], mask=[0, 1]),
+        np.zeros(2, dtype=[('x', int), ('y', float)]),
+        pd.DataFrame({'a': ['x', 'y']}),
+        pd.Series([1, 2]),
+        [1, 2],
+    ]
+)
+def test_unsupported_values(value):
+    """Test that values that need to be pickled are rejected."""
+    assert not is_bufferable(value)
+    with pytest.raises(TypeError):
+        to_buffers(value)
+
+
+if __name__ == "__main__":
+    pytest.main()
+
+
+def test_is_from_buffers():
+    """Test that arrays rebuilt from buffers are told apart from others."""
+    array = np.arange(6.).reshape(2, 3)
+    value = send(array)
+    assert is_from_buffers(value)
+    assert not is_from_buffers(array)
+    assert not is_from_buffers(value.copy())
+
+    readonly = np.frombuffer(array.tobytes())
+    assert not readonly.flags.writeable
+    assert not is_from_buffers(readonly)
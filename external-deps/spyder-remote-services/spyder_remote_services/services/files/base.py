@@ -7,6 +7,7 @@
 from http import HTTPStatus
 import os
 from pathlib import Path
+import re
 from shutil import copy, copy2, rmtree
 import stat
 import threading
@@ -19,6 +20,11 @@
 from tornado.websocket import WebSocketHandler
 
 from spyder_remote_services.services.files.compression import ZipStream, MemberFile, CompressionType
+from spyder_remote_services.services.files.search import (
+    is_binary_file,
+    iter_search_files,
+    search_in_file,
+)
 
 if typing.TYPE_CHECKING:
     from io import FileIO
@@ -322,8 +328,12 @@ class FilesRESTMixin:
         - fs_rmdir(path_str)
         - fs_rm_file(path_str, missing_ok=False)
         - fs_touch(path_str, truncate=True)
+        - fs_search(path_str, pattern, exclude=None, encoding="utf-8",
+                    max_results=None)
     """
 
+    SEARCH_MATCHES_PER_MESSAGE = 100
+
     def _info_for_path(self, path: Path) -> dict:
         """Get fsspec-like info about a single path."""
         out = path.stat(follow_symlinks=False)
@@ -461,6 +471,55 @@ def fs_move(self, src_str: str, dst_str: str):
         src.rename(dst)
         return {"success": True}
 
+    def fs_search(
+        self,
+        path_str: str,
+        pattern: re.Pattern,
+        exclude: re.Pattern | None = None,
+        encoding: str = "utf-8",
+        max_results: int | None = None,
+    ):
+        """
+        Search a compiled bytes pattern in the text files under path.
+
+        Yields a dict with the name of each file with matches and them as
+        [line number, start column, end column, line] lists, or with the
+        error found when reading it. Files with many matches are yielded in
+        several parts, so that every message is small.
+        """
+        path = self._load_path(path_str)
+        if not path.exists():
+            raise FileNotFoundError(
+                errno.ENOENT, os.strerror(errno.ENOENT), str(path)
+            )
+
+        num_results = 0
+        for p in iter_search_files(path, exclude=exclude):
+            try:
+                if is_binary_file(p):
+                    continue
+                matches = search_in_file(
+                    p,
+                    pattern,
+                    encoding=encoding,
+                    max_matches=(
+                        None if max_results is None
+                        else max_results - num_results
+                    ),
+                )
+            except OSError as e:
+                yield {"name": str(p), "error": e.strerror}
+                continue
+
+            for i in range(0, len(matches), self.SEARCH_MATCHES_PER_MESSAGE):
+                yield {
+                    "name": str(p),
+                    "matches": matches[i:i + self.SEARCH_MATCHES_PER_MESSAGE],
+                }
+            num_results += len(matches)
+            if max_results is not None and num_results >= max_results:
+                return
+
     @contextmanager
     def fs_zip_dir(
         self,
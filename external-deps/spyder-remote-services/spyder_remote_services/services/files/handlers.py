@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 from contextlib import asynccontextmanager
 from http import HTTPStatus
 from http.client import responses
@@ -16,6 +17,9 @@
     FilesRESTMixin,
     FileWebSocketHandler,
 )
+from spyder_remote_services.services.files.search import (
+    compile_search_pattern,
+)
 
 
 class ReadWriteWebsocketHandler(
@@ -165,6 +169,54 @@ async def get(self):
             for result in self.fs_ls(path, detail=detail):
                 await write_json(result)
 
+class SearchHandler(BaseFSHandler):
+    @web.authenticated
+    @authorized
+    async def get(self):
+        path = self.get_path_argument("path")
+        encoding = self.get_argument("encoding", default="utf-8")
+        exclude = self.get_argument("exclude", default="")
+        try:
+            max_results = int(self.get_argument("max_results", default="0"))
+            pattern = compile_search_pattern(
+                self.get_argument("pattern"),
+                regex=(self.get_argument("regex", "false").lower() == "true"),
+                case_sensitive=(
+                    self.get_argument("case_sensitive", "false").lower()
+                    == "true"
+                ),
+                encoding=encoding,
+            )
+            exclude = re.compile(exclude) if exclude else None
+        except (re.error, LookupError, ValueError) as e:
+            raise web.HTTPError(
+                HTTPStatus.BAD_REQUEST,
+                reason=f"Invalid search: {e}",
+            )
+
+        results = self.fs_search(
+            path,
+            pattern,
+            exclude=exclude,
+            encoding=encoding,
+            max_results=max_results or None,
+        )
+
+        # Files are walked and searched in a thread to not block the server
+        # while results are streamed
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(None, next, results, None)
+            async with self.stream_json() as write_json:
+                while result is not None:
+                    await write_json(result)
+                    result = await loop.run_in_executor(
+                        None, next, results, None
+                    )
+        finally:
+            results.close()
+
+
 class InfoHandler(BaseFSHandler):
     @web.authenticated
     @authorized
@@ -289,6 +341,7 @@ def post(self):
     (r"/fs/open", ReadWriteWebsocketHandler),  # WebSocket
     (r"/fs/ls", LsHandler),                  # GET
     (r"/fs/info", InfoHandler),              # GET
+    (r"/fs/search", SearchHandler),          # GET
     (r"/fs/exists", ExistsHandler),          # GET
     (r"/fs/isfile", IsFileHandler),          # GET
     (r"/fs/isdir", IsDirHandler),            # GET
@@ -0,0 +1,193 @@
+"""Text search in the files of a directory, run on the server."""
+
+from __future__ import annotations
+import mmap
+import os
+from pathlib import Path
+import re
+import typing
+
+if typing.TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+# Number of bytes read to check if a file is binary
+BINARY_CHECK_SIZE = 8192
+
+# Lines longer than this number of characters are cut around their matches,
+# so that results of minified files are not huge
+MAX_LINE_LENGTH = 1000
+
+# Characters kept before matches when lines are cut
+LINE_CONTEXT = 100
+
+# Syntax of regular expressions that can match differently in a line than in
+# a whole file (e.g. lookarounds can check the text of other lines). Files are
+# searched line by line for them, as Spyder does for local files.
+LINE_ONLY_RE_SYNTAX = (b"\\A", b"\\Z", b"(?<", b"(?!", b"(?=")
+
+
+def compile_search_pattern(
+    pattern: str,
+    regex: bool = False,
+    case_sensitive: bool = False,
+    encoding: str = "utf-8",
+) -> re.Pattern:
+    """Compile the bytes regular expression used to search files.
+
+    Raises
+    ------
+        re.error: If pattern is not a valid regular expression.
+    """
+    text = pattern.encode(encoding)
+    if not regex:
+        text = re.escape(text)
+    flags = re.MULTILINE
+    if not case_sensitive:
+        flags |= re.IGNORECASE
+    return re.compile(text, flags)
+
+
+def is_binary_file(path: Path) -> bool:
+    """Check if a file is binary by looking for null bytes at its start."""
+    with path.open("rb") as f:
+        return b"\0" in f.read(BINARY_CHECK_SIZE)
+
+
+def iter_search_files(
+    path: Path,
+    exclude: re.Pattern | None = None,
+) -> Iterator[Path]:
+    """Iterate over the files to search in path, skipping hidden dirs."""
+    if path.is_file():
+        yield path
+        return
+
+    for dirpath, dirnames, filenames in os.walk(path):
+        dirnames[:] = sorted(
+            dirname for dirname in dirnames
+            if not dirname.startswith(".")
+            and not (
+                exclude
+                and exclude.search(os.path.join(dirpath, dirname) + os.sep)
+            )
+        )
+        for filename in sorted(filenames):
+            filepath = os.path.join(dirpath, filename)
+            if exclude and exclude.search(filepath):
+                continue
+            if os.path.isfile(filepath):
+                yield Path(filepath)
+
+
+def iter_lines_with_matches(
+    buffer: mmap.mmap | bytes,
+    pattern: re.Pattern,
+) -> Iterator[tuple[int, bytes]]:
+    """Iterate over the lines of buffer where pattern can match.
+
+    The whole buffer is searched at once when the pattern can't match
+    differently than in single lines, so only the lines around its matches
+    are split. Otherwise, all lines are returned.
+
+    Yields
+    ------
+        tuple: Line number, starting at 1, and line, without its line break.
+    """
+    line_only = any(
+        syntax in pattern.pattern for syntax in LINE_ONLY_RE_SYNTAX
+    ) or (
+        # $ doesn't match before \r\n in the whole buffer, but lines are
+        # searched without \r
+        b"$" in pattern.pattern and buffer.find(b"\r") >= 0
+    )
+
+    size = len(buffer)
+    lineno = 1
+    pos = 0
+    while pos < size:
+        if line_only:
+            line_start = pos
+            line_end = size
+        else:
+            match = pattern.search(buffer, pos)
+            if match is None:
+                break
+
+            # Get the lines where the match is
+            start, end = match.span()
+            line_start = buffer.rfind(b"\n", pos, start) + 1 or pos
+            line_end = buffer.find(b"\n", max(start, end - 1)) + 1 or size
+            lineno += buffer[pos:line_start].count(b"\n")
+
+        while line_start < line_end:
+            next_start = buffer.find(b"\n", line_start, line_end) + 1
+            if next_start == 0:
+                next_start = line_end
+            yield lineno, buffer[line_start:next_start].rstrip(b"\r\n")
+            lineno += 1
+            line_start = next_start
+
+            if line_only:
+                break
+
+        pos = line_start
+
+
+def search_in_file(
+    path: Path,
+    pattern: re.Pattern,
+    encoding: str = "utf-8",
+    max_matches: int | None = None,
+) -> list[list]:
+    """Search a compiled pattern in a file.
+
+    Lines are searched one by one and without their line breaks, so results
+    are the same as when searching local files. Only the lines where the
+    pattern can match are split and decoded.
+
+    Returns
+    -------
+        list: [line number, start column, end column, line] lists for each
+        match, where line numbers start at 1 and columns are positions in
+        the decoded line. Lines longer than MAX_LINE_LENGTH are cut around
+        the match and columns refer to the part of the line that's kept.
+    """
+    results = []
+    with path.open("rb") as f:
+        try:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files and files that can't be mapped
+            return results
+
+        try:
+            for lineno, line in iter_lines_with_matches(buffer, pattern):
+                decoded_line = None
+                for match in pattern.finditer(line):
+                    start, end = match.span()
+                    if decoded_line is None:
+                        decoded_line = line.decode(encoding, "replace")
+
+                    col_start = len(line[:start].decode(encoding, "replace"))
+                    col_end = col_start + len(
+                        line[start:end].decode(encoding, "replace")
+                    )
+                    result_line = decoded_line
+                    if len(result_line) > MAX_LINE_LENGTH:
+                        offset = max(0, col_start - LINE_CONTEXT)
+                        result_line = result_line[
+                            offset:offset + MAX_LINE_LENGTH
+                        ]
+                        col_start -= offset
+                        col_end = min(col_end - offset, len(result_line))
+                    results.append([lineno, col_start, col_end, result_line])
+                    if (
+                        max_matches is not None
+                        and len(results) >= max_matches
+                    ):
+                        return results
+        finally:
+            buffer.close()
+
+    return results
@@ -0,0 +1,130 @@
+"""Tests for the text search in files run on the server."""
+
+from pathlib import Path
+import re
+
+import pytest
+
+from spyder_remote_services.services.files import search
+from spyder_remote_services.services.files.search import (
+    compile_search_pattern,
+    iter_search_files,
+    search_in_file,
+)
+
+
+LINES = [
+    "spam = 1\n",
+    "\n",
+    "  Spam and spam and spam\r\n",
+    "eggs and spam\n",
+    "spám\n",
+    "eggs\n",
+] * 20 + ["last spam"]
+
+
+def search_lines(lines, pattern):
+    """Search pattern line by line, without line breaks."""
+    results = []
+    for lineno, line in enumerate(lines, start=1):
+        line = line.rstrip("\r\n")
+        line_bytes = line.encode("utf-8")
+        for match in pattern.finditer(line_bytes):
+            start, end = match.span()
+            col_start = len(line_bytes[:start].decode("utf-8"))
+            col_end = col_start + len(line_bytes[start:end].decode("utf-8"))
+            results.append([lineno, col_start, col_end, line])
+    return results
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "test.py"
+    with path.open("w", encoding="utf-8", newline="") as f:
+        f.write("".join(LINES))
+    return path
+
+
+def test_compile_search_pattern():
+    """Test that texts are escaped unless they're regular expressions."""
+    pattern = compile_search_pattern("a.b")
+    assert pattern.search(b"A.B")
+    assert not pattern.search(b"axb")
+
+    pattern = compile_search_pattern("a.b", regex=True, case_sensitive=True)
+    assert pattern.search(b"axb")
+    assert not pattern.search(b"AxB")
+
+    pattern = compile_search_pattern("spám", encoding="latin-1")
+    assert pattern.search("spám".encode("latin-1"))
+
+    with pytest.raises(re.error):
+        compile_search_pattern("(", regex=True)
+
+
+def test_iter_search_files(tmp_path):
+    """Test that hidden and excluded directories and files are skipped."""
+    for name in ["b.py", "a.py", "c.txt", "sub/d.py", ".git/e.py",
+                 "build/f.py"]:
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("spam")
+
+    exclude = re.compile(r"build|\.txt")
+    files = [
+        str(p.relative_to(tmp_path))
+        for p in iter_search_files(tmp_path, exclude=exclude)
+    ]
+    assert files == ["a.py", "b.py", str(Path("sub", "d.py"))]
+
+    assert list(iter_search_files(tmp_path / "a.py")) == [tmp_path / "a.py"]
+
+
+@pytest.mark.parametrize(
+    "text,regex,case_sensitive",
+    [
+        ("spam", False, True),
+        ("spam", False, False),
+        ("sp.m$", True, True),
+        ("^ *spam", True, False),
+        ("\\Aspam", True, True),
+        ("spam(?!\\s*sp)", True, True),
+        ("spam\\s+eggs", True, True),
+        ("spám", False, True),
+    ]
+)
+def test_search_in_file(text_file, text, regex, case_sensitive):
+    """
+    Test that searching a file gives the same results as searching it line
+    by line.
+    """
+    pattern = compile_search_pattern(text, regex, case_sensitive)
+    expected = search_lines(LINES, pattern)
+    assert search_in_file(text_file, pattern) == expected
+
+
+def test_search_in_file_max_matches(text_file):
+    """Test that the search stops after a number of matches."""
+    pattern = compile_search_pattern("spam")
+    results = search_in_file(text_file, pattern, max_matches=5)
+    assert results == search_lines(LINES, pattern)[:5]
+
+
+def test_search_in_file_long_lines(tmp_path):
+    """Test that long lines are cut around their matches."""
+    path = tmp_path / "min.js"
+    path.write_text("x" * 5000 + "spam" + "x" * 5000)
+
+    pattern = compile_search_pattern("spam")
+    [[lineno, start, end, line]] = search_in_file(path, pattern)
+    assert lineno == 1
+    assert len(line) == search.MAX_LINE_LENGTH
+    assert start == search.LINE_CONTEXT
+    assert line[start:end] == "spam"
+
+
+def test_search_in_file_empty(tmp_path):
+    """Test that empty files have no matches."""
+    path = tmp_path / "empty.py"
+    path.touch()
+    assert search_in_file(path, compile_search_pattern("spam")) == []
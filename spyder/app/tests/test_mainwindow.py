@@ -2783,14 +2783,8 @@ def example_def_2():
 
 @flaky(max_runs=3)
 @pytest.mark.skipif(running_in_ci(), reason="Can't run on CI")
-def test_switcher_projects_integration(main_window, pytestconfig, qtbot,
-                                       tmp_path):
+def test_switcher_projects_integration(main_window, qtbot, tmp_path):
     """Test integration between the Switcher and Projects plugins."""
-    # Disable pytest stdin capture to make calls to fzf work. Idea taken from:
-    # https://github.com/pytest-dev/pytest/issues/2189#issuecomment-449512764
-    capmanager = pytestconfig.pluginmanager.getplugin('capturemanager')
-    capmanager.suspend_global_capture(in_=True)
-
     # Wait until the console is fully up
     shell = main_window.ipyconsole.get_current_shellwidget()
     qtbot.waitUntil(
@@ -2868,7 +2862,9 @@ def test_switcher_projects_integration(main_window, pytestconfig, qtbot,
     # Remove project file and check the switcher is updated
     n_files_project -= 1
     os.remove(str(project_dir / 'test_file1.py'))
-    qtbot.wait(500)
+    qtbot.waitUntil(
+        lambda: len(projects.get_widget().file_finder) == n_files_project
+    )
     switcher.open_switcher()
     assert switcher.count() == n_files_open + n_files_project
     switcher.on_close()
@@ -2886,21 +2882,16 @@ def test_switcher_projects_integration(main_window, pytestconfig, qtbot,
     assert switcher.count() == n_files_open + n_files_project - 1
     switcher.on_close()
 
-    # Check the switcher works without fzf
-    fzf = projects.get_widget()._fzf
-    projects.get_widget()._fzf = None
-    projects.get_widget()._default_switcher_paths = []
-
+    # Check that new project files are found
+    (project_dir / 'new_module.py').touch()
+    qtbot.waitUntil(
+        lambda: len(projects.get_widget().file_finder) == n_files_project + 1
+    )
     switcher.open_switcher()
-    switcher.set_search_text('0')
+    switcher.set_search_text('nwmod')
     qtbot.waitUntil(lambda: switcher.count() == 1)
     switcher.on_close()
 
-    projects.get_widget()._fzf = fzf
-
-    # Resume capturing
-    capmanager.resume_global_capture()
-
 
 @flaky(max_runs=3)
 @pytest.mark.skipif(sys.platform == 'darwin',
@@ -5498,17 +5489,17 @@ def test_goto_find(main_window, qtbot, tmpdir):
     with qtbot.waitSignal(findinfiles.sig_finished, timeout=SHELL_TIMEOUT):
         findinfiles.find()
 
-    results = findinfiles.result_browser.data
-    assert len(results) == 5
-    assert len(findinfiles.result_browser.files) == 1
+    results_model = findinfiles.result_browser.results_model
+    assert results_model.num_matches == 5
+    assert len(results_model.files) == 1
 
-    file_item = list(findinfiles.result_browser.files.values())[0]
-    assert file_item.childCount() == 5
+    file_index = results_model.index(0, 0)
+    assert results_model.rowCount(file_index) == 5
 
     for i in range(5):
-        item = file_item.child(i)
-        findinfiles.result_browser.setCurrentItem(item)
-        findinfiles.result_browser.on_item_activated(item)
+        index = results_model.index(i, 0, file_index)
+        findinfiles.result_browser.setCurrentIndex(index)
+        findinfiles.result_browser.on_item_activated(index)
         cursor = code_editor.textCursor()
         position = (cursor.selectionStart(), cursor.selectionEnd())
         assert position == match_positions[i]
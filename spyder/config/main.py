@@ -353,6 +353,8 @@
               'type_column': False,
               'date_column': False,
               'search_files_in_switcher': True,
+              'index_project_files': False,
+              'use_native_watcher': True,
               }),
             ('explorer',
              {
@@ -380,6 +382,8 @@
               'case_sensitive': False,
               'exclude_case_sensitive': False,
               'max_results': 1000,
+              'use_ignore_files': True,
+              'auto_refresh': False,
               }),
             ('completions',
              {
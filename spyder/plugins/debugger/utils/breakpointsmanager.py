@@ -169,6 +169,12 @@ def toogle_breakpoint(
             else:
                 self._breakpoint_blocks[block.blockNumber()] = block
         block.setUserData(data)
+
+        flags_manager = self.editor.flags_manager
+        if data.breakpoint:
+            flags_manager.add_line('breakpoint', block.blockNumber())
+        else:
+            flags_manager.remove_line('breakpoint', block.blockNumber())
         self.editor.sig_flags_changed.emit()
         self.breakpoints_changed()
 
@@ -196,6 +202,7 @@ def clear_breakpoints(self):
             data.breakpoint = False
             # data.breakpoint_condition = None  # not necessary, but logical
         self._breakpoint_blocks = {}
+        self.editor.flags_manager.set_lines('breakpoint', [])
         # Inform the editor that the breakpoints are changed
         self.breakpoints_changed()
         # Inform the editor that the flags must be updated
@@ -249,7 +249,7 @@ def mouseMoveEvent(self, event):
         if check and data:
             if data.code_analysis:
                 self.editor.show_code_analysis_results(line_number, data)
-            elif data.todo:
+            elif data.todo and self._markers_margin:
                 self.editor.show_todo(line_number, data)
         else:
             self.editor.hide_tooltip()
@@ -15,15 +15,13 @@
 import sys
 
 # Third party imports
-from lsprotocol import types as lsp
-from qtpy.QtCore import QSize, Qt, QThread
+from qtpy.QtCore import QSize, Qt
 from qtpy.QtGui import QColor, QCursor, QPainter
 from qtpy.QtWidgets import QApplication, QStyle, QStyleOptionSlider
 from superqt.utils import qdebounced
 
 # Local imports
 from spyder.plugins.editor.api.panel import Panel
-from spyder.plugins.editor.utils.editor import is_block_safe
 
 
 # For logging
@@ -75,17 +73,9 @@ def __init__(self):
         self._slider_range_brush = QColor(Qt.gray)
         self._slider_range_brush.setAlphaF(.5)
 
-        # Dictionary with flag lists
-        self._dict_flag_list = {}
-
         # Keep track if todo markers are enabled.
         self.todo_enabled = True
 
-        # Thread to update flags on it.
-        self._update_flags_thread = QThread(None)
-        self._update_flags_thread.run = self._update_flags
-        self._update_flags_thread.finished.connect(self.update)
-
     def on_install(self, editor):
         """Manages install setup of the pane."""
         super().on_install(editor)
@@ -121,11 +111,6 @@ def slider(self):
         """This property holds whether the vertical scrollbar is visible."""
         return self.editor.verticalScrollBar().isVisible()
 
-    def closeEvent(self, event):
-        self._update_flags_thread.quit()
-        self._update_flags_thread.wait()
-        super().closeEvent(event)
-
     def sizeHint(self):
         """Override Qt method"""
         return QSize(self.WIDTH, 0)
@@ -141,47 +126,14 @@ def update_flag_colors(self, color_dict):
 
     @qdebounced(timeout=REFRESH_RATE)
     def update_flags(self):
-        """Update flags list in a thread."""
-        logger.debug("Updating current flags")
-
-        self._dict_flag_list = {
-            'error': [],
-            'warning': [],
-            'todo': [],
-            'breakpoint': [],
-        }
-
-        # Run this computation in a different thread to prevent freezing
-        # the interface
-        if not self._update_flags_thread.isRunning():
-            self._update_flags_thread.start()
-
-    def _update_flags(self):
-        """Update flags list."""
-        editor = self.editor
-        block = editor.document().firstBlock()
-        while block.isValid():
-            # Parse all lines in the file looking for something to flag.
-            data = block.userData()
-            if data:
-                if data.code_analysis:
-                    for _, _, severity, _ in data.code_analysis:
-                        if severity == lsp.DiagnosticSeverity.Error:
-                            flag_type = 'error'
-                            break
-                    else:
-                        flag_type = 'warning'
-                elif data.todo:
-                    flag_type = 'todo'
-                elif data.breakpoint:
-                    flag_type = 'breakpoint'
-                else:
-                    flag_type = None
-
-                if flag_type is not None:
-                    self._dict_flag_list[flag_type].append(block)
+        """
+        Repaint flags.
 
-            block = block.next()
+        The flagged lines are kept up to date by the editor's flags manager,
+        so this only needs to schedule a repaint.
+        """
+        logger.debug("Updating current flags")
+        self.update()
 
     def paintEvent(self, event):
         """
@@ -242,12 +194,18 @@ def paintEvent(self, event):
         else:
             flag_height_lines = 0
 
-        # All the lists of block numbers for flags
+        # All the lists of line numbers for flags
+        flags_manager = editor.flags_manager
         dict_flag_lists = {
             "occurrence": editor.occurrences,
-            "found_results": editor.found_results
+            "found_results": editor.found_results,
+            "error": flags_manager.get_lines('error'),
+            "warning": flags_manager.get_lines('warning'),
+            "todo": flags_manager.get_lines('todo'),
+            "breakpoint": flags_manager.get_lines('breakpoint'),
         }
-        dict_flag_lists.update(self._dict_flag_list)
+        document = editor.document()
+        block_count = document.blockCount()
 
         # This is necessary to paint find matches above errors and warnings.
         # See spyder-ide/spyder#20970
@@ -263,9 +221,10 @@ def paintEvent(self, event):
             painter.setPen(self._edgecolors[flag_type])
             if editor.verticalScrollBar().maximum() == 0:
                 # No scroll
-                for block in dict_flag_lists[flag_type]:
-                    if not is_block_safe(block):
-                        continue
+                for line in dict_flag_lists[flag_type]:
+                    if line >= block_count:
+                        break
+                    block = document.findBlockByNumber(line)
                     geometry = editor.blockBoundingGeometry(block)
                     rect_y = ceil(
                         geometry.y() +
@@ -275,9 +234,7 @@ def paintEvent(self, event):
                     painter.drawRect(rect_x, rect_y, rect_w, rect_h)
             elif last_line == 0:
                 # Only one line
-                for block in dict_flag_lists[flag_type]:
-                    if not is_block_safe(block):
-                        continue
+                if dict_flag_lists[flag_type]:
                     rect_y = ceil(first_y_pos)
                     painter.drawRect(rect_x, rect_y, rect_w, rect_h)
             else:
@@ -285,11 +242,11 @@ def paintEvent(self, event):
                 if len(dict_flag_lists[flag_type]) < MAX_FLAGS:
                     # If the file is too long, do not freeze the editor
                     next_line = 0
-                    for block in dict_flag_lists[flag_type]:
-                        if not is_block_safe(block):
-                            continue
+                    for line in dict_flag_lists[flag_type]:
+                        if line >= block_count:
+                            break
+                        block = document.findBlockByNumber(line)
                         block_line = block.firstLineNumber()
-                        # block_line = -1 if invalid
                         if block_line < next_line:
                             # Don't print flags on top of flags
                             continue
@@ -12,7 +12,7 @@
 import pytest
 from lsprotocol import types as lsp
 from qtpy.QtCore import QPoint, Qt
-from qtpy.QtGui import QFont
+from qtpy.QtGui import QFont, QTextCursor
 
 # Local imports
 from spyder.plugins.debugger.panels.debuggerpanel import DebuggerPanel
@@ -177,6 +177,64 @@ def test_flag_painting(editor_bot, qtbot):
         editor.setTextCursor(cursor)
 
 
+def test_flags_manager(editor_bot, qtbot):
+    """Test that flagged lines are set by their producers and kept up to date
+    when lines are added or removed."""
+    editor = editor_bot
+    editor.filename = "file.py"
+    editor.breakpoints_manager = BreakpointsManager(editor)
+    flags_manager = editor.flags_manager
+    editor.set_text(long_code)
+
+    editor.breakpoints_manager.toogle_breakpoint(line_number=2)
+    editor.process_todo([[True, 3], [True, 10]])
+    editor.process_code_analysis([
+        lsp.Diagnostic(
+            range=lsp.Range(
+                start=lsp.Position(line=line, character=0),
+                end=lsp.Position(line=line, character=1),
+            ),
+            message='message',
+            severity=severity,
+            source='pyflakes',
+        )
+        for line, severity in [
+            (4, lsp.DiagnosticSeverity.Warning),
+            (5, lsp.DiagnosticSeverity.Warning),
+            (5, lsp.DiagnosticSeverity.Error),
+        ]
+    ])
+    qtbot.waitUntil(lambda: flags_manager.get_lines('error') == [5])
+    assert flags_manager.get_lines('warning') == [4]
+    assert flags_manager.get_lines('todo') == [2, 9]
+    assert flags_manager.get_lines('breakpoint') == [1]
+    assert flags_manager.get_kinds(9) == ['todo']
+
+    # Add two lines at the start of the file
+    cursor = editor.textCursor()
+    cursor.movePosition(QTextCursor.Start)
+    cursor.insertText('\n\n')
+    assert flags_manager.get_lines('breakpoint') == [3]
+    assert flags_manager.get_lines('todo') == [4, 11]
+    assert flags_manager.get_lines('error') == [7]
+
+    # Remove the line with the warning
+    cursor.setPosition(editor.document().findBlockByNumber(6).position())
+    cursor.movePosition(QTextCursor.Down, QTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+    assert flags_manager.get_lines('warning') == []
+    assert flags_manager.get_lines('error') == [6]
+    assert flags_manager.get_lines('todo') == [4, 10]
+
+    # Remove the breakpoint
+    editor.breakpoints_manager.toogle_breakpoint(line_number=4)
+    assert flags_manager.get_lines('breakpoint') == []
+
+    # Flags are removed when setting a new text
+    editor.set_text(short_code)
+    assert flags_manager.get_lines('todo') == []
+
+
 def test_range_indicator_visible_on_hover_only(editor_bot, qtbot):
     """Test that the slider range indicator is visible only when hovering
     over the scrollflag area when the editor vertical scrollbar is visible.
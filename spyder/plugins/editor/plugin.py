@@ -37,6 +37,7 @@
     CursorPositionStatus,
     EncodingStatus,
     EOLStatus,
+    LargeFileStatus,
     ReadWriteStatus,
     VCSStatus,
 )
@@ -261,6 +262,13 @@ def on_statusbar_available(self):
         widget.vcs_status = VCSStatus(widget)
         statusbar.add_status_widget(widget.vcs_status)
 
+        widget.large_file_status = LargeFileStatus(widget)
+        widget.large_file_status.hide()
+        widget.large_file_status.sig_clicked.connect(
+            widget.turn_off_large_file_mode
+        )
+        statusbar.add_status_widget(widget.large_file_status)
+
         # This is necessary for the first editorstack that is created because
         # when that's done these widgets can't exist yet.
         widget.register_status_widgets()
@@ -276,12 +284,14 @@ def on_statusbar_teardown(self):
         statusbar.remove_status_widget(EncodingStatus.ID)
         statusbar.remove_status_widget(CursorPositionStatus.ID)
         statusbar.remove_status_widget(VCSStatus.ID)
+        statusbar.remove_status_widget(LargeFileStatus.ID)
 
         widget.readwrite_status = None
         widget.eol_status = None
         widget.encoding_status = None
         widget.cursorpos_status = None
         widget.vcs_status = None
+        widget.large_file_status = None
 
     @on_plugin_available(plugin=Plugins.Run)
     def on_run_available(self):
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the code cells of a document.
+"""
+
+# Standard library imports
+from bisect import bisect_left, bisect_right
+
+# Local imports
+from spyder.plugins.editor.utils.editor import LinesIndex
+
+
+class CellIndex(LinesIndex):
+    """
+    Sorted line numbers of the cell headers of a document.
+
+    Cell headers are added and removed by the syntax highlighter as it finds
+    them. That allows to look for the cell that contains a line or the next
+    and previous cells without going through the document.
+    """
+
+    def __init__(self):
+        self._cells = None
+        super().__init__()
+
+    # ---- LinesIndex API
+    # -------------------------------------------------------------------------
+    def changed(self):
+        self._cells = None
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def get_cells(self):
+        """Return a sorted list of (line number, oedata) of cell headers."""
+        if self._cells is None:
+            self._cells = []
+            for line in self._lines:
+                oedata = self.get_oedata(line)
+                if oedata is not None:
+                    self._cells.append((line, oedata))
+        return self._cells
+
+    def get_oedata(self, line):
+        """Return the outline explorer data of the cell header at line."""
+        block = self._document.findBlockByNumber(line)
+        data = block.userData()
+        if data is None or getattr(data, 'oedata', None) is None:
+            return None
+        return data.oedata
+
+    def get_header(self, line):
+        """
+        Return the line of the header of the cell that contains line.
+
+        None is returned if line is before the first cell header.
+        """
+        index = bisect_right(self._lines, line)
+        return self._lines[index - 1] if index > 0 else None
+
+    def get_next_header(self, line):
+        """Return the line of the first cell header after line, or None."""
+        index = bisect_right(self._lines, line)
+        return self._lines[index] if index < len(self._lines) else None
+
+    def get_previous_header(self, line):
+        """Return the line of the last cell header before line, or None."""
+        index = bisect_left(self._lines, line)
+        return self._lines[index - 1] if index > 0 else None
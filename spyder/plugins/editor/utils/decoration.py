@@ -16,7 +16,12 @@
 <https://github.com/pyQode/pyqode.core/blob/master/pyqode/core/managers/decorations.py>
 """
 
+# Standard library imports
+import itertools
+import sys
+
 # Third party imports
+from intervaltree import Interval, IntervalTree
 from qtpy.QtCore import QObject, QTimer, Slot
 from qtpy.QtGui import QTextCharFormat
 
@@ -28,6 +33,14 @@
 # introduces a lot of sluggishness in the editor.
 UPDATE_TIMEOUT = 15  # milliseconds
 
+# Kinds of decorations that are always painted, regardless of the blocks
+# they span.
+ALWAYS_VISIBLE_KINDS = {'current_cell'}
+
+# Maximum number of lines that decorations can be shifted by edits before
+# computing again the block ranges of all of them.
+MAX_INDEX_SHIFT = 200
+
 
 def order_function(sel):
     end = sel.cursor.selectionEnd()
@@ -39,10 +52,33 @@ class TextDecorationsManager(Manager, QObject):
     """
     Manages the collection of TextDecoration that have been set on the editor
     widget.
+
+    Decorations are kept in an interval tree keyed by the range of blocks
+    they span, so that only the ones that intersect the visible region are
+    processed when updating the editor.
     """
     def __init__(self, editor):
         super().__init__(editor)
-        self._decorations = {"misc": []}
+
+        # Map of keys to decorations and their intervals in the index.
+        # Dicts are used to keep insertion order and to check membership
+        # and remove decorations in constant time.
+        self._decorations = {"misc": {}}
+
+        # Interval tree of block ranges. The data of each interval is a
+        # (insertion order, decoration) tuple.
+        self._index = IntervalTree()
+        self._counter = itertools.count()
+
+        # Adding or removing lines shifts the blocks of decorations. Instead
+        # of computing their ranges every time that happens, we keep track of
+        # the maximum shift and check the ranges of decorations that can
+        # be visible when updating.
+        self._index_shift = 0
+        self._index_outdated = False
+        self._document = None
+        self._block_count = 0
+        self.set_document(editor.document())
 
         # Timer to not constantly update decorations.
         self.update_timer = QTimer(self)
@@ -63,20 +99,13 @@ def add(self, decorations, key="misc"):
         Returns:
             int: Amount of decorations added.
         """
-        if key != "misc" and self._decorations.get(key) is None:
-            self._decorations[key] = []
+        if not isinstance(decorations, list):
+            decorations = [decorations]
 
-        current_decorations = self._decorations[key]
         added = 0
-
-        if isinstance(decorations, list):
-            not_repeated = set(decorations) - set(current_decorations)
-            current_decorations.extend(list(not_repeated))
-            self._decorations[key] = current_decorations
-            added = len(not_repeated)
-        elif decorations not in current_decorations:
-            self._decorations[key].append(decorations)
-            added = 1
+        for decoration in decorations:
+            if self._add_decoration(decoration, key):
+                added += 1
 
         if added > 0:
             self.update()
@@ -84,7 +113,10 @@ def add(self, decorations, key="misc"):
 
     def add_key(self, key, decorations):
         """Add decorations to key."""
-        self._decorations[key] = decorations
+        self._remove_decorations(key)
+        self._decorations[key] = {}
+        for decoration in decorations:
+            self._add_decoration(decoration, key)
         self.update()
 
     def remove(self, decoration, key="misc"):
@@ -98,27 +130,50 @@ def remove(self, decoration, key="misc"):
             several decorations
         """
         try:
-            self._decorations[key].remove(decoration)
-            self.update()
-            return True
-        except (ValueError, KeyError):
+            interval = self._decorations[key].pop(decoration)
+        except KeyError:
             return False
 
+        self._index.remove(interval)
+        self.update()
+        return True
+
     def remove_key(self, key):
         """Remove key"""
-        try:
+        if key in self._decorations:
+            self._remove_decorations(key)
             del self._decorations[key]
             self.update()
-        except KeyError:
-            pass
 
     def get(self, key, default=None):
         """Get a key from decorations."""
-        return self._decorations.get(key, default)
+        decorations = self._decorations.get(key)
+        if decorations is None:
+            return default
+        return list(decorations)
+
+    def set_document(self, document):
+        """Follow the changes of a new document (e.g. for cloned editors)."""
+        if self._document is not None:
+            try:
+                self._document.contentsChange.disconnect(
+                    self._on_contents_change
+                )
+            except (TypeError, RuntimeError):
+                # The document was already destroyed
+                pass
+
+        self._document = document
+        self._block_count = document.blockCount()
+        self._index_outdated = True
+        document.contentsChange.connect(self._on_contents_change)
 
     def clear(self):
         """Removes all text decoration from the editor."""
-        self._decorations = {"misc": []}
+        self._decorations = {"misc": {}}
+        self._index = IntervalTree()
+        self._index_shift = 0
+        self._index_outdated = False
         self.update()
 
     def update(self):
@@ -150,44 +205,132 @@ def _update(self):
 
             # Update visible decorations
             visible_decorations = []
-            for decoration in self._sorted_decorations():
-                need_update_sel = False
-                cursor = decoration.cursor
-                sel_start = cursor.selectionStart()
-                # This is required to update extra selections from the point
-                # an initial selection was made.
-                # Fixes spyder-ide/spyder#14282
-                if sel_start is not None:
-                    doc = cursor.document()
-                    block_nb_start = doc.findBlock(sel_start).blockNumber()
-                    need_update_sel = first <= block_nb_start <= last
-
-                block_nb = decoration.cursor.block().blockNumber()
-                if (first <= block_nb <= last or need_update_sel or
-                        decoration.kind == 'current_cell'):
-                    visible_decorations.append(decoration)
-                    try:
-                        decoration.format.setFont(
-                            font, QTextCharFormat.FontPropertiesSpecifiedOnly)
-                    except (TypeError, AttributeError):  # Qt < 5.3
-                        decoration.format.setFontFamily(font.family())
-                        decoration.format.setFontPointSize(font.pointSize())
+            for decoration in self.get_decorations_in_range(first, last):
+                visible_decorations.append(decoration)
+                try:
+                    decoration.format.setFont(
+                        font, QTextCharFormat.FontPropertiesSpecifiedOnly)
+                except (TypeError, AttributeError):  # Qt < 5.3
+                    decoration.format.setFontFamily(font.family())
+                    decoration.format.setFontPointSize(font.pointSize())
 
             editor.setExtraSelections(visible_decorations)
         except RuntimeError:
             # This is needed to fix spyder-ide/spyder#9173.
             return
 
+    def get_decorations_in_range(self, first, last):
+        """
+        Get sorted decorations that intersect blocks `first` to `last`
+        (both included).
+        """
+        if self._index_outdated:
+            self._rebuild_index()
+
+        shift = self._index_shift
+        intervals = self._index.overlap(first - shift, last + 1 + shift)
+
+        if shift:
+            # Check the current block range of decorations that could be
+            # visible after lines were added or removed.
+            checked_intervals = []
+            for interval in intervals:
+                order, decoration = interval.data
+                new_interval = self._get_interval(decoration, order)
+                if new_interval != interval:
+                    self._replace_interval(interval, new_interval)
+                if new_interval.overlaps(first, last + 1):
+                    checked_intervals.append(new_interval)
+            intervals = checked_intervals
+
+        intervals = sorted(
+            intervals,
+            key=lambda interval: (
+                order_function(interval.data[1]), interval.data[0]
+            )
+        )
+        return [interval.data[1] for interval in intervals]
+
     def __iter__(self):
         return iter(self._decorations)
 
     def __len__(self):
         return len(self._decorations)
 
-    def _sorted_decorations(self):
-        """Get all sorted decorations."""
-        return sorted(
-            [v for key in self._decorations
-             for v in self._decorations[key]],
-            key=order_function
-        )
+    # ---- Index management
+    def _get_interval(self, decoration, order):
+        """Get the interval of blocks spanned by `decoration`."""
+        if decoration.kind in ALWAYS_VISIBLE_KINDS:
+            return Interval(0, sys.maxsize, (order, decoration))
+
+        cursor = decoration.cursor
+        document = cursor.document()
+        start = document.findBlock(cursor.selectionStart()).blockNumber()
+        end = document.findBlock(cursor.selectionEnd()).blockNumber()
+
+        return Interval(start, max(start, end) + 1, (order, decoration))
+
+    def _add_decoration(self, decoration, key):
+        """Add `decoration` to `key` and the index if it's not already."""
+        decorations = self._decorations.setdefault(key, {})
+        if decoration in decorations:
+            return False
+
+        interval = self._get_interval(decoration, next(self._counter))
+        decorations[decoration] = interval
+        self._index.add(interval)
+        return True
+
+    def _replace_interval(self, interval, new_interval):
+        """Replace the interval of a decoration in the index."""
+        self._index.remove(interval)
+        self._index.add(new_interval)
+        decoration = interval.data[1]
+        for decorations in self._decorations.values():
+            if decorations.get(decoration) is interval:
+                decorations[decoration] = new_interval
+                break
+
+    def _remove_decorations(self, key):
+        """Remove the decorations of `key` from the index."""
+        for interval in self._decorations.get(key, {}).values():
+            self._index.discard(interval)
+
+    def _rebuild_index(self):
+        """Compute again the block ranges of all decorations."""
+        intervals = []
+        for decorations in self._decorations.values():
+            for decoration, interval in decorations.items():
+                new_interval = self._get_interval(decoration, interval.data[0])
+                decorations[decoration] = new_interval
+                intervals.append(new_interval)
+
+        self._index = IntervalTree(intervals)
+        self._index_shift = 0
+        self._index_outdated = False
+
+    @Slot(int, int, int)
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """Track how much decorations could be shifted by edits."""
+        document = self._document
+        block_count = document.blockCount()
+        first_block = document.findBlock(position)
+        last_block = document.findBlock(position + chars_added)
+        if not last_block.isValid():
+            last_block = document.lastBlock()
+
+        # Decorations in the changed blocks can be moved to any of them, even
+        # if the number of blocks doesn't change (e.g. when lines are
+        # replaced), and the ones after them are shifted by the lines added
+        # or removed.
+        new_span = last_block.blockNumber() - first_block.blockNumber()
+        old_span = new_span - (block_count - self._block_count)
+        self._block_count = block_count
+
+        if first_block.isValid():
+            self._index_shift += max(new_span, old_span)
+        else:
+            self._index_shift = MAX_INDEX_SHIFT + 1
+
+        if self._index_shift > MAX_INDEX_SHIFT:
+            self._index_outdated = True
@@ -18,6 +18,7 @@
 
 # Standard library imports
 from __future__ import annotations
+from bisect import bisect_left, bisect_right
 import os
 import os.path as osp
 import re
@@ -78,6 +79,153 @@ def is_block_safe(block):
     return block.isValid() and isinstance(block.userData(), BlockUserData)
 
 
+def get_lines_shift(document, position, chars_removed, chars_added,
+                    old_block_count, old_char_count):
+    """
+    Get how line numbers move after a change in document.
+
+    This follows what Qt does with the user data of blocks when text is
+    inserted or removed, so it can be used to keep sorted lists of the
+    numbers of lines that have some data attached.
+
+    Returns None if no lines were added or removed. Otherwise, returns a
+    function that takes a sorted list of line numbers and returns the shifted
+    ones.
+    """
+    if (
+        position == 0
+        and chars_removed > 0
+        and chars_removed >= old_char_count - 1
+    ):
+        # All text was replaced (e.g. by setPlainText), so all blocks were
+        # removed.
+        return lambda lines: []
+
+    first_block = document.findBlock(position)
+    last_block = document.findBlock(position + chars_added)
+    if not last_block.isValid():
+        last_block = document.lastBlock()
+
+    first = first_block.blockNumber()
+    added_lines = document.blockCount() - old_block_count
+    new_span = last_block.blockNumber() - first
+    old_span = new_span - added_lines
+    if old_span == 0 and added_lines == 0:
+        return None
+
+    # When text that spans several blocks is removed, Qt keeps the block
+    # where the removal ends if it starts at the beginning of a block, and
+    # the one where it starts otherwise. The other blocks are removed,
+    # together with their data.
+    if chars_removed > 0 and position == first_block.position():
+        kept_line = first + old_span
+    else:
+        kept_line = first
+
+    def shift(lines):
+        start = bisect_left(lines, first)
+        if start == len(lines):
+            return lines
+        end = bisect_right(lines, first + old_span)
+
+        new_lines = lines[:start]
+        if kept_line in lines[start:end]:
+            new_lines.append(first)
+        new_lines += [line + added_lines for line in lines[end:]]
+        return new_lines
+
+    return shift
+
+
+class LinesIndex:
+    """
+    Sorted numbers of the lines of a document that have some data attached.
+
+    Lines are added and removed by the code that finds them (e.g. the syntax
+    highlighter), and shifted when lines are added or removed in the
+    document, so they can be looked up without going through it.
+
+    Notes
+    -----
+    When lines are added or removed by the highlighter, the index needs to be
+    connected to the document before it, so that line numbers are already
+    shifted when changed blocks are highlighted.
+    """
+
+    def __init__(self):
+        self._lines = []
+        self._document = None
+        self._block_count = 0
+        self._char_count = 0
+
+    def set_document(self, document):
+        """Follow the changes of a new document."""
+        if self._document is not None:
+            try:
+                self._document.contentsChange.disconnect(
+                    self._on_contents_change
+                )
+            except (TypeError, RuntimeError):
+                # The document was already destroyed
+                pass
+
+        self._lines = []
+        self._document = document
+        self.changed()
+        if document is not None:
+            self._block_count = document.blockCount()
+            self._char_count = document.characterCount()
+            document.contentsChange.connect(self._on_contents_change)
+
+    def set_lines(self, lines):
+        """Set the lines in the index."""
+        self._lines = sorted(set(lines))
+        self.changed()
+
+    def update(self, line, state):
+        """Add (if state is True) or remove a line."""
+        index = bisect_left(self._lines, line)
+        found = index < len(self._lines) and self._lines[index] == line
+        if state and not found:
+            self._lines.insert(index, line)
+        elif found and not state:
+            del self._lines[index]
+        self.changed()
+
+    def changed(self):
+        """Called when the lines in the index change."""
+        # Reimplemented in childrens
+        pass
+
+    def count(self):
+        """Return the number of lines in the index."""
+        return len(self._lines)
+
+    def get_lines(self):
+        """Return the sorted line numbers (starting at 0) in the index."""
+        return self._lines
+
+    def get_lines_in_range(self, first, last):
+        """Return the lines in the index between two line numbers."""
+        return self._lines[
+            bisect_left(self._lines, first):bisect_right(self._lines, last)
+        ]
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """Shift lines when lines are added or removed in the document."""
+        document = self._document
+        shift = get_lines_shift(
+            document, position, chars_removed, chars_added,
+            self._block_count, self._char_count
+        )
+        self._block_count = document.blockCount()
+        self._char_count = document.characterCount()
+
+        if shift is not None:
+            self._lines = shift(self._lines)
+            self.changed()
+
+
 class BlockUserData(QTextBlockUserData):
 
     def __init__(
@@ -90,7 +238,7 @@ def __init__(
         self.breakpoint_condition = None
         self.bookmarks = []
         self.code_analysis = []
-        self.todo = ''
+        self.todo = []
         self.color = color
         self.oedata = None
         self.import_statement = None
@@ -100,6 +248,25 @@ def __init__(
         # To tell where an inline completion text starts in the block
         self.inline_completion_start: int | None = None
 
+        # Token runs and lexer states at the start and end of the block,
+        # used by highlighters that lex incrementally (e.g. PygmentsSH)
+        self.token_runs = None
+        self.lexer_entry_state = None
+        self.lexer_state = None
+
+        # Runs of format keys applied by highlighters that don't lex
+        # incrementally (e.g. PythonSH), to reapply them when only the formats
+        # change
+        self.format_runs = None
+
+        # Whether this was only created to keep the data above
+        self.only_cache = False
+
+    def __bool__(self):
+        # Blocks that only have data cached by highlighters are treated as
+        # blocks without data
+        return not self.only_cache
+
     def _selection(self):
         """
         Function to compute the selection.
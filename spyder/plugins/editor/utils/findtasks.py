@@ -24,12 +24,17 @@
 )
 
 
-def find_tasks(source_code):
-    """Find tasks in source code (TODO, FIXME, XXX, ...)."""
-    results = []
-    for line, text in enumerate(source_code.splitlines()):
-        for todo in re.findall(TASKS_PATTERN, text):
-            todo_text = (todo[-1].strip(' :').capitalize() if todo[-1]
-                         else todo[-2])
-            results.append((todo_text, line + 1))
-    return results
+TASKS_PROG = re.compile(TASKS_PATTERN)
+
+
+def find_tasks(comment):
+    """
+    Find the tasks (TODO, FIXME, XXX, ...) in a comment.
+
+    Returns a list with the messages of the tasks.
+    """
+    messages = []
+    for match in TASKS_PROG.finditer(comment):
+        keyword, text = match.groups()
+        messages.append(text.strip(' :').capitalize() or keyword)
+    return messages
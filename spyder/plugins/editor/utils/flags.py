@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Manager of the lines flagged in the editor's scroll flag area.
+"""
+
+# Standard library imports
+from bisect import bisect_left
+
+# Third party imports
+from qtpy.QtCore import QObject
+
+# Local imports
+from spyder.plugins.editor.api.manager import Manager
+from spyder.plugins.editor.utils.editor import LinesIndex
+
+
+# Kinds of flags that are set by their producers
+FLAG_KINDS = ('error', 'warning', 'todo', 'breakpoint')
+
+
+class FlagsManager(Manager, QObject):
+    """
+    Sorted line numbers of errors, warnings, todos and breakpoints.
+
+    The lines are set directly by the code that finds them (code analysis,
+    the todo finder and the breakpoints manager), and they're shifted when
+    lines are added or removed in the editor, so the scroll flag area doesn't
+    need to go through the document to paint them.
+    """
+
+    def __init__(self, editor):
+        super().__init__(editor)
+        self._indexes = {kind: LinesIndex() for kind in FLAG_KINDS}
+        self.set_document(editor.document())
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def get_lines(self, kind):
+        """Return the sorted line numbers (starting at 0) flagged as kind."""
+        return self._indexes[kind].get_lines()
+
+    def set_lines(self, kind, lines):
+        """Set the line numbers (starting at 0) flagged as kind."""
+        self._indexes[kind].set_lines(lines)
+
+    def add_line(self, kind, line):
+        """Flag a line as kind."""
+        self._indexes[kind].update(line, True)
+
+    def remove_line(self, kind, line):
+        """Remove the kind flag of a line."""
+        self._indexes[kind].update(line, False)
+
+    def get_kinds(self, line):
+        """Return the kinds of flags of a line."""
+        kinds = []
+        for kind, index in self._indexes.items():
+            lines = index.get_lines()
+            position = bisect_left(lines, line)
+            if position < len(lines) and lines[position] == line:
+                kinds.append(kind)
+        return kinds
+
+    def clear(self):
+        """Remove all flags."""
+        for index in self._indexes.values():
+            index.set_lines([])
+
+    def set_document(self, document):
+        """Follow the changes of a new document (e.g. for cloned editors)."""
+        for index in self._indexes.values():
+            index.set_document(document)
@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Manager to find and highlight the occurrences of a word in the editor.
+"""
+
+# Standard library imports
+import time
+
+# Third party imports
+from qtpy.QtCore import QObject, QTimer, Slot
+from qtpy.QtGui import QTextCursor
+
+# Local imports
+from spyder.plugins.editor.api.manager import Manager
+from spyder.utils.matchindex import compile_search_pattern, find_in_line
+
+
+# Time to spend searching occurrences before letting Qt process events.
+CHUNK_TIME = 0.01  # seconds
+
+# Maximum number of occurrences that are highlighted in the whole document.
+# Past that, only the ones around the visible region are highlighted.
+MAX_DECORATIONS = 5000
+
+
+class OccurrencesManager(Manager, QObject):
+    """
+    Find and highlight the occurrences of a word in the editor.
+
+    Occurrences around the visible region are searched and highlighted right
+    away. The rest of the document is searched afterwards in small chunks, so
+    that the interface doesn't freeze for big files.
+
+    The numbers of the lines with occurrences are available in `lines` once
+    the whole document has been searched, to be shown in the scroll flag
+    area.
+    """
+
+    def __init__(self, editor):
+        super().__init__(editor)
+        self.lines = []
+        self.count = 0
+
+        self._regobj = None
+        self._found_lines = []
+        self._pending_ranges = []
+        self._pending_decorations = []
+        self._capped = False
+        self._decorated_range = None
+
+        # The timer is a child of the editor so it's destroyed with it
+        self._timer = QTimer(editor)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._search_chunk)
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def start(self, text):
+        """Start to find the occurrences of text as a whole word."""
+        self.clear()
+        self._regobj = compile_search_pattern(text, case=True, word=True)
+
+        first, last = self._get_buffer_range()
+        self._search(first, last)
+        self._flush_decorations()
+        self._decorated_range = (first, last)
+
+        self._pending_ranges = [
+            (last + 1, self.editor.blockCount() - 1),
+            (0, first - 1),
+        ]
+        self._timer.start()
+
+    def clear(self):
+        """Stop searching and forget the occurrences found so far."""
+        self._timer.stop()
+        self.lines = []
+        self.count = 0
+
+        self._regobj = None
+        self._found_lines = []
+        self._pending_ranges = []
+        self._pending_decorations = []
+        self._capped = False
+        self._decorated_range = None
+
+    def is_searching(self):
+        """Return True if the document is still being searched."""
+        return self._timer.isActive()
+
+    def update_visible_region(self):
+        """
+        Highlight the occurrences in the visible region if that's needed.
+
+        This is necessary when there are more than MAX_DECORATIONS
+        occurrences and the editor is scrolled.
+        """
+        if not self._capped or self._decorated_range is None:
+            return
+
+        first, last = self.editor.get_visible_block_numbers()
+        first_decorated, last_decorated = self._decorated_range
+        if first < first_decorated or last > last_decorated:
+            self._decorate_buffer_region()
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _get_buffer_range(self):
+        """Return the first and last block numbers around the visible ones."""
+        first, last = self.editor.get_buffer_block_numbers()
+        return first, min(last, self.editor.blockCount() - 1)
+
+    def _search(self, first, last, deadline=None):
+        """
+        Search occurrences between two block numbers.
+
+        If deadline is given and reached, return the number of the next block
+        to search.
+        """
+        block = self.editor.document().findBlockByNumber(first)
+        block_number = first
+        while block.isValid() and block_number <= last:
+            spans = find_in_line(self._regobj, block.text())
+            if spans:
+                self._found_lines.append(block_number)
+                self._add_occurrences(block, spans)
+
+            block = block.next()
+            block_number += 1
+            if deadline is not None and time.monotonic() > deadline:
+                return block_number
+
+    def _add_occurrences(self, block, spans):
+        """Add decorations for the occurrences found in a block."""
+        self.count += len(spans)
+        if self._capped:
+            return
+
+        if self.count > MAX_DECORATIONS:
+            # Highlighting all occurrences would make the editor sluggish
+            self._capped = True
+            self._pending_decorations = []
+            self._decorate_buffer_region()
+            return
+
+        self._pending_decorations += self._get_decorations(block, spans)
+
+    def _get_decorations(self, block, spans):
+        """Get the decorations for the occurrences found in a block."""
+        editor = self.editor
+        position = block.position()
+        decorations = []
+        for start, end in spans:
+            cursor = QTextCursor(block)
+            cursor.setPosition(position + start)
+            cursor.setPosition(position + end, QTextCursor.KeepAnchor)
+            decorations.append(
+                editor.get_selection(
+                    cursor, background_color=editor.occurrence_color
+                )
+            )
+        return decorations
+
+    def _flush_decorations(self):
+        """Add the decorations found so far to the editor."""
+        # A single occurrence is not highlighted
+        if self.count > 1 and self._pending_decorations:
+            self.editor.add_extra_selections(
+                'occurrences', self._pending_decorations
+            )
+            self._pending_decorations = []
+
+    def _decorate_buffer_region(self):
+        """Only highlight the occurrences around the visible region."""
+        first, last = self._get_buffer_range()
+        decorations = []
+        block = self.editor.document().findBlockByNumber(first)
+        for __ in range(first, last + 1):
+            if not block.isValid():
+                break
+            spans = find_in_line(self._regobj, block.text())
+            if spans:
+                decorations += self._get_decorations(block, spans)
+            block = block.next()
+
+        self.editor.set_extra_selections('occurrences', decorations)
+        self._decorated_range = (first, last)
+
+    @Slot()
+    def _search_chunk(self):
+        """Search occurrences for some time and schedule the next chunk."""
+        deadline = time.monotonic() + CHUNK_TIME
+        while self._pending_ranges:
+            first, last = self._pending_ranges[0]
+            next_block = self._search(first, last, deadline)
+            if next_block is not None and next_block <= last:
+                self._pending_ranges[0] = (next_block, last)
+                self._flush_decorations()
+                self._timer.start()
+                return
+            self._pending_ranges.pop(0)
+
+        self._flush_decorations()
+        self.lines = sorted(self._found_lines)
+        self.editor.sig_flags_changed.emit()
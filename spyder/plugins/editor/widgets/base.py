@@ -195,6 +195,23 @@ def set_extra_selections(self, key, extra_selections):
             key (str) name of the extra selections group.
             extra_selections (list of sourcecode.api.TextDecoration).
         """
+        self._set_draw_order(key, extra_selections)
+        self.decorations.add_key(key, extra_selections)
+        self.update()
+
+    def add_extra_selections(self, key, extra_selections):
+        """Add extra selections to a key, keeping the previous ones.
+
+        Args:
+            key (str) name of the extra selections group.
+            extra_selections (list of sourcecode.api.TextDecoration).
+        """
+        self._set_draw_order(key, extra_selections)
+        self.decorations.add(extra_selections, key=key)
+        self.update()
+
+    def _set_draw_order(self, key, extra_selections):
+        """Assign the draw order and kind of key to extra selections."""
         # use draw orders to highlight current_cell and current_line first
         draw_order = DRAW_ORDERS.get(key)
         if draw_order is None:
@@ -204,9 +221,6 @@ def set_extra_selections(self, key, extra_selections):
             selection.draw_order = draw_order
             selection.kind = key
 
-        self.decorations.add_key(key, extra_selections)
-        self.update()
-
     def clear_extra_selections(self, key):
         """Remove decorations added through set_extra_selections.
 
@@ -534,6 +548,20 @@ def get_cell_list(self):
         # Reimplemented in childrens
         return []
 
+    def get_cell_header(self, block, forward=True):
+        """
+        Get the oedata of the closest cell header after or before block.
+
+        Returns None if there are no cell headers in that direction.
+        """
+        # Reimplemented in childrens
+        return next(
+            document_cells(
+                block, forward=forward, cell_list=self.get_cell_list()
+            ),
+            None
+        )
+
     def get_selection_as_executable_code(self, cursor=None):
         """
         Get selected text in a way that allows other plugins to execute it.
@@ -633,29 +661,26 @@ def select_current_cell(self, cursor=None):
                 self.current_cell = None
 
         block = cursor.block()
-        try:
-            if is_cell_header(block):
-                header = block.userData().oedata
-            else:
-                header = next(document_cells(
-                    block, forward=False,
-                    cell_list=self.get_cell_list()))
+        if is_cell_header(block):
+            header = block.userData().oedata
+        else:
+            header = self.get_cell_header(block, forward=False)
+
+        if header is not None:
             cell_start_pos = header.block.position()
             cell_at_file_start = False
             cursor.setPosition(cell_start_pos)
-        except StopIteration:
+        else:
             # This cell has no header, so it is the first cell.
             cell_at_file_start = True
             cursor.movePosition(QTextCursor.Start)
 
-        try:
-            footer = next(document_cells(
-                block, forward=True,
-                cell_list=self.get_cell_list()))
+        footer = self.get_cell_header(block, forward=True)
+        if footer is not None:
             cell_end_position = footer.block.position()
             cell_at_file_end = False
             cursor.setPosition(cell_end_position, QTextCursor.KeepAnchor)
-        except StopIteration:
+        else:
             # This cell has no next header, so it is the last cell.
             cell_at_file_end = True
             cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
@@ -707,13 +732,10 @@ def go_to_next_cell(self):
         """Go to the next cell of lines"""
         cursor = self.textCursor()
         block = cursor.block()
-        try:
-            footer = next(document_cells(
-                block, forward=True,
-                cell_list=self.get_cell_list()))
-            cursor.setPosition(footer.block.position())
-        except StopIteration:
+        footer = self.get_cell_header(block, forward=True)
+        if footer is None:
             return
+        cursor.setPosition(footer.block.position())
         self.setTextCursor(cursor)
 
     def go_to_previous_cell(self):
@@ -722,13 +744,10 @@ def go_to_previous_cell(self):
         block = cursor.block()
         if is_cell_header(block):
             block = block.previous()
-        try:
-            header = next(document_cells(
-                block, forward=False,
-                cell_list=self.get_cell_list()))
-            cursor.setPosition(header.block.position())
-        except StopIteration:
+        header = self.get_cell_header(block, forward=False)
+        if header is None:
             return
+        cursor.setPosition(header.block.position())
         self.setTextCursor(cursor)
 
     def get_line_count(self):
@@ -36,7 +36,7 @@
 from packaging.version import parse
 from qtpy import QT_VERSION
 from qtpy.QtCore import (
-    QEvent, QRegularExpression, Qt, QTimer, QUrl, Signal, Slot)
+    QEvent, Qt, QTimer, QUrl, Signal, Slot)
 from qtpy.QtGui import (
     QColor,
     QCursor,
@@ -50,7 +50,6 @@
     QTextCharFormat,
     QTextCursor,
     QTextLayout,
-    QTextDocument,
     QTextOption,
 )
 from qtpy.QtWidgets import (
@@ -79,8 +78,10 @@
     LineNumberArea, PanelsManager, ScrollFlagArea)
 from spyder.plugins.editor.utils.editor import (TextHelper, BlockUserData,
                                                 get_file_language)
+from spyder.plugins.editor.utils.flags import FlagsManager
 from spyder.plugins.editor.utils.kill_ring import QtKillRing
 from spyder.plugins.editor.utils.languages import ALL_LANGUAGES, CELL_LANGUAGES
+from spyder.plugins.editor.utils.occurrences import OccurrencesManager
 from spyder.plugins.editor.widgets.gotoline import GoToLineDialog
 from spyder.plugins.editor.widgets.base import TextEditBaseWidget
 from spyder.plugins.editor.widgets.codeeditor.inline_completions_mixin import (
@@ -93,8 +94,6 @@
 from spyder.plugins.editor.widgets.codeeditor.stack_mixin import (
     EditsStackMixin,
 )
-from spyder.plugins.outlineexplorer.api import (OutlineExplorerData as OED,
-                                                is_cell_header)
 from spyder.utils import encoding, sourcecode
 from spyder.utils.clipboard_helper import CLIPBOARD_HELPER
 from spyder.utils.icon_manager import ima
@@ -184,6 +183,15 @@ class CodeEditor(
     # the up/down arrow keys.
     UPDATE_DECORATIONS_TIMEOUT = 500  # milliseconds
 
+    # Files with more characters or lines than these are opened in large file
+    # mode, in which the most expensive features of the editor are turned off.
+    LARGE_FILE_SIZE = 10 * 1024 ** 2  # characters
+    LARGE_FILE_LINES = 100000
+
+    # Number of characters added to the document at a time when loading the
+    # text of a large file.
+    LOAD_CHUNK_SIZE = 128 * 1024  # characters
+
     # Custom signal to be emitted upon completion of the editor's paintEvent
     painted = Signal(QPaintEvent)
 
@@ -191,6 +199,9 @@ class CodeEditor(
     edge_line = None
     indent_guides = None
 
+    # To have this attr when the text is read by the edits stack on init
+    _pending_text = ''
+
     sig_filename_changed = Signal(str)
     sig_bookmarks_changed = Signal()
     go_to_definition = Signal(str, int, int)
@@ -237,6 +248,9 @@ class CodeEditor(
     #: Signal emitted when a new text is set on the widget
     new_text_set = Signal()
 
+    #: Signal emitted when large file mode is turned on or off
+    sig_large_file_changed = Signal(bool)
+
     # Used for testing. When the mouse moves with Ctrl/Cmd pressed and
     # a URI is found, this signal is emitted
     sig_uri_found = Signal(str)
@@ -431,7 +445,6 @@ def __init__(
 
         # Indicate occurrences of the selected word
         self.cursorPositionChanged.connect(self._cursor_position_changed)
-        self.__find_first_pos = None
         self.__find_args = {}
 
         self.language = None
@@ -445,8 +458,9 @@ def __init__(
 
         # Highlight using Pygments highlighter timer
         # ---------------------------------------------------------------------
-        # For files that use the PygmentsSH we parse the full file inside
-        # the highlighter in order to generate the correct coloring.
+        # For files that use a PygmentsSH with a lexer that can't be run
+        # incrementally, we parse the full file inside the highlighter in
+        # order to generate the correct coloring.
         self.timer_syntax_highlight = QTimer(self)
         self.timer_syntax_highlight.setSingleShot(True)
         self.timer_syntax_highlight.timeout.connect(
@@ -459,7 +473,19 @@ def __init__(
         self.occurrence_timer.setSingleShot(True)
         self.occurrence_timer.setInterval(1500)
         self.occurrence_timer.timeout.connect(self.mark_occurrences)
-        self.occurrences = []
+        self.occurrences_manager = OccurrencesManager(self)
+
+        # Lines flagged in the scroll flag area
+        self.flags_manager = FlagsManager(self)
+
+        # Large file mode
+        self.large_file = False
+        self._large_file_options = {}
+        self._load_position = 0
+        self._load_timer = QTimer(self)
+        self._load_timer.setSingleShot(True)
+        self._load_timer.setInterval(0)
+        self._load_timer.timeout.connect(self._load_chunk)
 
         # Update decorations
         self.update_decorations_timer = QTimer(self)
@@ -480,6 +506,7 @@ def __init__(
         # Mark found results
         self.textChanged.connect(self.__text_has_changed)
         self.found_results = []
+        self._found_results_range = None
 
         # Docstring
         self.writer_docstring = DocstringWriterExtension(self)
@@ -744,11 +771,18 @@ def get_document_id(self):
     def set_as_clone(self, editor):
         """Set as clone editor"""
         self.setDocument(editor.document())
+        self.flags_manager.set_document(self.document())
+        self.decorations.set_document(self.document())
         self.document_id = editor.get_document_id()
+        self.share_highlighter(editor)
+        self.eol_chars = editor.eol_chars
+        self.set_large_file(editor.large_file)
+
+    def share_highlighter(self, editor):
+        """Use the syntax highlighter of another editor."""
         self.highlighter = editor.highlighter
         self._rehighlight_timer.timeout.connect(
-            self.highlighter.rehighlight)
-        self.eol_chars = editor.eol_chars
+            self.highlighter.reformat)
         self._apply_highlighter_color_scheme()
         self.highlighter.sig_font_changed.connect(self.sync_font)
 
@@ -1094,12 +1128,20 @@ def toggle_format_on_save(self, state):
         self.format_on_save = state
 
     def toggle_code_folding(self, state):
+        if self.large_file:
+            self._large_file_options['code_folding'] = state
+            return
+
         self.code_folding = state
         self.set_folding_panel(state)
         if not state and self.indent_guides._enabled:
             self.code_folding = True
 
     def toggle_identation_guides(self, state):
+        if self.large_file:
+            self._large_file_options['indent_guides'] = state
+            return
+
         if state and not self.code_folding:
             self.code_folding = True
         self.indent_guides.set_enabled(state)
@@ -1144,6 +1186,10 @@ def set_auto_unindent_enabled(self, enable):
 
     def set_occurrence_highlighting(self, enable):
         """Enable/disable occurrence highlighting"""
+        if self.large_file:
+            self._large_file_options['occurrence_highlighting'] = enable
+            enable = False
+
         self.occurrence_highlighting = enable
         if not enable:
             self.clear_occurrences()
@@ -1213,6 +1259,11 @@ def set_language(self, language, filename=None):
                 if ext in extra_supported_languages:
                     self.language = extra_supported_languages[ext]
 
+        if self.large_file:
+            # Only a plain text highlighter is used for large files
+            self._large_file_options['highlighter_class'] = sh_class
+            sh_class = sh.TextSH
+
         self._set_highlighter(sh_class)
         self.completion_widget.set_language(self.language)
 
@@ -1231,7 +1282,7 @@ def _set_highlighter(self, sh_class):
         self.highlighter.editor = self
         self.highlighter.sig_font_changed.connect(self.sync_font)
         self._rehighlight_timer.timeout.connect(
-            self.highlighter.rehighlight)
+            self.highlighter.reformat)
 
     def set_mouse_shortcuts(self, shortcuts):
         """Apply mouse_shortcuts from CONF"""
@@ -1275,17 +1326,26 @@ def get_cell_list(self):
         """Get all cells."""
         if self.highlighter is None:
             return []
+        return self.highlighter.cell_index.get_cells()
 
-        # Filter out old cells
-        def good(oedata):
-            return oedata.is_valid() and oedata.def_type == oedata.CELL
+    def get_cell_header(self, block, forward=True):
+        """
+        Get the oedata of the closest cell header after or before block.
 
-        self.highlighter._cell_list = [
-            oedata for oedata in self.highlighter._cell_list if good(oedata)]
+        Returns None if there are no cell headers in that direction.
+        """
+        if self.highlighter is None or not block.isValid():
+            return None
+
+        cell_index = self.highlighter.cell_index
+        if forward:
+            line = cell_index.get_next_header(block.blockNumber())
+        else:
+            line = cell_index.get_previous_header(block.blockNumber())
 
-        return sorted(
-            {oedata.block.blockNumber(): oedata
-             for oedata in self.highlighter._cell_list}.items())
+        if line is None:
+            return None
+        return cell_index.get_oedata(line)
 
     def is_json(self):
         return (isinstance(self.highlighter, sh.PygmentsSH) and
@@ -1545,31 +1605,6 @@ def scroll_line_up(self):
         vsb = self.verticalScrollBar()
         vsb.setValue(vsb.value() - vsb.singleStep())
 
-    # ---- Find occurrences
-    # -------------------------------------------------------------------------
-    def __find_first(self, text):
-        """Find first occurrence: scan whole document"""
-        flags = QTextDocument.FindCaseSensitively|QTextDocument.FindWholeWords
-        cursor = self.textCursor()
-        # Scanning whole document
-        cursor.movePosition(QTextCursor.Start)
-        regexp = QRegularExpression(
-            r"\b%s\b" % QRegularExpression.escape(text)
-        )
-        cursor = self.document().find(regexp, cursor, flags)
-        self.__find_first_pos = cursor.position()
-        return cursor
-
-    def __find_next(self, text, cursor):
-        """Find next occurrence"""
-        flags = QTextDocument.FindCaseSensitively|QTextDocument.FindWholeWords
-        regexp = QRegularExpression(
-            r"\b%s\b" % QRegularExpression.escape(text)
-        )
-        cursor = self.document().find(regexp, cursor, flags)
-        if cursor.position() != self.__find_first_pos:
-            return cursor
-
     def _cursor_position_changed(self):
         """Cursor position has changed"""
         # Reject inline completions if there's any cursor change.
@@ -1594,9 +1629,14 @@ def _cursor_position_changed(self):
         # Strip if needed
         self.strip_trailing_spaces()
 
+    @property
+    def occurrences(self):
+        """Numbers of the lines with occurrences of the selected word."""
+        return self.occurrences_manager.lines
+
     def clear_occurrences(self):
         """Clear occurrence markers"""
-        self.occurrences = []
+        self.occurrences_manager.clear()
         self.clear_extra_selections('occurrences')
         self.sig_flags_changed.emit()
 
@@ -1658,35 +1698,7 @@ def mark_occurrences(self):
             return
 
         # Highlighting all occurrences of word *text*
-        cursor = self.__find_first(text)
-        self.occurrences = []
-        extra_selections = self.get_extra_selections('occurrences')
-        first_occurrence = None
-        while cursor:
-            block = cursor.block()
-            if not block.userData():
-                # Add user data to check block validity
-                block.setUserData(BlockUserData(self))
-            self.occurrences.append(block)
-
-            selection = self.get_selection(cursor)
-            if len(selection.cursor.selectedText()) > 0:
-                extra_selections.append(selection)
-                if len(extra_selections) == 1:
-                    first_occurrence = selection
-                else:
-                    selection.format.setBackground(self.occurrence_color)
-                    first_occurrence.format.setBackground(
-                        self.occurrence_color)
-            cursor = self.__find_next(text, cursor)
-        self.set_extra_selections('occurrences', extra_selections)
-
-        if len(self.occurrences) > 1 and self.occurrences[-1] == 0:
-            # XXX: this is never happening with PySide but it's necessary
-            # for PyQt4... this must be related to a different behavior for
-            # the QTextDocument.find function between those two libraries
-            self.occurrences.pop(-1)
-        self.sig_flags_changed.emit()
+        self.occurrences_manager.start(text)
 
     # ---- Highlight found results
     # -------------------------------------------------------------------------
@@ -1699,45 +1711,47 @@ def highlight_found_results(self, pattern, word=False, regexp=False,
             'regexp': regexp,
             'case': case,
         }
+        self.found_results = []
+        self._found_results_range = None
 
         pattern = str(pattern)
         if not pattern:
             return
-        if not regexp:
-            pattern = re.escape(str(pattern))
-        pattern = r"\b%s\b" % pattern if word else pattern
-        text = str(self.toPlainText())
-        re_flags = re.MULTILINE if case else re.IGNORECASE | re.MULTILINE
-        try:
-            regobj = re.compile(pattern, flags=re_flags)
-        except re.error:
+        index = self.get_match_index(pattern, case=case, regexp=regexp,
+                                     word=word)
+        if index is None:
             return
 
+        self.found_results = index.get_lines()
+        self.highlight_visible_found_results(index)
+
+    def highlight_visible_found_results(self, index=None):
+        """
+        Highlight found results in the visible region plus a buffer around it.
+
+        Results outside that region are only shown in the scroll flag area
+        and are highlighted when the editor is scrolled to them.
+        """
+        if index is None:
+            index = self.get_match_index(**self.__find_args)
+            if index is None:
+                return
+
+        first, last = self.get_buffer_block_numbers()
         extra_selections = []
-        self.found_results = []
-        has_unicode = len(text) != qstring_length(text)
-        for match in regobj.finditer(text):
-            if has_unicode:
-                pos1, pos2 = sh.get_span(match)
-            else:
-                pos1, pos2 = match.span()
+        for start, end in index.get_matches_in_range(first, last):
             selection = TextDecoration(self.textCursor())
             selection.format.setBackground(self.found_results_color)
-            selection.cursor.setPosition(pos1)
-
-            block = selection.cursor.block()
-            if not block.userData():
-                # Add user data to check block validity
-                block.setUserData(BlockUserData(self))
-            self.found_results.append(block)
-
-            selection.cursor.setPosition(pos2, QTextCursor.KeepAnchor)
+            selection.cursor.setPosition(start)
+            selection.cursor.setPosition(end, QTextCursor.KeepAnchor)
             extra_selections.append(selection)
         self.set_extra_selections('find', extra_selections)
+        self._found_results_range = (first, last)
 
     def clear_found_results(self):
         """Clear found results highlighting"""
         self.found_results = []
+        self._found_results_range = None
         self.clear_extra_selections('find')
         self.sig_flags_changed.emit()
 
@@ -1992,12 +2006,38 @@ def set_color_scheme(self, color_scheme):
 
     def set_text(self, text):
         """Set the text of the editor"""
-        self.setPlainText(text)
+        self._load_timer.stop()
+        self._pending_text = ''
+
+        large_file = self.is_large_text(text)
+        if large_file and not self.large_file:
+            # Remove the old text first so that the plain text highlighter
+            # doesn't go through it (which also marks the file as modified).
+            with self.suspend_undo_recording():
+                self.document().clear()
+
+        self.set_large_file(large_file)
+        if large_file:
+            # Show the beginning of the file right away and add the rest of
+            # it in chunks, so that the interface doesn't freeze.
+            end = self._get_chunk_end(text, 0)
+            self.setPlainText(text[:end])
+            self._pending_text = text
+            self._load_position = end
+            self._load_timer.start()
+        else:
+            self.setPlainText(text)
+
         self.set_eol_chars(text=text)
 
-        if (isinstance(self.highlighter, sh.PygmentsSH)
-                and not running_under_pytest()):
-            self.highlighter.make_charlist()
+        if self._pygments_lexes_document() and not running_under_pytest():
+            self.highlighter.lex_document()
+
+    def get_text_with_eol(self, linesep=None):
+        """Reimplemented to return the whole text of files being loaded."""
+        if self.is_loading():
+            self.finish_loading()
+        return super().get_text_with_eol(linesep)
 
     def set_text_from_file(self, filename, language=None):
         """Set the text of the editor from file *fname*"""
@@ -2224,6 +2264,108 @@ def redo(self):
             self.is_redoing = False
             self.skip_rstrip = False
 
+    # ---- Large files
+    # -------------------------------------------------------------------------
+    def is_large_text(self, text):
+        """Check if text is big enough to be shown in large file mode."""
+        return (
+            len(text) > self.LARGE_FILE_SIZE
+            or text.count('\n') >= self.LARGE_FILE_LINES
+        )
+
+    def set_large_file(self, state):
+        """
+        Turn large file mode on or off.
+
+        In large file mode a plain text highlighter is used, code folding,
+        indentation guides, occurrence highlighting and the scroll flag area
+        are turned off, and the file is not sent to language servers.
+        """
+        if state == self.large_file:
+            return
+
+        if state:
+            options = {
+                'highlighter_class': self.highlighter_class,
+                'code_folding': not self.folding_panel.isHidden(),
+                'indent_guides': self.indent_guides._enabled,
+                'occurrence_highlighting': self.occurrence_highlighting,
+                'scrollflagarea': self.scrollflagarea.enabled,
+            }
+
+            self.toggle_identation_guides(False)
+            self.toggle_code_folding(False)
+            self.set_occurrence_highlighting(False)
+            self.scrollflagarea.set_enabled(False)
+
+            # Cloned editors share the highlighter of the original one
+            if not self.is_cloned:
+                self._set_highlighter(sh.TextSH)
+
+            self._large_file_options = options
+            self.large_file = True
+        else:
+            options = self._large_file_options
+            self._large_file_options = {}
+            self.large_file = False
+
+            self.toggle_code_folding(options['code_folding'])
+            self.toggle_identation_guides(options['indent_guides'])
+            self.set_occurrence_highlighting(
+                options['occurrence_highlighting']
+            )
+            self.scrollflagarea.set_enabled(options['scrollflagarea'])
+
+            if not self.is_cloned:
+                # Removing the old highlighter marks the file as modified and
+                # the new one needs to be run right away to not do it later.
+                modified = self.document().isModified()
+                self._set_highlighter(options['highlighter_class'])
+                self.highlighter.rehighlight()
+                self.document().setModified(modified)
+
+            if self.completion_services_deferred:
+                self.start_completion_services()
+
+        self.sig_large_file_changed.emit(state)
+
+    def is_loading(self):
+        """Return True if the text of the file is still being loaded."""
+        return bool(self._pending_text)
+
+    def finish_loading(self):
+        """Add the text that's left to load to the document right away."""
+        while self._pending_text:
+            self._load_chunk()
+        self._load_timer.stop()
+
+    def _get_chunk_end(self, text, start):
+        """Get the end of the chunk of text to load that begins at start."""
+        # Chunks end after a newline to not split line terminators
+        end = text.find('\n', start + self.LOAD_CHUNK_SIZE) + 1
+        return end if end > 0 else len(text)
+
+    @Slot()
+    def _load_chunk(self):
+        """Add the next chunk of the text being loaded to the document."""
+        text = self._pending_text
+        start = self._load_position
+        end = self._get_chunk_end(text, start)
+
+        document = self.document()
+        modified = document.isModified()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.End)
+        with self.suspend_undo_recording():
+            cursor.insertText(text[start:end])
+        document.setModified(modified)
+
+        if end < len(text):
+            self._load_position = end
+            self._load_timer.start()
+        else:
+            self._pending_text = ''
+
     # ---- High-level editor features
     # -------------------------------------------------------------------------
     @Slot()
@@ -2309,6 +2451,15 @@ def update_decorations(self):
         if self.folding_supported and self.code_folding:
             self.highlight_folded_regions()
 
+        # Highlight occurrences and found results that were scrolled into
+        # view
+        self.occurrences_manager.update_visible_region()
+        if self._found_results_range is not None:
+            first, last = self.get_visible_block_numbers()
+            first_found, last_found = self._found_results_range
+            if first < first_found or last > last_found:
+                self.highlight_visible_found_results()
+
         # This is required to update decorations whether there are or not
         # underline errors in the visible portion of the screen.
         # See spyder-ide/spyder#14268.
@@ -2454,9 +2605,8 @@ def go_to_previous_warning(self):
 
     def cell_list(self):
         """Get the outline explorer data for all cells."""
-        for oedata in self.outlineexplorer_data_list():
-            if oedata.def_type == OED.CELL:
-                yield oedata
+        for __, oedata in self.get_cell_list():
+            yield oedata
 
     def get_cell_code(self, cell):
         """
@@ -2474,9 +2624,9 @@ def get_cell_code(self, cell):
             if cell == 0:
                 selected_block = self.document().firstBlock()
             else:
-                cell_list = list(self.cell_list())
+                cell_list = self.get_cell_list()
                 if cell <= len(cell_list):
-                    selected_block = cell_list[cell - 1].block
+                    selected_block = cell_list[cell - 1][1].block
 
         if not selected_block:
             raise RuntimeError("Cell {} not found.".format(repr(cell)))
@@ -2501,9 +2651,9 @@ def get_cell_code_and_position(self, cell):
             if cell == 0:
                 selected_block = self.document().firstBlock()
             else:
-                cell_list = list(self.cell_list())
+                cell_list = self.get_cell_list()
                 if cell <= len(cell_list):
-                    selected_block = cell_list[cell - 1].block
+                    selected_block = cell_list[cell - 1][1].block
 
         if not selected_block:
             raise RuntimeError("Cell {} not found.".format(repr(cell)))
@@ -2514,7 +2664,7 @@ def get_cell_code_and_position(self, cell):
 
     def get_cell_count(self):
         """Get number of cells in document."""
-        return 1 + len(list(self.cell_list()))
+        return 1 + len(self.get_cell_list())
 
     # ---- Tasks management
     # -------------------------------------------------------------------------
@@ -2524,22 +2674,23 @@ def show_todo(self, line_number, data):
         """
         self.show_tooltip(
             title=_("To do"),
-            text=data.todo,
+            text='<br>'.join(data.todo),
             at_line=line_number,
         )
 
+    def get_todo_results(self):
+        """Get the (message, line number) of the tasks in the document."""
+        if self.highlighter is None:
+            return []
+        return self.highlighter.get_todo_results()
+
     def process_todo(self, todo_results):
         """Process todo finder results"""
-        for data in self.blockuserdata_list():
-            data.todo = ''
-
-        for message, line_number in todo_results:
-            block = self.document().findBlockByNumber(line_number - 1)
-            data = block.userData()
-            if not data:
-                data = BlockUserData(self)
-            data.todo = message
-            block.setUserData(data)
+        # The messages of tasks are already set in the blocks' data by the
+        # highlighter, so we only need to update their flags.
+        self.flags_manager.set_lines(
+            'todo', [line_number - 1 for __, line_number in todo_results]
+        )
         self.sig_flags_changed.emit()
 
     # ---- Comments/Indentation
@@ -3594,8 +3745,9 @@ def keyReleaseEvent(self, event):
             self.update_decorations_timer.start()
 
         # This necessary to run our Pygments highlighter again after the
-        # user generated text changes
-        if event.text():
+        # user generated text changes (only for lexers that need to go over
+        # the whole document, the other ones are run as the text changes).
+        if event.text() and self._pygments_lexes_document():
             # Stop the active timer and start it again to not run it on
             # every event
             if self.timer_syntax_highlight.isActive():
@@ -3985,9 +4137,16 @@ def fix_and_strip_indent(self, *args, **kwargs):
         self.last_auto_indent = (cursor_before - nspaces_removed,
                                  cursor_after - nspaces_removed)
 
+    def _pygments_lexes_document(self):
+        """Check if the Pygments highlighter lexes the whole document."""
+        return (
+            isinstance(self.highlighter, sh.PygmentsSH)
+            and not self.highlighter.incremental
+        )
+
     def run_pygments_highlighter(self):
         """Run pygments highlighter."""
-        if isinstance(self.highlighter, sh.PygmentsSH):
+        if self._pygments_lexes_document():
             self.highlighter.rehighlight()
 
     def get_pattern_at(self, coordinates):
@@ -4640,8 +4799,18 @@ def _draw_editor_cell_divider(self):
             pen.setBrush(cell_line_color)
             painter.setPen(pen)
 
-            for top, line_number, block in self.visible_blocks:
-                if is_cell_header(block):
+            visible_blocks = self.visible_blocks
+            if not visible_blocks or self.highlighter is None:
+                return
+
+            # Line numbers in visible_blocks start at 1
+            headers = set(
+                self.highlighter.cell_index.get_lines_in_range(
+                    visible_blocks[0][1] - 1, visible_blocks[-1][1] - 1
+                )
+            )
+            for top, line_number, block in visible_blocks:
+                if line_number - 1 in headers:
                     painter.drawLine(0, top, self.width(), top)
 
     @property
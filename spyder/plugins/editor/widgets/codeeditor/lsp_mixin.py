@@ -206,6 +206,7 @@ def __init__(self):
         self.file_uri = None
         self.position_encoding = lsp.PositionEncodingKind.Utf16
         self.completions_available = False
+        self.completion_services_deferred = False
         self.save_include_text = True
         self.open_close_notifications = True
         self.sync_mode = lsp.TextDocumentSyncKind.Incremental
@@ -351,6 +352,18 @@ def manage_lsp_handle_errors(self, message):
     # -------------------------------------------------------------------------
     def start_completion_services(self):
         """Start completion services for this instance."""
+        if self.large_file:
+            # Large files are only sent to the server after users turn off
+            # large file mode for them.
+            self.completion_services_deferred = True
+            logger.debug(
+                "Completion services deferred for large file: {0}".format(
+                    self.filename
+                )
+            )
+            return
+
+        self.completion_services_deferred = False
         self.completions_available = True
 
         # Requests sent to a previous server instance will never be answered.
@@ -456,6 +469,7 @@ def register_completion_capabilities(
     def stop_completion_services(self):
         logger.debug("Stopping completion services for %s" % self.filename)
         self.completions_available = False
+        self.completion_services_deferred = False
 
         # Requests that were not answered before stopping the server won't be
         # answered at all.
@@ -678,6 +692,8 @@ def cleanup_code_analysis(self):
         self.clear_extra_selections("code_analysis_underline")
         for data in self.blockuserdata_list():
             data.code_analysis = []
+        self.flags_manager.set_lines('error', [])
+        self.flags_manager.set_lines('warning', [])
 
         self.setUpdatesEnabled(True)
         # When the new code analysis results are empty, it is necessary
@@ -743,6 +759,9 @@ def _process_code_analysis(self, underline):
         document = self.document()
         if underline:
             first_block, last_block = self.get_buffer_block_numbers()
+        else:
+            error_lines = set()
+            warning_lines = set()
 
         for diagnostic in self._diagnostics:
             message = diagnostic.message
@@ -807,6 +826,18 @@ def _process_code_analysis(self, underline):
                     )
                 block.setUserData(data)
 
+                if severity == lsp.DiagnosticSeverity.Error:
+                    error_lines.add(start_pos.line)
+                else:
+                    warning_lines.add(start_pos.line)
+
+        if not underline:
+            # Lines with errors are only flagged as such
+            self.flags_manager.set_lines('error', error_lines)
+            self.flags_manager.set_lines(
+                'warning', warning_lines - error_lines
+            )
+
     # ---- Completion
     # -------------------------------------------------------------------------
     @schedule_request(
@@ -22,6 +22,7 @@
 from spyder.plugins.preferences.tests.conftest import config_dialog  # noqa
 from spyder.plugins.shortcuts.plugin import Shortcuts
 from spyder.utils import sourcecode
+from spyder.utils import syntaxhighlighters as sh
 from spyder.widgets.mixins import TIP_PARAMETER_HIGHLIGHT_COLOR
 
 
@@ -731,6 +732,169 @@ def test_cell_highlight(codeeditor, qtbot):
     assert editor.current_cell[0].selectionEnd() == 8
 
 
+def test_cell_index(codeeditor):
+    """Test the index of cells is kept in sync while editing."""
+    editor = codeeditor
+    editor.set_text('x = 1\n#%% a\ny = 2\n#%% b\nz = 3\n')
+    cell_index = editor.highlighter.cell_index
+    assert cell_index.get_lines() == [1, 3]
+    assert cell_index.get_header(0) is None
+    assert cell_index.get_header(2) == 1
+    assert cell_index.get_header(3) == 3
+    assert cell_index.get_next_header(1) == 3
+    assert cell_index.get_previous_header(3) == 1
+    assert [oedata.def_name for __, oedata in editor.get_cell_list()] == [
+        'a', 'b']
+
+    # Add lines before the cells
+    cursor = editor.textCursor()
+    cursor.setPosition(0)
+    cursor.insertText('\n\n')
+    assert cell_index.get_lines() == [3, 5]
+
+    # Split a cell header
+    cursor.setPosition(editor.document().findBlockByNumber(3).position())
+    cursor.insertText('\n')
+    assert cell_index.get_lines() == [4, 6]
+
+    # Remove lines with a cell header
+    cursor.setPosition(editor.document().findBlockByNumber(2).position())
+    cursor.setPosition(
+        editor.document().findBlockByNumber(5).position(),
+        QTextCursor.KeepAnchor
+    )
+    cursor.removeSelectedText()
+    assert cell_index.get_lines() == [3]
+    assert editor.get_cell_count() == 2
+
+    # Turn a comment into a cell header and back
+    cursor.setPosition(0)
+    cursor.insertText('# %% c')
+    assert cell_index.get_lines() == [0, 3]
+    cursor.setPosition(0, QTextCursor.KeepAnchor)
+    cursor.removeSelectedText()
+    assert cell_index.get_lines() == [3]
+
+    # Replace the whole text
+    editor.set_text('#%%\n' * 3)
+    assert cell_index.get_lines() == [0, 1, 2]
+
+
+def test_cell_navigation_many_cells(codeeditor, monkeypatch):
+    """
+    Test cell lookups don't go through all cells of a file.
+
+    This uses a notebook-style file with 2000 cells.
+    """
+    editor = codeeditor
+    ncells = 2000
+    editor.set_text(
+        ''.join('# %% Cell {0}\nx = {0}\n\n'.format(i) for i in range(ncells))
+    )
+    assert editor.get_cell_count() == ncells + 1
+
+    # Count how many cell headers are looked up in the document
+    cell_index = editor.highlighter.cell_index
+    get_oedata = cell_index.get_oedata
+    lookups = []
+
+    def counted_get_oedata(line):
+        lookups.append(line)
+        return get_oedata(line)
+
+    monkeypatch.setattr(cell_index, 'get_oedata', counted_get_oedata)
+
+    document = editor.document()
+    max_lookups = 0
+    for i in range(ncells):
+        lookups.clear()
+        block = document.findBlockByNumber(3 * i + 1)
+        header = editor.get_cell_header(block, forward=False)
+        footer = editor.get_cell_header(block, forward=True)
+        editor.current_cell = None
+        cursor, __ = editor.select_current_cell(QTextCursor(block))
+        max_lookups = max(max_lookups, len(lookups))
+
+    # Each navigation only looks up the headers around the block, instead of
+    # going through all cells
+    assert max_lookups <= 4
+
+    assert header.def_name == 'Cell 1999'
+    assert footer is None
+    assert cursor.selectionStart() == header.block.position()
+    assert cursor.selectionEnd() == len(editor.toPlainText())
+    assert editor.get_cell_code(ncells).strip() == 'x = 1999'
+
+
+def test_large_file_mode(codeeditor, qtbot):
+    """Test expensive features are turned off for large files."""
+    editor = codeeditor
+    editor.LARGE_FILE_LINES = 1000
+    editor.LOAD_CHUNK_SIZE = 1000
+    editor.toggle_identation_guides(True)
+    editor.start_completion_services()
+    assert editor.completions_available
+
+    # Small files are opened as usual
+    editor.set_text('x = 1\n' * 999)
+    assert not editor.large_file
+    assert not editor.is_loading()
+    editor.stop_completion_services()
+
+    # Large files are loaded in chunks with a plain text highlighter and
+    # without the expensive features
+    text = 'x = 1\n' * 5000
+    with qtbot.waitSignal(editor.sig_large_file_changed) as blocker:
+        editor.set_text(text)
+        editor.document().setModified(False)
+    assert blocker.args == [True]
+    assert editor.large_file
+    assert editor.is_loading()
+    assert len(editor.toPlainText()) < len(text)
+    assert isinstance(editor.highlighter, sh.TextSH)
+    assert not editor.occurrence_highlighting
+    assert not editor.scrollflagarea.enabled
+    assert not editor.indent_guides._enabled
+    assert editor.folding_panel.isHidden()
+
+    qtbot.waitUntil(lambda: not editor.is_loading())
+    assert editor.toPlainText() == text
+    assert not editor.document().isModified()
+    assert editor.blockCount() == 5001
+
+    # Loading chunks is not undoable
+    editor.undo()
+    assert editor.toPlainText() == text
+
+    # Files are not sent to the server in large file mode
+    editor.start_completion_services()
+    assert not editor.completions_available
+    assert editor.completion_services_deferred
+
+    # Changing options doesn't turn features back on
+    editor.set_occurrence_highlighting(True)
+    assert not editor.occurrence_highlighting
+
+    # Saving doesn't wait for the text to be loaded
+    editor.set_text(text)
+    assert editor.is_loading()
+    assert editor.get_text_with_eol() == text
+    assert not editor.is_loading()
+
+    # Turning large file mode off restores everything
+    editor.document().setModified(False)
+    editor.set_large_file(False)
+    qtbot.wait(10)
+    assert not editor.document().isModified()
+    assert isinstance(editor.highlighter, sh.PythonSH)
+    assert editor.occurrence_highlighting
+    assert editor.scrollflagarea.enabled
+    assert editor.indent_guides._enabled
+    assert not editor.folding_panel.isHidden()
+    assert editor.completions_available
+    assert not editor.completion_services_deferred
+
+
 @pytest.mark.parametrize(
     'config_dialog',
     # [[MainWindowMock, [ConfigPlugins], [Plugins]]]
@@ -20,6 +20,9 @@
 
 # Local imports
 from spyder.config.base import running_in_ci
+from spyder.plugins.editor.api.decoration import TextDecoration
+from spyder.plugins.editor.utils.decoration import MAX_INDEX_SHIFT
+from spyder.plugins.editor.utils import occurrences
 from spyder.plugins.editor.widgets.codeeditor import CodeEditor
 
 
@@ -57,7 +60,9 @@ def test_decorations(codeeditor, qtbot):
 
     # Assert number of decorations is the one we expect.
     qtbot.wait(3000)
-    decorations = editor.decorations._sorted_decorations()
+    decorations = editor.decorations.get_decorations_in_range(
+        0, editor.blockCount() - 1
+    )
 
     assert len(decorations) == 2 + text.count('some_variable')
 
@@ -82,7 +87,9 @@ def test_decorations(codeeditor, qtbot):
     # Clear decorations to be sure they are painted again below.
     editor.decorations.clear()
     editor.decorations._update()
-    assert editor.decorations._sorted_decorations() == []
+    assert editor.decorations.get_decorations_in_range(
+        0, editor.blockCount() - 1
+    ) == []
 
     # Move to a random place in the file and wait until decorations are
     # updated.
@@ -91,10 +98,114 @@ def test_decorations(codeeditor, qtbot):
     qtbot.wait(editor.UPDATE_DECORATIONS_TIMEOUT + 100)
 
     # Assert a new cell is painted
-    decorations = editor.decorations._sorted_decorations()
+    decorations = editor.decorations.get_decorations_in_range(
+        0, editor.blockCount() - 1
+    )
     assert decorations[0].kind == 'current_cell'
 
 
+def test_decorations_index(codeeditor):
+    """Test that decorations are looked up by the blocks they span."""
+    editor = codeeditor
+    editor.set_text('x = 1\n' * 1000)
+    manager = editor.decorations
+    manager.clear()
+
+    decorations = []
+    for line in range(0, 1000, 10):
+        position = editor.document().findBlockByNumber(line).position()
+        decorations.append(
+            TextDecoration(
+                editor.document(), start_pos=position, end_pos=position + 5
+            )
+        )
+    assert manager.add(decorations, key='test') == len(decorations)
+
+    # Only decorations in the range are returned
+    in_range = manager.get_decorations_in_range(100, 149)
+    assert set(in_range) == set(decorations[10:15])
+
+    # Decorations are found after replacing lines by the same number of them
+    cursor = editor.textCursor()
+    cursor.setPosition(editor.document().findBlockByNumber(5).position())
+    cursor.setPosition(
+        editor.document().findBlockByNumber(15).position(),
+        QTextCursor.KeepAnchor
+    )
+    cursor.insertText('y = 2\n' * 10)
+    line = editor.document().findBlock(
+        decorations[1].cursor.selectionStart()
+    ).blockNumber()
+    assert line != 10
+    assert manager.get_decorations_in_range(line, line) == [decorations[1]]
+
+    # Decorations are still found after adding lines before them
+    cursor.movePosition(QTextCursor.Start)
+    cursor.insertText('\n' * 5)
+    in_range = manager.get_decorations_in_range(105, 154)
+    assert set(in_range) == set(decorations[10:15])
+
+    # And after adding enough lines to rebuild the index
+    cursor.insertText('\n' * (MAX_INDEX_SHIFT + 1))
+    assert manager._index_outdated
+    offset = MAX_INDEX_SHIFT + 6
+    in_range = manager.get_decorations_in_range(100 + offset, 149 + offset)
+    assert set(in_range) == set(decorations[10:15])
+    assert not manager._index_outdated
+
+    # Removing decorations removes them from the index
+    assert manager.remove(decorations[10], key='test')
+    assert not manager.remove(decorations[10], key='test')
+    in_range = manager.get_decorations_in_range(100 + offset, 149 + offset)
+    assert decorations[10] not in in_range
+    assert len(manager.get('test')) == len(decorations) - 1
+
+    manager.remove_key('test')
+    in_range = manager.get_decorations_in_range(0, editor.blockCount())
+    assert not set(in_range) & set(decorations)
+
+
+def test_occurrences(codeeditor, qtbot, monkeypatch):
+    """
+    Test that occurrences are highlighted around the visible region first and
+    that the number of decorations for them is limited.
+    """
+    monkeypatch.setattr(occurrences, 'MAX_DECORATIONS', 100)
+    editor = codeeditor
+    editor.set_text('foo = foo + 1\n' * 2000)
+    manager = editor.occurrences_manager
+
+    # Only the occurrences around the visible region are found right away
+    editor.go_to_line(1)
+    editor.mark_occurrences()
+    assert manager.is_searching()
+    assert editor.occurrences == []
+    first, last = editor.get_buffer_block_numbers()
+    assert manager.count == 2 * (last - first + 1)
+
+    # The rest of the document is searched afterwards
+    qtbot.waitUntil(lambda: not manager.is_searching())
+    assert manager.count == 4000
+    assert editor.occurrences == list(range(2000))
+
+    # Only occurrences around the visible region are highlighted because
+    # there are too many of them.
+    decorations = editor.decorations.get('occurrences')
+    assert len(decorations) == 2 * (last - first + 1)
+
+    # Occurrences are highlighted when scrolling to them
+    editor.go_to_line(1990)
+    editor.update_decorations()
+    decorations = editor.decorations.get('occurrences')
+    lines = {d.cursor.block().blockNumber() for d in decorations}
+    assert 1989 in lines
+    assert 0 not in lines
+
+    editor.clear_occurrences()
+    assert editor.occurrences == []
+    assert editor.decorations.get('occurrences', []) == []
+
+
 @flaky(max_runs=10)
 @pytest.mark.skipif(
     QT_VERSION.startswith("6"),
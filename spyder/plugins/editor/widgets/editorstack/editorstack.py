@@ -113,6 +113,7 @@ class EditorStack(SpyderWidgetMixin, QWidget):
     reset_statusbar = Signal()
     readonly_changed = Signal(bool)
     encoding_changed = Signal(str)
+    large_file_changed = Signal(bool)
     sig_editor_cursor_position_changed = Signal(int, int)
     sig_refresh_eol_chars = Signal(str)
     starting_long_process = Signal(str)
@@ -2428,6 +2429,7 @@ def __refresh_statusbar(self, index):
         if self.data and len(self.data) > index:
             finfo = self.data[index]
             self.encoding_changed.emit(finfo.encoding)
+            self.large_file_changed.emit(finfo.editor.large_file)
             # Refresh cursor position status:
             line, index = finfo.editor.get_cursor_line_column()
             self.sig_editor_cursor_position_changed.emit(line, index)
@@ -2621,6 +2623,12 @@ def modification_changed(self, state=None, index=None, editor_id=None):
         self.refresh_eol_chars(eol_chars)
         self.stack_history.refresh()
 
+    def refresh_large_file(self, state, editor_id):
+        """Report large file mode changes of the current editor."""
+        editor = self.get_current_editor()
+        if editor is not None and id(editor) == editor_id:
+            self.large_file_changed.emit(state)
+
     def refresh_eol_chars(self, eol_chars):
         os_name = sourcecode.get_os_name_from_eol_chars(eol_chars)
         self.sig_refresh_eol_chars.emit(os_name)
@@ -2792,6 +2800,9 @@ def create_new_editor(
         editor.zoom_reset.connect(self.zoom_reset)
         editor.sig_eol_chars_changed.connect(
             lambda eol_chars: self.refresh_eol_chars(eol_chars))
+        editor.sig_large_file_changed.connect(
+            lambda state: self.refresh_large_file(state, editor_id=id(editor))
+        )
         editor.sig_next_cursor.connect(self.sig_next_cursor)
         editor.sig_prev_cursor.connect(self.sig_prev_cursor)
 
@@ -14,9 +14,6 @@
 from qtpy.QtCore import Signal, QFileInfo, QObject, QTimer, QThread
 from qtpy.QtWidgets import QApplication
 
-# Local imports
-from spyder.plugins.editor.utils.findtasks import find_tasks
-
 
 if TYPE_CHECKING:
     from spyder.plugins.editor.widgets.codeeditor import CodeEditor
@@ -188,16 +185,10 @@ def get_source_code(self):
         return str(self.editor.toPlainText())
 
     def run_todo_finder(self):
-        """Run TODO finder."""
+        """Update TODO results with the tasks found by the highlighter."""
         if self.editor.is_python_or_ipython():
-            self.threadmanager.add_thread(find_tasks,
-                                          self.todo_finished,
-                                          self.get_source_code(), self)
-
-    def todo_finished(self, results):
-        """Code analysis thread has finished."""
-        self.set_todo_results(results)
-        self.todo_results_changed.emit()
+            self.set_todo_results(self.editor.get_todo_results())
+            self.todo_results_changed.emit()
 
     def set_todo_results(self, results):
         """Set TODO results and update markers in editor."""
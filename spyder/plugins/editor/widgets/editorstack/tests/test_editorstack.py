@@ -851,7 +851,7 @@ def test_maybe_autosave_does_not_save_after_open(base_editor_bot, mocker,
                  return_value=('spam\n', 42))
     editor_stack.load(filename)
     mocker.patch.object(editor_stack, '_write_to_file')
-    qtbot.wait(100)  # Wait for PygmentsSH.makeCharlist() if applicable
+    qtbot.wait(100)  # Wait for PygmentsSH.lex_document() if applicable
     editor_stack.autosave.maybe_autosave(0)
     editor_stack._write_to_file.assert_not_called()
 
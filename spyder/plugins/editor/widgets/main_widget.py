@@ -63,6 +63,7 @@
                                                    update_bookmarks)
 from spyder.plugins.editor.widgets.status import (CursorPositionStatus,
                                                   EncodingStatus, EOLStatus,
+                                                  LargeFileStatus,
                                                   ReadWriteStatus, VCSStatus)
 from spyder.plugins.run.api import (
     RunContext, RunConfigurationMetadata, RunConfiguration,
@@ -291,6 +292,7 @@ def __init__(self, name, plugin, parent, ignore_last_opened_files=False):
         self.encoding_status: EncodingStatus | None = None
         self.cursorpos_status: CursorPositionStatus| None = None
         self.vcs_status: VCSStatus | None = None
+        self.large_file_status: LargeFileStatus | None = None
 
         self.last_edit_cursor_pos = None
         self.cursor_undo_history = []
@@ -1328,6 +1330,12 @@ def register_status_widgets(self, editorstack: EditorStack | None = None):
             )
             editorstack.file_saved.connect(self.vcs_status.update_vcs_state)
 
+        if self.large_file_status is not None:
+            editorstack.reset_statusbar.connect(self.large_file_status.hide)
+            editorstack.large_file_changed.connect(
+                self.large_file_status.update_large_file
+            )
+
     def register_editorstack(self, editorstack):
         logger.debug("Registering new EditorStack")
         self.editorstacks.append(editorstack)
@@ -1610,6 +1618,28 @@ def get_current_editor(self):
         if editorstack is not None:
             return editorstack.get_current_editor()
 
+    def turn_off_large_file_mode(self, editorwindow=None):
+        """Turn on all editor features for the current file."""
+        editorstack = self.get_current_editorstack(editorwindow)
+        if editorstack is None or not editorstack.data:
+            return
+
+        filename = editorstack.get_current_filename()
+        editors = [
+            finfo.editor
+            for stack in self.editorstacks
+            for finfo in stack.data
+            if finfo.filename == filename
+        ]
+
+        # The original editor needs to go first because it's the one that
+        # changes the highlighter its clones use.
+        editors.sort(key=lambda editor: editor.is_cloned)
+        for editor in editors:
+            editor.set_large_file(False)
+            if editor.is_cloned:
+                editor.share_highlighter(editors[0])
+
     def get_current_finfo(self):
         editorstack = self.get_current_editorstack()
         if editorstack is not None:
@@ -59,6 +59,24 @@ def get_tooltip(self):
         return _("Encoding")
 
 
+class LargeFileStatus(StatusBarWidget):
+    """Status bar widget to show that large file mode is on."""
+    ID = "large_file_status"
+    INTERACT_ON_CLICK = True
+
+    def update_large_file(self, large_file):
+        """Show the widget only for files in large file mode."""
+        self.set_value(_("Large file"))
+        self.setVisible(large_file)
+
+    def get_tooltip(self):
+        """Return localized tool tip for widget."""
+        return _(
+            "Some features are turned off for this file because it's very "
+            "large. Click to turn them on."
+        )
+
+
 class CursorPositionStatus(StatusBarWidget):
     """Status bar widget for the current file cursor position."""
     ID = "cursor_position_status"
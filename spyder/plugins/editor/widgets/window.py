@@ -38,6 +38,7 @@
 from spyder.plugins.editor.widgets.splitter import EditorSplitter
 from spyder.plugins.editor.widgets.status import (CursorPositionStatus,
                                                   EncodingStatus, EOLStatus,
+                                                  LargeFileStatus,
                                                   ReadWriteStatus, VCSStatus)
 from spyder.plugins.mainmenu.api import (
     ApplicationMenu,
@@ -139,8 +140,16 @@ def __init__(self, parent, main_widget, menu_actions, outline_plugin):
 
             self.vcs_status = VCSStatus(self)
             statusbar.insertPermanentWidget(0, self.vcs_status)
+
+            self.large_file_status = LargeFileStatus(self)
+            self.large_file_status.hide()
+            self.large_file_status.sig_clicked.connect(
+                lambda: main_widget.turn_off_large_file_mode(parent)
+            )
+            statusbar.insertPermanentWidget(0, self.large_file_status)
         else:
             statusbar.hide()
+            self.large_file_status = None
             self.vcs_status = None
             self.cursorpos_status = None
             self.encoding_status = None
@@ -277,6 +286,12 @@ def register_editorstack(self, editorstack):
             )
             editorstack.file_saved.connect(self.vcs_status.update_vcs_state)
 
+        if self.large_file_status is not None:
+            editorstack.reset_statusbar.connect(self.large_file_status.hide)
+            editorstack.large_file_changed.connect(
+                self.large_file_status.update_large_file
+            )
+
         # Register stack
         self.main_widget.register_editorstack(editorstack)
 
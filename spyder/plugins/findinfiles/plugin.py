@@ -17,6 +17,8 @@
     on_plugin_available, on_plugin_teardown)
 from spyder.api.translations import _
 from spyder.plugins.findinfiles.widgets.main_widget import FindInFilesWidget
+from spyder.plugins.findinfiles.widgets.search_thread import (
+    shutdown_search_pool)
 from spyder.plugins.mainmenu.api import ApplicationMenus, SearchMenuSections
 from spyder.utils.misc import getcwd_or_home
 
@@ -82,6 +84,7 @@ def on_projects_available(self):
         projects = self.get_plugin(Plugins.Projects)
         projects.sig_project_loaded.connect(self.set_project_path)
         projects.sig_project_closed.connect(self.unset_project_path)
+        projects.sig_search_index_changed.connect(self.set_search_index)
 
     @on_plugin_available(plugin=Plugins.MainMenu)
     def on_main_menu_available(self):
@@ -114,6 +117,7 @@ def on_projects_teardon_plugin_teardown(self):
         projects = self.get_plugin(Plugins.Projects)
         projects.sig_project_loaded.disconnect(self.set_project_path)
         projects.sig_project_closed.disconnect(self.unset_project_path)
+        projects.sig_search_index_changed.disconnect(self.set_search_index)
 
     @on_plugin_teardown(plugin=Plugins.MainMenu)
     def on_main_menu_teardown(self):
@@ -135,6 +139,7 @@ def on_close(self, cancelable=False):
         self.get_widget()._update_options()
         if self.get_widget().running:
             self.get_widget()._stop_and_reset_thread(ignore_results=True)
+        shutdown_search_pool()
         return True
 
     # --- Public API
@@ -167,6 +172,17 @@ def set_project_path(self, path):
         """
         self.get_widget().set_project_path(path)
 
+    def set_search_index(self, index):
+        """
+        Set the index used to search in the current project.
+
+        Parameters
+        ----------
+        index: spyder.plugins.projects.utils.search_index.TrigramIndex
+            Index of the project files, or None if there's no index.
+        """
+        self.get_widget().set_search_index(index)
+
     def set_max_results(self, value=None):
         """
         Set maximum amount of results to add to the result browser.
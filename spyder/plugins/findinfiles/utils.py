@@ -0,0 +1,383 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Utils to search text in files.
+
+These don't depend on Qt so that they can be run in worker processes.
+"""
+
+# Standard library imports
+import io
+import mmap
+import os
+import os.path as osp
+import re
+import stat
+
+# Local imports
+from spyder.api.translations import _
+from spyder.config.utils import EDIT_EXTENSIONS
+from spyder.utils.filewalk import is_text_file_cached, walk_files
+
+
+PYTHON_EXTENSIONS = ['.py', '.pyw', '.pyx', '.ipy', '.pyi', '.pyt']
+
+USEFUL_EXTENSIONS = [
+    '.ipynb', '.md',  '.c', '.cpp', '.h', '.cxx', '.f', '.f03', '.f90',
+    '.json', '.dat', '.csv', '.tsv', '.txt', '.md', '.rst', '.yml',
+    '.yaml', '.ini', '.bat', '.sh', '.ui'
+]
+
+SKIPPED_EXTENSIONS = ['.svg']
+
+# Number of lines searched between checks for cancellation
+LINES_PER_STOP_CHECK = 1024
+
+# Size of the parts of files that are searched at once
+SEARCH_CHUNK_SIZE = 16 * 1024 ** 2
+
+# When this number of hits is found less than DENSE_HITS_DISTANCE bytes
+# apart, the following DENSE_BLOCK_SIZE bytes are searched line by line
+# because that's faster than looking for hits first
+DENSE_HITS = 8
+DENSE_HITS_DISTANCE = 256
+DENSE_BLOCK_SIZE = 64 * 1024
+
+# Syntax of regular expressions that can match differently in a line than in
+# a whole file (e.g. lookarounds can check the text of other lines). Files are
+# searched line by line for them.
+LINE_ONLY_RE_SYNTAX = [b'\\A', b'\\Z', b'(?<', b'(?!', b'(?=']
+
+# Event set to stop the searches of a worker process
+_stop_event = None
+
+
+def iter_search_files(path, exclude=None, is_stopped=None,
+                      use_ignore_files=True):
+    """
+    Iterate over the files to search in path.
+
+    Parameters
+    ----------
+    path: str
+        Directory to walk.
+    exclude: re.Pattern, optional
+        Pattern of the directories and files to skip.
+    is_stopped: callable, optional
+        Function to check if the iteration was stopped.
+    use_ignore_files: bool, optional
+        Whether to skip the files ignored by `.gitignore` and `.ignore`
+        files.
+    """
+    for filename in walk_files(
+        path,
+        exclude=exclude,
+        is_stopped=is_stopped,
+        use_ignore_files=use_ignore_files
+    ):
+        if is_searchable_file(filename):
+            yield filename
+
+
+def is_searchable_file(filename):
+    """Check if filename is a regular, plain text file."""
+    # Only search in regular files (i.e. not pipes).
+    # The try/except is necessary to catch an error when Python can't get
+    # the file status due to too many levels of symbolic links.
+    # Fixes spyder-ide/spyder#20798
+    try:
+        st = os.stat(filename)
+        if not stat.S_ISREG(st.st_mode):
+            return False
+    except OSError:
+        return False
+
+    # Don't search in plain text files with skipped extensions (e.g .svg)
+    ext = osp.splitext(filename)[1]
+    if ext in SKIPPED_EXTENSIONS:
+        return False
+
+    # It's much faster to check for extension first before validating if
+    # the file is plain text.
+    return (
+        ext in PYTHON_EXTENSIONS
+        or ext in USEFUL_EXTENSIONS
+        or ext in EDIT_EXTENSIONS
+        or is_text_file_cached(filename, st)
+    )
+
+
+def iter_lines_with_hits(buffer, texts, text_re, case_sensitive,
+                         is_stopped=None):
+    """
+    Iterate over the lines of buffer where texts can be found.
+
+    Texts are searched in big chunks of buffer instead of line by line, and
+    lines are only split around the hits.
+
+    Yields
+    ------
+    lineno: int
+        Line number, starting at 0.
+    line: bytes
+        Line, including its line break.
+    """
+    if text_re:
+        # Make ^ and $ match at line breaks, as they do when searching line
+        # by line
+        patterns = [
+            re.compile(text.pattern, text.flags | re.MULTILINE)
+            for text, __ in texts
+        ]
+    else:
+        patterns = [text for text, __ in texts]
+
+    def find(chunk, pattern, pos):
+        if text_re:
+            match = pattern.search(chunk, pos)
+            return False if match is None else match.span()
+        else:
+            start = chunk.find(pattern, pos)
+            return False if start < 0 else (start, start + len(pattern))
+
+    size = len(buffer)
+    chunk_start = 0
+    lineno = 0
+    while chunk_start < size:
+        if is_stopped is not None and is_stopped():
+            return
+
+        # Chunks end at line breaks so that lines are not split
+        chunk_end = chunk_start + SEARCH_CHUNK_SIZE
+        if chunk_end < size:
+            chunk_end = buffer.rfind(b'\n', chunk_start, chunk_end) + 1
+            if chunk_end <= chunk_start:
+                chunk_end = buffer.find(b'\n', chunk_start) + 1 or size
+        else:
+            chunk_end = size
+
+        chunk = buffer[chunk_start:chunk_end]
+        chunk_search = chunk if case_sensitive else chunk.lower()
+
+        # Position of the first line that was not checked yet and next hit
+        # of each pattern after it
+        pos = 0
+        hits = [None] * len(patterns)
+        consecutive_hits = 0
+        while True:
+            # When there are hits in most lines, it's faster to go through
+            # the next ones than to look for them
+            if consecutive_hits >= DENSE_HITS:
+                block_end = chunk.rfind(b'\n', pos, pos + DENSE_BLOCK_SIZE)
+                if block_end >= pos:
+                    for line in io.BytesIO(chunk[pos:block_end + 1]):
+                        yield lineno, line
+                        lineno += 1
+                    pos = block_end + 1
+                consecutive_hits = 0
+
+            hit = None
+            for i, pattern in enumerate(patterns):
+                if hits[i] is None or (hits[i] and hits[i][0] < pos):
+                    hits[i] = find(chunk_search, pattern, pos)
+                if hits[i] and (hit is None or hits[i] < hit):
+                    hit = hits[i]
+
+            if hit is None:
+                break
+
+            # Get the lines where the hit is
+            start, end = hit
+            line_start = chunk.rfind(b'\n', pos, start) + 1 or pos
+            line_end = (
+                chunk.find(b'\n', max(start, end - 1)) + 1 or len(chunk)
+            )
+            if line_start >= line_end:
+                break
+
+            if line_start - pos < DENSE_HITS_DISTANCE:
+                consecutive_hits += 1
+            else:
+                consecutive_hits = 0
+            lineno += chunk.count(b'\n', pos, line_start)
+
+            while line_start < line_end:
+                next_start = (
+                    chunk.find(b'\n', line_start, line_end) + 1 or line_end
+                )
+                yield lineno, chunk[line_start:next_start]
+                lineno += 1
+                line_start = next_start
+
+            pos = line_end
+
+        lineno += chunk.count(b'\n', pos)
+        chunk_start = chunk_end
+
+
+def search_in_file(fname, texts, text_re, case_sensitive, is_stopped=None):
+    """
+    Search texts in a file.
+
+    Parameters
+    ----------
+    fname: str
+        Path of the file.
+    texts: list
+        List of (text, encoding) tuples to search for, where text is an
+        encoded string or a compiled regular expression.
+    text_re: bool
+        Whether texts are regular expressions.
+    case_sensitive: bool
+        Whether the search is case sensitive. If it's not, texts must be
+        lower case.
+    is_stopped: callable, optional
+        Function to check if the search was stopped.
+
+    Returns
+    -------
+    results: list
+        List of (filename, line number, start column, end column, line)
+        tuples for each match.
+    error: str or None
+        Error found while reading the file.
+    """
+    results = []
+    fname = osp.abspath(fname)
+    try:
+        with open(fname, 'rb') as f:
+            # Search the whole file at once when the texts can't match
+            # differently than in single lines
+            buffer = None
+            if not text_re or not any(
+                syntax in text.pattern
+                for text, __ in texts
+                for syntax in LINE_ONLY_RE_SYNTAX
+            ):
+                try:
+                    buffer = mmap.mmap(
+                        f.fileno(), 0, access=mmap.ACCESS_READ
+                    )
+                except (ValueError, OSError):
+                    # Empty files and files that can't be mapped
+                    pass
+
+            if buffer is None:
+                lines = enumerate(f)
+            else:
+                lines = iter_lines_with_hits(
+                    buffer, texts, text_re, case_sensitive, is_stopped
+                )
+
+            try:
+                for i, (lineno, line) in enumerate(lines):
+                    if (
+                        is_stopped is not None
+                        and i % LINES_PER_STOP_CHECK == 0
+                        and is_stopped()
+                    ):
+                        break
+
+                    for text, enc in texts:
+                        line_search = line
+                        if not case_sensitive:
+                            line_search = line_search.lower()
+                        if text_re:
+                            found = text.search(line_search)
+                            if found is not None:
+                                break
+                        else:
+                            found = line_search.find(text)
+                            if found > -1:
+                                break
+                    try:
+                        line_dec = line.decode(enc)
+                    except UnicodeDecodeError:
+                        line_dec = line
+
+                    if not case_sensitive:
+                        line = line.lower()
+
+                    if text_re:
+                        for match in text.finditer(line):
+                            bstart, bend = match.start(), match.end()
+                            try:
+                                # Go from binary position to utf8 position
+                                start = len(line[:bstart].decode(enc))
+                                end = start + len(
+                                    line[bstart:bend].decode(enc)
+                                )
+                            except UnicodeDecodeError:
+                                start = bstart
+                                end = bend
+                            results.append(
+                                (fname, lineno + 1, start, end, line_dec)
+                            )
+                    else:
+                        found = line.find(text)
+                        while found > -1:
+                            try:
+                                # Go from binary position to utf8 position
+                                start = len(line[:found].decode(enc))
+                                end = start + len(text.decode(enc))
+                            except UnicodeDecodeError:
+                                start = found
+                                end = found + len(text)
+                            results.append(
+                                (fname, lineno + 1, start, end, line_dec)
+                            )
+
+                            next_start = found + 1
+                            for text, enc in texts:
+                                found = line.find(text, next_start)
+                                if found > -1:
+                                    break
+            finally:
+                if buffer is not None:
+                    buffer.close()
+    except IOError:
+        return results, _("permission denied errors were encountered")
+
+    return results, None
+
+
+def search_in_files(fnames, texts, text_re, case_sensitive):
+    """
+    Search texts in several files.
+
+    This is run by worker processes, which stop searching when the event
+    passed to `init_search_worker` is set.
+
+    Returns
+    -------
+    results: list
+        Matches in all files, as returned by `search_in_file`.
+    error: str or None
+        Last error found while reading the files.
+    """
+    all_results = []
+    last_error = None
+    is_stopped = None if _stop_event is None else _stop_event.is_set
+
+    for fname in fnames:
+        if is_stopped is not None and is_stopped():
+            break
+
+        results, error = search_in_file(
+            fname, texts, text_re, case_sensitive, is_stopped
+        )
+        all_results.extend(results)
+        if error:
+            last_error = error
+
+    return all_results, last_error
+
+
+def init_search_worker(stop_event):
+    """Initialize a worker process with the event used to stop searches."""
+    global _stop_event
+    _stop_event = stop_event
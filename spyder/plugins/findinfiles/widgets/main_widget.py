@@ -11,7 +11,7 @@
 import re
 
 # Third party imports
-from qtpy.QtCore import QEvent, Qt, Signal
+from qtpy.QtCore import QEvent, Qt, QTimer, Signal
 from qtpy.QtGui import QFontMetricsF
 from qtpy.QtWidgets import (
     QAction,
@@ -43,6 +43,13 @@
 MAX_COMBOBOX_WIDTH = AppStyle.FindMinWidth + 80  # In pixels
 MIN_COMBOBOX_WIDTH = AppStyle.FindMinWidth - 80  # In pixels
 
+# Maximum number of results that can be set. The results browser can show
+# many more, but keeping all of them in memory is not useful.
+MAX_RESULTS_LIMIT = 1000000
+
+# Time after which results are refreshed when that's enabled, in miliseconds
+AUTO_REFRESH_INTERVAL = 5000
+
 
 # ---- Enums
 # -----------------------------------------------------------------------------
@@ -57,6 +64,8 @@ class FindInFilesWidgetActions:
     ToggleExcludeRegex = 'togle_use_regex_on_exlude_action'
     ToggleMoreOptions = 'toggle_more_options_action'
     ToggleSearchRegex = 'toggle_use_regex_on_search_action'
+    ToggleUseIgnoreFiles = 'toggle_use_ignore_files_action'
+    ToggleAutoRefresh = 'toggle_auto_refresh_action'
 
 
 class FindInFilesWidgetToolbars:
@@ -148,6 +157,7 @@ def __init__(self, name=None, plugin=None, parent=None):
         self.text_color = self.get_conf('text_color')
         self.supported_encodings = self.get_conf('supported_encodings')
         self.search_thread = None
+        self.search_index = None
         self.running = False
         self.more_options_action = None
         self.extras_toolbar = None
@@ -157,6 +167,17 @@ def __init__(self, name=None, plugin=None, parent=None):
         self._is_first_time = False
         self.error_icon = ima.icon('error')
 
+        # Options of the running search and (options, results of each file)
+        # of the last one that went through all files, to only search the
+        # files that changed when it's run again
+        self._search_key = None
+        self._last_search = None
+
+        self._auto_refresh_timer = QTimer(self)
+        self._auto_refresh_timer.setSingleShot(True)
+        self._auto_refresh_timer.setInterval(AUTO_REFRESH_INTERVAL)
+        self._auto_refresh_timer.timeout.connect(self._auto_refresh)
+
         search_text = self.get_conf('search_text', '')
         path_history = self.get_conf('path_history', [])
         exclude = self.get_conf('exclude')
@@ -365,6 +386,28 @@ def setup(self):
             tip=_('Set maximum number of results'),
             triggered=lambda x=None: self.set_max_results(),
         )
+        self.use_ignore_files_action = self.create_action(
+            FindInFilesWidgetActions.ToggleUseIgnoreFiles,
+            text=_('Skip files ignored by Git'),
+            tip=_(
+                'Skip the files and directories listed in .gitignore and '
+                '.ignore files'
+            ),
+            toggled=True,
+            initial=self.get_conf('use_ignore_files'),
+            option='use_ignore_files'
+        )
+        self.auto_refresh_action = self.create_action(
+            FindInFilesWidgetActions.ToggleAutoRefresh,
+            text=_('Refresh results automatically'),
+            tip=_(
+                'Search again every few seconds in the files that changed '
+                'since the last search'
+            ),
+            toggled=True,
+            initial=self.get_conf('auto_refresh'),
+            option='auto_refresh'
+        )
 
         # Toolbar
         toolbar = self.get_main_toolbar()
@@ -405,10 +448,13 @@ def setup(self):
             )
 
         menu = self.get_options_menu()
-        self.add_item_to_menu(
-            self.set_max_results_action,
-            menu=menu,
-        )
+        for item in [self.set_max_results_action,
+                     self.use_ignore_files_action,
+                     self.auto_refresh_action]:
+            self.add_item_to_menu(
+                item,
+                menu=menu,
+            )
 
     def update_actions(self):
         self.find_action.setIcon(self.create_icon(
@@ -467,6 +513,13 @@ def on_more_options_update(self, value):
     def on_max_results_update(self, value):
         self.result_browser.set_max_results(value)
 
+    @on_conf_change(option='auto_refresh')
+    def on_auto_refresh_update(self, value):
+        if value and self._last_search is not None:
+            self._auto_refresh_timer.start()
+        else:
+            self._auto_refresh_timer.stop()
+
     # ---- Qt methods
     # ------------------------------------------------------------------------
     def showEvent(self, event):
@@ -567,6 +620,44 @@ def _get_options(self):
 
         return (path, file_search, exclude, texts, text_re, case_sensitive)
 
+    def _get_search_key(self, options):
+        """
+        Get the values that need to be the same for a search to refresh the
+        results of the previous one, or None if that's not possible.
+        """
+        path, file_search, exclude, texts, text_re, case_sensitive = options
+        if file_search:
+            return None
+
+        return (
+            path,
+            getattr(exclude, 'pattern', exclude),
+            tuple(
+                (getattr(text, 'pattern', text), enc) for text, enc in texts
+            ),
+            text_re,
+            case_sensitive,
+            self.get_conf('use_ignore_files'),
+            self.get_conf('max_results'),
+        )
+
+    def _auto_refresh(self):
+        """Refresh the results of the last search if it wasn't changed."""
+        if self.running or self._last_search is None:
+            return
+
+        # Wait until the results are visible
+        if not self.isVisible():
+            self._auto_refresh_timer.start()
+            return
+
+        options = self._get_options()
+        if (
+            options is not None
+            and self._get_search_key(options) == self._last_search[0]
+        ):
+            self.start()
+
     def _update_options(self):
         """
         Extract search options from widgets and set the corresponding option.
@@ -593,12 +684,19 @@ def _handle_search_complete(self, completed):
         """
         self.result_browser.set_sorting(ON)
         self.result_browser.set_width()
-        self.result_browser.expandAll()
+        self.result_browser.expand_results()
         if self.search_thread is None:
             return
 
         self.sig_finished.emit()
         found = self.search_thread.get_results()
+
+        file_results = self.search_thread.get_file_results()
+        if self._search_key is not None and file_results is not None:
+            self._last_search = (self._search_key, file_results)
+            if self.get_conf('auto_refresh'):
+                self._auto_refresh_timer.start()
+
         self._stop_and_reset_thread()
         if found is not None:
             self.result_browser.show()
@@ -662,6 +760,17 @@ def set_project_path(self, path):
         """
         self.path_selection_combo.set_project_path(path)
 
+    def set_search_index(self, index):
+        """
+        Set the index used to narrow searches in the current project.
+
+        Parameters
+        ----------
+        index: spyder.plugins.projects.utils.search_index.TrigramIndex
+            Index of the project files, or None if there's no index.
+        """
+        self.search_index = index
+
     def disable_project_search(self):
         """Disable project search path in combobox."""
         self.path_selection_combo.set_project_path(None)
@@ -730,13 +839,26 @@ def start(self):
         self._stop_and_reset_thread(ignore_results=True)
         search_text = self.search_text_edit.currentText()
 
+        # Only search the files that changed if this search was done before
+        # and its results are still shown
+        self._search_key = self._get_search_key(options)
+        previous_results = None
+        if (
+            self._last_search is not None
+            and self._last_search[0] == self._search_key
+        ):
+            previous_results = self._last_search[1]
+        self._last_search = None
+        self._auto_refresh_timer.stop()
+
         # Update and set options
         self._update_options()
 
         # Setup result_browser
-        self.result_browser.set_path(options[0])
-        self.result_browser.longest_file_item = ''
-        self.result_browser.longest_line_item = ''
+        if previous_results is None:
+            self.result_browser.set_path(options[0])
+            self.result_browser.longest_file_item = ''
+            self.result_browser.longest_line_item = ''
 
         # Start
         self.running = True
@@ -745,7 +867,10 @@ def start(self):
             None,
             search_text,
             self.text_color,
-            self.get_conf('max_results')
+            self.get_conf('max_results'),
+            self.search_index,
+            self.get_conf('use_ignore_files'),
+            previous_results
         )
         self.search_thread.sig_finished.connect(self._handle_search_complete)
         self.search_thread.sig_file_match.connect(
@@ -754,8 +879,12 @@ def start(self):
         self.search_thread.sig_line_match.connect(
             self.result_browser.append_result
         )
-        self.result_browser.clear_title(search_text)
-        self.search_thread.initialize(*self._get_options())
+        self.search_thread.sig_results_changed.connect(
+            self.result_browser.update_results
+        )
+        if previous_results is None:
+            self.result_browser.clear_title(search_text)
+        self.search_thread.initialize(*options)
         self.search_thread.start()
         self.update_actions()
 
@@ -795,7 +924,7 @@ def set_max_results(self, value=None):
             # dialog. Since that value seems a bit arbitrary, we decided to set
             # it to 5.
             # See spyder-ide/spyder#16256
-            dialog.setIntRange(5, 10000)
+            dialog.setIntRange(5, MAX_RESULTS_LIMIT)
 
             # Connect slot
             dialog.intValueSelected.connect(
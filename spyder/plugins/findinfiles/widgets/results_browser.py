@@ -7,24 +7,28 @@
 """Results browser."""
 
 # Standard library imports
+from array import array
 import os.path as osp
 
 # Third party imports
-from qtpy.QtCore import QPoint, QSize, Qt, Signal, Slot
+from qtpy.QtCore import (QAbstractItemModel, QModelIndex, QPoint, QSize, Qt,
+                         Signal, Slot)
 from qtpy.QtGui import (QAbstractTextDocumentLayout, QColor, QFontMetrics,
                         QTextDocument)
-from qtpy.QtWidgets import (QApplication, QStyle, QStyledItemDelegate,
-                            QStyleOptionViewItem, QTreeWidgetItem)
+from qtpy.QtWidgets import (QAbstractItemView, QApplication, QHeaderView,
+                            QStyle, QStyledItemDelegate, QStyleOptionViewItem,
+                            QTreeView)
 
 # Local imports
 from spyder.api.fonts import SpyderFontsMixin, SpyderFontType
 from spyder.api.translations import _
+from spyder.api.widgets.mixins import SpyderWidgetMixin
 from spyder.plugins.findinfiles.widgets.search_thread import (
-    ELLIPSIS, MAX_RESULT_LENGTH)
+    ELLIPSIS, MAX_RESULT_LENGTH, truncate_result)
 from spyder.utils import icon_manager as ima
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.stylesheet import AppStyle
-from spyder.widgets.onecolumntree import OneColumnTree
+from spyder.widgets.onecolumntree import OneColumnTreeActions
 
 
 # ---- Constants
@@ -32,92 +36,436 @@
 ON = 'on'
 OFF = 'off'
 
+# Files are collapsed when the number of results reaches this value, because
+# the view needs to go through all visible rows every time results are added
+MAX_EXPANDED_RESULTS = 10000
 
-# ---- Items
-# ----------------------------------------------------------------------------
-class LineMatchItem(QTreeWidgetItem):
 
-    def __init__(self, parent, lineno, colno, match, font, text_color):
-        self.lineno = lineno
-        self.colno = colno
-        self.match = match['formatted_text']
-        self.plain_match = match['text']
+# ---- Model
+# ----------------------------------------------------------------------------
+class ResultsModel(QAbstractItemModel):
+    """
+    Model of the matches found by a search.
+
+    Files are the top level rows and their matches are their children.
+    Matches are stored in arrays, one per field, and their HTML is only
+    generated when they're shown, so huge numbers of them can be added.
+    The matches of files can also be replaced or removed in place, to
+    refresh the results of a search.
+    """
+
+    # The match arrays are rebuilt when the number of matches that were
+    # replaced or removed is greater than this and than the number of
+    # matches in them
+    MIN_DEAD_MATCHES_TO_COMPACT = 1000
+
+    def __init__(self, parent, text_color):
+        super().__init__(parent)
         self.text_color = text_color
-        self.font = font
-        super().__init__(parent, [self.__repr__()], QTreeWidgetItem.Type)
-
-    def __repr__(self):
-        match = str(self.match).rstrip()
-        _str = (
-            f"<!-- LineMatchItem -->"
-            f"<p style=\"color:'{self.text_color}';\">"
-            f'&nbsp;&nbsp;'
-            f"<b>{self.lineno}</b> ({self.colno}): "
-            f"<span style='font-family:{self.font.family()};"
-            f"font-size:{self.font.pointSize()}pt;'>{match}</span></p>"
+        self.font = None
+        self.path = None
+        self.title = ''
+        self._clear()
+
+    # ---- Qt methods
+    # ------------------------------------------------------------------------
+    def index(self, row, column, parent=QModelIndex()):
+        if column != 0:
+            return QModelIndex()
+
+        if not parent.isValid():
+            if 0 <= row < len(self._file_order):
+                return self.createIndex(row, 0, 0)
+        elif parent.internalId() == 0:
+            file_index = self._file_order[parent.row()]
+            if 0 <= row < self._file_counts[file_index]:
+                # The id of matches is the index of their file plus one
+                return self.createIndex(row, 0, file_index + 1)
+
+        return QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+
+        file_index = index.internalId() - 1
+        return self.createIndex(self._file_rows[file_index], 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._file_order)
+        elif parent.internalId() == 0:
+            return self._file_counts[self._file_order[parent.row()]]
+        else:
+            return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if index.internalId() == 0:
+            file_index = self._file_order[index.row()]
+            filename = self.files[file_index]
+            if role == Qt.DisplayRole:
+                return self._get_file_html(filename)
+            elif role == Qt.DecorationRole:
+                icon = self._icons.get(file_index)
+                if icon is None:
+                    icon = ima.get_icon_by_extension_or_type(filename, 1.0)
+                    self._icons[file_index] = icon
+                return icon
+            elif role == Qt.ToolTipRole:
+                return filename
+        elif role == Qt.DisplayRole:
+            return self._get_match_html(self._get_match_position(index))
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.title
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort files by name, keeping the rows that are expanded."""
+        self.layoutAboutToBeChanged.emit()
+
+        file_order = sorted(
+            self._file_order,
+            key=lambda i: osp.basename(self.files[i]),
+            reverse=(order == Qt.DescendingOrder)
         )
-        return _str
-
-    def __unicode__(self):
-        return self.__repr__()
+        file_rows = [-1] * len(self.files)
+        for row, file_index in enumerate(file_order):
+            file_rows[file_index] = row
+
+        # Only file rows move
+        old_indexes = self.persistentIndexList()
+        new_indexes = []
+        for index in old_indexes:
+            if index.isValid() and index.internalId() == 0:
+                file_index = self._file_order[index.row()]
+                index = self.createIndex(file_rows[file_index], 0, 0)
+            new_indexes.append(index)
+
+        self._file_order = file_order
+        self._file_rows = file_rows
+        self.changePersistentIndexList(old_indexes, new_indexes)
+
+        self.layoutChanged.emit()
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    @property
+    def num_matches(self):
+        """Number of matches in the model."""
+        return self._num_matches
+
+    def clear(self):
+        """Remove all files and matches."""
+        self.beginResetModel()
+        self._clear()
+        self.endResetModel()
 
-    def __str__(self):
-        return self.__repr__()
-
-    def __lt__(self, x):
-        return self.lineno < x.lineno
+    def set_title(self, title):
+        """Set the title shown in the header."""
+        self.title = title
+        self.headerDataChanged.emit(Qt.Horizontal, 0, 0)
+
+    def add_file(self, filename):
+        """
+        Add a file with matches.
+
+        Return its row.
+        """
+        file_index = len(self.files)
+        row = len(self._file_order)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._file_indexes[filename] = file_index
+        self.files.append(filename)
+        self._file_starts.append(-1)
+        self._file_counts.append(0)
+        self._file_order.append(file_index)
+        self._file_rows.append(row)
+        self.endInsertRows()
+        return row
+
+    def add_matches(self, items):
+        """
+        Add matches to their files.
+
+        Parameters
+        ----------
+        items: list
+            List of (filename, line number, start column, line, end column)
+            tuples. Files must be added before their matches, and all the
+            matches of a file must be added before the ones of the next file.
+        """
+        i = 0
+        while i < len(items):
+            # Add consecutive matches of the same file at once
+            filename = items[i][0]
+            j = i + 1
+            while j < len(items) and items[j][0] == filename:
+                j += 1
+
+            file_index = self._file_indexes.get(filename)
+            if file_index is not None and file_index >= self._last_file:
+                self._last_file = file_index
+                self._add_file_matches(file_index, items[i:j])
+
+            i = j
+
+    def set_file_matches(self, filename, items):
+        """
+        Replace the matches of a file, adding it if it's not in the model.
+
+        Parameters
+        ----------
+        filename: str
+            Path of the file.
+        items: list
+            List of (filename, line number, start column, line, end column)
+            tuples of the matches of the file.
+
+        Returns
+        -------
+        row: int or None
+            Row of the file if it was added, None if it was already there.
+        """
+        added_row = None
+        file_index = self._file_indexes.get(filename)
+        if file_index is None:
+            added_row = self.add_file(filename)
+            file_index = self._file_indexes[filename]
+        else:
+            self._remove_file_matches(file_index)
 
-    def __ge__(self, x):
-        return self.lineno >= x.lineno
+        # Matches of other files can't be added after this with add_matches,
+        # because they must be next to the other matches of their files
+        self._last_file = len(self.files)
 
+        if items:
+            self._add_file_matches(file_index, items)
+        self._compact()
 
-class FileMatchItem(QTreeWidgetItem):
+        return added_row
 
-    def __init__(self, parent, path, filename, sorting, text_color):
+    def remove_file(self, filename):
+        """Remove a file and its matches."""
+        file_index = self._file_indexes.pop(filename, None)
+        if file_index is None:
+            return
 
-        self.sorting = sorting
-        self.filename = osp.basename(filename)
+        row = self._file_rows[file_index]
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._num_matches -= self._file_counts[file_index]
+        self._num_dead_matches += self._file_counts[file_index]
+        self._file_counts[file_index] = 0
+        self._icons.pop(file_index, None)
+
+        del self._file_order[row]
+        self._file_rows[file_index] = -1
+        for next_row in range(row, len(self._file_order)):
+            self._file_rows[self._file_order[next_row]] = next_row
+        self.endRemoveRows()
+
+        self._compact()
+
+    def get_num_file_matches(self, filename):
+        """Get the number of matches of filename."""
+        file_index = self._file_indexes.get(filename)
+        if file_index is None:
+            return 0
+        return self._file_counts[file_index]
+
+    def get_match(self, index):
+        """
+        Get the (filename, line number, start column, end column) tuple of
+        the match at index, or None if it's not a match.
+        """
+        if not index.isValid() or index.internalId() == 0:
+            return None
+
+        position = self._get_match_position(index)
+        return (
+            self.files[index.internalId() - 1],
+            self._linenos[position],
+            self._colnos[position],
+            self._colends[position]
+        )
 
-        # Get relative dirname according to the path we're searching in.
+    def iter_matches(self):
+        """Iterate over all matches, as returned by `get_match`."""
+        for file_index in self._file_order:
+            start = self._file_starts[file_index]
+            filename = self.files[file_index]
+            for position in range(
+                start, start + self._file_counts[file_index]
+            ):
+                yield (
+                    filename,
+                    self._linenos[position],
+                    self._colnos[position],
+                    self._colends[position]
+                )
+
+    def get_rel_dirname(self, filename):
+        """Get the directory of filename relative to the search path."""
         dirname = osp.dirname(filename)
 
         # Catch errors when it's not possible to get the relative directory
         # name. This happens when the user is searching in a single file.
         # Fixes spyder-ide/spyder#17443 and spyder-ide/spyder#20964
         try:
-            rel_dirname = dirname.split(path)[1]
+            rel_dirname = dirname.split(self.path)[1]
             if rel_dirname.startswith(osp.sep):
                 rel_dirname = rel_dirname[1:]
         except IndexError:
             rel_dirname = dirname
 
-        self.rel_dirname = rel_dirname
+        return rel_dirname
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _clear(self):
+        # Files with matches, the index of each one in that list, and the
+        # position and number of their matches in the arrays below
+        self.files = []
+        self._file_indexes = {}
+        self._file_starts = array('l')
+        self._file_counts = array('l')
+
+        # File index of each row and row of each file index, which are
+        # different after sorting
+        self._file_order = []
+        self._file_rows = []
+
+        # Matches
+        self._linenos = array('l')
+        self._colnos = array('l')
+        self._colends = array('l')
+        self._lines = []
+
+        # Last file with matches, and number of matches that are in the
+        # arrays and of the ones that were replaced or removed
+        self._last_file = -1
+        self._num_matches = 0
+        self._num_dead_matches = 0
+
+        # Icons of the files that were shown
+        self._icons = {}
+
+    def _add_file_matches(self, file_index, items):
+        """Add matches of the file at file_index."""
+        if self._file_starts[file_index] < 0:
+            self._file_starts[file_index] = len(self._linenos)
+
+        count = self._file_counts[file_index]
+        parent = self.createIndex(self._file_rows[file_index], 0, 0)
+        self.beginInsertRows(parent, count, count + len(items) - 1)
+
+        for __, lineno, colno, line, colend in items:
+            self._linenos.append(lineno)
+            self._colnos.append(colno)
+            self._colends.append(colend)
+            self._lines.append(line)
+        self._file_counts[file_index] += len(items)
+        self._num_matches += len(items)
+
+        self.endInsertRows()
+
+    def _remove_file_matches(self, file_index):
+        """
+        Remove the matches of the file at file_index, but not the file.
+
+        They're left in the arrays until they're compacted.
+        """
+        count = self._file_counts[file_index]
+        if count:
+            parent = self.createIndex(self._file_rows[file_index], 0, 0)
+            self.beginRemoveRows(parent, 0, count - 1)
+            self._file_counts[file_index] = 0
+            self._num_matches -= count
+            self._num_dead_matches += count
+            self.endRemoveRows()
+
+        # New matches are added at the end of the arrays
+        self._file_starts[file_index] = -1
+
+    def _compact(self):
+        """
+        Rebuild the match arrays without the matches that were replaced or
+        removed, if there are many of them.
+
+        Indexes don't change because matches are identified by their files
+        and rows.
+        """
+        if self._num_dead_matches <= max(
+            self._num_matches, self.MIN_DEAD_MATCHES_TO_COMPACT
+        ):
+            return
 
-        title = (
+        linenos = array('l')
+        colnos = array('l')
+        colends = array('l')
+        lines = []
+        for file_index in self._file_order:
+            count = self._file_counts[file_index]
+            if not count:
+                self._file_starts[file_index] = -1
+                continue
+
+            start = self._file_starts[file_index]
+            end = start + count
+            self._file_starts[file_index] = len(linenos)
+            linenos.extend(self._linenos[start:end])
+            colnos.extend(self._colnos[start:end])
+            colends.extend(self._colends[start:end])
+            lines.extend(self._lines[start:end])
+
+        self._linenos = linenos
+        self._colnos = colnos
+        self._colends = colends
+        self._lines = lines
+        self._num_dead_matches = 0
+
+    def _get_match_position(self, index):
+        """Get the position in the match arrays of the match at index."""
+        return self._file_starts[index.internalId() - 1] + index.row()
+
+    def _get_file_html(self, filename):
+        rel_dirname = self.get_rel_dirname(filename)
+        return (
             f'<!-- FileMatchItem -->'
-            f'<b style="color:{text_color}">{osp.basename(filename)}</b>'
+            f'<b style="color:{self.text_color}">{osp.basename(filename)}</b>'
             f'&nbsp;&nbsp;&nbsp;'
-            f'<span style="color:{text_color}">'
-            f'<em>{self.rel_dirname}</em>'
+            f'<span style="color:{self.text_color}">'
+            f'<em>{rel_dirname}</em>'
             f'</span>'
         )
 
-        super().__init__(parent, [title], QTreeWidgetItem.Type)
-
-        self.setIcon(0, ima.get_icon_by_extension_or_type(filename, 1.0))
-        self.setToolTip(0, filename)
-
-    def __lt__(self, x):
-        if self.sorting['status'] == ON:
-            return self.filename < x.filename
-        else:
-            return False
-
-    def __ge__(self, x):
-        if self.sorting['status'] == ON:
-            return self.filename >= x.filename
-        else:
-            return False
+    def _get_match_html(self, position):
+        lineno = self._linenos[position]
+        colno = self._colnos[position]
+        match = truncate_result(
+            self._lines[position],
+            colno,
+            self._colends[position],
+            self.text_color
+        )['formatted_text'].rstrip()
+
+        return (
+            f"<!-- LineMatchItem -->"
+            f"<p style=\"color:'{self.text_color}';\">"
+            f'&nbsp;&nbsp;'
+            f"<b>{lineno}</b> ({colno}): "
+            f"<span style='font-family:{self.font.family()};"
+            f"font-size:{self.font.pointSize()}pt;'>{match}</span></p>"
+        )
 
 
 # ---- Browser
@@ -128,6 +476,7 @@ def __init__(self, parent):
         super().__init__(parent)
         self._margin = None
         self._background_color = QColor(SpyderPalette.COLOR_BACKGROUND_3)
+        self._height = None
         self.width = 0
 
     def paint(self, painter, option, index):
@@ -176,39 +525,49 @@ def paint(self, painter, option, index):
         painter.restore()
 
     def sizeHint(self, option, index):
-        options = QStyleOptionViewItem(option)
-        self.initStyleOption(options, index)
-        doc = QTextDocument()
-        doc.setHtml(options.text)
-        doc.setTextWidth(options.rect.width())
-        size = QSize(self.width, int(doc.size().height()))
-        return size
+        # All rows have the same height, so it's only computed once because
+        # this is called for lots of rows when results are added.
+        if self._height is None:
+            options = QStyleOptionViewItem(option)
+            self.initStyleOption(options, index)
+            doc = QTextDocument()
+            doc.setHtml(options.text)
+            doc.setTextWidth(options.rect.width())
+            self._height = int(doc.size().height())
 
+        return QSize(self.width, self._height)
 
-class ResultsBrowser(OneColumnTree, SpyderFontsMixin):
+    def reset_height(self):
+        """Compute the height of rows again, e.g. after a font change."""
+        self._height = None
+
+
+class ResultsBrowser(SpyderWidgetMixin, SpyderFontsMixin, QTreeView):
 
     sig_edit_goto_requested = Signal(str, int, str, int, int)
     sig_max_results_reached = Signal()
 
     def __init__(self, parent, text_color, max_results=1000):
-        super().__init__(parent)
+        QTreeView.__init__(self, parent)
+        SpyderWidgetMixin.__init__(self, class_parent=parent)
+
         self.search_text = None
-        self.results = None
         self.max_results = max_results
-        self.total_matches = None
-        self.error_flag = None
-        self.completed = None
         self.sorting = {}
         self.font = self.get_font(SpyderFontType.MonospaceInterface)
-        self.data = None
-        self.files = None
-        self.root_items = None
         self.text_color = text_color
         self.path = None
         self.longest_file_item = ''
         self.longest_line_item = ''
 
+        self.results_model = ResultsModel(self, text_color)
+        self.results_model.font = self.font
+        self.setModel(self.results_model)
+
         # Setup
+        self.menu = None
+        self.setup()
+        self.setItemsExpandable(True)
         self.set_title('')
         self.set_sorting(OFF)
         self.setSortingEnabled(False)
@@ -216,18 +575,76 @@ def __init__(self, parent, text_color, max_results=1000):
         self.setUniformRowHeights(True)  # Needed for performance
         self.sortByColumn(0, Qt.AscendingOrder)
 
-        # Only show the actions for collaps/expand all entries in the widget
-        # For further information see spyder-ide/spyder#13178
-        self.common_actions = self.common_actions[:2]
+        # Use horizontal scrollbar when needed.
+        # The column width is set in set_width instead of resizing it to its
+        # contents because that requires to check lots of rows every time
+        # results are added.
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.header().setSectionResizeMode(0, QHeaderView.Fixed)
+        self.header().setStretchLastSection(False)
+
+        # To change the cursor shape in mouseMoveEvent
+        self.setMouseTracking(True)
 
         # Signals
+        self.activated.connect(self.on_item_activated)
+        self.clicked.connect(self.on_item_clicked)
         self.header().sectionClicked.connect(self.sort_section)
 
-    def on_item_activated(self, item):
+    # ---- SpyderWidgetMixin API
+    # ------------------------------------------------------------------------
+    def setup(self):
+        # Only show the actions for collaps/expand all entries in the widget
+        # For further information see spyder-ide/spyder#13178
+        self.menu = self.create_menu("context_menu")
+
+        collapse_all_action = self.create_action(
+            OneColumnTreeActions.CollapseAllAction,
+            text=_("Collapse all"),
+            icon=ima.icon("collapse"),
+            triggered=self.collapseAll,
+            register_shortcut=False,
+        )
+        expand_all_action = self.create_action(
+            OneColumnTreeActions.ExpandAllAction,
+            text=_("Expand all"),
+            icon=ima.icon("expand"),
+            triggered=self.expandAll,
+            register_shortcut=False,
+        )
+
+        for item in [collapse_all_action, expand_all_action]:
+            self.add_item_to_menu(item, self.menu)
+
+    def update_actions(self):
+        pass
+
+    # ---- Qt methods
+    # ------------------------------------------------------------------------
+    def contextMenuEvent(self, event):
+        """Override Qt method"""
+        self.menu.popup(event.globalPos())
+
+    def mouseMoveEvent(self, event):
+        """Change cursor shape."""
+        index = self.indexAt(event.pos())
+        if index.isValid():
+            vrect = self.visualRect(index)
+            item_identation = vrect.x() - self.visualRect(self.rootIndex()).x()
+            if event.pos().x() > item_identation:
+                # When hovering over results
+                self.setCursor(Qt.PointingHandCursor)
+            else:
+                # On every other element
+                self.setCursor(Qt.ArrowCursor)
+
+    # ---- Public API
+    # ------------------------------------------------------------------------
+    def on_item_activated(self, index):
         """Double-click event."""
-        itemdata = self.data.get(id(self.currentItem()))
-        if itemdata is not None:
-            filename, lineno, colno, colend = itemdata
+        match = self.results_model.get_match(index)
+        if match is not None:
+            filename, lineno, colno, colend = match
             self.sig_edit_goto_requested.emit(
                 filename, lineno, self.search_text, colno, colend - colno)
 
@@ -240,23 +657,19 @@ def set_sorting(self, flag):
     def sort_section(self, idx):
         self.setSortingEnabled(True)
 
-    def on_item_clicked(self, item):
+    def on_item_clicked(self, index):
         """Click event."""
-        if isinstance(item, FileMatchItem):
-            if item.isExpanded():
-                self.collapseItem(item)
-            else:
-                self.expandItem(item)
+        if self.results_model.get_match(index) is None:
+            self.setExpanded(index, not self.isExpanded(index))
         else:
-            self.on_item_activated(item)
+            self.on_item_activated(index)
 
     def clear_title(self, search_text):
         self.font = self.get_font(SpyderFontType.MonospaceInterface)
-        self.clear()
+        self.results_model.font = self.font
+        self.results_model.clear()
+        self.itemDelegate().reset_height()
         self.setSortingEnabled(False)
-        self.num_files = 0
-        self.data = {}
-        self.files = {}
         self.set_sorting(OFF)
         self.search_text = search_text
 
@@ -273,57 +686,116 @@ def set_title(self, title):
         else:
             elided_title = title
 
-        self.setHeaderLabels([elided_title])
+        self.results_model.set_title(elided_title)
 
     @Slot(object)
     def append_file_result(self, filename):
         """Real-time update of file items."""
-        if len(self.data) < self.max_results:
-            item = FileMatchItem(
-                self,
-                self.path,
-                filename,
-                self.sorting,
-                self.text_color
-            )
-
-            self.files[filename] = item
-
-            item.setExpanded(True)
-            self.num_files += 1
-
-            item_text = osp.join(item.rel_dirname, item.filename)
-            if len(item_text) > len(self.longest_file_item):
-                self.longest_file_item = item_text
+        if self.results_model.num_matches < self.max_results:
+            row = self.results_model.add_file(filename)
+            if self.results_model.num_matches < MAX_EXPANDED_RESULTS:
+                self.expand(self.results_model.index(row, 0))
+            self._update_longest_file_item(filename)
 
     @Slot(object, object)
     def append_result(self, items, title):
         """Real-time update of line items."""
-        if len(self.data) >= self.max_results:
+        num_matches = self.results_model.num_matches
+        if num_matches >= self.max_results:
             self.set_title(_('Maximum number of results reached! Try '
                              'narrowing the search.'))
             self.sig_max_results_reached.emit()
             return
 
-        available = self.max_results - len(self.data)
+        available = self.max_results - num_matches
         if available < len(items):
             items = items[:available]
 
         self.setUpdatesEnabled(False)
         self.set_title(title)
-        for item in items:
-            filename, lineno, colno, line, match_end = item
-            file_item = self.files.get(filename, None)
-            if file_item:
-                item = LineMatchItem(file_item, lineno, colno, line,
-                                     self.font, self.text_color)
-                self.data[id(item)] = (filename, lineno, colno, match_end)
+        self.results_model.add_matches(items)
+
+        if (
+            num_matches < MAX_EXPANDED_RESULTS
+            <= self.results_model.num_matches
+        ):
+            self.collapseAll()
+
+        longest_line = max((item[3] for item in items), key=len, default='')
+        if len(longest_line) > len(self.longest_line_item):
+            self.longest_line_item = longest_line.rstrip()
+            self.set_width()
+
+        self.setUpdatesEnabled(True)
+
+    @Slot(object, object)
+    def update_results(self, changes, title):
+        """
+        Replace the matches of the files that changed when refreshing the
+        results of a search.
+
+        Parameters
+        ----------
+        changes: dict
+            Filename -> list of matches, in the format used by
+            `append_result`. Files without matches are removed.
+        title: str
+            Title to show.
+        """
+        self.setUpdatesEnabled(False)
+        self.set_title(title)
+
+        max_results_reached = False
+        longest_line = ''
+        for filename, items in changes.items():
+            if not items:
+                self.results_model.remove_file(filename)
+                continue
+
+            # The previous matches of the file are not counted because
+            # they're replaced
+            available = (
+                self.max_results
+                - self.results_model.num_matches
+                + self.results_model.get_num_file_matches(filename)
+            )
+            if available < len(items):
+                items = items[:available]
+                max_results_reached = True
+            if not items:
+                self.results_model.remove_file(filename)
+                continue
+
+            row = self.results_model.set_file_matches(filename, items)
+            if row is not None:
+                if self.results_model.num_matches < MAX_EXPANDED_RESULTS:
+                    self.expand(self.results_model.index(row, 0))
+                self._update_longest_file_item(filename)
+
+            longest_line = max(
+                longest_line, *(item[3] for item in items), key=len
+            )
 
-                if len(item.plain_match) > len(self.longest_line_item):
-                    self.longest_line_item = item.plain_match
+        if len(longest_line) > len(self.longest_line_item):
+            self.longest_line_item = longest_line.rstrip()
+            self.set_width()
 
         self.setUpdatesEnabled(True)
 
+        if max_results_reached:
+            self.set_title(_('Maximum number of results reached! Try '
+                             'narrowing the search.'))
+            self.sig_max_results_reached.emit()
+
+    def expand_results(self):
+        """
+        Expand all files if there are not too many results.
+
+        Otherwise, users need to expand the files they're interested in.
+        """
+        if self.results_model.num_matches < MAX_EXPANDED_RESULTS:
+            self.expandAll()
+
     def set_max_results(self, value):
         """Set maximum amount of results to add."""
         self.max_results = value
@@ -331,10 +803,11 @@ def set_max_results(self, value):
     def set_path(self, path):
         """Set path where the search is performed."""
         self.path = path
+        self.results_model.path = path
 
     def set_width(self):
         """Set widget width according to its longest item."""
-        if not self.data:
+        if not self.results_model.num_matches:
             return
 
         # File item width
@@ -373,3 +846,17 @@ def set_width(self):
                 width = width + 2 * AppStyle.MarginSize
 
         self.itemDelegate().width = width
+
+        # Leave space for the indentation of matches
+        self.header().resizeSection(0, width + 2 * self.indentation())
+
+    # ---- Private API
+    # ------------------------------------------------------------------------
+    def _update_longest_file_item(self, filename):
+        """Save the text of the file item of filename if it's the longest."""
+        item_text = osp.join(
+            self.results_model.get_rel_dirname(filename),
+            osp.basename(filename)
+        )
+        if len(item_text) > len(self.longest_file_item):
+            self.longest_file_item = item_text
@@ -7,10 +7,16 @@
 """Search thread."""
 
 # Standard library imports
+from collections import deque
+from concurrent.futures import (
+    CancelledError, ProcessPoolExecutor, TimeoutError)
+from concurrent.futures.process import BrokenProcessPool
+import itertools
+import logging
+import multiprocessing
 import os
 import os.path as osp
 import re
-import stat
 import traceback
 
 # Third party imports
@@ -18,48 +24,216 @@
 
 # Local imports
 from spyder.api.translations import _
-from spyder.config.utils import EDIT_EXTENSIONS
-from spyder.utils.encoding import is_text_file
+from spyder.plugins.findinfiles.utils import (
+    init_search_worker, iter_search_files, search_in_file, search_in_files)
 from spyder.utils.palette import SpyderPalette
 
 
+logger = logging.getLogger(__name__)
+
+
 # ---- Constants
 # ----------------------------------------------------------------------------
 ELLIPSIS = '...'
 MAX_RESULT_LENGTH = 80
 MAX_NUM_CHAR_FRAGMENT = 40
 
+# Maximum number of worker processes to search in files
+MAX_SEARCH_WORKERS = 8
+
+
+# ---- Auxiliary functions
+# ----------------------------------------------------------------------------
+def truncate_result(line, start, end, text_color):
+    """
+    Shorten text on line to display the match within `max_line_length`.
+
+    Returns
+    -------
+    dict
+        Plain text of the shortened line in `text` and its HTML, with the
+        match highlighted, in `formatted_text`.
+    """
+    html_escape_table = {
+        "&": "&amp;",
+        '"': "&quot;",
+        "'": "&apos;",
+        ">": "&gt;",
+        "<": "&lt;",
+    }
+
+    def html_escape(text):
+        """Produce entities within text."""
+        return "".join(html_escape_table.get(c, c) for c in text)
+
+    line = str(line)
+    left, match, right = line[:start], line[start:end], line[end:]
+
+    if len(line) > MAX_RESULT_LENGTH:
+        offset = (len(line) - len(match)) // 2
+
+        left = left.split(' ')
+        num_left_words = len(left)
+
+        if num_left_words == 1:
+            left = left[0]
+            if len(left) > MAX_NUM_CHAR_FRAGMENT:
+                left = ELLIPSIS + left[-offset:]
+            left = [left]
+
+        right = right.split(' ')
+        num_right_words = len(right)
+
+        if num_right_words == 1:
+            right = right[0]
+            if len(right) > MAX_NUM_CHAR_FRAGMENT:
+                right = right[:offset] + ELLIPSIS
+            right = [right]
+
+        left = left[-4:]
+        right = right[:4]
+
+        if len(left) < num_left_words:
+            left = [ELLIPSIS] + left
+
+        if len(right) < num_right_words:
+            right = right + [ELLIPSIS]
+
+        left = ' '.join(left)
+        right = ' '.join(right)
+
+        if len(left) > MAX_NUM_CHAR_FRAGMENT:
+            left = ELLIPSIS + left[-30:]
+
+        if len(right) > MAX_NUM_CHAR_FRAGMENT:
+            right = right[:30] + ELLIPSIS
+
+    match_color = SpyderPalette.COLOR_OCCURRENCE_4
+    trunc_line = dict(
+        text=''.join([left, match, right]),
+        formatted_text=(
+            f'<span style="color:{text_color}">'
+            f'{html_escape(left)}'
+            f'<span style="background-color:{match_color}">'
+            f'{html_escape(match)}'
+            f'</span>'
+            f'{html_escape(right)}'
+            f'</span>'
+        )
+    )
+
+    return trunc_line
+
+
+# ---- Process pool
+# ----------------------------------------------------------------------------
+class SearchPool:
+    """Pool of worker processes to search in files."""
+
+    def __init__(self, max_workers):
+        # Spawn processes because forking a process with Qt threads is unsafe
+        context = multiprocessing.get_context('spawn')
+        self.stop_event = context.Event()
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=context,
+            initializer=init_search_worker,
+            initargs=(self.stop_event,)
+        )
+
+    def submit(self, fnames, texts, text_re, case_sensitive):
+        """Search texts in fnames in a worker process."""
+        return self.executor.submit(
+            search_in_files, fnames, texts, text_re, case_sensitive
+        )
+
+    def stop(self):
+        """Stop the searches in progress."""
+        self.stop_event.set()
+
+    def reset(self):
+        """Allow new searches after stopping the previous ones."""
+        self.stop_event.clear()
+
+    def shutdown(self):
+        """Stop searches and worker processes."""
+        self.stop()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+_search_pool = None
+
+
+def get_search_pool():
+    """
+    Get the pool of worker processes to search in files, creating it if
+    necessary.
+
+    Return None if the pool can't be created.
+    """
+    global _search_pool
+    if _search_pool is None:
+        max_workers = max(
+            1, min(MAX_SEARCH_WORKERS, (os.cpu_count() or 1) - 1)
+        )
+        try:
+            _search_pool = SearchPool(max_workers)
+        except (OSError, ValueError, NotImplementedError):
+            logger.warning(
+                "Could not create worker processes to search in files",
+                exc_info=True
+            )
+    return _search_pool
+
+
+def shutdown_search_pool():
+    """Stop the worker processes to search in files, if any."""
+    global _search_pool
+    if _search_pool is not None:
+        _search_pool.shutdown()
+        _search_pool = None
+
 
 # ---- Thread
 # ----------------------------------------------------------------------------
 class SearchThread(QThread):
     """Find in files search thread."""
-    PYTHON_EXTENSIONS = ['.py', '.pyw', '.pyx', '.ipy', '.pyi', '.pyt']
 
-    USEFUL_EXTENSIONS = [
-        '.ipynb', '.md',  '.c', '.cpp', '.h', '.cxx', '.f', '.f03', '.f90',
-        '.json', '.dat', '.csv', '.tsv', '.txt', '.md', '.rst', '.yml',
-        '.yaml', '.ini', '.bat', '.sh', '.ui'
-    ]
+    # Number of files searched in this thread before using worker processes,
+    # to avoid their overhead in small searches
+    PARALLEL_MIN_FILES = 200
+
+    # Number of files searched by each task sent to worker processes
+    FILES_PER_TASK = 32
 
-    SKIPPED_EXTENSIONS = ['.svg']
+    # Maximum number of tasks waiting for their results
+    MAX_PENDING_TASKS = 4 * MAX_SEARCH_WORKERS
+
+    # Number of files whose results changed that are sent at once when
+    # refreshing the results of a previous search
+    CHANGED_FILES_PER_BATCH = 64
 
     sig_finished = Signal(bool)
     sig_current_file = Signal(str)
     sig_current_folder = Signal(str)
     sig_file_match = Signal(object)
     sig_line_match = Signal(object, object)
+    sig_results_changed = Signal(object, object)
     sig_out_print = Signal(object)
 
     # Batch power sizes (2**power)
     power = 0       # 0**1 = 1
     max_power = 9   # 2**9 = 512
 
-    def __init__(self, parent, search_text, text_color, max_results=1000):
+    def __init__(self, parent, search_text, text_color, max_results=1000,
+                 search_index=None, use_ignore_files=True,
+                 previous_results=None):
         super().__init__(parent)
         self.search_text = search_text
         self.text_color = text_color
         self.max_results = max_results
+        self.search_index = search_index
+        self.use_ignore_files = use_ignore_files
 
         self.mutex = QMutex()
         self.stopped = None
@@ -76,9 +250,32 @@ def __init__(self, parent, search_text, text_color, max_results=1000):
         self.results = {}
 
         self.num_files = 0
-        self.files = []
+        self.files = set()
         self.partial_results = []
         self.total_items = 0
+        self.search_pool = None
+
+        # Filename -> ((mtime, size), matches) of all files searched or whose
+        # previous results were kept, and (mtime, size) of the files that
+        # are being searched
+        self.file_results = {}
+        self.results_complete = False
+        self._file_stats = {}
+
+        # Filename -> matches of the files whose results changed and were
+        # not sent yet
+        self._changed_results = {}
+
+        # Results of a previous search of the same text in the same path, as
+        # returned by get_file_results. Only the files that changed since
+        # then are searched, and their results are sent with
+        # sig_results_changed to replace the previous ones.
+        self.previous_results = previous_results
+        if previous_results is not None:
+            for __, matches in previous_results.values():
+                if matches:
+                    self.total_matches += len(matches)
+                    self.num_files += 1
 
     def initialize(self, path, is_file, exclude,
                    texts, text_re, case_sensitive):
@@ -90,6 +287,7 @@ def initialize(self, path, is_file, exclude,
         self.is_file = is_file
         self.stopped = False
         self.completed = False
+        self.error_flag = False
         self.case_sensitive = case_sensitive
 
     def run(self):
@@ -111,181 +309,200 @@ def run(self):
     def stop(self):
         with QMutexLocker(self.mutex):
             self.stopped = True
+            if self.search_pool is not None:
+                self.search_pool.stop()
             if not self.total_matches:
                 self.report_no_result()
 
+    def is_stopped(self):
+        """Check if the search was stopped."""
+        with QMutexLocker(self.mutex):
+            return self.stopped
+
+    def iter_files(self, path):
+        """
+        Iterate over the files to search in path, skipping the ones that
+        didn't change since the previous search.
+        """
+        for filename in iter_search_files(
+            path, self.exclude, self.is_stopped, self.use_ignore_files
+        ):
+            # This is the name used by search_in_file for its results
+            filename = osp.abspath(filename)
+            try:
+                st = os.stat(filename)
+            except OSError:
+                continue
+
+            # The stat is taken before searching, so files that change
+            # while they're searched are searched again next time
+            stat_key = (st.st_mtime_ns, st.st_size)
+            if self.previous_results is not None:
+                previous = self.previous_results.get(filename)
+                if previous is not None and previous[0] == stat_key:
+                    self.file_results[filename] = previous
+                    continue
+
+            self._file_stats[filename] = stat_key
+            yield filename
+
     def find_files_in_path(self, path):
         if self.pathlist is None:
             self.pathlist = []
         self.pathlist.append(path)
-        for path, dirs, files in os.walk(path):
-            with QMutexLocker(self.mutex):
-                if self.stopped:
+        files = self.iter_files(path)
+        try:
+            # Skip files that the index shows can't contain the texts
+            if self.search_index is not None:
+                candidates = self.search_index.get_candidates(
+                    self.texts, self.text_re
+                )
+                if candidates is not None:
+                    files = (
+                        f for f in files
+                        if self.search_index.may_match(f, candidates)
+                    )
+
+            # Search small trees in this thread
+            for filename in itertools.islice(files, self.PARALLEL_MIN_FILES):
+                self.find_string_in_file(filename)
+                if self.is_stopped():
                     return False
-            try:
-                # For directories
-                for d in dirs[:]:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-
-                    dirname = os.path.join(path, d)
-
-                    # Only search in regular directories.
-                    # The try/except is necessary to catch an error when Python
-                    # can't access a directory with junctions on Windows.
-                    # Fixes spyder-ide/spyder#24898
-                    try:
-                        st_dir_mode = os.stat(dirname).st_mode
-                        if not stat.S_ISDIR(st_dir_mode):
-                            dirs.remove(d)
-                    except OSError:
-                        dirs.remove(d)
-
-                    if (self.exclude and
-                            re.search(self.exclude, dirname + os.sep)):
-                        # Exclude patterns defined by the user
-                        dirs.remove(d)
-                    elif d.startswith('.'):
-                        # Exclude all dot dirs.
-                        dirs.remove(d)
-
-                # For files
-                for f in files:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-
-                    filename = os.path.join(path, f)
-                    ext = osp.splitext(filename)[1]
-
-                    # Only search in regular files (i.e. not pipes).
-                    # The try/except is necessary to catch an error when
-                    # Python can't get the file status due to too many levels
-                    # of symbolic links.
-                    # Fixes spyder-ide/spyder#20798
-                    try:
-                        st_file_mode = os.stat(filename).st_mode
-                        if not stat.S_ISREG(st_file_mode):
-                            continue
-                    except OSError:
-                        continue
-
-                    # Exclude patterns defined by the user
-                    if self.exclude and re.search(self.exclude, filename):
-                        continue
-
-                    # Don't search in plain text files with skipped extensions
-                    # (e.g .svg)
-                    if ext in self.SKIPPED_EXTENSIONS:
-                        continue
-
-                    # It's much faster to check for extension first before
-                    # validating if the file is plain text.
-                    if (
-                        ext in self.PYTHON_EXTENSIONS
-                        or ext in self.USEFUL_EXTENSIONS
-                        or ext in EDIT_EXTENSIONS
-                        or is_text_file(filename)
-                    ):
-                        self.find_string_in_file(filename)
-            except re.error:
-                self.error_flag = _("invalid regular expression")
-                return False
-            except FileNotFoundError:
-                return False
 
-        # Process pending results or report that no results were found
-        if self.partial_results:
+            if not self.find_files_in_workers(files):
+                return False
+        except re.error:
+            self.error_flag = _("invalid regular expression")
+            return False
+        except FileNotFoundError:
+            return False
+
+        if self.previous_results is not None:
+            # Drop the results of files that were deleted
+            for filename, (__, matches) in self.previous_results.items():
+                if matches and filename not in self.file_results:
+                    self._update_totals(matches, [])
+                    self._changed_results[filename] = []
+            self.process_changed_results()
+        elif self.partial_results:
+            # Process pending results
             self.process_results()
         elif not self.total_matches:
             self.report_no_result()
 
+        self.results_complete = True
         return True
 
-    def find_string_in_file(self, fname):
-        self.error_flag = False
-        self.sig_current_file.emit(fname)
+    def find_files_in_workers(self, files):
+        """
+        Search in files with worker processes.
+
+        Results are processed in the same order as files, so they are the
+        same as when searching in this thread.
+        """
+        with QMutexLocker(self.mutex):
+            if self.stopped:
+                return False
+            self.search_pool = get_search_pool()
+            if self.search_pool is not None:
+                self.search_pool.reset()
+
+        pending = deque()
+        try:
+            while True:
+                fnames = list(itertools.islice(files, self.FILES_PER_TASK))
+                if not fnames:
+                    break
+
+                pending.append((fnames, self.submit_search(fnames)))
+
+                # Process finished tasks and wait if there are too many
+                while pending and (
+                    pending[0][1] is None
+                    or pending[0][1].done()
+                    or len(pending) > self.MAX_PENDING_TASKS
+                ):
+                    if not self.process_task(*pending.popleft()):
+                        return False
+
+            while pending:
+                if not self.process_task(*pending.popleft()):
+                    return False
+        finally:
+            for __, future in pending:
+                if future is not None:
+                    future.cancel()
+
+        return True
+
+    def submit_search(self, fnames):
+        """
+        Send a task to search in fnames to a worker process.
+
+        Return None if that's not possible, so they're searched in this
+        thread.
+        """
+        if self.search_pool is None:
+            return None
+
         try:
-            for lineno, line in enumerate(open(fname, 'rb')):
-                for text, enc in self.texts:
-                    with QMutexLocker(self.mutex):
-                        if self.stopped:
-                            return False
-                    line_search = line
-                    if not self.case_sensitive:
-                        line_search = line_search.lower()
-                    if self.text_re:
-                        found = re.search(text, line_search)
-                        if found is not None:
-                            break
-                    else:
-                        found = line_search.find(text)
-                        if found > -1:
-                            break
+            return self.search_pool.submit(
+                fnames, self.texts, self.text_re, self.case_sensitive
+            )
+        except (BrokenProcessPool, RuntimeError):
+            self.on_search_pool_broken()
+            return None
+
+    def process_task(self, fnames, future):
+        """
+        Process the results of the search in fnames.
+
+        Return False if the search was stopped.
+        """
+        if future is not None:
+            while True:
                 try:
-                    line_dec = line.decode(enc)
-                except UnicodeDecodeError:
-                    line_dec = line
-
-                if not self.case_sensitive:
-                    line = line.lower()
-
-                if self.text_re:
-                    for match in re.finditer(text, line):
-                        with QMutexLocker(self.mutex):
-                            if self.stopped:
-                                return False
-                        self.total_matches += 1
-                        bstart, bend = match.start(), match.end()
-                        try:
-                            # Go from binary position to utf8 position
-                            start = len(line[:bstart].decode(enc))
-                            end = start + len(line[bstart:bend].decode(enc))
-                        except UnicodeDecodeError:
-                            start = bstart
-                            end = bend
-                        self.partial_results.append((osp.abspath(fname),
-                                                     lineno + 1,
-                                                     start,
-                                                     end,
-                                                     line_dec))
-                        if len(self.partial_results) > (2**self.power):
-                            self.process_results()
-                            if self.power < self.max_power:
-                                self.power += 1
+                    results, error = future.result(timeout=0.1)
+                except TimeoutError:
+                    if self.is_stopped():
+                        return False
+                except CancelledError:
+                    return False
+                except BrokenProcessPool:
+                    self.on_search_pool_broken()
+                    break
                 else:
-                    found = line.find(text)
-                    while found > -1:
-                        with QMutexLocker(self.mutex):
-                            if self.stopped:
-                                return False
-                        self.total_matches += 1
-                        try:
-                            # Go from binary position to utf8 position
-                            start = len(line[:found].decode(enc))
-                            end = start + len(text.decode(enc))
-                        except UnicodeDecodeError:
-                            start = found
-                            end = found + len(text)
-
-                        self.partial_results.append((osp.abspath(fname),
-                                                     lineno + 1,
-                                                     start,
-                                                     end,
-                                                     line_dec))
-                        if len(self.partial_results) > (2**self.power):
-                            self.process_results()
-                            if self.power < self.max_power:
-                                self.power += 1
-
-                        for text, enc in self.texts:
-                            found = line.find(text, found + 1)
-                            if found > -1:
-                                break
-        except IOError as xxx_todo_changeme:
-            (_errno, _strerror) = xxx_todo_changeme.args
-            self.error_flag = _("permission denied errors were encountered")
+                    self.sig_current_file.emit(fnames[-1])
+                    self.add_file_results(fnames, results, error)
+                    return not self.is_stopped()
+
+        for fname in fnames:
+            self.find_string_in_file(fname)
+            if self.is_stopped():
+                return False
+
+        return True
+
+    def on_search_pool_broken(self):
+        """Search in this thread after worker processes stopped working."""
+        logger.warning(
+            "Worker processes to search in files stopped working",
+            exc_info=True
+        )
+        with QMutexLocker(self.mutex):
+            self.search_pool = None
+        shutdown_search_pool()
+
+    def find_string_in_file(self, fname):
+        self.sig_current_file.emit(fname)
+        results, error = search_in_file(
+            fname,
+            self.texts,
+            self.text_re,
+            self.case_sensitive,
+            self.is_stopped
+        )
+        self.add_file_results([fname], results, error)
 
         # Process pending results or report that no results were found
         if self.is_file:
@@ -296,6 +513,52 @@ def find_string_in_file(self, fname):
 
         self.completed = True
 
+    def add_file_results(self, fnames, results, error=None):
+        """
+        Add the matches found in fnames and save them to refresh them later.
+        """
+        if self.previous_results is None:
+            self.add_results(results, error)
+        elif error:
+            self.error_flag = error
+
+        if not self._file_stats:
+            return
+
+        # Matches are found in the same order as files
+        file_matches = {}
+        for result in results:
+            file_matches.setdefault(result[0], []).append(result)
+
+        for fname in fnames:
+            stat_key = self._file_stats.pop(fname, None)
+            if stat_key is None:
+                continue
+
+            matches = file_matches.get(fname, [])
+            if self.previous_results is not None:
+                previous = self.previous_results.get(fname, (None, []))
+                if matches or previous[1]:
+                    self._update_totals(previous[1], matches)
+                    self._changed_results[fname] = matches
+            self.file_results[fname] = (stat_key, matches)
+
+        if len(self._changed_results) >= self.CHANGED_FILES_PER_BATCH:
+            self.process_changed_results()
+
+    def add_results(self, results, error=None):
+        """Add matches and process them in batches of increasing size."""
+        if error:
+            self.error_flag = error
+
+        for result in results:
+            self.total_matches += 1
+            self.partial_results.append(result)
+            if len(self.partial_results) > (2**self.power):
+                self.process_results()
+                if self.power < self.max_power:
+                    self.power += 1
+
     def process_results(self):
         """
         Process all matches found inside a file.
@@ -315,108 +578,71 @@ def process_results(self):
                 filename, lineno, colno, match_end, line = result
 
                 if filename not in self.files:
-                    self.files.append(filename)
+                    self.files.add(filename)
                     self.sig_file_match.emit(filename)
                     self.num_files += 1
 
-                line = self.truncate_result(line, colno, match_end)
                 item = (filename, lineno, colno, line, match_end)
                 items.append(item)
                 self.total_items += 1
 
-        # Process title
-        title = "'%s' - " % self.search_text
-        nb_files = self.num_files
+        title = self.get_title(num_matches, self.num_files)
+        self.partial_results = []
+        self.sig_line_match.emit(items, title)
 
+    def process_changed_results(self):
+        """
+        Send the matches of the files whose results changed since the
+        previous search, which replace the ones they had.
+        """
+        if self._changed_results:
+            changes = {
+                filename: [
+                    (filename, lineno, colno, line, match_end)
+                    for filename, lineno, colno, match_end, line in matches
+                ]
+                for filename, matches in self._changed_results.items()
+            }
+            self._changed_results = {}
+        else:
+            changes = {}
+
+        if self.total_matches:
+            title = self.get_title(self.total_matches, self.num_files)
+        else:
+            title = f"'{self.search_text}' - " + _("String not found")
+        self.sig_results_changed.emit(changes, title)
+
+    def _update_totals(self, old_matches, new_matches):
+        """Update the number of matches and files when a file changed."""
+        self.total_matches += len(new_matches) - len(old_matches)
+        self.num_files += bool(new_matches) - bool(old_matches)
+
+    def get_title(self, num_matches, num_files):
+        """Get the title shown for num_matches found in num_files."""
         text_matches = _('matches in')
-        text_files = _('files') if nb_files > 1 else _("file")
-        text = "%d %s %d %s" % (
+        text_files = _('files') if num_files > 1 else _("file")
+        return "'%s' - %d %s %d %s" % (
+            self.search_text,
             num_matches,
             text_matches,
-            nb_files,
+            num_files,
             text_files,
         )
-        title = title + text
 
-        self.partial_results = []
-        self.sig_line_match.emit(items, title)
+    def get_results(self):
+        return self.results, self.pathlist, self.total_matches, self.error_flag
 
-    def truncate_result(self, line, start, end):
-        """
-        Shorten text on line to display the match within `max_line_length`.
+    def get_file_results(self):
         """
-        html_escape_table = {
-            "&": "&amp;",
-            '"': "&quot;",
-            "'": "&apos;",
-            ">": "&gt;",
-            "<": "&lt;",
-        }
-
-        def html_escape(text):
-            """Produce entities within text."""
-            return "".join(html_escape_table.get(c, c) for c in text)
-
-        line = str(line)
-        left, match, right = line[:start], line[start:end], line[end:]
-
-        if len(line) > MAX_RESULT_LENGTH:
-            offset = (len(line) - len(match)) // 2
-
-            left = left.split(' ')
-            num_left_words = len(left)
-
-            if num_left_words == 1:
-                left = left[0]
-                if len(left) > MAX_NUM_CHAR_FRAGMENT:
-                    left = ELLIPSIS + left[-offset:]
-                left = [left]
-
-            right = right.split(' ')
-            num_right_words = len(right)
-
-            if num_right_words == 1:
-                right = right[0]
-                if len(right) > MAX_NUM_CHAR_FRAGMENT:
-                    right = right[:offset] + ELLIPSIS
-                right = [right]
+        Get the matches found in each file and the (mtime, size) it had, to
+        refresh them with another search.
 
-            left = left[-4:]
-            right = right[:4]
-
-            if len(left) < num_left_words:
-                left = [ELLIPSIS] + left
-
-            if len(right) < num_right_words:
-                right = right + [ELLIPSIS]
-
-            left = ' '.join(left)
-            right = ' '.join(right)
-
-            if len(left) > MAX_NUM_CHAR_FRAGMENT:
-                left = ELLIPSIS + left[-30:]
-
-            if len(right) > MAX_NUM_CHAR_FRAGMENT:
-                right = right[:30] + ELLIPSIS
-
-        match_color = SpyderPalette.COLOR_OCCURRENCE_4
-        trunc_line = dict(
-            text=''.join([left, match, right]),
-            formatted_text=(
-                f'<span style="color:{self.text_color}">'
-                f'{html_escape(left)}'
-                f'<span style="background-color:{match_color}">'
-                f'{html_escape(match)}'
-                f'</span>'
-                f'{html_escape(right)}'
-                f'</span>'
-            )
-        )
-
-        return trunc_line
-
-    def get_results(self):
-        return self.results, self.pathlist, self.total_matches, self.error_flag
+        Return None if the search didn't go through all files.
+        """
+        if not self.results_complete or self.total_matches > self.max_results:
+            return None
+        return self.file_results
 
     def report_no_result(self):
         title = f"'{self.search_text}' - " + _("String not found")
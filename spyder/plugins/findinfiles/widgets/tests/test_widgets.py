@@ -11,23 +11,29 @@
 # Test library imports
 import os
 import os.path as osp
+import re
 from unittest.mock import MagicMock
 
 # Third party imports
 from flaky import flaky
 import pytest
-from qtpy.QtCore import Qt
+from qtpy.QtCore import QModelIndex, QPersistentModelIndex, Qt
+from qtpy.QtGui import QFont
 from qtpy.QtWidgets import QMessageBox
 
 # Local imports
 from spyder.config.base import running_in_ci
 from spyder.config.manager import CONF
+from spyder.plugins.findinfiles import utils
 from spyder.plugins.findinfiles.widgets.main_widget import FindInFilesWidget
 from spyder.plugins.findinfiles.widgets.combobox import (
     SearchInComboBox,
     SearchInComboBoxItems
 )
-from spyder.plugins.findinfiles.widgets.search_thread import SearchThread
+from spyder.plugins.findinfiles.widgets.results_browser import ResultsModel
+from spyder.plugins.findinfiles.widgets.search_thread import (
+    SearchThread, shutdown_search_pool, truncate_result)
+from spyder.plugins.projects.utils.search_index import TrigramIndex
 from spyder.utils.palette import SpyderPalette
 from spyder.utils.stylesheet import APP_STYLESHEET
 
@@ -44,7 +50,7 @@ def process_search_results(results):
     test framework comparison representation.
     """
     matches = {}
-    for result in results.values():
+    for result in results:
         file, line, col, __ = result
         filename = osp.basename(file)
         if filename not in matches:
@@ -149,8 +155,233 @@ def test_find_in_files_search(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
+    assert expected_results() == matches
+
+
+def test_find_in_files_search_workers(findinfiles, qtbot, monkeypatch):
+    """
+    Test that searching in worker processes gives the same results as
+    searching in the search thread.
+    """
+    monkeypatch.setattr(SearchThread, 'PARALLEL_MIN_FILES', 0)
+    monkeypatch.setattr(SearchThread, 'FILES_PER_TASK', 1)
+
+    def on_search_pool_broken(self):
+        raise AssertionError("Worker processes didn't work")
+
+    monkeypatch.setattr(
+        SearchThread, 'on_search_pool_broken', on_search_pool_broken
+    )
+
+    findinfiles.set_search_text("spam")
+    findinfiles.set_directory(osp.join(LOCATION, "data"))
+    try:
+        with qtbot.waitSignal(findinfiles.sig_finished, timeout=30000):
+            findinfiles.find()
+    finally:
+        shutdown_search_pool()
+
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
+    assert expected_results() == matches
+
+
+def test_find_in_files_search_index(findinfiles, qtbot, tmp_path,
+                                    monkeypatch):
+    """
+    Test that only files that can contain the searched text are searched
+    when there's an index for them.
+    """
+    path = osp.join(LOCATION, "data")
+    index = TrigramIndex(path, str(tmp_path / 'index'))
+    index.refresh()
+    findinfiles.set_search_index(index)
+
+    searched = []
+    find_string_in_file = SearchThread.find_string_in_file
+
+    def find_string_in_file_spy(self, fname):
+        searched.append(osp.basename(fname))
+        find_string_in_file(self, fname)
+
+    monkeypatch.setattr(
+        SearchThread, 'find_string_in_file', find_string_in_file_spy
+    )
+
+    findinfiles.set_search_text("spam")
+    findinfiles.set_directory(path)
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find()
+
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
     assert expected_results() == matches
+    assert sorted(searched) == sorted(expected_results())
+
+
+def test_find_in_files_refresh(findinfiles, qtbot, tmp_path, monkeypatch):
+    """
+    Test that only the files that changed are searched when the same search
+    is run again, and that its results are updated in place.
+    """
+    for name in ['a.py', 'b.py', 'c.py', 'd.py']:
+        (tmp_path / name).write_text('spam\n')
+    (tmp_path / 'd.py').write_text('eggs\n')
+
+    searched = []
+    find_string_in_file = SearchThread.find_string_in_file
+
+    def find_string_in_file_spy(self, fname):
+        searched.append(osp.basename(fname))
+        find_string_in_file(self, fname)
+
+    monkeypatch.setattr(
+        SearchThread, 'find_string_in_file', find_string_in_file_spy
+    )
+
+    def get_matches():
+        return process_search_results(
+            findinfiles.result_browser.results_model.iter_matches()
+        )
+
+    findinfiles.set_search_text("spam")
+    findinfiles.set_directory(str(tmp_path))
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find()
+    assert sorted(searched) == ['a.py', 'b.py', 'c.py', 'd.py']
+    assert get_matches() == {
+        'a.py': [(1, 0)], 'b.py': [(1, 0)], 'c.py': [(1, 0)]
+    }
+
+    # Modified, created and deleted files
+    searched.clear()
+    model = findinfiles.result_browser.results_model
+    persistent = QPersistentModelIndex(model.index(0, 0))
+    (tmp_path / 'a.py').write_text('x = 1\nspam spam\n')
+    (tmp_path / 'd.py').write_text('eggs spam\n')
+    (tmp_path / 'e.py').write_text('spam\n')
+    os.remove(tmp_path / 'c.py')
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find()
+
+    assert sorted(searched) == ['a.py', 'd.py', 'e.py']
+    assert get_matches() == {
+        'a.py': [(2, 0), (2, 5)],
+        'b.py': [(1, 0)],
+        'd.py': [(1, 5)],
+        'e.py': [(1, 0)],
+    }
+    assert model.num_matches == 5
+
+    # The rows of files that were kept didn't change
+    assert persistent.isValid()
+    assert model.data(QModelIndex(persistent), Qt.ToolTipRole) == str(
+        tmp_path / 'a.py'
+    )
+    assert '5 matches in 4 files' in model.title
+
+    # Nothing is searched when nothing changed
+    searched.clear()
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find()
+    assert searched == []
+    assert model.num_matches == 5
+
+    # Other searches search all files again
+    findinfiles.set_search_text("eggs")
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find()
+    assert sorted(searched) == ['a.py', 'b.py', 'd.py', 'e.py']
+    assert get_matches() == {'d.py': [(1, 0)]}
+
+
+@pytest.mark.parametrize('findinfiles',
+                         [{'auto_refresh': True}],
+                         indirect=True)
+def test_find_in_files_auto_refresh(findinfiles, qtbot, tmp_path):
+    """Test that results are refreshed automatically when enabled."""
+    (tmp_path / 'a.py').write_text('spam\n')
+    findinfiles._auto_refresh_timer.setInterval(100)
+
+    findinfiles.set_search_text("spam")
+    findinfiles.set_directory(str(tmp_path))
+    with qtbot.waitSignal(findinfiles.sig_finished):
+        findinfiles.find()
+    assert findinfiles.result_browser.results_model.num_matches == 1
+
+    (tmp_path / 'b.py').write_text('spam spam\n')
+    qtbot.waitUntil(
+        lambda: findinfiles.result_browser.results_model.num_matches == 3
+    )
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, utils.SEARCH_CHUNK_SIZE])
+@pytest.mark.parametrize(
+    'text,text_re,case_sensitive',
+    [
+        (b'spam', False, True),
+        (b'spam', False, False),
+        (b'sp.m$', True, True),
+        (b'^ *spam', True, False),
+        (b'\\Aspam', True, True),
+        (b'spam(?!\\s*sp)', True, True),
+        (b'\xc3\xa1', False, True),
+    ]
+)
+def test_search_in_file_chunks(tmp_path, monkeypatch, chunk_size, text,
+                               text_re, case_sensitive):
+    """
+    Test that searching whole files in chunks gives the same results as
+    searching them line by line.
+    """
+    lines = [
+        "spam = 1\n",
+        "\n",
+        "  Spam and spam and spam\r\n",
+        "eggs and spam\n",
+        "sp\u00e1m\n",
+        "eggs\n",
+    ] * 20 + ["last spam"]
+    fname = str(tmp_path / 'test.py')
+    with open(fname, 'w', encoding='utf-8', newline='') as f:
+        f.write(''.join(lines))
+
+    if text_re:
+        text = re.compile(text, 0 if case_sensitive else re.IGNORECASE)
+    elif not case_sensitive:
+        text = text.lower()
+    texts = [(text, 'utf-8')]
+
+    # Compute the expected results line by line
+    expected = []
+    for lineno, line in enumerate(lines):
+        line_search = line.encode('utf-8')
+        if not case_sensitive and not text_re:
+            line_search = line_search.lower()
+        if text_re:
+            spans = [m.span() for m in text.finditer(line_search)]
+        else:
+            spans = [
+                m.span() for m in re.finditer(re.escape(text), line_search)
+            ]
+        for start, end in spans:
+            # Columns are counted in characters
+            start = len(line_search[:start].decode('utf-8'))
+            end = len(line_search[:end].decode('utf-8'))
+            expected.append((fname, lineno + 1, start, end, line))
+
+    monkeypatch.setattr(utils, 'SEARCH_CHUNK_SIZE', chunk_size)
+    results, error = utils.search_in_file(
+        fname, texts, text_re, case_sensitive
+    )
+    assert error is None
+    assert results == expected
+    assert results
 
 
 @pytest.mark.parametrize('findinfiles',
@@ -162,7 +393,9 @@ def test_exclude_extension_regex(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
     files_filtered = True
     for file in matches:
         filename, ext = osp.splitext(file)
@@ -181,7 +414,9 @@ def test_exclude_extension_string(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
     files_filtered = True
     for file in matches:
         filename, ext = osp.splitext(file)
@@ -200,7 +435,9 @@ def test_exclude_extension_empty_regex(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
     assert expected_results() == matches
 
 
@@ -213,7 +450,9 @@ def test_exclude_extension_string_no_regexp(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
     assert expected_results() == matches
 
 
@@ -226,7 +465,9 @@ def test_exclude_extension_multiple_string(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
     files_filtered = True
     for file in matches:
         filename, ext = osp.splitext(file)
@@ -257,13 +498,89 @@ def test_truncate_result_with_different_input(findinfiles, qtbot, line_input):
     )
 
     # when
-    thread = SearchThread(None, '', text_color=SpyderPalette.COLOR_TEXT_1)
-    truncated_line = thread.truncate_result(line_input, slice_start,
-                                            slice_end)
+    truncated_line = truncate_result(
+        line_input, slice_start, slice_end, SpyderPalette.COLOR_TEXT_1
+    )
     # then
     assert truncated_line['formatted_text'] == expected_result
 
 
+def test_results_model(qtbot):
+    """Test adding matches to the results model and sorting its files."""
+    model = ResultsModel(None, SpyderPalette.COLOR_TEXT_1)
+    model.path = osp.join('path', 'to')
+    model.font = QFont()
+    spam = osp.join('path', 'to', 'spam.py')
+    eggs = osp.join('path', 'to', 'eggs.py')
+
+    # Files can be added before the matches of the previous ones
+    model.add_file(spam)
+    model.add_file(eggs)
+    model.add_matches([(spam, 3, 4, 'x = foo\n', 7)])
+    model.add_matches([(spam, 5, 0, 'foo()\n', 3), (eggs, 1, 0, 'foo\n', 3)])
+
+    assert model.num_matches == 3
+    assert model.rowCount() == 2
+    assert model.rowCount(model.index(0, 0)) == 2
+    assert model.get_match(model.index(0, 0)) is None
+    assert model.get_match(model.index(1, 0, model.index(0, 0))) == (
+        spam, 5, 0, 3
+    )
+    assert 'foo' in model.data(model.index(0, 0, model.index(1, 0)))
+
+    # Sorting moves the files with their matches
+    persistent = QPersistentModelIndex(model.index(0, 0, model.index(0, 0)))
+    model.sort(0)
+    assert model.data(model.index(0, 0), Qt.ToolTipRole) == eggs
+    assert model.rowCount(model.index(0, 0)) == 1
+    assert model.get_match(QModelIndex(persistent)) == (spam, 3, 4, 7)
+    assert [match[0] for match in model.iter_matches()] == [eggs, spam, spam]
+
+    model.clear()
+    assert model.num_matches == 0
+    assert model.rowCount() == 0
+
+
+def test_results_model_update(qtbot, monkeypatch):
+    """Test replacing and removing the matches of files in place."""
+    monkeypatch.setattr(ResultsModel, 'MIN_DEAD_MATCHES_TO_COMPACT', 0)
+    model = ResultsModel(None, SpyderPalette.COLOR_TEXT_1)
+    spam = osp.join('path', 'to', 'spam.py')
+    eggs = osp.join('path', 'to', 'eggs.py')
+    ham = osp.join('path', 'to', 'ham.py')
+
+    for filename in [spam, eggs]:
+        model.add_file(filename)
+        model.add_matches([(filename, 1, 0, 'foo\n', 3)])
+    persistent = QPersistentModelIndex(model.index(0, 0, model.index(1, 0)))
+
+    # Replaced matches
+    assert model.set_file_matches(
+        spam, [(spam, 2, 0, 'foo\n', 3), (spam, 3, 0, 'foo\n', 3)]
+    ) is None
+    assert model.num_matches == 3
+    assert [match[:2] for match in model.iter_matches()] == [
+        (spam, 2), (spam, 3), (eggs, 1)
+    ]
+
+    # Added file
+    assert model.set_file_matches(ham, [(ham, 4, 0, 'foo\n', 3)]) == 2
+    assert model.rowCount() == 3
+
+    # Removed file. Matches of other files are kept after compacting them.
+    model.remove_file(spam)
+    assert model.rowCount() == 2
+    assert model.num_matches == 2
+    assert len(model._linenos) == 2
+    assert model.get_match(QModelIndex(persistent)) == (eggs, 1, 0, 3)
+    assert [match[:2] for match in model.iter_matches()] == [
+        (eggs, 1), (ham, 4)
+    ]
+
+    model.sort(0, Qt.DescendingOrder)
+    assert [match[0] for match in model.iter_matches()] == [ham, eggs]
+
+
 @pytest.mark.parametrize('findinfiles',
                          [{'case_sensitive': False}],
                          indirect=True)
@@ -273,7 +590,9 @@ def test_case_unsensitive_search(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
     print(matches)
     assert expected_case_unsensitive_results() == matches
 
@@ -287,7 +606,9 @@ def test_case_sensitive_search(findinfiles, qtbot):
     findinfiles.find()
     blocker = qtbot.waitSignal(findinfiles.sig_finished)
     blocker.wait()
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
     print(matches)
     assert matches == {'ham.txt': [(9, 0)]}
 
@@ -336,16 +657,17 @@ def test_no_empty_file_items(findinfiles, qtbot):
     # expected because os.walk (used by findinfiles) gives an arbitrary file
     # ordering.)
     spamfiles = set(['spam.py', 'spam.txt', 'spam.cpp'])
-    find_results = process_search_results(findinfiles.result_browser.data)
+    find_results = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
     assert set(find_results.keys()).issubset(spamfiles)
     assert sum(len(finds) for finds in find_results.values()) == max_results
 
     # Assert that the files with results are exactly the same as those
     # displayed in the results browser.
-    files_with_results = set(
-        [v[0] for v in findinfiles.result_browser.data.values()]
-    )
-    displayed_files = set(findinfiles.result_browser.files.keys())
+    results_model = findinfiles.result_browser.results_model
+    files_with_results = set([v[0] for v in results_model.iter_matches()])
+    displayed_files = set(results_model.files)
     assert files_with_results == displayed_files
 
 
@@ -720,8 +1042,9 @@ def test_max_results(findinfiles, qtbot):
     blocker = qtbot.waitSignal(findinfiles.sig_max_results_reached)
     blocker.wait()
 
-    print(len(findinfiles.result_browser.data), value)
-    assert len(findinfiles.result_browser.data) == value
+    num_matches = findinfiles.result_browser.results_model.num_matches
+    print(num_matches, value)
+    assert num_matches == value
 
     # Restore defaults
     findinfiles.set_max_results(1000)
@@ -742,7 +1065,9 @@ def test_find_in_single_file(findinfiles, qtbot):
     with qtbot.waitSignal(findinfiles.sig_finished):
         findinfiles.find()
 
-    matches = process_search_results(findinfiles.result_browser.data)
+    matches = process_search_results(
+        findinfiles.result_browser.results_model.iter_matches()
+    )
     assert list(matches.keys()) == ['spam.txt']
     assert expected_results()['spam.txt'] == matches['spam.txt']
 
@@ -177,5 +177,30 @@ def handler(a, b):
     assert res == 'ab'
 
 
+@pytest.mark.skipif(os.name == 'nt', reason="Hangs on Windows")
+def test_request_with_buffers(comms):
+    """Test that bytes and memoryviews in lists are replied as buffers."""
+    kernel_comm, frontend_comm = comms
+    sent_buffers = []
+
+    def handler():
+        return [{'size': 2}, b'ab', 'c', memoryview(b'de')]
+
+    def send(msg_dict, buffers=None):
+        sent_buffers.append(buffers)
+        send_message(msg_dict, buffers)
+
+    kernel_comm.register_call_handler('test_request', handler)
+    comm = kernel_comm._comms[1]['comm']
+    send_message = comm.send
+    comm.send = send
+
+    res = frontend_comm.remote_call(blocking=True).test_request()
+
+    assert sent_buffers == [[b'ab', memoryview(b'de')]]
+    assert res[:3] == [{'size': 2}, b'ab', 'c']
+    assert bytes(res[3]) == b'de'
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -20,6 +20,7 @@
 from packaging.version import parse
 from qtconsole.rich_jupyter_widget import RichJupyterWidget
 from spyder_kernels.comms.commbase import CommError
+from spyder_kernels.utils.arraybuffers import from_buffers
 
 # Local imports
 from spyder.api.translations import _
@@ -45,8 +46,14 @@ class NamepaceBrowserWidget(RichJupyterWidget):
     between the IPython Console and the kernel namespace
     """
     # --- Public API --------------------------------------------------
-    def get_value(self, name):
-        """Ask kernel for a value"""
+    def get_value(self, name, bufferable=False):
+        """
+        Ask kernel for a value.
+
+        If bufferable is True, the value is an array or DataFrame that is
+        first requested as raw memory buffers, and only pickled if the kernel
+        can't send it that way.
+        """
         # ---- Reasons
         reason_big = _("The variable is too big to be retrieved")
         reason_not_picklable = _(
@@ -139,6 +146,11 @@ def get_value(self, name):
         kernel_call_success = False
         show_full_msg = True
         try:
+            if bufferable:
+                value = self._get_value_from_buffers(name)
+                if value is not None:
+                    return value
+
             value = self.call_kernel(
                 blocking=True,
                 # We prefer not to display errors because it's not clear that
@@ -277,6 +289,100 @@ def get_value(self, name):
         except Exception:
             raise ValueError(msg % reason_other)
 
+    def _get_value_from_buffers(self, name):
+        """
+        Ask kernel for an array or DataFrame as a header and the buffers with
+        its memory, which are used without copying them.
+
+        Return None if the value can't be sent that way, or if the kernel
+        can't send values like this (i.e. it's older than this method).
+        """
+        try:
+            header, *buffers = self.call_kernel(
+                blocking=True,
+                display_error=False,
+                timeout=CALL_KERNEL_TIMEOUT
+            ).get_value_buffers(name)
+        except (TypeError, CommError):
+            return None
+        return from_buffers(header, buffers)
+
+    def get_data_frame_info(self, name, view=None):
+        """Ask kernel for the shape, dtypes and header levels of a DataFrame"""
+        return self.call_kernel(
+            blocking=True,
+            display_error=False,
+            timeout=CALL_KERNEL_TIMEOUT
+        ).get_data_frame_info(name, view=view)
+
+    def get_data_frame_window(self, name, rows, columns, view=None,
+                              callback=None):
+        """
+        Ask kernel for the values of a DataFrame in a range of rows and
+        columns, given as [start, stop] lists.
+
+        If callback is given, the call doesn't block and the values are
+        passed to it when they arrive.
+        """
+        if callback is not None:
+            self.call_kernel(
+                display_error=False,
+                callback=lambda window: callback(cloudpickle.loads(window))
+            ).get_data_frame_window(name, rows, columns, view=view)
+            return
+
+        window = self.call_kernel(
+            blocking=True,
+            display_error=False,
+            timeout=CALL_KERNEL_TIMEOUT
+        ).get_data_frame_window(name, rows, columns, view=view)
+        return cloudpickle.loads(window)
+
+    def get_data_frame_header(self, name, axis, start, stop, view=None,
+                              callback=None):
+        """
+        Ask kernel for the column (axis 0) or row labels of a DataFrame.
+
+        If callback is given, the call doesn't block and the labels are
+        passed to it when they arrive.
+        """
+        if callback is not None:
+            self.call_kernel(
+                display_error=False,
+                callback=lambda labels: callback(cloudpickle.loads(labels))
+            ).get_data_frame_header(name, axis, start, stop, view=view)
+            return
+
+        labels = self.call_kernel(
+            blocking=True,
+            display_error=False,
+            timeout=CALL_KERNEL_TIMEOUT
+        ).get_data_frame_header(name, axis, start, stop, view=view)
+        return cloudpickle.loads(labels)
+
+    def set_data_frame_view(self, name, sort=None, filter=None, columns=None,
+                            view=None):
+        """
+        Ask kernel to sort, filter and select the columns of a DataFrame.
+
+        The kernel replies with the info of the result and the id of a view
+        to get parts of it with the methods above.
+        """
+        return self.call_kernel(
+            blocking=True,
+            display_error=False,
+            timeout=CALL_KERNEL_TIMEOUT
+        ).set_data_frame_view(
+            name, sort=sort, filter=filter, columns=columns, view=view
+        )
+
+    def close_data_frame_view(self, view):
+        """Ask kernel to forget a view of a DataFrame"""
+        self.call_kernel(
+            blocking=False,
+            display_error=False,
+        ).close_data_frame_view(view)
+
     def set_value(self, name, value):
         """Set value for a variable"""
         reason_mismatched_numpy = _(
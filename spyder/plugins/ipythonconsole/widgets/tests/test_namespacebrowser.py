@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# -----------------------------------------------------------------------------
+# Copyright © Spyder Project Contributors
+#
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+# -----------------------------------------------------------------------------
+
+"""Tests for the communications between the console and the kernel."""
+
+# Standard library imports
+from functools import partial
+from unittest.mock import Mock
+
+# Third party imports
+import cloudpickle
+import numpy as np
+from numpy.testing import assert_array_equal
+import pytest
+from spyder_kernels.comms.commbase import CommError
+from spyder_kernels.utils.arraybuffers import to_buffers
+
+# Local imports
+from spyder.plugins.ipythonconsole.widgets.namespacebrowser import (
+    NamepaceBrowserWidget)
+
+
+def get_shellwidget(kernel):
+    """Shell widget whose calls go to kernel."""
+    shellwidget = Mock()
+    shellwidget.call_kernel.return_value = kernel
+    shellwidget._get_value_from_buffers = partial(
+        NamepaceBrowserWidget._get_value_from_buffers, shellwidget
+    )
+    return shellwidget
+
+
+@pytest.mark.parametrize('buffers_handler', [True, False])
+def test_get_value_bufferable(buffers_handler):
+    """
+    Test that arrays are received as buffers, or pickled if the kernel
+    doesn't have the handler to send them that way.
+    """
+    array = np.arange(12.).reshape(3, 4)
+    kernel = Mock()
+    kernel.get_value.return_value = cloudpickle.dumps(array)
+    if buffers_handler:
+        header, buffers = to_buffers(array)
+        kernel.get_value_buffers.return_value = [header] + [
+            bytes(buffer) for buffer in buffers
+        ]
+    else:
+        # This is what older kernels raise
+        kernel.get_value_buffers.side_effect = CommError(
+            "No such spyder call type: get_value_buffers"
+        )
+    shellwidget = get_shellwidget(kernel)
+
+    value = NamepaceBrowserWidget.get_value(
+        shellwidget, 'a', bufferable=True
+    )
+    assert_array_equal(value, array)
+    kernel.get_value_buffers.assert_called_once_with('a')
+    if buffers_handler:
+        kernel.get_value.assert_not_called()
+        assert not value.flags.writeable
+    else:
+        kernel.get_value.assert_called_once_with('a', encoded=True)
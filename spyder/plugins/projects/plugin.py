@@ -87,6 +87,17 @@ class Projects(SpyderDockablePlugin):
         between projects (signature 2).
     """
 
+    sig_search_index_changed = Signal(object)
+    """
+    This signal is emitted when the index of the project files is created or
+    removed.
+
+    Parameters
+    ----------
+    index: spyder.plugins.projects.utils.search_index.TrigramIndex
+        Index of the project files, or None if there's no index.
+    """
+
     # ---- SpyderDockablePlugin API
     # -------------------------------------------------------------------------
     @staticmethod
@@ -112,6 +123,7 @@ def on_initialize(self):
         widget.sig_project_created.connect(self.sig_project_created)
         widget.sig_project_closed.connect(self.sig_project_closed)
         widget.sig_project_loaded.connect(self.sig_project_loaded)
+        widget.sig_search_index_changed.connect(self.sig_search_index_changed)
 
         treewidget.sig_delete_project.connect(self.delete_project)
         treewidget.sig_redirect_stdio_requested.connect(
@@ -384,6 +396,10 @@ def get_active_project(self):
         """Get the active project."""
         return self.get_widget().current_active_project
 
+    def get_search_index(self):
+        """Get the index of the files of the active project, if any."""
+        return self.get_widget().search_index
+
     def get_project_filenames(self):
         """Get the list of recent filenames of a project."""
         return self.get_widget().get_project_filenames()
@@ -587,7 +603,7 @@ def _display_items_in_switcher(self, items, setup, clear_section):
                 data=path,
                 last_item=is_last_item,
                 score=1e10,  # To make the editor results appear first
-                use_score=False  # Results come from fzf in the right order
+                use_score=False  # Results are already sorted by the finder
             )
 
         if setup:
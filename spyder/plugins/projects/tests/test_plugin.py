@@ -468,6 +468,50 @@ def test_filesystem_notifications(qtbot, projects, tmpdir):
         png_file.write("")
 
 
+@flaky(max_runs=5)
+def test_search_index(qtbot, projects, tmpdir):
+    """
+    Test that the index of the project files is created when the project is
+    opened and updated when files change.
+    """
+    project_root = tmpdir.mkdir('project0')
+    file0 = project_root.join('file0.py')
+    file0.write('spam = 1')
+    project_root.join('file1.txt').write('eggs')
+
+    projects.set_conf('index_project_files', True)
+    try:
+        with qtbot.waitSignal(projects.sig_search_index_changed) as blocker:
+            projects.open_project(path=str(project_root))
+
+        index = blocker.args[0]
+        assert index is projects.get_search_index()
+
+        def get_candidates(text):
+            candidates = index.get_candidates([(text, 'utf-8')], False)
+            return [
+                name for name in ['file0.py', 'file1.txt']
+                if index.may_match(str(project_root.join(name)), candidates)
+            ]
+
+        qtbot.waitUntil(lambda: len(index) == 2, timeout=5000)
+        assert get_candidates(b'spam') == ['file0.py']
+
+        # The index is updated when files change
+        file0.write('ham = 1')
+        assert get_candidates(b'spam') == ['file0.py']
+        qtbot.waitUntil(lambda: get_candidates(b'spam') == [], timeout=30000)
+        assert get_candidates(b'ham') == ['file0.py']
+
+        # The index is removed when the project is closed
+        with qtbot.waitSignal(projects.sig_search_index_changed) as blocker:
+            projects.close_project()
+        assert blocker.args == [None]
+        assert projects.get_search_index() is None
+    finally:
+        projects.set_conf('index_project_files', False)
+
+
 def test_loaded_and_closed_signals(create_projects, tmpdir, mocker, qtbot):
     """
     Test that loaded and closed signals are emitted when switching
@@ -0,0 +1,387 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Fuzzy finder of the files in a project.
+
+A file matches a searched text when the characters of the text appear in its
+path in the same order, although not necessarily next to each other. To find
+them fast, the finder keeps for every character a bitset (a Python int with
+one bit per file) of the files whose path contains it, so the files that
+contain all the characters of a text are computed with a few bitwise
+operations before checking their order. It doesn't depend on Qt, so it can be
+built from worker threads.
+"""
+
+# Standard library imports
+import os
+import os.path as osp
+import re
+import threading
+
+# Local imports
+from spyder.config.utils import EDIT_EXTENSIONS
+from spyder.utils.filewalk import walk_files
+
+
+# Positions of the bits that are set in every byte
+BYTE_BITS = [
+    tuple(bit for bit in range(8) if byte & (1 << bit)) for byte in range(256)
+]
+
+NONZERO_BYTE_RE = re.compile(b'[^\x00]')
+
+
+# ---- Auxiliary functions
+# -----------------------------------------------------------------------------
+def iter_bits(bitset):
+    """Iterate over the positions of the bits set in bitset, in order."""
+    data = bitset.to_bytes((bitset.bit_length() + 7) // 8, 'little')
+    for match in NONZERO_BYTE_RE.finditer(data):
+        position = match.start()
+        for bit in BYTE_BITS[data[position]]:
+            yield position * 8 + bit
+
+
+def get_fuzzy_regexp(text):
+    """
+    Get a regular expression that matches the strings in which the
+    characters of text appear in order.
+    """
+    regexp = ''
+    for char in text:
+        char = re.escape(char)
+        # The possessive quantifier prevents backtracking, which is not
+        # necessary because it stops at the first occurrence of char.
+        regexp += f'[^{char}]*+{char}'
+
+    return re.compile(regexp, re.DOTALL)
+
+
+def normalize_search_text(text):
+    """Get the text to search, which is case insensitive and has no spaces."""
+    text = ''.join(text.lower().split())
+    if os.sep != '/':
+        text = text.replace('/', os.sep)
+    return text
+
+
+def is_switcher_file(filename):
+    """Check if filename can be found, i.e. if it can be edited."""
+    return osp.splitext(filename)[1] in EDIT_EXTENSIONS
+
+
+# ---- Finder
+# -----------------------------------------------------------------------------
+class FileFinder:
+    """
+    Fuzzy finder of the editable files in a directory.
+
+    Results are ranked by matching first the file names and then their whole
+    paths, and by preferring shorter paths. When the searched text extends
+    the previous one, only the files that matched it are checked.
+    """
+
+    # Number of matches that are ranked by how well they match the searched
+    # text, apart from their length. This limits the time taken by searches
+    # that match most files.
+    MAX_RANKED_MATCHES = 1000
+
+    # The bitsets are built again when this fraction of the files was
+    # removed or added after they were built, to keep them sorted by length.
+    MAX_UNSORTED_FRACTION = 0.1
+
+    def __init__(self, root_path):
+        self.root_path = osp.normpath(root_path)
+        self._lock = threading.RLock()
+        self._stopped = False
+        self._clear()
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def __len__(self):
+        with self._lock:
+            return len(self._ids)
+
+    def stop(self):
+        """Stop building or updating the finder."""
+        self._stopped = True
+
+    def is_stopped(self):
+        """Check if building or updating the finder was stopped."""
+        return self._stopped
+
+    def refresh(self):
+        """Find again all the files in the root directory."""
+        relpaths = []
+        for filename in walk_files(self.root_path, is_stopped=self.is_stopped):
+            if is_switcher_file(filename):
+                relpaths.append(osp.relpath(filename, self.root_path))
+
+        if not self.is_stopped():
+            self._build(relpaths)
+
+    def set_paths(self, relpaths):
+        """Set the paths of the files to find, relative to the root path."""
+        self._build(list(relpaths))
+
+    def update_paths(self, paths):
+        """
+        Update the finder for paths, which can be files or directories that
+        were created, modified or deleted.
+        """
+        # Walk the paths before taking the lock, so searches are not blocked
+        # while going through big directories
+        added = []
+        removed = []
+        prefixes = []
+        for path in paths:
+            if self.is_stopped():
+                return
+
+            path = osp.normpath(path)
+            relpath = osp.relpath(path, self.root_path)
+            if relpath == os.curdir or relpath.startswith(os.pardir):
+                continue
+
+            if osp.isfile(path):
+                if is_switcher_file(path):
+                    added.append(relpath)
+                continue
+
+            if osp.isdir(path):
+                for filename in walk_files(path, is_stopped=self.is_stopped):
+                    if is_switcher_file(filename):
+                        added.append(osp.relpath(filename, self.root_path))
+            else:
+                removed.append(relpath)
+
+            # The files that were in a directory that was moved or deleted
+            # need to be removed
+            prefixes.append(relpath + os.sep)
+
+        if self.is_stopped():
+            return
+
+        if prefixes:
+            prefixes = tuple(prefixes)
+            with self._lock:
+                found = [
+                    relpath for relpath in self._ids
+                    if relpath.startswith(prefixes)
+                ]
+            removed += [
+                relpath for relpath in found
+                if not osp.isfile(osp.join(self.root_path, relpath))
+            ]
+
+        with self._lock:
+            for relpath in removed:
+                self._remove_path(relpath)
+            for relpath in added:
+                self._add_path(relpath)
+
+            num_unsorted = self._num_added + self._num_dead
+            if num_unsorted <= self.MAX_UNSORTED_FRACTION * len(self._paths):
+                return
+            relpaths = list(self._ids)
+
+        self._build(relpaths)
+
+    def search(self, text, max_results):
+        """
+        Find the files that match text.
+
+        Parameters
+        ----------
+        text: str
+            Text to search for. Case and spaces are ignored.
+        max_results: int
+            Maximum number of results.
+
+        Returns
+        -------
+        results: list
+            Relative paths of the matching files, from best to worst match.
+        """
+        text = normalize_search_text(text)
+        with self._lock:
+            if not text:
+                results = []
+                for i in iter_bits(self._alive):
+                    if len(results) >= max_results:
+                        break
+                    results.append(self._paths[i])
+                return results
+
+            # Narrow the files that matched the previous text if this one
+            # extends it
+            last_text, last_version, last_candidates = self._last_search
+            if (
+                last_text is not None
+                and last_version == self._version
+                and text.startswith(last_text)
+            ):
+                candidates = last_candidates
+                new_chars = text[len(last_text):]
+            else:
+                candidates = self._alive
+                new_chars = text
+
+            for char in set(new_chars):
+                candidates &= self._path_bits.get(char, 0)
+
+            name_candidates = candidates
+            for char in set(text):
+                name_candidates &= self._name_bits.get(char, 0)
+
+            regexp = get_fuzzy_regexp(text)
+
+            # Files that match in their names go first
+            matches = []
+            for i in iter_bits(name_candidates):
+                if len(matches) >= self.MAX_RANKED_MATCHES:
+                    break
+                name = self._lower_names[i]
+                if regexp.match(name):
+                    # Files are sorted by length, so this is only necessary
+                    # to prefer names that contain text as is
+                    matches.append((text not in name, i))
+
+            matches.sort()
+            results = [i for __, i in matches[:max_results]]
+
+            # Then the ones that match in the rest of their paths. The files
+            # that don't match can't match a text that extends this one.
+            rejected = []
+            if len(results) < max_results:
+                found = set(results)
+                for i in iter_bits(candidates):
+                    if i in found:
+                        continue
+                    if regexp.match(self._lower_paths[i]):
+                        results.append(i)
+                        if len(results) >= max_results:
+                            break
+                    else:
+                        rejected.append(i)
+
+            if rejected:
+                candidates &= ~self._get_bitset(rejected)
+            self._last_search = (text, self._version, candidates)
+
+            return [self._paths[i] for i in results]
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _clear(self):
+        # Relative paths of files by id, which is the position of their bit
+        # in the bitsets. They're None for removed files.
+        self._paths = []
+        self._lower_paths = []
+        self._lower_names = []
+
+        # Relative path -> id
+        self._ids = {}
+
+        # Character -> bitset of the files that have it in their paths or
+        # names
+        self._path_bits = {}
+        self._name_bits = {}
+
+        # Bitset of the files that were not removed
+        self._alive = 0
+
+        # Files added or removed after building the bitsets
+        self._num_added = 0
+        self._num_dead = 0
+
+        # Changed every time files are added or removed, to know if the
+        # results of the last search can be narrowed
+        self._version = 0
+        self._last_search = (None, None, 0)
+
+    def _build(self, relpaths):
+        """Build the bitsets for relpaths, sorted by length."""
+        relpaths.sort(key=lambda relpath: (len(relpath), relpath))
+        lower_paths = [relpath.lower() for relpath in relpaths]
+        lower_names = [osp.basename(path) for path in lower_paths]
+
+        # Building byte arrays first is much faster than setting the bits
+        # of ints one by one
+        size = (len(relpaths) + 7) // 8
+        path_bytes = {}
+        name_bytes = {}
+        for i, (path, name) in enumerate(zip(lower_paths, lower_names)):
+            if i % 1024 == 0 and self.is_stopped():
+                return
+
+            position = i >> 3
+            bit = 1 << (i & 7)
+            for chars, char_bytes in [(path, path_bytes), (name, name_bytes)]:
+                for char in set(chars):
+                    data = char_bytes.get(char)
+                    if data is None:
+                        data = char_bytes[char] = bytearray(size)
+                    data[position] |= bit
+
+        with self._lock:
+            self._clear()
+            self._paths = relpaths
+            self._lower_paths = lower_paths
+            self._lower_names = lower_names
+            self._ids = {relpath: i for i, relpath in enumerate(relpaths)}
+            self._path_bits = {
+                char: int.from_bytes(data, 'little')
+                for char, data in path_bytes.items()
+            }
+            self._name_bits = {
+                char: int.from_bytes(data, 'little')
+                for char, data in name_bytes.items()
+            }
+            self._alive = (1 << len(relpaths)) - 1
+
+    def _add_path(self, relpath):
+        if relpath in self._ids:
+            return
+
+        i = len(self._paths)
+        lower_path = relpath.lower()
+        lower_name = osp.basename(lower_path)
+        self._paths.append(relpath)
+        self._lower_paths.append(lower_path)
+        self._lower_names.append(lower_name)
+        self._ids[relpath] = i
+
+        bit = 1 << i
+        for char in set(lower_path):
+            self._path_bits[char] = self._path_bits.get(char, 0) | bit
+        for char in set(lower_name):
+            self._name_bits[char] = self._name_bits.get(char, 0) | bit
+        self._alive |= bit
+
+        self._num_added += 1
+        self._version += 1
+
+    def _remove_path(self, relpath):
+        i = self._ids.pop(relpath, None)
+        if i is None:
+            return
+
+        # The bits of the file in the character bitsets are left, so that
+        # it's not necessary to update all of them
+        self._paths[i] = None
+        self._alive &= ~(1 << i)
+
+        self._num_dead += 1
+        self._version += 1
+
+    def _get_bitset(self, ids):
+        """Get the bitset with the bits of ids set."""
+        data = bytearray((len(self._paths) + 7) // 8)
+        for i in ids:
+            data[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(data, 'little')
@@ -0,0 +1,409 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Trigram index of the files in a project.
+
+The index maps each sequence of three bytes (trigram) to the files that
+contain it, so that searches only need to read the files that contain all the
+trigrams of the searched text. It doesn't depend on Qt, so it can be updated
+from worker threads.
+"""
+
+# Standard library imports
+from array import array
+import hashlib
+import logging
+import os
+import os.path as osp
+import pickle
+import re
+from re import _constants as sre_constants, _parser as sre_parser
+import threading
+
+# Local imports
+from spyder.config.base import get_conf_path
+from spyder.plugins.findinfiles.utils import (
+    is_searchable_file, iter_search_files)
+
+
+logger = logging.getLogger(__name__)
+
+# This finds all overlapping trigrams faster than slicing in Python
+TRIGRAM_RE = re.compile(b'(?=(...))', re.DOTALL)
+
+
+# ---- Auxiliary functions
+# -----------------------------------------------------------------------------
+def get_index_path(root_path):
+    """Get the path of the file where the index of root_path is saved."""
+    name = hashlib.sha1(osp.normcase(root_path).encode('utf-8')).hexdigest()
+    return get_conf_path(osp.join('search_indexes', name))
+
+
+def get_trigrams(data):
+    """Get the set of (lower case) trigrams in data."""
+    return set(TRIGRAM_RE.findall(data.lower()))
+
+
+def get_required_literals(text, text_re):
+    """
+    Get the literals that a match of text must contain.
+
+    Parameters
+    ----------
+    text: bytes or re.Pattern
+        Text to search for.
+    text_re: bool
+        Whether text is a regular expression.
+
+    Returns
+    -------
+    literals: list or None
+        Lower case literals of at least three bytes that are part of every
+        match, or None if there are none.
+    """
+    if not text_re:
+        return [text.lower()] if len(text) >= 3 else None
+
+    # Take the runs of literal characters at the top level of the
+    # expression, which appear in all its matches.
+    try:
+        items = sre_parser.parse(text.pattern, text.flags)
+    except (re.error, AttributeError, TypeError):
+        return None
+
+    literals = []
+    run = bytearray()
+    for op, value in list(items) + [(None, None)]:
+        if op is sre_constants.LITERAL and value < 256:
+            run.append(value)
+        else:
+            if len(run) >= 3:
+                literals.append(bytes(run).lower())
+            run = bytearray()
+
+    return literals or None
+
+
+# ---- Index
+# -----------------------------------------------------------------------------
+class TrigramIndex:
+    """
+    Trigram index of the searchable files in a directory.
+
+    Files that are not in the index or that changed since they were indexed
+    are always candidates for a search, so the index can be used while it's
+    being built or updated.
+    """
+
+    # Change this when the format of the saved index changes
+    VERSION = 1
+
+    # Files larger than this are not indexed
+    MAX_FILE_SIZE = 1024 ** 2
+
+    def __init__(self, root_path, index_path=None):
+        self.root_path = osp.normpath(root_path)
+        self.index_path = (
+            get_index_path(self.root_path) if index_path is None
+            else index_path
+        )
+
+        self._lock = threading.RLock()
+        self._stopped = False
+        self._clear()
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def __len__(self):
+        with self._lock:
+            return len(self._files)
+
+    def stop(self):
+        """Stop building or updating the index."""
+        self._stopped = True
+
+    def is_stopped(self):
+        """Check if building or updating the index was stopped."""
+        return self._stopped
+
+    def load(self):
+        """
+        Load the index saved for this directory.
+
+        Return True if it was loaded.
+        """
+        try:
+            with open(self.index_path, 'rb') as f:
+                data = pickle.load(f)
+            if (
+                data['version'] != self.VERSION
+                or data['root_path'] != self.root_path
+            ):
+                return False
+        except FileNotFoundError:
+            return False
+        except Exception:
+            logger.debug(
+                f"Could not load search index {self.index_path}",
+                exc_info=True
+            )
+            return False
+
+        with self._lock:
+            self._files = data['files']
+            self._postings = data['postings']
+            self._next_id = data['next_id']
+            self._num_dead = data['num_dead']
+
+        return True
+
+    def save(self):
+        """Save the index to disk."""
+        with self._lock:
+            self._compact()
+            data = pickle.dumps(
+                {
+                    'version': self.VERSION,
+                    'root_path': self.root_path,
+                    'files': self._files,
+                    'postings': self._postings,
+                    'next_id': self._next_id,
+                    'num_dead': self._num_dead,
+                },
+                protocol=pickle.HIGHEST_PROTOCOL
+            )
+
+        # Write to a temporary file first to not leave a truncated index
+        # behind if this fails.
+        tmp_path = self.index_path + '.tmp'
+        try:
+            os.makedirs(osp.dirname(self.index_path), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            logger.debug(
+                f"Could not save search index {self.index_path}",
+                exc_info=True
+            )
+
+    def delete(self):
+        """Delete the index from memory and disk."""
+        with self._lock:
+            self._clear()
+
+        try:
+            os.remove(self.index_path)
+        except OSError:
+            pass
+
+    def refresh(self):
+        """
+        Index the files that changed since the index was built and remove
+        the ones that don't exist anymore.
+        """
+        seen = set()
+        for filename in iter_search_files(
+            self.root_path, is_stopped=self.is_stopped
+        ):
+            relpath = osp.relpath(filename, self.root_path)
+            seen.add(relpath)
+            self._update_file(relpath, searchable=True)
+
+        if self.is_stopped():
+            return
+
+        with self._lock:
+            for relpath in set(self._files) - seen:
+                self._remove_file(relpath)
+
+    def update_paths(self, paths):
+        """
+        Update the index for paths, which can be files or directories that
+        were created, modified or deleted.
+        """
+        for path in paths:
+            if self.is_stopped():
+                return
+
+            path = osp.normpath(path)
+            relpath = osp.relpath(path, self.root_path)
+            if relpath == os.curdir or relpath.startswith(os.pardir):
+                continue
+
+            if osp.isfile(path):
+                self._update_file(relpath)
+                continue
+
+            if osp.isdir(path):
+                for filename in iter_search_files(
+                    path, is_stopped=self.is_stopped
+                ):
+                    self._update_file(
+                        osp.relpath(filename, self.root_path),
+                        searchable=True
+                    )
+            else:
+                self._update_file(relpath)
+
+            # Remove the files that were in a directory that was moved or
+            # deleted
+            with self._lock:
+                prefix = relpath + os.sep
+                for indexed in list(self._files):
+                    if indexed.startswith(prefix) and not osp.isfile(
+                        osp.join(self.root_path, indexed)
+                    ):
+                        self._remove_file(indexed)
+
+    def get_candidates(self, texts, text_re):
+        """
+        Get the files that can contain any of texts.
+
+        Parameters
+        ----------
+        texts: list
+            List of (text, encoding) tuples, as used by Find in Files.
+        text_re: bool
+            Whether texts are regular expressions.
+
+        Returns
+        -------
+        candidates: set or None
+            Ids of the indexed files that can contain texts, or None if the
+            index can't be used to narrow the search. Use `may_match` to
+            check a file against them.
+        """
+        candidates = set()
+        with self._lock:
+            for text, __ in texts:
+                literals = get_required_literals(text, text_re)
+                if literals is None:
+                    return None
+
+                trigrams = set()
+                for literal in literals:
+                    trigrams.update(get_trigrams(literal))
+
+                postings = sorted(
+                    (self._postings.get(trigram, ()) for trigram in trigrams),
+                    key=len
+                )
+                file_ids = set(postings[0])
+                for posting in postings[1:]:
+                    if not file_ids:
+                        break
+                    file_ids.intersection_update(posting)
+
+                candidates.update(file_ids)
+
+        return candidates
+
+    def may_match(self, filename, candidates):
+        """Check if filename needs to be searched given candidates."""
+        relpath = osp.relpath(filename, self.root_path)
+        with self._lock:
+            entry = self._files.get(relpath)
+
+        if entry is None:
+            return True
+
+        file_id, mtime, size = entry
+        try:
+            st = os.stat(filename)
+        except OSError:
+            return True
+
+        if (st.st_mtime_ns, st.st_size) != (mtime, size):
+            return True
+
+        return file_id in candidates
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _clear(self):
+        # Relative path -> (file id, mtime, size)
+        self._files = {}
+
+        # Trigram -> ids of the files that contain it
+        self._postings = {}
+
+        # Ids are not reused, so the ones of files that changed or were
+        # removed are just ignored until the index is compacted.
+        self._next_id = 0
+        self._num_dead = 0
+
+    def _update_file(self, relpath, searchable=False):
+        """
+        Index relpath again if it changed.
+
+        Pass searchable=True if it's already known that it can be searched.
+        """
+        filename = osp.join(self.root_path, relpath)
+        try:
+            st = os.stat(filename)
+        except OSError:
+            st = None
+
+        with self._lock:
+            entry = self._files.get(relpath)
+
+        if st is not None and entry is not None:
+            if (st.st_mtime_ns, st.st_size) == entry[1:]:
+                return
+
+        trigrams = None
+        if (
+            st is not None
+            and st.st_size <= self.MAX_FILE_SIZE
+            and (searchable or is_searchable_file(filename))
+        ):
+            try:
+                with open(filename, 'rb') as f:
+                    trigrams = get_trigrams(f.read())
+            except OSError:
+                pass
+
+        with self._lock:
+            self._remove_file(relpath)
+            if trigrams is None:
+                return
+
+            file_id = self._next_id
+            self._next_id += 1
+            self._files[relpath] = (file_id, st.st_mtime_ns, st.st_size)
+
+            postings = self._postings
+            for trigram in trigrams:
+                posting = postings.get(trigram)
+                if posting is None:
+                    postings[trigram] = array('I', [file_id])
+                else:
+                    posting.append(file_id)
+
+    def _remove_file(self, relpath):
+        entry = self._files.pop(relpath, None)
+        if entry is not None:
+            self._num_dead += 1
+            if self._num_dead > max(1000, len(self._files)):
+                self._compact()
+
+    def _compact(self):
+        """Remove the ids of files that are not in the index anymore."""
+        if not self._num_dead:
+            return
+
+        live = {entry[0] for entry in self._files.values()}
+        postings = {}
+        for trigram, posting in self._postings.items():
+            posting = array('I', (i for i in posting if i in live))
+            if posting:
+                postings[trigram] = posting
+
+        self._postings = postings
+        self._num_dead = 0
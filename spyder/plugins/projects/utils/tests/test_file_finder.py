@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the file finder of projects.
+"""
+
+# Standard library imports
+import os
+import os.path as osp
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.projects.utils.file_finder import (
+    FileFinder, get_fuzzy_regexp, iter_bits)
+
+
+def search(finder, text, max_results=50):
+    """Search text and return the results with `/` as separator."""
+    return [
+        path.replace(os.sep, '/') for path in finder.search(text, max_results)
+    ]
+
+
+@pytest.fixture
+def finder(tmp_path):
+    for relpath in [
+        'main.py', 'setup.py', 'README.md', 'image.png',
+        'app/mainwindow.py', 'app/utils.py', 'app/widgets/main_widget.py',
+        'tests/test_main.py'
+    ]:
+        path = tmp_path / relpath
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text('')
+
+    finder = FileFinder(str(tmp_path))
+    finder.refresh()
+    return finder
+
+
+def test_iter_bits():
+    """Test getting the positions of the bits set in ints."""
+    assert list(iter_bits(0)) == []
+    assert list(iter_bits(0b1011)) == [0, 1, 3]
+    assert list(iter_bits((1 << 100) | (1 << 8))) == [8, 100]
+
+
+@pytest.mark.parametrize(
+    'text,string,matches',
+    [
+        ('mw', 'mainwindow.py', True),
+        ('wm', 'mainwindow.py', False),
+        ('aa', 'a.py', False),
+        ('a.p', 'a_b.py', True),
+        ('[]', '[x]', True),
+    ]
+)
+def test_get_fuzzy_regexp(text, string, matches):
+    """Test the regexp used to check if characters appear in order."""
+    assert bool(get_fuzzy_regexp(text).match(string)) == matches
+
+
+def test_search(finder):
+    """Test searching files and how results are ranked."""
+    assert len(finder) == 7
+
+    # Files that can't be edited are not found
+    assert search(finder, 'image.png') == []
+
+    # Matches in file names go first, preferring the ones that contain the
+    # text as is and shorter paths
+    assert search(finder, 'main') == [
+        'main.py', 'app/mainwindow.py', 'tests/test_main.py',
+        'app/widgets/main_widget.py'
+    ]
+    assert search(finder, 'mw') == [
+        'app/mainwindow.py', 'app/widgets/main_widget.py'
+    ]
+    assert search(finder, 'ap/ut') == ['app/utils.py']
+
+    # Case and spaces are ignored
+    assert search(finder, 'Main Win') == ['app/mainwindow.py']
+
+    assert search(finder, 'main', max_results=2) == [
+        'main.py', 'app/mainwindow.py'
+    ]
+    assert search(finder, '')[:2] == ['main.py', 'setup.py']
+
+
+def test_search_narrowing(finder):
+    """Test narrowing the results of a text for texts that extend it."""
+    assert search(finder, 'st') == [
+        'tests/test_main.py', 'setup.py', 'app/widgets/main_widget.py'
+    ]
+    assert search(finder, 'stu') == ['setup.py']
+    assert search(finder, 'st') == [
+        'tests/test_main.py', 'setup.py', 'app/widgets/main_widget.py'
+    ]
+
+    # Files that have the characters of a text in a different order are not
+    # checked again for texts that extend it
+    assert search(finder, 'yp') == []
+    __, __, candidates = finder._last_search
+    assert candidates == 0
+    assert search(finder, 'ypa') == []
+
+
+def test_update_paths(finder, tmp_path):
+    """Test updating the finder when files change."""
+    assert search(finder, 'utils') == ['app/utils.py']
+
+    # Created file
+    (tmp_path / 'app' / 'utils2.py').write_text('')
+    finder.update_paths([str(tmp_path / 'app' / 'utils2.py')])
+    assert search(finder, 'utils') == ['app/utils.py', 'app/utils2.py']
+
+    # Deleted file
+    os.remove(tmp_path / 'app' / 'utils.py')
+    finder.update_paths([str(tmp_path / 'app' / 'utils.py')])
+    assert search(finder, 'utils') == ['app/utils2.py']
+
+    # Deleted directory
+    for name in os.listdir(tmp_path / 'tests'):
+        os.remove(tmp_path / 'tests' / name)
+    os.rmdir(tmp_path / 'tests')
+    finder.update_paths([str(tmp_path / 'tests')])
+    assert search(finder, 'test') == []
+
+    # Created directory
+    (tmp_path / 'lib').mkdir()
+    (tmp_path / 'lib' / 'test_lib.py').write_text('')
+    finder.update_paths([str(tmp_path / 'lib')])
+    assert search(finder, 'test') == ['lib/test_lib.py']
+
+    # Paths outside the root directory are ignored
+    finder.update_paths([osp.dirname(str(tmp_path))])
+    assert len(finder) == 7
+
+
+def test_update_paths_rebuild(finder, tmp_path):
+    """Test that files are sorted by length again after many changes."""
+    finder.MAX_UNSORTED_FRACTION = 0
+    (tmp_path / 'a.py').write_text('')
+    finder.update_paths([str(tmp_path / 'a.py')])
+
+    assert finder._num_added == 0
+    assert search(finder, '')[0] == 'a.py'
+
+
+if __name__ == "__main__":
+    pytest.main()
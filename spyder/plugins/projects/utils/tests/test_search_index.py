@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the search index of projects.
+"""
+
+# Standard library imports
+import os.path as osp
+import re
+import shutil
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.findinfiles.utils import iter_search_files
+from spyder.plugins.projects.utils.search_index import (
+    get_required_literals, TrigramIndex)
+
+
+def get_candidates(index, text, text_re=False):
+    """Get the names of the files that can contain text."""
+    if text_re:
+        text = re.compile(text)
+
+    candidates = index.get_candidates([(text, 'utf-8')], text_re)
+    if candidates is None:
+        return None
+
+    return sorted(
+        osp.relpath(filename, index.root_path)
+        for filename in iter_search_files(index.root_path)
+        if index.may_match(filename, candidates)
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with some files and an index for them."""
+    root = tmp_path / 'project'
+    (root / 'pkg').mkdir(parents=True)
+    (root / '.git').mkdir()
+    (root / 'spam.py').write_text("import os\nspam = 'Eggs'\n")
+    (root / 'pkg' / 'ham.txt').write_text("ham and eggs\n")
+    (root / 'pkg' / 'bacon.md').write_text("bacon\n")
+    (root / '.git' / 'config').write_text("spam\n")
+
+    index = TrigramIndex(str(root), str(tmp_path / 'index'))
+    index.refresh()
+    return index
+
+
+@pytest.mark.parametrize(
+    'text,text_re,literals',
+    [
+        (b'Spam', False, [b'spam']),
+        (b'sp', False, None),
+        (b'def spam\\(', True, [b'def spam(']),
+        (b'foo.*bar', True, [b'foo', b'bar']),
+        (b'spams?', True, [b'spam']),
+        (b'spam|eggs', True, None),
+        (b'[a-z]+', True, None),
+    ]
+)
+def test_required_literals(text, text_re, literals):
+    """Test getting the literals that all matches must contain."""
+    if text_re:
+        text = re.compile(text)
+    assert get_required_literals(text, text_re) == literals
+
+
+def test_search_index(project):
+    """Test that only files that contain the text are candidates."""
+    assert len(project) == 3
+
+    assert get_candidates(project, b'eggs') == ['pkg/ham.txt', 'spam.py']
+    assert get_candidates(project, b'spam') == ['spam.py']
+    assert get_candidates(project, b'bacon') == ['pkg/bacon.md']
+    assert get_candidates(project, b'bac.n', True) == ['pkg/bacon.md']
+    assert get_candidates(project, b'ba.on', True) is None
+    assert get_candidates(project, b'ham and', True) == ['pkg/ham.txt']
+    assert get_candidates(project, b'foo') == []
+    assert get_candidates(project, b'a', False) is None
+
+
+def test_search_index_changes(project):
+    """Test that changed files are searched until they are indexed again."""
+    root = project.root_path
+    with open(osp.join(root, 'pkg', 'ham.txt'), 'a') as f:
+        f.write("spam and more spam\n")
+    with open(osp.join(root, 'new.txt'), 'w') as f:
+        f.write("eggs\n")
+
+    # Files that changed or are not indexed are always candidates
+    assert get_candidates(project, b'bacon') == [
+        'new.txt', 'pkg/bacon.md', 'pkg/ham.txt'
+    ]
+
+    project.update_paths(
+        [osp.join(root, 'pkg', 'ham.txt'), osp.join(root, 'new.txt')]
+    )
+    assert get_candidates(project, b'bacon') == ['pkg/bacon.md']
+    assert get_candidates(project, b'spam') == ['pkg/ham.txt', 'spam.py']
+
+    # Remove a directory
+    shutil.rmtree(osp.join(root, 'pkg'))
+    project.update_paths([osp.join(root, 'pkg')])
+    assert len(project) == 2
+    assert get_candidates(project, b'eggs') == ['new.txt', 'spam.py']
+
+
+def test_search_index_save_load(project, tmp_path):
+    """Test saving an index and loading it again."""
+    project.save()
+
+    index = TrigramIndex(project.root_path, project.index_path)
+    assert index.load()
+    assert get_candidates(index, b'eggs') == ['pkg/ham.txt', 'spam.py']
+
+    # The index of a different directory is not loaded
+    index = TrigramIndex(str(tmp_path), project.index_path)
+    assert not index.load()
+    assert len(index) == 0
+
+    project.delete()
+    assert len(project) == 0
+    assert not osp.exists(project.index_path)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for the watcher of the project's directory.
+"""
+
+# Standard library imports
+import errno
+import os.path as osp
+import sys
+
+# Third party imports
+import pytest
+
+# Local imports
+from spyder.plugins.projects.utils import watcher as watcher_module
+from spyder.plugins.projects.utils.watcher import (
+    WorkspaceWatcher, coalesce_paths)
+
+
+@pytest.fixture
+def watcher(qtbot):
+    watcher = WorkspaceWatcher()
+    yield watcher
+    watcher.stop()
+
+
+def test_coalesce_paths():
+    """Test reducing the paths that changed to their subtrees."""
+    root = osp.join(osp.sep, 'project')
+
+    def join(*parts):
+        return osp.join(root, *parts)
+
+    paths = [
+        join('a', 'b', 'c.py'), join('a', 'b'), join('a', 'd.py'),
+        join('e.py'), join('a-b', 'f.py'), join('a', 'b', 'c.py')
+    ]
+    assert coalesce_paths(paths, root, 10) == sorted([
+        join('a', 'b'), join('a', 'd.py'), join('e.py'), join('a-b', 'f.py')
+    ])
+
+    # Parent directories replace their children when there are too many
+    paths = [join('a', 'b', 'c', f'{i}.py') for i in range(5)]
+    paths.append(join('a', 'x.py'))
+    assert coalesce_paths(paths, root, 2) == [
+        join('a', 'b', 'c'), join('a', 'x.py')
+    ]
+    assert coalesce_paths(paths, root, 1) == [join('a')]
+
+    # But paths above the top level entries are never returned
+    assert coalesce_paths(
+        [join('a', 'b.py'), join('c', 'd.py')], root, 1
+    ) == [join('a'), join('c')]
+
+
+def test_take_changed_paths(watcher, mocker):
+    """Test that changed paths are taken after they settle."""
+    handler = watcher.event_handler
+    monotonic = mocker.patch.object(watcher_module.time, 'monotonic')
+
+    monotonic.return_value = 10
+    assert handler._record_change(['a.py'])
+    monotonic.return_value = 10.2
+    assert handler._record_change(['b.py', 'c.py'])
+
+    # Not settled yet
+    assert handler.take_changed_paths(0.3, 3) is None
+
+    # Settled
+    monotonic.return_value = 10.6
+    assert handler.take_changed_paths(0.3, 3) == {'a.py', 'b.py', 'c.py'}
+    assert handler.take_changed_paths(0.3, 3) is None
+
+    # Paths are taken after max_wait even if they keep changing
+    for i in range(20):
+        monotonic.return_value = 20 + i * 0.2
+        handler._record_change([f'{i}.py'])
+    assert len(handler.take_changed_paths(0.3, 3)) == 20
+
+    assert handler.take_num_events() == 22
+    assert handler.take_num_events() == 0
+
+    # Signals are not emitted for events after the first ones of a burst
+    handler.MAX_SIGNALED_EVENTS = 2
+    assert handler._record_change(['a.py'])
+    assert handler._record_change(['a.py'])
+    assert not handler._record_change(['a.py'])
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith('linux'), reason="inotify is used on Linux"
+)
+@pytest.mark.parametrize('use_native', [True, False])
+def test_watcher(watcher, qtbot, tmp_path, use_native):
+    """Test the paths emitted by the native and polling watchers."""
+    (tmp_path / 'folder').mkdir()
+    watcher.start(str(tmp_path), use_native=use_native)
+    assert watcher.native == use_native
+
+    with qtbot.waitSignal(
+        watcher.sig_paths_changed, timeout=10000
+    ) as blocker:
+        (tmp_path / 'folder' / 'a.py').write_text('')
+        (tmp_path / 'b.py').write_text('')
+
+    paths = blocker.args[0]
+    assert str(tmp_path / 'b.py') in paths
+    assert any(
+        path in paths
+        for path in [
+            str(tmp_path / 'folder'), str(tmp_path / 'folder' / 'a.py')
+        ]
+    )
+
+    qtbot.waitUntil(lambda: sum(watcher.get_event_counts()) > 0)
+
+    # Changes in ignored directories are not emitted
+    if use_native:
+        (tmp_path / '.git').mkdir()
+        with qtbot.assertNotEmitted(watcher.sig_paths_changed, wait=1000):
+            (tmp_path / '.git' / 'index.py').write_text('')
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith('linux'), reason="inotify is used on Linux"
+)
+def test_watcher_fallback(watcher, qtbot, tmp_path, mocker):
+    """Test falling back to polling when inotify limits are reached."""
+    mocker.patch.object(
+        watcher_module.InotifyObserver,
+        'start',
+        side_effect=OSError(errno.ENOSPC, "inotify watch limit reached")
+    )
+    watcher.start(str(tmp_path))
+    assert not watcher.native
+    mocker.stopall()
+
+    # When the limit is reached while watching
+    watcher.stop()
+    (tmp_path / 'a.py').write_text('')
+    watcher.start(str(tmp_path))
+    assert watcher.native
+
+    with qtbot.waitSignal(
+        watcher.sig_paths_changed, timeout=10000
+    ) as blocker:
+        watcher_module._watch_limit_reached.set()
+
+    assert str(tmp_path / 'a.py') in blocker.args[0]
+    assert not watcher.native
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -7,17 +7,37 @@
 """Watcher to detect filesystem changes in the project's directory."""
 
 # Standard lib imports
+from collections import deque
+import errno
 import os
+import os.path as osp
 import logging
 from pathlib import Path
+import threading
+import time
 
 # Third-party imports
-from qtpy.QtCore import QObject, Signal
+from qtpy.QtCore import QObject, QTimer, Signal
 from superqt.utils import qthrottled
 import watchdog
-from watchdog.events import FileSystemEventHandler, PatternMatchingEventHandler
+from watchdog.events import (
+    EVENT_TYPE_MODIFIED, FileSystemEventHandler, PatternMatchingEventHandler)
 from watchdog.observers.polling import PollingObserverVFS
 
+try:
+    from watchdog.utils import UnsupportedLibcError
+except ImportError:
+    # Not available in the older watchdog versions we support
+    class UnsupportedLibcError(Exception):
+        pass
+
+try:
+    from watchdog.observers.inotify import InotifyObserver
+    from watchdog.observers.inotify_buffer import InotifyBuffer
+except (ImportError, UnsupportedLibcError):
+    # inotify is only available on Linux
+    InotifyObserver = InotifyBuffer = None
+
 # Local imports
 from spyder.config.utils import EDIT_EXTENSIONS
 
@@ -31,6 +51,13 @@
     "build",
 ]
 
+# Errors raised by inotify when the limits of watches or instances of the
+# user are reached
+WATCH_LIMIT_ERRORS = (errno.ENOSPC, errno.EMFILE)
+
+# Set when a watchdog thread exits because a watch limit was reached
+_watch_limit_reached = threading.Event()
+
 
 # ---- Monkey patches
 # -----------------------------------------------------------------------------
@@ -60,11 +87,35 @@ def run_wrapper(self):
 watchdog.utils.BaseThread = BaseThreadWrapper
 
 
+def _inotify_buffer_run(self):
+    """
+    Run the thread that reads inotify events, recording if it exits because
+    a watch limit was reached when watching new directories.
+    """
+    try:
+        _original_inotify_buffer_run(self)
+    except OSError as e:
+        if e.errno in WATCH_LIMIT_ERRORS:
+            _watch_limit_reached.set()
+        raise
+
+
+# Monkeypatching InotifyBuffer to fall back to polling when that happens
+if InotifyBuffer is not None:
+    _original_inotify_buffer_run = InotifyBuffer.run
+    InotifyBuffer.run = _inotify_buffer_run
+
+
 # ---- Auxiliary functions
 # -----------------------------------------------------------------------------
 def ignore_entry(entry: os.DirEntry) -> bool:
     """Check if an entry should be ignored."""
-    parts = Path(entry.path).parts
+    return ignore_path(entry.path)
+
+
+def ignore_path(path: str) -> bool:
+    """Check if a path should be ignored."""
+    parts = Path(path).parts
 
     # Ignore files in hidden directories (e.g. .git)
     if any([p.startswith(".") for p in parts]):
@@ -96,6 +147,62 @@ def filter_scandir(path):
     )
 
 
+def coalesce_paths(paths, root_path, max_paths):
+    """
+    Reduce the paths that changed to the subtrees that contain them.
+
+    Paths inside other ones are removed, and when there are more than
+    max_paths, they're replaced by their parent directories until there
+    aren't or they're the top level entries of root_path.
+
+    Parameters
+    ----------
+    paths: iterable
+        Paths of the files and directories that changed.
+    root_path: str
+        Directory that contains all paths.
+    max_paths: int
+        Maximum number of paths to return, if possible.
+
+    Returns
+    -------
+    paths: list
+        Sorted paths of the files and directories whose subtrees changed.
+    """
+    root_path = osp.normpath(root_path)
+    paths = {osp.normpath(path) for path in paths}
+
+    while True:
+        # Shorter paths go first, so parents are found before their children
+        coalesced = set()
+        for path in sorted(paths, key=len):
+            parent = osp.dirname(path)
+            while len(parent) > len(root_path):
+                if parent in coalesced:
+                    break
+                parent = osp.dirname(parent)
+            else:
+                coalesced.add(path)
+
+        if len(coalesced) <= max_paths:
+            break
+
+        # Replace the deepest paths by their parents
+        depth = max(path.count(os.sep) for path in coalesced)
+        paths = set()
+        for path in coalesced:
+            parent = osp.dirname(path)
+            if path.count(os.sep) == depth and len(parent) > len(root_path):
+                paths.add(parent)
+            else:
+                paths.add(path)
+
+        if paths == coalesced:
+            break
+
+    return sorted(coalesced)
+
+
 # ---- Event handler
 # -----------------------------------------------------------------------------
 class WorkspaceEventHandler(QObject, PatternMatchingEventHandler):
@@ -119,6 +226,18 @@ class WorkspaceEventHandler(QObject, PatternMatchingEventHandler):
     sig_file_deleted = Signal(str, bool)
     sig_file_modified = Signal(str, bool)
 
+    sig_changes_started = Signal()
+    """
+    This signal is emitted when a path changes after the ones that changed
+    before were taken with `take_changed_paths`.
+    """
+
+    # Maximum number of events of a burst of changes for which the signals
+    # above are emitted. The rest are only available with
+    # `take_changed_paths`, to not flood the main thread with signals when
+    # e.g. switching git branches.
+    MAX_SIGNALED_EVENTS = 100
+
     def __init__(self, parent=None):
         QObject.__init__(self, parent)
         PatternMatchingEventHandler.__init__(
@@ -126,10 +245,56 @@ def __init__(self, parent=None):
             patterns=[f"*{ext}" for ext in EDIT_EXTENSIONS],
         )
 
+        # Whether to skip the events in ignored paths, which can only happen
+        # with native observers because polling ones don't list them
+        self.filter_ignored = False
+
+        self._lock = threading.Lock()
+        self._emit_signals = True
+        self._changed_paths = set()
+        self._first_change_time = 0
+        self._last_change_time = 0
+        self._num_burst_events = 0
+        self._num_events = 0
+
+    def take_changed_paths(self, settle_time, max_wait):
+        """
+        Take the paths that changed if no change happened in the last
+        settle_time seconds or the first change happened more than max_wait
+        seconds ago.
+
+        Returns
+        -------
+        paths: set or None
+            Paths that changed, or None if they can't be taken yet.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if not self._changed_paths or (
+                now - self._last_change_time < settle_time
+                and now - self._first_change_time < max_wait
+            ):
+                return None
+
+            paths = self._changed_paths
+            self._changed_paths = set()
+            self._num_burst_events = 0
+            return paths
+
+    def take_num_events(self):
+        """Take the number of events received since the last call."""
+        with self._lock:
+            num_events = self._num_events
+            self._num_events = 0
+            return num_events
+
     def fmt_is_dir(self, is_dir):
         return 'directory' if is_dir else 'file'
 
     def on_moved(self, event):
+        if not self._emit_signals:
+            return
+
         src_path = event.src_path
         dest_path = event.dest_path
         is_dir = event.is_directory
@@ -138,6 +303,9 @@ def on_moved(self, event):
         self.sig_file_moved.emit(src_path, dest_path, is_dir)
 
     def on_created(self, event):
+        if not self._emit_signals:
+            return
+
         src_path = event.src_path
         is_dir = event.is_directory
         logger.info("Created {0}: {1}".format(
@@ -145,6 +313,9 @@ def on_created(self, event):
         self.sig_file_created.emit(src_path, is_dir)
 
     def on_deleted(self, event):
+        if not self._emit_signals:
+            return
+
         src_path = event.src_path
         is_dir = event.is_directory
         logger.info("Deleted {0}: {1}".format(
@@ -152,19 +323,68 @@ def on_deleted(self, event):
         self.sig_file_deleted.emit(src_path, is_dir)
 
     def on_modified(self, event):
+        if not self._emit_signals:
+            return
+
         src_path = event.src_path
         is_dir = event.is_directory
         logger.info("Modified {0}: {1}".format(
             self.fmt_is_dir(is_dir), src_path))
         self.sig_file_modified.emit(src_path, is_dir)
 
+    def on_any_event(self, event):
+        paths = self._get_paths(event)
+
+        # The paths that changed in modified directories are recorded by
+        # their own events
+        if event.is_directory and event.event_type == EVENT_TYPE_MODIFIED:
+            paths = []
+
+        self._emit_signals = self._record_change(paths)
+
     def dispatch(self, event):
+        if self.filter_ignored and all(
+            ignore_path(path) for path in self._get_paths(event)
+        ):
+            return
+
         # Don't apply patterns to directories, only to files
         if event.is_directory:
             FileSystemEventHandler.dispatch(self, event)
         else:
             super().dispatch(event)
 
+    def _get_paths(self, event):
+        """Get the paths affected by event."""
+        paths = [event.src_path]
+        if getattr(event, 'dest_path', ''):
+            paths.append(event.dest_path)
+        return paths
+
+    def _record_change(self, paths):
+        """
+        Record that paths changed.
+
+        Returns whether the signals for them can be emitted.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._num_burst_events += 1
+            self._num_events += 1
+            signal = self._num_burst_events <= self.MAX_SIGNALED_EVENTS
+
+            started = bool(paths) and not self._changed_paths
+            if started:
+                self._first_change_time = now
+            if paths:
+                self._last_change_time = now
+                self._changed_paths.update(paths)
+
+        if started:
+            self.sig_changes_started.emit()
+
+        return signal
+
 
 # ---- Watcher
 # -----------------------------------------------------------------------------
@@ -177,19 +397,67 @@ class WorkspaceWatcher(QObject):
 
     observer = None
 
+    # Time without changes after which the paths that changed are emitted,
+    # and maximum time to wait for that while they keep changing (in seconds)
+    SETTLE_TIME = 0.3
+    MAX_SETTLE_WAIT = 3
+
+    # Interval to check if changes settled (in ms)
+    SETTLE_CHECK_INTERVAL = 100
+
+    # Maximum number of paths emitted at once, if possible
+    MAX_CHANGED_PATHS = 1000
+
+    # Interval of the event counts (in ms) and number of them that are kept
+    EVENT_COUNT_INTERVAL = 1000
+    MAX_EVENT_COUNTS = 60
+
     sig_file_moved = Signal(str, str, bool)
     sig_file_created = Signal(str, bool)
     sig_file_deleted = Signal(str, bool)
     sig_file_modified = Signal(str, bool)
 
+    sig_paths_changed = Signal(list)
+    """
+    This signal is emitted with the paths that were moved, created, deleted
+    or modified when they stop changing for a while.
+
+    Unlike the signals above, it's not throttled, so no change is missed.
+    However, paths inside directories that changed are not included and,
+    when too many paths changed, their parent directories are emitted
+    instead, meaning that their whole subtrees changed.
+
+    Parameters
+    ----------
+    paths: list
+        Paths of the files and directories that changed.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.event_handler = WorkspaceEventHandler(self)
 
+        # Whether the observer of the OS is used instead of polling
+        self.native = False
+
+        self._workspace_folder = None
+        self._event_counts = deque(maxlen=self.MAX_EVENT_COUNTS)
+
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setInterval(self.SETTLE_CHECK_INTERVAL)
+        self._settle_timer.timeout.connect(self._emit_changed_paths)
+
+        self._event_count_timer = QTimer(self)
+        self._event_count_timer.setInterval(self.EVENT_COUNT_INTERVAL)
+        self._event_count_timer.timeout.connect(self._count_events)
+
         self.event_handler.sig_file_moved.connect(self.on_moved)
         self.event_handler.sig_file_created.connect(self.on_created)
         self.event_handler.sig_file_deleted.connect(self.on_deleted)
         self.event_handler.sig_file_modified.connect(self.on_modified)
+        self.event_handler.sig_changes_started.connect(
+            self._settle_timer.start
+        )
 
     def connect_signals(self, project):
         self.sig_file_created.connect(project.file_created)
@@ -197,31 +465,44 @@ def connect_signals(self, project):
         self.sig_file_deleted.connect(project.file_deleted)
         self.sig_file_modified.connect(project.file_modified)
 
-    def start(self, workspace_folder):
-        # We use a polling observer because:
-        # * It doesn't introduce long freezes on Linux when switching git
-        #   branches that have many changes between them. That's because the
-        #   OS-based observer (i.e. inotify) generates way too many events.
+    def start(self, workspace_folder, use_native=True):
+        """
+        Start watching workspace_folder.
+
+        Parameters
+        ----------
+        workspace_folder: str
+            Directory to watch, including its subdirectories.
+        use_native: bool, optional
+            Whether to use the observer of the OS, which is only done with
+            inotify on Linux. It falls back to polling if the limits of
+            inotify watches are reached.
+        """
+        self._workspace_folder = workspace_folder
+        self._event_counts.clear()
+        _watch_limit_reached.clear()
+
+        # The native observer generates lots of events when e.g. switching
+        # git branches, but they're coalesced by the event handler so that
+        # they don't introduce long freezes.
+        if use_native and InotifyObserver is not None:
+            if self._start_observer(InotifyObserver(), native=True):
+                return
+
+        # We use a polling observer on the rest of OSes because:
         # * The OS-based observer on Windows has many shortcomings (see
         #   openmsi/openmsistream#56).
         # * There doesn't seem to be issues on Mac, but it's simpler to use a
-        #   single observer for all OSes.
-        self.observer = PollingObserverVFS(
-            stat=os.stat, listdir=filter_scandir
+        #   single observer for all of them.
+        self._start_observer(
+            PollingObserverVFS(stat=os.stat, listdir=filter_scandir),
+            native=False
         )
 
-        self.observer.schedule(
-            self.event_handler, workspace_folder, recursive=True
-        )
-
-        try:
-            self.observer.start()
-        except Exception:
-            logger.debug(
-                f"Observer could not be started for: {workspace_folder}."
-            )
-
     def stop(self):
+        self._settle_timer.stop()
+        self._event_count_timer.stop()
+
         if self.observer is not None:
             # This is required to avoid showing an error when closing
             # projects.
@@ -234,6 +515,13 @@ def stop(self):
             except RuntimeError:
                 pass
 
+    def get_event_counts(self):
+        """
+        Get the number of events received in the last intervals of
+        EVENT_COUNT_INTERVAL ms, from the oldest to the newest one.
+        """
+        return list(self._event_counts)
+
     @qthrottled(timeout=200)
     def on_moved(self, src_path, dest_path, is_dir):
         self.sig_file_moved.emit(src_path, dest_path, is_dir)
@@ -249,3 +537,79 @@ def on_deleted(self, path, is_dir):
     @qthrottled(timeout=200)
     def on_modified(self, path, is_dir):
         self.sig_file_modified.emit(path, is_dir)
+
+    def _start_observer(self, observer, native):
+        """Start observer and return whether it could be started."""
+        self.event_handler.filter_ignored = native
+        self.observer = observer
+        self.observer.schedule(
+            self.event_handler, self._workspace_folder, recursive=True
+        )
+
+        try:
+            self.observer.start()
+        except Exception as e:
+            if native:
+                logger.info(
+                    f"Native observer could not be started for "
+                    f"{self._workspace_folder}, so polling will be used: {e}"
+                )
+                self.stop()
+                return False
+
+            logger.debug(
+                f"Observer could not be started for: "
+                f"{self._workspace_folder}."
+            )
+
+        self.native = native
+        self._event_count_timer.start()
+        return True
+
+    def _emit_changed_paths(self):
+        """Emit the paths that changed if they stopped changing."""
+        paths = self.event_handler.take_changed_paths(
+            self.SETTLE_TIME, self.MAX_SETTLE_WAIT
+        )
+        if paths is None:
+            return
+
+        self._settle_timer.stop()
+        self.sig_paths_changed.emit(
+            coalesce_paths(
+                paths, self._workspace_folder, self.MAX_CHANGED_PATHS
+            )
+        )
+
+    def _count_events(self):
+        """Save the number of events received in the last interval."""
+        num_events = self.event_handler.take_num_events()
+        self._event_counts.append(num_events)
+        if num_events:
+            logger.debug(
+                f"{num_events} filesystem events in the last "
+                f"{self.EVENT_COUNT_INTERVAL} ms"
+            )
+
+        if self.native and _watch_limit_reached.is_set():
+            logger.info(
+                f"The limit of inotify watches was reached for "
+                f"{self._workspace_folder}, so polling will be used"
+            )
+            self._fall_back_to_polling()
+
+    def _fall_back_to_polling(self):
+        """Watch the workspace by polling it instead of with inotify."""
+        self.stop()
+        self.start(self._workspace_folder, use_native=False)
+
+        # Changes could have been missed after the native observer failed,
+        # so everything could have changed
+        try:
+            paths = [
+                osp.join(self._workspace_folder, name)
+                for name in os.listdir(self._workspace_folder)
+            ]
+        except OSError:
+            return
+        self.sig_paths_changed.emit(sorted(paths))
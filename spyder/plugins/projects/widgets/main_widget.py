@@ -20,7 +20,7 @@
 # Third party imports
 from lsprotocol import types as lsp
 from qtpy.compat import getexistingdirectory
-from qtpy.QtCore import Qt, Signal, Slot
+from qtpy.QtCore import Qt, QTimer, Signal, Slot
 from qtpy.QtWidgets import (
     QHBoxLayout, QInputDialog, QLabel, QMessageBox, QVBoxLayout, QWidget)
 
@@ -37,6 +37,8 @@
 from spyder.plugins.explorer.api import DirViewActions
 from spyder.plugins.projects.api import (
     BaseProjectType, EmptyProject, WORKSPACE)
+from spyder.plugins.projects.utils.file_finder import FileFinder
+from spyder.plugins.projects.utils.search_index import TrigramIndex
 from spyder.plugins.projects.utils.watcher import WorkspaceWatcher
 from spyder.plugins.projects.widgets.projectdialog import (
     is_writable,
@@ -47,7 +49,6 @@
 from spyder.plugins.switcher.utils import get_file_icon, shorten_paths
 from spyder.utils import encoding
 from spyder.utils.misc import getcwd_or_home
-from spyder.utils.programs import find_program
 from spyder.utils.workers import WorkerManager
 
 
@@ -81,6 +82,7 @@ class RecentProjectsMenuSections:
 
 class ProjectsOptionsMenuActions:
     SearchInSwitcher = "search_in_switcher"
+    IndexFiles = "index_files"
 
 
 # ---- Main widget
@@ -102,6 +104,13 @@ class ProjectExplorerWidget(PluginMainWidget):
     # -------------------------------------------------------------------------
     MAX_SWITCHER_RESULTS = 50
 
+    # Time to wait for more file changes before updating the search index
+    SEARCH_INDEX_UPDATE_DELAY = 1000  # ms
+
+    # Time to wait for more file changes before updating the files found in
+    # the switcher
+    FILE_FINDER_UPDATE_DELAY = 200  # ms
+
     # ---- Signals
     # -------------------------------------------------------------------------
     sig_open_file_requested = Signal(str)
@@ -172,6 +181,17 @@ class ProjectExplorerWidget(PluginMainWidget):
         Parameters of the notification.
     """
 
+    sig_search_index_changed = Signal(object)
+    """
+    This signal is emitted when the index of the project files is created or
+    removed.
+
+    Parameters
+    ----------
+    index: spyder.plugins.projects.utils.search_index.TrigramIndex
+        Index of the project files, or None if there's no index.
+    """
+
     def __init__(self, name, plugin, parent=None):
         super().__init__(name, plugin=plugin, parent=parent)
 
@@ -187,7 +207,6 @@ def __init__(self, name, plugin, parent=None):
         self.current_active_project = None
         self.latest_project = None
         self.completions_available = False
-        self._fzf = find_program('fzf')
         self._default_switcher_paths = []
 
         # -- Tree widget
@@ -202,20 +221,43 @@ def __init__(self, name, plugin, parent=None):
         self.watcher = WorkspaceWatcher(self)
         self.watcher.connect_signals(self)
 
-        # -- Worker manager for calls to fzf
-        self._worker_manager = WorkerManager(self)
+        # -- Finder of the project files shown in the switcher
+        # It's built and updated in a single thread, but searched in the
+        # main one.
+        self.file_finder = None
+        self._files_worker_manager = WorkerManager(self, max_threads=1)
+        self._pending_finder_paths = set()
+        self._finder_timer = QTimer(self)
+        self._finder_timer.setSingleShot(True)
+        self._finder_timer.setInterval(self.FILE_FINDER_UPDATE_DELAY)
+        self._finder_timer.timeout.connect(self._update_file_finder)
+        self.watcher.sig_paths_changed.connect(self._add_pending_finder_paths)
+
+        # -- Search index
+        # Its updates are run one after the other in a single thread
+        self.search_index = None
+        self._index_worker_manager = WorkerManager(self, max_threads=1)
+        self._pending_index_paths = set()
+        self._index_timer = QTimer(self)
+        self._index_timer.setSingleShot(True)
+        self._index_timer.setInterval(self.SEARCH_INDEX_UPDATE_DELAY)
+        self._index_timer.timeout.connect(self._update_search_index)
+        self.watcher.sig_paths_changed.connect(self._add_pending_index_paths)
 
         # -- Signals
         self.sig_project_loaded.connect(self._setup_project)
 
-        # This is necessary to populate the switcher with some default list of
-        # paths instead of computing that list every time it's shown.
-        self.sig_project_loaded.connect(
-            lambda p: self._update_default_switcher_paths()
-        )
+        # Find the project files to show in the switcher. This also populates
+        # it with some default list of paths instead of computing that list
+        # every time it's shown.
+        self.sig_project_loaded.connect(lambda p: self._start_file_finder())
 
         # Clear saved paths for the switcher when closing the project.
-        self.sig_project_closed.connect(lambda p: self._clear_switcher_paths())
+        self.sig_project_closed.connect(lambda p: self._stop_file_finder())
+
+        # Index the project files to speed up searches in them
+        self.sig_project_loaded.connect(lambda p: self._start_search_index())
+        self.sig_project_closed.connect(lambda p: self._stop_search_index())
 
         # -- Layout
         self.setMinimumWidth(200)
@@ -285,6 +327,13 @@ def setup(self):
             option='search_files_in_switcher',
         )
 
+        index_files_action = self.create_action(
+            ProjectsOptionsMenuActions.IndexFiles,
+            text=_("Index project files to speed up searches"),
+            toggled=True,
+            option='index_project_files',
+        )
+
         # Add some DirView actions to the Options menu for easy access.
         hidden_action = self.get_action(DirViewActions.ToggleHiddenFiles)
         single_click_action = self.get_action(DirViewActions.ToggleSingleClick)
@@ -295,6 +344,7 @@ def setup(self):
             hidden_action,
             single_click_action,
             search_in_switcher_action,
+            index_files_action,
         ]:
             self.add_item_to_menu(
                 action,
@@ -306,7 +356,10 @@ def update_actions(self):
         pass
 
     def on_close(self):
-        self._worker_manager.terminate_all()
+        self._stop_file_finder()
+        self._files_worker_manager.terminate_all()
+        self._stop_search_index()
+        self._index_worker_manager.terminate_all()
 
     # ---- Public API
     # -------------------------------------------------------------------------
@@ -442,7 +495,9 @@ def open_project(self, path=None, project_type=None, restart_console=True,
             else:
                 self.sig_project_loaded.emit(path)
 
-        self.watcher.start(path)
+        self.watcher.start(
+            path, use_native=self.get_conf('use_native_watcher')
+        )
 
         if restart_console:
             self.sig_restart_console_requested.emit()
@@ -720,7 +775,7 @@ def handle_switcher_search(self, search_text):
         text: str
             The current search text in the switcher dialog box.
         """
-        self._call_fzf(search_text)
+        self._search_files_in_switcher(search_text)
 
     # ---- Public API for the LSP
     # -------------------------------------------------------------------------
@@ -755,8 +810,6 @@ def handle_response(self, method, params):
     @Slot(str, bool)
     def file_created(self, src_file, is_dir):
         """Notify LSP server about file creation."""
-        self._update_default_switcher_paths()
-
         # LSP specification only considers file updates
         if is_dir:
             return
@@ -775,8 +828,6 @@ def file_created(self, src_file, is_dir):
     )
     def file_moved(self, src_file, dest_file, is_dir):
         """Notify LSP server about a file that is moved."""
-        self._update_default_switcher_paths()
-
         if is_dir:
             return
 
@@ -802,8 +853,6 @@ def file_moved(self, src_file, dest_file, is_dir):
     @Slot(str, bool)
     def file_deleted(self, src_file, is_dir):
         """Notify LSP server about file deletion."""
-        self._update_default_switcher_paths()
-
         if is_dir:
             return
 
@@ -1089,45 +1138,37 @@ def _is_valid_location(self, location: str):
 
     # ---- Private API for the Switcher
     # -------------------------------------------------------------------------
-    def _call_fzf(self, search_text=""):
+    def _search_files_in_switcher(self, search_text):
         """
-        Call fzf in a worker to get the list of files in the current project
-        that match with `search_text`.
+        Show the files in the current project that match with `search_text`
+        in the switcher.
 
         Parameters
         ----------
-        search_text: str, optional
-            The search text to pass to fzf.
+        search_text: str
+            The text to search for.
         """
-        project_path = self.get_active_project_path()
         if (
             not self.get_conf("search_files_in_switcher")
-            or self._fzf is None
-            or project_path is None
+            or self.file_finder is None
         ):
             return
 
-        self._worker_manager.terminate_all()
-
-        worker = self._worker_manager.create_process_worker(
-            [self._fzf, "--filter", search_text],
-            os.environ.copy()
+        relative_path_list = self.file_finder.search(
+            search_text, self.MAX_SWITCHER_RESULTS
+        )
+        result_list = self._get_switcher_paths(relative_path_list)
+        self._display_paths_in_switcher(
+            result_list, setup=True, clear_section=True
         )
 
-        worker.set_cwd(project_path)
-        worker.sig_finished.connect(self._process_fzf_output)
-        worker.start()
-
-    def _process_fzf_output(self, worker, output, error):
-        """Process output that comes from the fzf worker."""
-        if output is None or error:
-            return
-
-        # Get list of paths from fzf output
-        relative_path_list = output.decode('utf-8').strip().split("\n")
-
+    def _get_switcher_paths(self, relative_path_list):
+        """
+        Get the absolute paths of the project files in relative_path_list
+        that can be shown in the switcher.
+        """
         # List of results with absolute path
-        if relative_path_list != ['']:
+        if relative_path_list:
             project_path = self.get_active_project_path()
 
             # If Spyder is closed while a project is loaded at startup,
@@ -1155,12 +1196,7 @@ def _process_fzf_output(self, worker, output, error):
         if len(result_list) > self.MAX_SWITCHER_RESULTS:
             result_list = result_list[:self.MAX_SWITCHER_RESULTS]
 
-        if not self._default_switcher_paths:
-            self._default_switcher_paths = result_list
-        else:
-            self._display_paths_in_switcher(
-                result_list, setup=True, clear_section=True
-            )
+        return result_list
 
     def _convert_paths_to_switcher_items(self, paths):
         """
@@ -1208,8 +1244,63 @@ def _clear_switcher_paths(self):
 
     def _update_default_switcher_paths(self):
         """Update default paths to be shown in the switcher."""
-        self._default_switcher_paths = []
-        self._call_fzf()
+        if self.file_finder is None:
+            self._default_switcher_paths = []
+            return
+
+        self._default_switcher_paths = self._get_switcher_paths(
+            self.file_finder.search("", self.MAX_SWITCHER_RESULTS)
+        )
+
+    def _start_file_finder(self):
+        """Find the files of the current project shown in the switcher."""
+        path = self.get_active_project_path()
+        if (
+            not self.get_conf("search_files_in_switcher")
+            or path is None
+            or self.file_finder is not None
+        ):
+            return
+
+        self.file_finder = FileFinder(path)
+        worker = self._files_worker_manager.create_python_worker(
+            self.file_finder.refresh
+        )
+        worker.sig_finished.connect(
+            lambda worker, output, error: self._update_default_switcher_paths()
+        )
+        worker.start()
+
+    def _stop_file_finder(self):
+        """Stop finding the files of the current project."""
+        self._finder_timer.stop()
+        self._pending_finder_paths = set()
+        self._clear_switcher_paths()
+
+        if self.file_finder is not None:
+            self.file_finder.stop()
+            self.file_finder = None
+
+    def _add_pending_finder_paths(self, paths):
+        """Update the files found in the switcher for paths after a while."""
+        if self.file_finder is not None:
+            self._pending_finder_paths.update(paths)
+            self._finder_timer.start()
+
+    def _update_file_finder(self):
+        """Update the files found in the switcher for the paths changed."""
+        if self.file_finder is None or not self._pending_finder_paths:
+            return
+
+        paths = self._pending_finder_paths
+        self._pending_finder_paths = set()
+        worker = self._files_worker_manager.create_python_worker(
+            self.file_finder.update_paths, paths
+        )
+        worker.sig_finished.connect(
+            lambda worker, output, error: self._update_default_switcher_paths()
+        )
+        worker.start()
 
     @on_conf_change(option="search_files_in_switcher")
     def _on_search_files_in_switcher_changed(self, value):
@@ -1218,9 +1309,78 @@ def _on_search_files_in_switcher_changed(self, value):
         switcher.
         """
         if value:
-            self._update_default_switcher_paths()
+            self._start_file_finder()
+        else:
+            self._stop_file_finder()
+
+    def _start_search_index(self):
+        """Load the index of the project files and bring it up to date."""
+        path = self.get_active_project_path()
+        if (
+            not self.get_conf('index_project_files')
+            or path is None
+            or self.search_index is not None
+        ):
+            return
+
+        self.search_index = TrigramIndex(path)
+        self.sig_search_index_changed.emit(self.search_index)
+
+        # The index can be used while this runs because files that are not
+        # indexed yet are always searched.
+        worker = self._index_worker_manager.create_python_worker(
+            self._build_search_index, self.search_index
+        )
+        worker.start()
+
+    @staticmethod
+    def _build_search_index(index):
+        """Load index from disk, update it and save it back."""
+        index.load()
+        index.refresh()
+        if not index.is_stopped():
+            index.save()
+
+    def _stop_search_index(self, delete=False):
+        """Stop updating the index of the project files."""
+        if self.search_index is None:
+            return
+
+        self._index_timer.stop()
+        self._pending_index_paths = set()
+
+        self.search_index.stop()
+        if delete:
+            self.search_index.delete()
+
+        self.search_index = None
+        self.sig_search_index_changed.emit(None)
+
+    def _add_pending_index_paths(self, paths):
+        """Update the index for paths after a while."""
+        if self.search_index is not None:
+            self._pending_index_paths.update(paths)
+            self._index_timer.start()
+
+    def _update_search_index(self):
+        """Update the index for the paths that changed."""
+        if self.search_index is None or not self._pending_index_paths:
+            return
+
+        paths = self._pending_index_paths
+        self._pending_index_paths = set()
+        worker = self._index_worker_manager.create_python_worker(
+            self.search_index.update_paths, paths
+        )
+        worker.start()
+
+    @on_conf_change(option="index_project_files")
+    def _on_index_project_files_changed(self, value):
+        """Create or remove the index of the project files."""
+        if value:
+            self._start_search_index()
         else:
-            self._clear_switcher_paths()
+            self._stop_search_index(delete=True)
 
 
 # =============================================================================
@@ -400,6 +400,66 @@ async def ls(self, path: Path, *, detail: bool = True):
             if not running_in_ci():
                 raise error
 
+    async def search(
+        self,
+        path: Path,
+        pattern: str,
+        *,
+        regex: bool = False,
+        case_sensitive: bool = False,
+        exclude: str | None = None,
+        encoding: str = "utf-8",
+        max_results: int | None = None,
+    ):
+        """
+        Search text in the files under path on the remote server.
+
+        Files are searched on the server and results are streamed back as
+        they're found, so it's not necessary to download them.
+
+        Parameters
+        ----------
+        path : Path
+            Directory or file to search in. Hidden directories are skipped.
+        pattern : str
+            Text to search for.
+        regex : bool, optional
+            Whether pattern is a regular expression, by default False.
+        case_sensitive : bool, optional
+            Whether the search is case sensitive, by default False.
+        exclude : str, optional
+            Regular expression of the paths to skip, by default None.
+        encoding : str, optional
+            Encoding of the files, by default "utf-8".
+        max_results : int, optional
+            Maximum number of matches, by default None (no limit).
+
+        Yields
+        ------
+        dict
+            The name of each file with matches and a "matches" list with a
+            [line number, start column, end column, line] list per match,
+            or an "error" message if the file couldn't be read. Files with
+            many matches are yielded in several parts.
+        """
+        params = {
+            "path": f"file://{path}",
+            "pattern": pattern,
+            "regex": str(regex).lower(),
+            "case_sensitive": str(case_sensitive).lower(),
+            "encoding": encoding,
+        }
+        if exclude:
+            params["exclude"] = exclude
+        if max_results:
+            params["max_results"] = max_results
+
+        async with self.session.get(
+            self.api_url / "search", params=params
+        ) as response:
+            async for line in response.content:
+                yield json.loads(line)
+
     async def info(self, path: Path):
         async with self.session.get(
             self.api_url / "info",
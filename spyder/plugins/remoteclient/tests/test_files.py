@@ -140,6 +140,51 @@ async def test_zip_dir(
             ) as file:
                 assert file.read() == b"Hello, world!"
 
+    @AsyncDispatcher(early_return=False)
+    async def test_search(
+        self,
+        remote_client: RemoteClient,
+        remote_client_id: str,
+    ):
+        """Test that text can be searched in files on the remote server."""
+        file_api_class = remote_client.get_file_api(remote_client_id)
+        assert file_api_class is not None
+
+        async with file_api_class() as file_api:
+            results = [
+                result async for result in file_api.search(
+                    self.remote_temp_dir, "WORLD"
+                )
+            ]
+            assert sorted(result["name"] for result in results) == [
+                self.remote_temp_dir + "/test.txt",
+                self.remote_temp_dir + "/test2.txt",
+            ]
+            assert results[0]["matches"] == [[1, 7, 12, "Hello, world!"]]
+
+            # Case sensitive, regular expressions and excluded files
+            results = [
+                result async for result in file_api.search(
+                    self.remote_temp_dir,
+                    r"w\w+",
+                    regex=True,
+                    case_sensitive=True,
+                    exclude=r"test2\.txt$",
+                )
+            ]
+            assert results == [
+                {
+                    "name": self.remote_temp_dir + "/test.txt",
+                    "matches": [[1, 7, 12, "Hello, world!"]],
+                }
+            ]
+
+            assert [
+                result async for result in file_api.search(
+                    self.remote_temp_dir, "WORLD", case_sensitive=True
+                )
+            ] == []
+
     @AsyncDispatcher(early_return=False)
     async def test_rm_file(
         self,
@@ -125,6 +125,39 @@ def test_switcher_filter_unicode(dlg_switcher, qtbot):
     assert dlg_switcher.count() == 2
 
 
+def test_switcher_highlight_visible_items(dlg_switcher, qtbot):
+    """Test that only the items that can be seen are highlighted."""
+    dlg_switcher.clear()
+    for i in range(3 * dlg_switcher._MAX_NUM_ITEMS):
+        dlg_switcher.add_item(
+            title='branch {}'.format(i), last_item=False
+        )
+
+    dlg_switcher.edit.setText("bra")
+    qtbot.wait(1000)
+
+    def get_item(row):
+        index = dlg_switcher.proxy.mapToSource(
+            dlg_switcher.proxy.index(row, 0)
+        )
+        return dlg_switcher.model.item(index.row())
+
+    def highlighted_rows():
+        return [
+            row for row in range(dlg_switcher.count())
+            if get_item(row).get_rich_title()
+        ]
+
+    num_items = dlg_switcher._MAX_NUM_ITEMS
+    assert dlg_switcher.count() == 3 * num_items
+    assert highlighted_rows() == list(range(num_items))
+    assert get_item(0).get_rich_title() == '<b>bra</b>nch&nbsp;0'
+
+    # Items are highlighted when they're scrolled to
+    dlg_switcher.list.verticalScrollBar().setValue(num_items)
+    assert highlighted_rows() == list(range(num_items, 2 * num_items))
+
+
 # --- Helper functions for tests
 # -----------------------------------------------------------------------------
 def create_vcs_example_switcher(sw):
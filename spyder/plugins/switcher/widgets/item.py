@@ -82,9 +82,10 @@ def get_score(self):
 
     def set_score(self, value):
         """Set the search text fuzzy match score."""
+        # The score is not shown, so it's not necessary to render the item
+        # again, which is slow when scores change for all items while typing
         if self._use_score:
             self._score = value
-            self._set_rendered_text()
 
     def is_action_item(self):
         """Return whether the item is of action type."""
@@ -311,6 +312,8 @@ def get_title(self):
 
     def set_rich_title(self, value):
         """Set the rich title version (filter highlight) of the item."""
+        if value == self._rich_title:
+            return
         self._rich_title = value
         self._set_rendered_text()
 
@@ -359,6 +362,8 @@ def get_section(self):
 
     def set_section_visible(self, value):
         """Set visibility of the item section."""
+        if value == self._section_visible:
+            return
         self._section_visible = value
         self._set_rendered_text()
 
@@ -30,7 +30,7 @@
     SwitcherItem, SwitcherSeparatorItem)
 from spyder.utils.palette import SpyderPalette
 from spyder.widgets.helperwidgets import HTMLDelegate
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import SearchScorer
 from spyder.plugins.switcher.utils import clean_string
 
 
@@ -142,6 +142,7 @@ def __init__(self, parent, help_text=None):
         # Attributes
         self._modes = {}
         self._mode_on = ''
+        self._scorer = SearchScorer()
 
         font_size = self.get_font(SpyderFontType.Interface).pointSize()
         self._item_styles = {
@@ -204,6 +205,8 @@ def __init__(self, parent, help_text=None):
         self.list.clicked.connect(self.edit.setFocus)
         self.list.selectionModel().currentChanged.connect(
             self.current_item_changed)
+        self.list.verticalScrollBar().valueChanged.connect(
+            self._highlight_visible_items)
 
         # Gives focus to text edit
         self.edit.setFocus()
@@ -317,25 +320,17 @@ def setup(self):
             titles.append(title)
 
         search_text = clean_string(search_text)
-        scores = get_search_scores(
-            str(search_text),
-            titles,
-            template=u"<b>{0}</b>"
-        )
-
-        for idx, (title, rich_title, score_value) in enumerate(scores):
-            item = self.model.item(idx)
-            if not self._is_separator(item) and not item.is_action_item():
-                rich_title = rich_title.replace(" ", "&nbsp;")
-                item.set_rich_title(rich_title)
+        scores = self._scorer.get_scores(str(search_text), titles)
 
-            item.set_score(score_value)
+        for row, score_value in enumerate(scores):
+            self.model.item(row).set_score(score_value)
 
         self.proxy.set_filter_by_score(True)
         self.proxy.sortBy('_score')
 
         # Graphical setup
         self.setup_sections()
+        self._highlight_visible_items()
         self.set_height()
 
     def setup_sections(self):
@@ -497,6 +492,39 @@ def _on_search_text_changed(self):
 
     # ---- Helper methods: List widget
     # -------------------------------------------------------------------------
+    def _highlight_visible_items(self):
+        """
+        Highlight the letters of the search text in the items that can be
+        seen.
+
+        This is only done for them because it's slow to render all items
+        again every time the search text changes.
+        """
+        highlighted_rows = set()
+        if self.search_text_without_mode():
+            first_row = self.list.verticalScrollBar().value()
+            last_row = min(
+                first_row + self._MAX_NUM_ITEMS, self.proxy.rowCount()
+            )
+            for row in range(first_row, last_row):
+                source_index = self.proxy.mapToSource(self.proxy.index(row, 0))
+                highlighted_rows.add(source_index.row())
+
+        # The rows must be collected first because the proxy can move them
+        # when the text of their items changes
+        for row in range(self.model.rowCount()):
+            item = self.model.item(row)
+            if not isinstance(item, SwitcherItem) or item.is_action_item():
+                continue
+
+            if row in highlighted_rows:
+                rich_title = self._scorer.get_enriched_text(
+                    item.get_title(), template="<b>{0}</b>"
+                )
+                item.set_rich_title(rich_title.replace(" ", "&nbsp;"))
+            else:
+                item.set_rich_title('')
+
     def _is_separator(self, item):
         """Check if item is an separator item (SwitcherSeparatorItem)."""
         return isinstance(item, SwitcherSeparatorItem)
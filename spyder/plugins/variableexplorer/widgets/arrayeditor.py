@@ -15,6 +15,7 @@
 
 # Standard library imports
 from __future__ import annotations
+from collections import OrderedDict
 import io
 import sys
 from typing import Callable, Optional, TYPE_CHECKING
@@ -36,6 +37,7 @@
     QAbstractItemDelegate, QApplication, QDialog, QHBoxLayout, QInputDialog,
     QItemDelegate, QLabel, QLineEdit, QMessageBox, QPushButton, QSpinBox,
     QStackedWidget, QStyle, QTableView, QToolButton, QVBoxLayout, QWidget)
+from spyder_kernels.utils.arraybuffers import is_from_buffers
 from spyder_kernels.utils.nsview import value_to_display
 from spyder_kernels.utils.lazymodules import numpy as np
 
@@ -129,6 +131,15 @@ class ArrayEditorWidgets:
 LARGE_NROWS = 1e5
 LARGE_COLS = 60
 
+# Size of the tiles of cells that are formatted and colored at once, and
+# number of tiles kept in memory
+TILE_ROWS = 64
+TILE_COLS = 16
+MAX_TILES = 64
+
+# Number of background colors from the maximum to the minimum value
+COLOR_TABLE_SIZE = 256
+
 #==============================================================================
 # ---- Utility functions
 #==============================================================================
@@ -158,6 +169,10 @@ class ArrayModel(SpyderFontsMixin, QAbstractTableModel):
     """
     Array Editor Table Model
 
+    The text and background color of cells are computed for tiles of
+    TILE_ROWS x TILE_COLS cells at once, and the last MAX_TILES used tiles are
+    kept in memory.
+
     Attributes
     ----------
     bgcolor_enabled : bool
@@ -193,6 +208,10 @@ def __init__(self, data, format_spec=".6g", readonly=False, parent=None):
         self._data = data
         self._format_spec = format_spec
 
+        # Texts and indexes in the color table of the cells in tiles, by
+        # tile row and column, from the least to the most recently used
+        self._tiles = OrderedDict()
+
         self.total_rows = self._data.shape[0]
         self.total_cols = self._data.shape[1]
         size = self.total_rows * self.total_cols
@@ -205,12 +224,20 @@ def __init__(self, data, format_spec=".6g", readonly=False, parent=None):
                     self.vmin -= 1
                 self.hue0 = huerange[0]
                 self.dhue = huerange[1]-huerange[0]
+                self.color_table = [
+                    QColor.fromHsvF(
+                        float(abs(self.hue0 + self.dhue * fraction)),
+                        self.sat, self.val, self.alp
+                    )
+                    for fraction in np.linspace(0, 1, COLOR_TABLE_SIZE)
+                ]
                 self.bgcolor_enabled = True
             except (AttributeError, TypeError, ValueError):
                 self.vmin = None
                 self.vmax = None
                 self.hue0 = None
                 self.dhue = None
+                self.color_table = None
                 self.bgcolor_enabled = False
 
         # Array with infinite values cannot display background colors and
@@ -250,6 +277,7 @@ def set_format_spec(self, format_spec: str) -> None:
         Set format specification for floats.
         """
         self._format_spec = format_spec
+        self._tiles.clear()
         self.reset()
 
     def get_data(self):
@@ -303,6 +331,7 @@ def bgcolor(self, value: bool):
         Set whether background color varies depending on cell value.
         """
         self.bgcolor_enabled = value
+        self._tiles.clear()
         self.reset()
 
     def get_value(self, index):
@@ -314,13 +343,8 @@ def get_value(self, index):
             value = self._data[i, j]
         return self.changes.get((i, j), value)
 
-    def data(self, index, role=Qt.DisplayRole):
-        """Cell content."""
-        if not index.isValid():
-            return to_qvariant()
-        value = self.get_value(index)
-        dtn = self._data.dtype.name
-
+    def format_value(self, value):
+        """Return the text to display for value."""
         # Tranform binary string to unicode so they are displayed
         # correctly
         if isinstance(value, bytes):
@@ -329,35 +353,147 @@ def data(self, index, role=Qt.DisplayRole):
             except Exception:
                 pass
 
+        if value is np.ma.masked:
+            return ''
+        elif self._data.dtype.name == 'object':
+            # We don't know what's inside an object array, so
+            # we can't trust value repr's here.
+            return value_to_display(value)
+        else:
+            try:
+                return format(value, self._format_spec)
+            except TypeError:
+                self.readonly = True
+                return repr(value)
+
+    def format_values(self, values):
+        """Return the texts to display for a 2D array of values by row."""
+        kind = values.dtype.kind
+        if (
+            values.ndim == 2
+            and (
+                kind in 'iu'
+                or (kind == 'f' and values.dtype.itemsize <= 8)
+                or (kind == 'c' and values.dtype.itemsize <= 16)
+            )
+            and self._format_spec
+        ):
+            # Converting the values to Python numbers at once and formatting
+            # them gives the same texts as formatting each NumPy scalar, but
+            # is much faster.
+            format_spec = self._format_spec
+            try:
+                texts = [
+                    [format(value, format_spec) for value in row]
+                    for row in np.ma.getdata(values).tolist()
+                ]
+            except (TypeError, ValueError):
+                pass
+            else:
+                for i, j in zip(*np.nonzero(np.ma.getmaskarray(values))):
+                    texts[i][j] = ''
+                return texts
+
+        return [
+            [self.format_value(values[i, j]) for j in range(values.shape[1])]
+            for i in range(values.shape[0])
+        ]
+
+    def map_colors(self, values):
+        """
+        Return the indexes in the color table of the background of a 2D
+        array of values, or -1 for values without one.
+        """
+        if values.ndim != 2 or values.dtype.kind not in 'biufc':
+            return None
+
+        with np.errstate(invalid='ignore'):
+            levels = self.color_func(np.ma.getdata(values)).astype(float)
+            fraction = (
+                (float(self.vmax) - levels) / (float(self.vmax) - self.vmin)
+            )
+            colors = np.rint(fraction * (COLOR_TABLE_SIZE - 1))
+            colors = np.clip(colors, 0, COLOR_TABLE_SIZE - 1)
+
+        colors[np.isnan(fraction) | np.ma.getmaskarray(values)] = -1
+        return colors.astype(np.int16)
+
+    def _get_tile(self, row, column):
+        """
+        Return the texts and color indexes of the tile of a cell, computing
+        them if it's not in memory.
+        """
+        key = (row // TILE_ROWS, column // TILE_COLS)
+        if key in self._tiles:
+            self._tiles.move_to_end(key)
+            return self._tiles[key]
+
+        row_start = key[0] * TILE_ROWS
+        col_start = key[1] * TILE_COLS
+        values = self._data[
+            row_start:row_start + TILE_ROWS,
+            col_start:col_start + TILE_COLS
+        ]
+
+        changes = [
+            (i, j) for (i, j) in self.changes
+            if 0 <= i - row_start < values.shape[0]
+            and 0 <= j - col_start < values.shape[1]
+        ]
+        if changes:
+            values = values.copy()
+            for i, j in changes:
+                values[i - row_start, j - col_start] = self.changes[(i, j)]
+
+        colors = None
+        if self.bgcolor_enabled and not self.has_inf:
+            colors = self.map_colors(values)
+
+        tile = (self.format_values(values), colors)
+        self._tiles[key] = tile
+        while len(self._tiles) > MAX_TILES:
+            self._tiles.popitem(last=False)
+        return tile
+
+    def _update_tile(self, row, column):
+        """Update the text and color of an edited cell in its tile."""
+        key = (row // TILE_ROWS, column // TILE_COLS)
+        if key not in self._tiles:
+            return
+
+        texts, colors = self._tiles[key]
+        value = np.array(
+            [[self.changes[(row, column)]]], dtype=self._data.dtype
+        )
+        texts[row % TILE_ROWS][column % TILE_COLS] = (
+            self.format_values(value)[0][0]
+        )
+        if colors is not None:
+            colors[row % TILE_ROWS, column % TILE_COLS] = (
+                self.map_colors(value)[0, 0]
+            )
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell content."""
+        if not index.isValid():
+            return to_qvariant()
+
         # Handle roles
         if role == Qt.DisplayRole:
-            if value is np.ma.masked:
-                return ''
-            else:
-                if dtn == 'object':
-                    # We don't know what's inside an object array, so
-                    # we can't trust value repr's here.
-                    return value_to_display(value)
-                else:
-                    try:
-                        format_spec = self._format_spec
-                        return to_qvariant(format(value, format_spec))
-                    except TypeError:
-                        self.readonly = True
-                        return repr(value)
+            texts, __ = self._get_tile(index.row(), index.column())
+            text = texts[index.row() % TILE_ROWS][index.column() % TILE_COLS]
+            return to_qvariant(text)
         elif role == Qt.TextAlignmentRole:
             return to_qvariant(int(Qt.AlignCenter|Qt.AlignVCenter))
         elif (role == Qt.BackgroundColorRole and self.bgcolor_enabled
-                and value is not np.ma.masked and not self.has_inf):
-            try:
-                hue = (self.hue0 +
-                       self.dhue * (float(self.vmax) - self.color_func(value))
-                       / (float(self.vmax) - self.vmin))
-                hue = float(np.abs(hue))
-                color = QColor.fromHsvF(hue, self.sat, self.val, self.alp)
-                return to_qvariant(color)
-            except (TypeError, ValueError):
+                and not self.has_inf):
+            __, colors = self._get_tile(index.row(), index.column())
+            if colors is None:
+                return to_qvariant()
+            color = colors[index.row() % TILE_ROWS, index.column() % TILE_COLS]
+            if color < 0:
                 return to_qvariant()
+            return to_qvariant(self.color_table[color])
         elif role == Qt.FontRole:
             return self.get_font(SpyderFontType.MonospaceInterface)
         return to_qvariant()
@@ -401,17 +537,19 @@ def setData(self, index, value, role=Qt.EditRole):
         # Add change to self.changes
         # Use self.test_array to convert to correct dtype
         self.changes[(i, j)] = self.test_array[0]
-        self.dataChanged.emit(index, index)
 
         if not isinstance(val, (str, bytes)):
             val = self.color_func(val)
 
-            if val > self.vmax:
-                self.vmax = val
+            if val > self.vmax or val < self.vmin:
+                self.vmax = max(val, self.vmax)
+                self.vmin = min(val, self.vmin)
 
-            if val < self.vmin:
-                self.vmin = val
+                # The colors of all cells depend on the maximum and minimum
+                self._tiles.clear()
 
+        self._update_tile(i, j)
+        self.dataChanged.emit(index, index)
         return True
 
     def flags(self, index):
@@ -978,7 +1116,6 @@ def set_data_and_check(self, data, readonly=False):
             return False
 
         self.data = data
-        readonly = readonly or not self.data.flags.writeable
         is_masked_array = isinstance(data, np.ma.MaskedArray)
 
         # Reset data for 3d arrays
@@ -993,6 +1130,12 @@ def set_data_and_check(self, data, readonly=False):
         else:
             is_record_array = False
 
+        # Arrays received from the kernel as memory buffers are read-only
+        # because of that, so they're copied when accepting changes (see
+        # accept). Other read-only arrays can't be edited.
+        if not is_from_buffers(data):
+            readonly = readonly or not self.data.flags.writeable
+
         if data.ndim > 3:
             self.error(_("Arrays with more than 3 dimensions are not "
                          "supported"))
@@ -1264,6 +1407,12 @@ def ask_for_refresh_confirmation(self) -> bool:
     def accept(self):
         """Reimplement Qt method."""
         try:
+            for index in range(self.stack.count()):
+                widget = self.stack.widget(index)
+                if widget.model.changes and not widget.data.flags.writeable:
+                    self.copy_data()
+                    break
+
             for index in range(self.stack.count()):
                 self.stack.widget(index).accept_changes()
             QDialog.accept(self)
@@ -1272,6 +1421,27 @@ def accept(self):
             # RuntimeError: wrapped C/C++ object has been deleted
             pass
 
+    def copy_data(self):
+        """
+        Replace data by a writable copy and make the widgets in the stack
+        point to it.
+        """
+        self.data = self.data.copy()
+
+        if self.data.ndim != 3:
+            widget = self.stack.widget(0)
+            widget.data = self.data.reshape(widget.data.shape)
+            return
+
+        for dim, indexes in enumerate(self.dim_indexes):
+            for data_index, stack_index in indexes.items():
+                widget = self.stack.widget(stack_index)
+                if not widget.model.changes:
+                    continue
+                slice_index = [slice(None)] * 3
+                slice_index[dim] = data_index
+                widget.data = self.data[tuple(slice_index)]
+
     def get_value(self):
         """Return modified array -- this is *not* a copy"""
         # It is important to avoid accessing Qt C++ object as it has probably
@@ -111,6 +111,15 @@ def set_value(self, index, value):
         if index.isValid():
             index.model().set_value(index, value)
 
+    def get_remote_data_frame(self, index):
+        """
+        Return a RemoteDataFrame to display the value of index, if possible.
+
+        That's only the case for large dataframes that live in a kernel, so
+        this returns None here.
+        """
+        return None
+
     def make_data_function(
         self,
         index: QModelIndex
@@ -192,7 +201,13 @@ def createEditor(self, parent, option, index, object_explorer=False):
         self.sig_editor_creation_started.emit()
         if index.column() < 3:
             return None
-        if self.show_warning(index):
+
+        # Large dataframes are displayed without transferring their data
+        remote_data_frame = (
+            None if object_explorer else self.get_remote_data_frame(index)
+        )
+
+        if remote_data_frame is None and self.show_warning(index):
             answer = QMessageBox.warning(
                 self.parent(), _("Warning"),
                 _("Opening this variable can be slow\n\n"
@@ -202,7 +217,10 @@ def createEditor(self, parent, option, index, object_explorer=False):
                 self.sig_editor_shown.emit()
                 return None
         try:
-            value = self.get_value(index)
+            if remote_data_frame is None:
+                value = self.get_value(index)
+            else:
+                value = remote_data_frame
             if value is None:
                 return None
         except Exception as exception:
@@ -216,7 +234,8 @@ def createEditor(self, parent, option, index, object_explorer=False):
 
         key = index.model().get_key(index)
         readonly = (isinstance(value, (tuple, set)) or self.parent().readonly
-                    or not is_known_type(value))
+                    or not is_known_type(value)
+                    or remote_data_frame is not None)
 
         # We can't edit Numpy void objects because they could be anything, so
         # this might cause a crash.
@@ -291,8 +310,12 @@ def createEditor(self, parent, option, index, object_explorer=False):
                                             conv=conv_func))
             return None
         # DataFrameEditor for a pandas dataframe, series or index
-        elif (isinstance(value, (pd.DataFrame, pd.Index, pd.Series))
-                and pd.DataFrame is not FakeObject and not object_explorer):
+        elif (
+            isinstance(value, (pd.DataFrame, pd.Index, pd.Series))
+            and pd.DataFrame is not FakeObject
+            and not object_explorer
+            or remote_data_frame is not None
+        ):
             try:
                 source_index = index.model().mapToSource(index)
             except AttributeError:
@@ -308,7 +331,11 @@ def createEditor(self, parent, option, index, object_explorer=False):
             editor = DataFrameEditor(
                 parent=parent,
                 namespacebrowser=self.namespacebrowser,
-                data_function=self.make_data_function(index),
+                data_function=(
+                    self.make_data_function(index)
+                    if remote_data_frame is None
+                    else remote_data_frame.reload
+                ),
                 readonly=readonly
             )
             editor.sig_close_all_editors_requested.connect(
@@ -34,10 +34,14 @@
 
 # Standard library imports
 from __future__ import annotations
+from collections import OrderedDict
+import functools
 import io
+import logging
 import sys
 from time import perf_counter
 from typing import Any, Callable, Optional, TYPE_CHECKING
+import warnings
 
 # Third party imports
 from packaging.version import parse
@@ -87,6 +91,10 @@
 from spyder.widgets.helperwidgets import MessageCheckBox
 
 
+# For logging
+logger = logging.getLogger(__name__)
+
+
 if TYPE_CHECKING:
     from matplotlib.figure import Figure
     from pandas import DataFrame
@@ -125,6 +133,9 @@ class DataframeEditorActions:
     ResizeRows = 'resize_rows_action'
     CloseAllEditors = 'close_all_editors_action'
     Export = 'export_action'
+    FilterRows = 'filter_rows_action'
+    SelectColumns = 'select_columns_action'
+    ResetView = 'reset_view_action'
 
 
 class DataframeEditorMenus:
@@ -145,6 +156,7 @@ class DataframeEditorContextMenuSections:
     Edit = 'edit_section'
     Row = 'row_section'
     Column = 'column_section'
+    View = 'view_section'
     Convert = 'convert_section'
 
 
@@ -170,6 +182,18 @@ class DataframeEditorToolbarSections:
 ROWS_TO_LOAD = 500
 COLS_TO_LOAD = 40
 
+# Size of the tiles in which the data of dataframes that live in the kernel
+# is fetched, number of tiles around the displayed ones that are fetched
+# with them and maximum number of tiles kept in memory
+REMOTE_TILE_ROWS = 100
+REMOTE_TILE_COLS = 20
+REMOTE_PREFETCH_TILES = 1
+REMOTE_MAX_TILES = 64
+
+# Seconds after which tiles requested to the kernel are requested again if
+# they didn't arrive (e.g. because of an error)
+REMOTE_TILE_TIMEOUT = 30
+
 # Background colours
 BACKGROUND_NUMBER_MINHUE = 0.66  # hue for largest number
 BACKGROUND_NUMBER_HUERANGE = 0.33  # (hue for smallest) minus (hue for largest)
@@ -207,6 +231,19 @@ def bool_false_check(value):
     return value
 
 
+def get_frame_value(df, row, column):
+    """Return the value of a dataframe at the given position."""
+    # To increase the performance iat is used but that requires error
+    # handling, so fallback uses iloc
+    try:
+        value = df.iat[row, column]
+    except pd._libs.tslib.OutOfBoundsDatetime:
+        value = df.iloc[:, column].astype(str).iat[row]
+    except:
+        value = df.iloc[row, column]
+    return value
+
+
 def global_max(col_vals, index):
     """Returns the global maximum and minimum."""
     col_vals_without_None = [x for x in col_vals if x is not None]
@@ -275,9 +312,13 @@ def __init__(
         self.total_cols = self.df.shape[1]
         size = self.total_rows * self.total_cols
 
-        self.max_min_col = None
+        # Maximum and minimum of the columns computed so far, by column
+        # position, and version of the data they were computed for
+        self._max_min_cols = {}
+        self._max_min_cols_version = 0
+        self._data_version = 0
+
         if size < LARGE_SIZE:
-            self.max_min_col_update()
             self.colum_avg_enabled = True
             self.bgcolor_enabled = True
             self.colum_avg(True)
@@ -373,47 +414,145 @@ def name(self, axis, level):
         if ax.name:
             return ax.name
 
-    def max_min_col_update(self):
+    @property
+    def max_min_col(self):
         """
-        Determines the maximum and minimum number in each column.
+        The maximum and minimum number in each column.
 
-        The result is a list whose k-th entry is [vmax, vmin], where vmax and
-        vmin denote the maximum and minimum of the k-th column (ignoring NaN).
-        This list is stored in self.max_min_col.
+        This is a list whose k-th entry is [vmax, vmin], where vmax and vmin
+        denote the maximum and minimum of the k-th column (ignoring NaN).
 
         If the k-th column has a non-numerical dtype, then the k-th entry
-        is set to None. If the dtype is complex, then compute the maximum and
-        minimum of the absolute values. If vmax equals vmin, then vmin is
+        is None. If the dtype is complex, then the maximum and minimum are
+        those of the absolute values. If vmax equals vmin, then vmin is
         decreased by one.
         """
+        total_cols = self.df.shape[1]
+        self._compute_missing_max_min(range(total_cols))
+        return [self._max_min_cols.get(column) for column in range(total_cols)]
+
+    def max_min_col_update(self):
+        """
+        Mark the maximum and minimum of the columns as outdated.
+
+        This needs to be called after changing the data in the dataframe, so
+        they are computed again the next time they are needed. Sorting the
+        dataframe doesn't change them.
+        """
+        self._data_version += 1
+
+    def get_max_min_col(self, column):
+        """
+        Return the maximum and minimum of a column, as in max_min_col.
+
+        They are computed and saved the first time they are needed for the
+        current data. Columns are computed together with the rest of the
+        columns, or with the ones loaded at the same time if the dataframe
+        has too many columns.
+        """
+        total_cols = self.df.shape[1]
+        if total_cols > LARGE_COLS:
+            start = column - column % COLS_TO_LOAD
+            columns = range(start, min(start + COLS_TO_LOAD, total_cols))
+        else:
+            columns = range(total_cols)
+
+        if (
+            self._max_min_cols_version != self._data_version
+            or column not in self._max_min_cols
+        ):
+            self._compute_missing_max_min(columns)
+        return self._max_min_cols.get(column)
+
+    def _compute_missing_max_min(self, columns):
+        """
+        Compute the maximum and minimum of the columns that are not saved
+        for the current data.
+        """
+        if self._max_min_cols_version != self._data_version:
+            self._max_min_cols = {}
+            self._max_min_cols_version = self._data_version
+
+        missing = [
+            column for column in columns if column not in self._max_min_cols
+        ]
+        if missing:
+            self._max_min_cols.update(self.compute_max_min(missing))
+
+    def compute_max_min(self, columns):
+        """
+        Compute the maximum and minimum of several columns.
+
+        Columns of the same NumPy numerical dtype are computed together with
+        a single pass over their values, and the rest one by one.
+
+        Returns
+        -------
+        dict
+            The entry of max_min_col of each column, by column position.
+        """
+        result = {column: None for column in columns}
         if self.df.shape[0] == 0:  # If no rows to compute max/min then return
-            return
-        self.max_min_col = []
-        for __, col in self.df.items():
-            # This is necessary to catch some errors in Pandas when computing
-            # the maximum of a column.
-            # Fixes spyder-ide/spyder#17145 and spyder-ide/spyder#24094
-            try:
-                if (
-                    is_any_real_numeric_dtype(col.dtype)
-                    or col.dtype in COMPLEX_NUMBER_TYPES
-                ):
-                    if is_any_real_numeric_dtype(col.dtype):
-                        vmax = col.max(skipna=True)
-                        vmin = col.min(skipna=True)
-                    else:
-                        vmax = col.abs().max(skipna=True)
-                        vmin = col.abs().min(skipna=True)
-                    if vmax != vmin:
-                        max_min = [vmax, vmin]
-                    else:
-                        max_min = [vmax, vmin - 1]
+            return result
+
+        blocks = {}
+        dtypes = self.df.dtypes
+        for column in columns:
+            dtype = dtypes.iloc[column]
+            if isinstance(dtype, np.dtype) and dtype.kind in 'iufc':
+                blocks.setdefault(dtype, []).append(column)
+            else:
+                result[column] = self._compute_max_min_col(column)
+
+        for dtype, block_columns in blocks.items():
+            values = self.df.iloc[:, block_columns].to_numpy()
+            if dtype.kind == 'c':
+                values = np.abs(values)
+
+            # Columns with only NaN's give NaN as maximum and minimum, as
+            # with Pandas
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                vmaxs = np.nanmax(values, axis=0)
+                vmins = np.nanmin(values, axis=0)
+
+            for column, vmax, vmin in zip(block_columns, vmaxs, vmins):
+                if vmax != vmin:
+                    result[column] = [vmax, vmin]
                 else:
-                    max_min = None
-            except (TypeError, ValueError):
-                max_min = None
+                    result[column] = [vmax, vmin - 1]
 
-            self.max_min_col.append(max_min)
+        return result
+
+    def _compute_max_min_col(self, column):
+        """
+        Compute the maximum and minimum of a column that doesn't have a NumPy
+        numerical dtype, like nullable numbers.
+        """
+        col = self.df.iloc[:, column]
+
+        # This is necessary to catch some errors in Pandas when computing
+        # the maximum of a column.
+        # Fixes spyder-ide/spyder#17145 and spyder-ide/spyder#24094
+        try:
+            if (
+                is_any_real_numeric_dtype(col.dtype)
+                or col.dtype in COMPLEX_NUMBER_TYPES
+            ):
+                if is_any_real_numeric_dtype(col.dtype):
+                    vmax = col.max(skipna=True)
+                    vmin = col.min(skipna=True)
+                else:
+                    vmax = col.abs().max(skipna=True)
+                    vmin = col.abs().min(skipna=True)
+                if vmax != vmin:
+                    return [vmax, vmin]
+                else:
+                    return [vmax, vmin - 1]
+        except (TypeError, ValueError):
+            pass
+
+        return None
 
     def get_format_spec(self) -> str:
         """
@@ -458,7 +597,8 @@ def get_bgcolor(self, index):
             return
 
         value = self.get_value(index.row(), column)
-        if self.max_min_col[column] is None or pd.isna(value):
+        max_min = self.get_max_min_col(column)
+        if max_min is None or pd.isna(value):
             color = QColor(BACKGROUND_NONNUMBER_COLOR)
             if isinstance(value, str):
                 color.setAlphaF(BACKGROUND_STRING_ALPHA)
@@ -469,7 +609,10 @@ def get_bgcolor(self, index):
                 color_func = abs
             else:
                 color_func = float
-            vmax, vmin = self.return_max(self.max_min_col, column)
+            if self.colum_avg_enabled:
+                vmax, vmin = max_min
+            else:
+                vmax, vmin = self.return_max(self.max_min_col, column)
 
             # This is necessary to catch an error in Pandas when computing
             # the difference between the max and min of a column.
@@ -495,15 +638,7 @@ def get_bgcolor(self, index):
 
     def get_value(self, row, column):
         """Return the value of the DataFrame."""
-        # To increase the performance iat is used but that requires error
-        # handling, so fallback uses iloc
-        try:
-            value = self.df.iat[row, column]
-        except pd._libs.tslib.OutOfBoundsDatetime:
-            value = self.df.iloc[:, column].astype(str).iat[row]
-        except:
-            value = self.df.iloc[row, column]
-        return value
+        return get_frame_value(self.df, row, column)
 
     def data(self, index, role=Qt.DisplayRole):
         """Cell content"""
@@ -624,7 +759,9 @@ def setData(self, index, value, role=Qt.EditRole):
             or isinstance(current_value, str)
         ):
             try:
-                self.df.iloc[row, column] = current_value.__class__(val)
+                self.set_frame_value(
+                    row, column, current_value.__class__(val)
+                )
             except (ValueError, OverflowError) as e:
                 QMessageBox.critical(self.dialog, "Error",
                                      str(type(e).__name__) + ": " + str(e))
@@ -635,14 +772,36 @@ def setData(self, index, value, role=Qt.EditRole):
                                  .format(type(current_value).__name__))
             return False
 
-        self.max_min_col_update()
+        # Only the maximum and minimum of the edited column can change
+        self._max_min_cols.pop(column, None)
         self.dataChanged.emit(index, index)
         return True
 
+    def set_frame_value(self, row, column, value):
+        """Set the value of a cell in the DataFrame."""
+        try:
+            self.df.iloc[row, column] = value
+        except ValueError as e:
+            if 'read-only' not in str(e):
+                raise
+
+            # DataFrames received from the kernel as memory buffers are
+            # read-only, so they are copied the first time they are edited
+            self.df = self.df.copy()
+            self.df.iloc[row, column] = value
+
     def get_data(self):
         """Return data"""
         return self.df
 
+    def get_window(self, rows, columns):
+        """
+        Return the part of the dataframe in a range of rows and columns.
+
+        The ranges are given as [start, stop] lists.
+        """
+        return self.df.iloc[slice(*rows), slice(*columns)]
+
     def rowCount(self, index=QModelIndex()):
         """DataFrame row number"""
         # Avoid a "Qt exception in virtual methods" generated in our
@@ -694,6 +853,478 @@ def reset(self):
         self.endResetModel()
 
 
+class RemoteDataFrame:
+    """
+    Dataframe that lives in the kernel.
+
+    Only its shape, dtypes and header levels are transferred when this object
+    is created. Its values and labels are requested to the kernel when they
+    are displayed by RemoteDataFrameModel.
+
+    It can also be sorted, filtered and have its columns selected in the
+    kernel, which keeps the result as a view of the dataframe that's used to
+    request its values and labels.
+
+    Parameters
+    ----------
+    name : str
+        Name of the dataframe in the kernel namespace.
+    shellwidget : ShellWidget
+        Shell widget of the console where the kernel runs.
+    """
+
+    def __init__(self, name: str, shellwidget):
+        self.name = name
+        self.shellwidget = shellwidget
+
+        # Id of the view in the kernel and the settings used to create it.
+        # Columns are given by their position in the dataframe, and -1 is
+        # used to sort by the index.
+        self.view = None
+        self.sort = None
+        self.filter = None
+        self.columns = None
+
+        self._set_info(shellwidget.get_data_frame_info(name))
+
+    def _set_info(self, info):
+        """Set the shape, dtypes and header levels given by the kernel."""
+        self.shape = tuple(info['shape'])
+        self.dtypes = info['dtypes']
+        self.header_shape = tuple(info['header_shape'])
+        self.names = info['names']
+
+    def _view_kwargs(self):
+        """Arguments to request values and labels of the view, if any."""
+        return {} if self.view is None else {'view': self.view}
+
+    def reload(self) -> Optional[RemoteDataFrame]:
+        """
+        Return the current version of the dataframe in the kernel.
+
+        The sorting, filter and column selection are kept if possible. This
+        returns None if the variable is not a dataframe anymore.
+        """
+        try:
+            df = RemoteDataFrame(self.name, self.shellwidget)
+        except TypeError:
+            return None
+
+        if self.view is not None:
+            try:
+                df.update_view(
+                    sort=self.sort, filter=self.filter, columns=self.columns
+                )
+            except Exception:
+                logger.debug("Error updating dataframe view", exc_info=True)
+            self.close_view()
+
+        return df
+
+    def column_position(self, column: int) -> int:
+        """Return the position in the dataframe of a column in the view."""
+        if column < 0 or self.columns is None:
+            return column
+        return self.columns[column]
+
+    def update_view(self, **settings):
+        """
+        Sort, filter or select the columns of the dataframe in the kernel.
+
+        The settings that are not passed (sort, filter or columns) are kept
+        from the previous view. Errors in the kernel are raised.
+        """
+        view_settings = {
+            'sort': self.sort,
+            'filter': self.filter,
+            'columns': self.columns,
+        }
+        view_settings.update(settings)
+
+        if all(value is None for value in view_settings.values()):
+            self.close_view()
+            self._set_info(self.shellwidget.get_data_frame_info(self.name))
+        else:
+            info = self.shellwidget.set_data_frame_view(
+                self.name, view=self.view, **view_settings
+            )
+            self.view = info['view']
+            self._set_info(info)
+
+        self.sort = view_settings['sort']
+        self.filter = view_settings['filter']
+        self.columns = view_settings['columns']
+
+    def close_view(self):
+        """Forget the view in the kernel, if any."""
+        if self.view is not None:
+            self.shellwidget.close_data_frame_view(self.view)
+            self.view = None
+
+    def get_window(self, rows, columns, callback=None) -> DataFrame:
+        """
+        Get the values in a range of rows and columns.
+
+        The ranges are given as [start, stop] lists. If callback is given,
+        this doesn't wait for the kernel and the values are passed to it
+        when they arrive.
+        """
+        return self.shellwidget.get_data_frame_window(
+            self.name, rows, columns, callback=callback,
+            **self._view_kwargs()
+        )
+
+    def get_header(self, axis, start, stop, callback=None):
+        """
+        Get the column (axis 0) or row (axis 1) labels in a range.
+
+        If callback is given, this doesn't wait for the kernel and the labels
+        are passed to it when they arrive.
+        """
+        return self.shellwidget.get_data_frame_header(
+            self.name, axis, start, stop, callback=callback,
+            **self._view_kwargs()
+        )
+
+
+class RemoteDataFrameModel(DataFrameModel):
+    """
+    Model encapsulating a dataframe that lives in the kernel.
+
+    Values and labels are fetched in tiles of REMOTE_TILE_ROWS rows and
+    REMOTE_TILE_COLS columns when they are first displayed, together with
+    the tiles around them, and the last used tiles are kept in memory.
+    Tiles are fetched without waiting for the kernel, so cells and labels
+    are empty until they arrive. These dataframes can't be edited, and they
+    are sorted and filtered in the kernel.
+
+    Parameters
+    ----------
+    dataFrame : RemoteDataFrame
+        The dataframe encapsulated by the model.
+    format_spec : str, optional
+        Format specification for floats. The default is DEFAULT_FORMAT.
+    parent : Optional[QWidget], optional
+        The parent widget for the model. The default is None.
+    """
+
+    def __init__(
+        self,
+        dataFrame: RemoteDataFrame,
+        format_spec: str = DEFAULT_FORMAT,
+        parent: Optional[QWidget] = None,
+    ):
+        # Tiles of values by tile row and column, and of labels by axis and
+        # tile, from the least to the most recently used
+        self._tiles = OrderedDict()
+        self._header_tiles = OrderedDict()
+
+        # Time when the tiles that didn't arrive yet were requested, and
+        # number of times the view was changed, to discard tiles of previous
+        # views
+        self._requested_tiles = {}
+        self._requested_header_tiles = {}
+        self._view_version = 0
+
+        super().__init__(dataFrame, format_spec, parent, readonly=True)
+        self.max_min_col_update()
+
+    def _axis_levels(self, axis):
+        """Return the number of levels of the columns (0) or rows (1)."""
+        return self.df.header_shape[axis]
+
+    def _prefetch_range(self, tile, tile_size, total):
+        """Return the tiles that are fetched together with a tile."""
+        num_tiles = -(-total // tile_size)
+        return range(
+            max(tile - REMOTE_PREFETCH_TILES, 0),
+            min(tile + REMOTE_PREFETCH_TILES + 1, num_tiles)
+        )
+
+    def _add_tile(self, cache, key, tile):
+        """Add a tile to a cache, removing the least recently used ones."""
+        cache[key] = tile
+        cache.move_to_end(key)
+        while len(cache) > REMOTE_MAX_TILES:
+            cache.popitem(last=False)
+
+    def _get_tile(self, cache, key, fetch):
+        """
+        Get a tile from a cache, requesting it if it's not there.
+
+        None is returned if the tile didn't arrive yet.
+        """
+        if key not in cache:
+            fetch(*key)
+            if key not in cache:
+                return None
+
+        cache.move_to_end(key)
+        return cache[key]
+
+    def _get_missing(self, keys, cache, requested):
+        """
+        Get the tiles that are not in cache and are not waiting for the
+        kernel, and set them as requested.
+        """
+        now = perf_counter()
+        missing = [
+            key for key in keys
+            if key not in cache
+            and now - requested.get(key, -REMOTE_TILE_TIMEOUT)
+            >= REMOTE_TILE_TIMEOUT
+        ]
+        for key in missing:
+            requested[key] = now
+        return missing
+
+    def _fetch_tiles(self, tile_row, tile_col):
+        """
+        Request a tile of values and the ones around it not in memory.
+
+        All of them are requested with a single call to the kernel.
+        """
+        missing = self._get_missing(
+            [
+                (row, col)
+                for row in self._prefetch_range(
+                    tile_row, REMOTE_TILE_ROWS, self.total_rows
+                )
+                for col in self._prefetch_range(
+                    tile_col, REMOTE_TILE_COLS, self.total_cols
+                )
+            ],
+            self._tiles,
+            self._requested_tiles,
+        )
+        if not missing:
+            return
+
+        # The requested tile is added last so that it's the most recent one
+        missing.sort(key=lambda key: key == (tile_row, tile_col))
+        rows = [
+            min(row for row, __ in missing) * REMOTE_TILE_ROWS,
+            (max(row for row, __ in missing) + 1) * REMOTE_TILE_ROWS
+        ]
+        columns = [
+            min(col for __, col in missing) * REMOTE_TILE_COLS,
+            (max(col for __, col in missing) + 1) * REMOTE_TILE_COLS
+        ]
+        try:
+            self.df.get_window(
+                rows,
+                columns,
+                callback=functools.partial(
+                    self._set_tiles, self._view_version, missing, rows,
+                    columns
+                ),
+            )
+        except Exception:
+            # Request the tiles again the next time they're painted
+            logger.debug("Error fetching dataframe tiles", exc_info=True)
+            for key in missing:
+                self._requested_tiles.pop(key, None)
+
+    def _set_tiles(self, view_version, keys, rows, columns, window):
+        """Add the tiles of values sent by the kernel and display them."""
+        if view_version != self._view_version:
+            return
+
+        for row, col in keys:
+            self._requested_tiles.pop((row, col), None)
+            row_start = row * REMOTE_TILE_ROWS - rows[0]
+            col_start = col * REMOTE_TILE_COLS - columns[0]
+            self._add_tile(
+                self._tiles,
+                (row, col),
+                window.iloc[
+                    row_start:row_start + REMOTE_TILE_ROWS,
+                    col_start:col_start + REMOTE_TILE_COLS
+                ]
+            )
+
+        last_row = min(rows[1], self.rowCount()) - 1
+        last_col = min(columns[1], self.columnCount()) - 1
+        if rows[0] <= last_row and columns[0] <= last_col:
+            self.dataChanged.emit(
+                self.index(rows[0], columns[0]),
+                self.index(last_row, last_col)
+            )
+
+    def _fetch_header_tiles(self, axis, tile):
+        """Request a tile of labels and the ones around it not in memory."""
+        if axis == 0:
+            tile_size, total = REMOTE_TILE_COLS, self.total_cols
+        else:
+            tile_size, total = REMOTE_TILE_ROWS, self.total_rows
+
+        missing = self._get_missing(
+            [
+                (axis, t)
+                for t in self._prefetch_range(tile, tile_size, total)
+            ],
+            self._header_tiles,
+            self._requested_header_tiles,
+        )
+        if not missing:
+            return
+
+        missing.sort(key=lambda key: key == (axis, tile))
+        start = min(t for __, t in missing) * tile_size
+        stop = (max(t for __, t in missing) + 1) * tile_size
+        try:
+            self.df.get_header(
+                axis,
+                start,
+                stop,
+                callback=functools.partial(
+                    self._set_header_tiles, self._view_version, axis,
+                    missing, start, stop
+                ),
+            )
+        except Exception:
+            logger.debug("Error fetching dataframe labels", exc_info=True)
+            for key in missing:
+                self._requested_header_tiles.pop(key, None)
+
+    def _set_header_tiles(self, view_version, axis, keys, start, stop,
+                          labels):
+        """Add the tiles of labels sent by the kernel and display them."""
+        if view_version != self._view_version:
+            return
+
+        tile_size = REMOTE_TILE_COLS if axis == 0 else REMOTE_TILE_ROWS
+        labels = labels.tolist()
+        for key in keys:
+            self._requested_header_tiles.pop(key, None)
+            tile_start = key[1] * tile_size - start
+            self._add_tile(
+                self._header_tiles,
+                key,
+                labels[tile_start:tile_start + tile_size]
+            )
+
+        if axis == 0:
+            orientation, count = Qt.Horizontal, self.columnCount()
+        else:
+            orientation, count = Qt.Vertical, self.rowCount()
+        last = min(stop, count) - 1
+        if start <= last:
+            self.headerDataChanged.emit(orientation, start, last)
+
+    def header(self, axis, x, level=0):
+        """
+        Return the values of the labels for the header of columns or rows.
+
+        The value corresponds to the header of column or row x in the
+        given level. It's an empty string until the label arrives from the
+        kernel.
+        """
+        tile_size = REMOTE_TILE_COLS if axis == 0 else REMOTE_TILE_ROWS
+        labels = self._get_tile(
+            self._header_tiles, (axis, x // tile_size),
+            self._fetch_header_tiles
+        )
+        if labels is None:
+            return ''
+
+        label = labels[x % tile_size]
+        if self._axis_levels(axis) > 1:
+            return label[level]
+        return label
+
+    def name(self, axis, level):
+        """Return the labels of the levels if any."""
+        names = self.df.names[axis]
+        if len(names) > 1:
+            return names[level]
+        if names[0]:
+            return names[0]
+
+    def compute_max_min(self, columns):
+        """
+        Set that no column has a maximum and minimum.
+
+        Computing them would require all the data in the dataframe, so
+        cells are colored as non-numerical ones.
+        """
+        return {column: None for column in columns}
+
+    def _get_value_tile(self, row, column):
+        """Return the tile of values of a cell, or None if it's not here."""
+        return self._get_tile(
+            self._tiles,
+            (row // REMOTE_TILE_ROWS, column // REMOTE_TILE_COLS),
+            self._fetch_tiles
+        )
+
+    def get_value(self, row, column):
+        """Return the value of the DataFrame."""
+        tile = self._get_value_tile(row, column)
+        if tile is None:
+            return None
+
+        return get_frame_value(
+            tile, row % REMOTE_TILE_ROWS, column % REMOTE_TILE_COLS
+        )
+
+    def data(self, index, role=Qt.DisplayRole):
+        """Cell content, which is empty until its value arrives."""
+        if (
+            index.isValid()
+            and self._get_value_tile(index.row(), index.column()) is None
+        ):
+            return to_qvariant()
+        return super().data(index, role)
+
+    def recalculate_index(self):
+        """Nothing to recalculate because the dataframe can't change."""
+        pass
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """Sort the dataframe in the kernel."""
+        ascending = order == Qt.AscendingOrder
+        return self.update_view(
+            sort=[self.df.column_position(column), ascending]
+        )
+
+    def update_view(self, **settings):
+        """
+        Sort, filter or select the columns of the dataframe in the kernel,
+        and display the result.
+
+        This returns False and shows the error if that's not possible.
+        """
+        try:
+            self.df.update_view(**settings)
+        except Exception as e:
+            QMessageBox.critical(
+                self.dialog, "Error", "{}: {}".format(type(e).__name__, e)
+            )
+            return False
+
+        self.beginResetModel()
+        self._tiles.clear()
+        self._header_tiles.clear()
+        self._requested_tiles.clear()
+        self._requested_header_tiles.clear()
+        self._view_version += 1
+        self.total_rows, self.total_cols = self.df.shape
+        self.rows_loaded = ROWS_TO_LOAD
+        self.cols_loaded = COLS_TO_LOAD
+        self.max_min_col_update()
+        self.endResetModel()
+        return True
+
+    def get_window(self, rows, columns):
+        """
+        Return the part of the dataframe in a range of rows and columns.
+
+        The ranges are given as [start, stop] lists.
+        """
+        return self.df.get_window(rows, columns)
+
+
 class DataFrameView(SpyderWidgetMixin, QTableView):
     """
     View displaying a dataframe in the dataframe editor
@@ -728,10 +1359,13 @@ class DataFrameView(SpyderWidgetMixin, QTableView):
     -------
     sig_sort_by_column(): Raised after more columns are fetched.
     sig_fetch_more_rows(): Raised after more rows are fetched.
+    sig_view_changed(): Raised after the rows or columns in the view change
+        because the dataframe is filtered in the kernel.
     """
     sig_sort_by_column = Signal()
     sig_fetch_more_columns = Signal()
     sig_fetch_more_rows = Signal()
+    sig_view_changed = Signal()
 
     CONF_SECTION = 'variable_explorer'
 
@@ -771,6 +1405,9 @@ def __init__(
         self.resize_columns_action = None
         self.histogram_action = None
         self.export_action = None
+        self.filter_rows_action = None
+        self.select_columns_action = None
+        self.reset_view_action = None
         self.export_filename = None
 
         self.menu = self.setup_menu()
@@ -906,9 +1543,26 @@ def refresh_menu(self):
                        self.remove_col_action, self.histogram_action]:
             action.setEnabled(condition_copy_remove)
 
-        # Enable/disable action for plot
-        condition_plot = (index.isValid() and len(self.selectedIndexes()) > 0)
+        # Enable/disable action for plot. Plotting and exporting need all the
+        # data, which is not transferred for dataframes that live in the
+        # kernel.
+        remote = isinstance(self.model(), RemoteDataFrameModel)
+        condition_plot = (
+            index.isValid()
+            and len(self.selectedIndexes()) > 0
+            and not remote
+        )
         self.histogram_action.setEnabled(condition_plot)
+        self.export_action.setEnabled(not remote)
+
+        # Filtering and selecting columns is done in the kernel, so it's only
+        # available for dataframes that live there
+        for action in [self.filter_rows_action, self.select_columns_action,
+                       self.reset_view_action]:
+            action.setVisible(remote)
+        self.select_columns_action.setEnabled(
+            remote and len(self.selectedIndexes()) > 0
+        )
 
     def setup_menu(self):
         """Setup context menu."""
@@ -1016,6 +1670,28 @@ def setup_menu(self):
             triggered=self.export_data,
             register_action=False
         )
+        self.filter_rows_action = self.create_action(
+            name=DataframeEditorActions.FilterRows,
+            text=_("Filter rows..."),
+            tip=_("Show only the rows that satisfy an expression"),
+            icon=ima.icon('filter'),
+            triggered=self.filter_rows,
+            register_action=False
+        )
+        self.select_columns_action = self.create_action(
+            name=DataframeEditorActions.SelectColumns,
+            text=_("Show only selected columns"),
+            icon=ima.icon('filter'),
+            triggered=self.select_columns,
+            register_action=False
+        )
+        self.reset_view_action = self.create_action(
+            name=DataframeEditorActions.ResetView,
+            text=_("Show all rows and columns"),
+            icon=ima.icon('undo'),
+            triggered=self.reset_view,
+            register_action=False
+        )
 
         # ---- Create context menu and fill it
 
@@ -1040,9 +1716,65 @@ def setup_menu(self):
                 menu,
                 section=DataframeEditorContextMenuSections.Column
             )
+        for action in [self.filter_rows_action, self.select_columns_action,
+                       self.reset_view_action]:
+            self.add_item_to_menu(
+                action,
+                menu,
+                section=DataframeEditorContextMenuSections.View
+            )
 
         return menu
 
+    @Slot()
+    def filter_rows(self):
+        """Filter the rows of a dataframe that lives in the kernel."""
+        model = self.model()
+        expression, valid = QInputDialog.getText(
+            self,
+            _("Filter rows"),
+            _("Expression with the column names, e.g. a > 0 and b == 'x'"),
+            QLineEdit.Normal,
+            model.df.filter or ''
+        )
+        if valid and model.update_view(filter=expression.strip() or None):
+            self.sig_view_changed.emit()
+
+    @Slot()
+    def select_columns(self):
+        """Show only the selected columns of a dataframe in the kernel."""
+        model = self.model()
+        columns = sorted({index.column() for index in self.selectedIndexes()})
+        columns = [model.df.column_position(column) for column in columns]
+        if model.update_view(columns=columns):
+            self.update_sort_indicator()
+            self.sig_view_changed.emit()
+
+    @Slot()
+    def reset_view(self):
+        """Show all the rows and columns of a dataframe in the kernel."""
+        if self.model().update_view(sort=None, filter=None, columns=None):
+            self.update_sort_indicator()
+            self.sig_view_changed.emit()
+
+    def update_sort_indicator(self):
+        """Show the column a dataframe in the kernel is sorted by, if any."""
+        df = self.model().df
+        column = None
+        if df.sort is not None and df.sort[0] >= 0:
+            if df.columns is None:
+                column = df.sort[0]
+            elif df.sort[0] in df.columns:
+                column = df.columns.index(df.sort[0])
+
+        if column is None:
+            self.header_class.setSortIndicatorShown(False)
+            self.sort_old = [None]
+        else:
+            order = Qt.AscendingOrder if df.sort[1] else Qt.DescendingOrder
+            self.header_class.setSortIndicator(column, order)
+            self.sort_old = [column, order]
+
     @Slot()
     def export_data(self):
         """Export DataFrame to CSV or Excel file."""
@@ -1116,9 +1848,9 @@ def copy(self):
         # Copy index and header too (equal True).
         # See spyder-ide/spyder#11096
         index = header = True
-        df = self.model().df
-        obj = df.iloc[slice(row_min, row_max + 1),
-                      slice(col_min, col_max + 1)]
+        obj = self.model().get_window(
+            [row_min, row_max + 1], [col_min, col_max + 1]
+        )
         output = io.StringIO()
         try:
             obj.to_csv(output, sep='\t', index=index, header=header)
@@ -1629,6 +2361,10 @@ def __init__(self, model, axis, use_monospace_font=False):
             self.total_rows = self.model.shape[0]
             self._shape = (self.model.shape[0], self.model.header_shape[1])
 
+        # Labels of dataframes that live in the kernel arrive after they're
+        # requested
+        self.model.headerDataChanged.connect(self._on_header_data_changed)
+
     def rowCount(self, index=None):
         """Get number of rows in the header."""
         if self.axis == 0:
@@ -1649,6 +2385,25 @@ def columnCount(self, index=QModelIndex()):
         else:
             return max(1, self._shape[1])
 
+    def _on_header_data_changed(self, orientation, first, last):
+        """Display the labels of the model that changed."""
+        axis = 0 if orientation == Qt.Horizontal else 1
+        if axis != self.axis:
+            return
+
+        if axis == 0:
+            last = min(last, self.columnCount() - 1)
+            top_left = self.index(0, first)
+            bottom_right = self.index(self.rowCount() - 1, last)
+        else:
+            last = min(last, self.rowCount() - 1)
+            top_left = self.index(first, 0)
+            bottom_right = self.index(last, self.columnCount() - 1)
+
+        if first <= last:
+            self.headerDataChanged.emit(orientation, first, last)
+            self.dataChanged.emit(top_left, bottom_right)
+
     def fetch_more(self, rows=False, columns=False):
         """Get more columns or rows (based on axis)."""
         if self.axis == 1 and self.total_rows > self.rows_loaded:
@@ -1977,12 +2732,17 @@ def setup_and_check(
         Setup editor.
 
         It returns False if data is not supported, True otherwise. Supported
-        types for data are DataFrame, Series and Index.
+        types for data are DataFrame, Series, Index and RemoteDataFrame.
         """
+        if isinstance(data, RemoteDataFrame):
+            class_name = 'DataFrame'
+        else:
+            class_name = data.__class__.__name__
+
         if title:
-            title = str(title) + " - %s" % data.__class__.__name__
+            title = str(title) + " - %s" % class_name
         else:
-            title = _("%s editor") % data.__class__.__name__
+            title = _("%s editor") % class_name
 
         self.setup_ui(title, from_variable_explorer)
         return self.set_data_and_check(data)
@@ -2096,7 +2856,9 @@ def set_data_and_check(self, data) -> bool:
 
         This method returns False if data is not supported.
         """
-        if not isinstance(data, (pd.DataFrame, pd.Series, pd.Index)):
+        if not isinstance(
+            data, (pd.DataFrame, pd.Series, pd.Index, RemoteDataFrame)
+        ):
             return False
 
         self._selection_rec = False
@@ -2109,11 +2871,14 @@ def set_data_and_check(self, data) -> bool:
             data = pd.DataFrame(data)
 
         # Create the model and view of the data
-        self.dataModel = DataFrameModel(
-            data,
-            parent=self,
-            readonly=self.readonly
-        )
+        if isinstance(data, RemoteDataFrame):
+            self.dataModel = RemoteDataFrameModel(data, parent=self)
+        else:
+            self.dataModel = DataFrameModel(
+                data,
+                parent=self,
+                readonly=self.readonly
+            )
         self.dataModel.dataChanged.connect(self.save_and_close_enable)
         self.dataTable.setModel(self.dataModel)
 
@@ -2305,6 +3070,7 @@ def create_data_table(self):
         self.glayout.addWidget(self.dataTable, 1, 1)
         self.setFocusProxy(self.dataTable)
         self.dataTable.sig_sort_by_column.connect(self._sort_update)
+        self.dataTable.sig_view_changed.connect(self._reload)
         self.dataTable.sig_fetch_more_columns.connect(self._fetch_more_columns)
         self.dataTable.sig_fetch_more_rows.connect(self._fetch_more_rows)
 
@@ -2579,6 +3345,13 @@ def ask_for_refresh_confirmation(self) -> bool:
         )
         return result == QMessageBox.Yes
 
+    def done(self, result):
+        """Reimplement Qt method to forget views of dataframes in the kernel"""
+        data_model = getattr(self, 'dataModel', None)
+        if isinstance(data_model, RemoteDataFrameModel):
+            data_model.df.close_view()
+        super().done(result)
+
     def error(self, message):
         """An error occurred, closing the dialog box"""
         QMessageBox.critical(self, _("Dataframe editor"), message)
@@ -23,8 +23,10 @@
 from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QApplication, QMessageBox
 from scipy.io import loadmat
+from spyder_kernels.utils.arraybuffers import from_buffers, to_buffers
 
 # Local imports
+from spyder.plugins.variableexplorer.widgets import arrayeditor
 from spyder.plugins.variableexplorer.widgets.arrayeditor import (
     ArrayEditor, ArrayModel)
 
@@ -374,6 +376,48 @@ def test_arrayeditor_edit_2d_array(qtbot):
     assert np.sum(diff_arr != dlg.get_value()) == 2
 
 
+@pytest.mark.parametrize(
+    'shape, edited_index',
+    [((4,), (1,)), ((2, 3), (1, 0)), ((2, 3, 4), (0, 1, 0))]
+)
+def test_arrayeditor_edit_buffers_array(qtbot, shape, edited_index):
+    """
+    Test that arrays received from the kernel as memory buffers, which are
+    read-only, can be edited and are copied when accepting the changes.
+    """
+    header, buffers = to_buffers(np.ones(shape))
+    arr = from_buffers(header, [bytes(buffer) for buffer in buffers])
+    assert not arr.flags.writeable
+    dlg = ArrayEditor()
+    assert dlg.setup_and_check(arr)
+    dlg.show()
+    qtbot.addWidget(dlg)
+
+    model = dlg.arraywidget.model
+    assert not model.readonly
+    model.setData(model.index(1, 0), '2')
+    dlg.accept()
+
+    exp_arr = np.ones(shape)
+    exp_arr[edited_index] = 2
+    assert_array_equal(dlg.get_value(), exp_arr)
+    assert not np.shares_memory(dlg.get_value(), arr)
+    assert (arr == 1).all()
+
+
+def test_arrayeditor_readonly_array(qtbot):
+    """Test that arrays set as read-only by users can't be edited."""
+    arr = np.ones((2, 3))
+    arr.flags.writeable = False
+    dlg = ArrayEditor()
+    assert dlg.setup_and_check(arr)
+    qtbot.addWidget(dlg)
+
+    assert dlg.arraywidget.model.readonly
+    dlg.accept()
+    assert dlg.get_value() is arr
+
+
 @pytest.mark.skipif(
     sys.platform.startswith('linux'),
     reason="Sometimes fails on Linux ")
@@ -398,6 +442,62 @@ def test_arrayeditor_edit_complex_array(qtbot):
     dlg.accept()
 
 
+def test_arraymodel_tiles(qtbot, monkeypatch):
+    """
+    Test that the texts and background colors of cells are computed by
+    tiles, which are kept in memory until they are the least recently used
+    ones, and that editing a cell only updates that cell.
+    """
+    monkeypatch.setattr(arrayeditor, 'MAX_TILES', 3)
+    arr = np.ma.array(
+        np.linspace(0, 1, 200 * 40).reshape(200, 40),
+        mask=np.zeros((200, 40), dtype=bool)
+    )
+    arr[5, 5] = np.nan
+    arr.mask[6, 6] = True
+    model = ArrayModel(arr)
+
+    def data(i, j, role=Qt.DisplayRole):
+        return model.data(model.index(i, j), role)
+
+    # Texts are the same as formatting each value
+    for i, j in [(0, 0), (63, 15), (150, 30), (199, 39)]:
+        assert data(i, j) == format(arr[i, j], '.6g')
+    assert data(5, 5) == 'nan'
+    assert data(6, 6) == ''
+    assert list(model._tiles) == [(2, 1), (3, 2), (0, 0)]
+
+    # The least recently used tile is removed
+    assert data(0, 20) == format(arr[0, 20], '.6g')
+    assert list(model._tiles) == [(3, 2), (0, 0), (0, 1)]
+
+    # Colors go from the maximum to the minimum value
+    first = data(0, 0, Qt.BackgroundColorRole)
+    last = data(199, 39, Qt.BackgroundColorRole)
+    assert first.hueF() == pytest.approx(0.99, abs=1e-2)
+    assert last.hueF() == pytest.approx(0.66, abs=1e-2)
+    assert data(5, 5, Qt.BackgroundColorRole) is None
+    assert data(6, 6, Qt.BackgroundColorRole) is None
+
+    # Editing a value updates its cell in memory
+    data(1, 1)
+    tile = model._tiles[(0, 0)]
+    assert model.setData(model.index(1, 1), '0.5')
+    assert model._tiles[(0, 0)] is tile
+    assert data(1, 1) == '0.5'
+    assert data(1, 1, Qt.BackgroundColorRole).hueF() == pytest.approx(
+        data(100, 0, Qt.BackgroundColorRole).hueF(), abs=1e-2
+    )
+
+    # Unless it changes the range of the colors
+    assert model.setData(model.index(1, 1), '2')
+    assert (0, 0) not in model._tiles
+    assert data(1, 1) == '2'
+    assert data(1, 1, Qt.BackgroundColorRole).hueF() == pytest.approx(
+        0.66, abs=1e-2
+    )
+
+
 def test_arraymodel_set_data_overflow(monkeypatch):
     """
     Test that entry of an overflowing integer is caught and handled properly.
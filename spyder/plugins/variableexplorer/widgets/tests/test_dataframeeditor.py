@@ -359,6 +359,62 @@ def test_dataframemodel_with_categories():  # cf. spyder-ide/spyder#3308.
     assert dfm.max_min_col == [[6, 1], None, None]
 
 
+def test_dataframemodel_max_min_col_cache(monkeypatch):
+    """
+    Test that the maximum and minimum of columns are computed by dtype
+    blocks, only for the columns that are needed in wide dataframes, and
+    only again for the edited column after an edit.
+    """
+    monkeypatch.setattr(dataframeeditor, 'LARGE_COLS', 4)
+    monkeypatch.setattr(dataframeeditor, 'COLS_TO_LOAD', 3)
+    df = DataFrame({
+        'a': [1, 2, 3],
+        'b': [0.5, numpy.nan, 1.5],
+        'c': [1j, 2, 3 + 4j],
+        'd': [4, 4, 4],
+        'e': ['x', 'y', 'z'],
+        'f': Series([1, None, 5], dtype='Int64'),
+        'g': [numpy.nan] * 3,
+    })
+    dfm = DataFrameModel(df)
+    assert dfm._max_min_cols == {}
+
+    computed = []
+    compute_max_min = dfm.compute_max_min
+
+    def compute(columns):
+        computed.append(list(columns))
+        return compute_max_min(columns)
+
+    monkeypatch.setattr(dfm, 'compute_max_min', compute)
+
+    # Only the columns loaded with the needed one are computed
+    assert dfm.get_max_min_col(4) is None
+    assert dfm.get_max_min_col(3) == [4, 3]
+    assert computed == [[3, 4, 5]]
+
+    # Sorting doesn't compute them again
+    dfm.sort(0, order=Qt.DescendingOrder)
+    assert dfm.max_min_col[:-1] == [
+        [3, 1], [1.5, 0.5], [5.0, 1.0], [4, 3], None, [5, 1]
+    ]
+    assert numpy.isnan(dfm.max_min_col[-1]).all()
+    assert computed == [[3, 4, 5], [0, 1, 2, 6]]
+
+    # Editing a value only computes its column again
+    assert dfm.setData(dfm.index(0, 0), '7')
+    assert dfm.get_max_min_col(0) == [7, 1]
+    assert dfm.get_max_min_col(1) == [1.5, 0.5]
+    assert computed[-1] == [0]
+
+    # Unless the data is marked as changed
+    dfm.max_min_col_update()
+    dfm.get_max_min_col(1)
+    assert computed[-1] == [0, 1, 2]
+    dfm.get_max_min_col(1)
+    assert len(computed) == 4
+
+
 def test_dataframemodel_get_bgcolor_with_numbers():
     df = DataFrame([[0, 10], [1, 20], [2, 40]])
     dfm = DataFrameModel(df)
@@ -1017,6 +1073,21 @@ def test_dataframemodel_set_data_bool(monkeypatch):
                              model.df.as_matrix()[:, 0]) == len(expected_df)
 
 
+def test_dataframemodel_set_data_readonly():
+    """
+    Test that DataFrames backed by read-only memory, like the ones received
+    from the kernel as memory buffers, are copied when they're edited.
+    """
+    values = numpy.frombuffer(numpy.arange(6.).tobytes()).reshape((3, 2))
+    test_df = DataFrame(values, copy=False)
+    model = DataFrameModel(test_df)
+
+    assert model.setData(model.createIndex(1, 1), '10')
+    assert model.df.iloc[1, 1] == 10
+    assert model.df is not test_df
+    assert values[1, 1] == 3
+
+
 @flaky(max_runs=3)
 @pytest.mark.no_xvfb
 @pytest.mark.skipif(sys.platform == 'darwin', reason="It fails on macOS")
@@ -1167,6 +1238,265 @@ def test_dataframeeditor_readonly(qtbot):
     assert not editor.dataTable.edit_action.isEnabled()
 
 
+def test_dataframeeditor_remote(qtbot, monkeypatch):
+    """
+    Test that the values and labels of a dataframe that lives in the kernel
+    are fetched in tiles, which are kept in memory until they are the least
+    recently used ones.
+    """
+    monkeypatch.setattr(dataframeeditor, 'REMOTE_MAX_TILES', 12)
+    df = DataFrame(
+        numpy.arange(1000 * 60).reshape(1000, 60),
+        columns=MultiIndex.from_product(
+            [['a', 'b'], range(30)], names=['x', None]
+        )
+    )
+
+    # Shell widget which gets the parts of df like the kernel would. Replies
+    # to calls with a callback are sent when calling reply.
+    replies = []
+
+    def send(value, callback):
+        if callback is None:
+            return value
+        replies.append(lambda: callback(value))
+
+    def reply():
+        while replies:
+            replies.pop(0)()
+
+    shellwidget = Mock()
+    shellwidget.get_data_frame_info.return_value = {
+        'shape': [1000, 60],
+        'dtypes': ['int64'] * 60,
+        'header_shape': [2, 1],
+        'names': [['x', None], [None]],
+    }
+    shellwidget.get_data_frame_window.side_effect = (
+        lambda name, rows, columns, callback=None:
+        send(df.iloc[slice(*rows), slice(*columns)], callback)
+    )
+    shellwidget.get_data_frame_header.side_effect = (
+        lambda name, axis, start, stop, callback=None:
+        send(df.axes[1 - axis][start:stop], callback)
+    )
+    get_window = shellwidget.get_data_frame_window
+
+    editor = DataFrameEditor(readonly=True)
+    assert editor.setup_and_check(
+        dataframeeditor.RemoteDataFrame('df', shellwidget), title='df'
+    )
+    reply()
+    assert editor.windowTitle() == 'df - DataFrame'
+    model = editor.dataModel
+    assert isinstance(model, dataframeeditor.RemoteDataFrameModel)
+    assert model.shape == (1000, 60)
+    assert model.header_shape == (2, 1)
+    assert model.name(0, 0) == 'x'
+    assert not editor.dataTable.export_action.isEnabled()
+
+    # Labels are empty until they arrive, and then they're displayed
+    model._header_tiles.clear()
+    assert model.header(0, 45, 0) == ''
+    header_model = editor.table_header.model()
+    with qtbot.waitSignal(header_model.dataChanged):
+        with qtbot.waitSignal(model.headerDataChanged) as blocker:
+            reply()
+    assert blocker.args == [Qt.Horizontal, 20, 59]
+    assert model.header(0, 45, 0) == 'b'
+    assert model.header(0, 45, 1) == 15
+    assert model.header(1, 999) == ''
+    reply()
+    assert model.header(1, 999) == 999
+
+    # A tile is fetched with the ones around it in a single call, and its
+    # cells are empty until it arrives
+    model._tiles.clear()
+    get_window.reset_mock()
+    assert data(model, 250, 45) is None
+    get_window.assert_called_once_with(
+        'df', [100, 400], [20, 60], callback=ANY
+    )
+    with qtbot.waitSignal(model.dataChanged) as blocker:
+        reply()
+    assert blocker.args[0].row() == 100
+    assert blocker.args[0].column() == 20
+    assert blocker.args[1].row() == 399
+    assert blocker.args[1].column() == 59
+    assert data(model, 250, 45) == str(df.iat[250, 45])
+    assert data(model, 399, 59) == str(df.iat[399, 59])
+    assert data(model, 100, 20) == str(df.iat[100, 20])
+    get_window.assert_called_once()
+
+    # Tiles are not requested again while they're waiting for the kernel
+    assert data(model, 450, 45) is None
+    assert data(model, 450, 45) is None
+    get_window.assert_called_with('df', [400, 600], [20, 60], callback=ANY)
+    assert get_window.call_count == 2
+
+    # Only the tiles that are not in memory are fetched
+    reply()
+    assert data(model, 450, 45) == str(df.iat[450, 45])
+    assert len(model._tiles) == 10
+
+    # The least recently used tiles are removed
+    assert data(model, 0, 0) is None
+    get_window.assert_called_with('df', [0, 200], [0, 40], callback=ANY)
+    reply()
+    assert data(model, 0, 0) == str(df.iat[0, 0])
+    assert len(model._tiles) == 12
+    assert (1, 1) in model._tiles
+    assert (1, 2) not in model._tiles
+
+    # Tiles that don't arrive (e.g. because of an error in the kernel) are
+    # not kept, and are requested again after some time
+    monkeypatch.setattr(dataframeeditor, 'REMOTE_TILE_TIMEOUT', 0)
+    get_window.reset_mock()
+    assert data(model, 950, 0) is None
+    replies.clear()
+    assert data(model, 950, 0) is None
+    assert get_window.call_count == 2
+    reply()
+    assert data(model, 950, 0) == str(df.iat[950, 0])
+
+    # Tiles of previous views are discarded
+    assert data(model, 650, 0) is None
+    model._view_version += 1
+    reply()
+    assert data(model, 650, 0) is None
+
+    # Copying fetches the selected values
+    view = editor.dataTable
+    view.selectionModel().select(
+        QItemSelection(model.index(998, 58), model.index(999, 59)),
+        QItemSelectionModel.ClearAndSelect
+    )
+    view.copy()
+    get_window.assert_called_with(
+        'df', [998, 1000], [58, 60], callback=None
+    )
+
+
+def test_dataframeeditor_remote_views(qtbot, monkeypatch):
+    """
+    Test that dataframes that live in the kernel are sorted, filtered and
+    have their columns selected there, and that the editor pages through
+    the resulting view.
+    """
+    df = DataFrame(
+        {'a': numpy.arange(1000) % 7, 'b': numpy.arange(1000), 'c': 0.5}
+    )
+    views = {}
+
+    def get_info(rows, columns):
+        return {
+            'shape': [len(rows), len(columns)],
+            'dtypes': [str(dtype) for dtype in df.dtypes.iloc[columns]],
+            'header_shape': [1, 1],
+            'names': [[None], [None]],
+        }
+
+    def set_view(name, sort=None, filter=None, columns=None, view=None):
+        views.pop(view, None)
+        part = df if filter is None else df.query(filter)
+        if sort is not None:
+            part = part.sort_values(
+                df.columns[sort[0]], ascending=sort[1], kind='mergesort'
+            )
+        rows = [df.index.get_loc(label) for label in part.index]
+        columns = list(range(3)) if columns is None else columns
+        view = 'view{}'.format(len(views))
+        views[view] = (rows, columns)
+        return dict(get_info(rows, columns), view=view)
+
+    def get_window(name, rows, columns, view=None, callback=None):
+        view_rows, view_columns = views.get(
+            view, (range(len(df)), range(3))
+        )
+        window = df.iloc[
+            list(view_rows)[slice(*rows)], list(view_columns)[slice(*columns)]
+        ]
+        if callback is None:
+            return window
+        callback(window)
+
+    def get_header(name, axis, start, stop, view=None, callback=None):
+        view_rows, view_columns = views.get(
+            view, (range(len(df)), range(3))
+        )
+        positions = view_columns if axis == 0 else view_rows
+        labels = df.axes[1 - axis][list(positions)[start:stop]]
+        if callback is None:
+            return labels
+        callback(labels)
+
+    # Shell widget which does the operations like the kernel would
+    shellwidget = Mock()
+    shellwidget.get_data_frame_info.return_value = get_info(
+        range(1000), range(3)
+    )
+    shellwidget.set_data_frame_view.side_effect = set_view
+    shellwidget.get_data_frame_window.side_effect = get_window
+    shellwidget.get_data_frame_header.side_effect = get_header
+
+    editor = DataFrameEditor(readonly=True)
+    assert editor.setup_and_check(
+        dataframeeditor.RemoteDataFrame('df', shellwidget), title='df'
+    )
+    qtbot.addWidget(editor)
+    model = editor.dataModel
+    view = editor.dataTable
+    assert view.filter_rows_action.isVisible()
+
+    # Sort in descending order by the second column
+    view.header_class.setSortIndicator(1, Qt.DescendingOrder)
+    view.sortByColumn(1)
+    shellwidget.set_data_frame_view.assert_called_with(
+        'df', view=None, sort=[1, False], filter=None, columns=None
+    )
+    assert data(model, 0, 1) == '999'
+    assert data_index(editor.table_index.model(), 0, 0) == '999'
+
+    # Filter rows, keeping the sorting
+    monkeypatch.setattr(
+        'spyder.plugins.variableexplorer.widgets.dataframeeditor.QInputDialog'
+        '.getText',
+        lambda *args: ('a == 3', True)
+    )
+    view.filter_rows()
+    shellwidget.set_data_frame_view.assert_called_with(
+        'df', view='view0', sort=[1, False], filter='a == 3', columns=None
+    )
+    assert model.shape == (143, 3)
+    assert editor.table_index.model().rowCount() == 143
+    assert data(model, 0, 1) == '997'
+
+    # Select the last two columns, which moves the sort indicator
+    view.selectionModel().select(
+        QItemSelection(model.index(0, 1), model.index(0, 2)),
+        QItemSelectionModel.ClearAndSelect
+    )
+    view.select_columns()
+    shellwidget.set_data_frame_view.assert_called_with(
+        'df', view='view0', sort=[1, False], filter='a == 3', columns=[1, 2]
+    )
+    assert model.shape == (143, 2)
+    assert data(model, 0, 0) == '997'
+    assert view.header_class.sortIndicatorSection() == 0
+
+    # Sorting by a column in the view uses its position in the dataframe
+    view.header_class.setSortIndicator(1, Qt.AscendingOrder)
+    view.sortByColumn(1)
+    assert model.df.sort == [2, True]
+
+    # Going back to all the rows and columns forgets the view in the kernel
+    view.reset_view()
+    shellwidget.close_data_frame_view.assert_called_once_with('view0')
+    assert model.shape == (1000, 3)
+    assert data(model, 0, 1) == '0'
+    assert not view.header_class.isSortIndicatorShown()
+
+
 def test_dataframeeditor_remove_column(qtbot):
     """
     Test that removing a column from a dataframe works as expected.
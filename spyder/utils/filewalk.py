@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Enumeration of the files in a directory tree.
+
+This is shared by Find in Files, Projects and other places that need to go
+through all files in a directory. It skips hidden directories and the files
+ignored by `.gitignore` and `.ignore` files, and caches the checks to know
+if files are binary, which require reading them.
+"""
+
+# Standard library imports
+import os
+import os.path as osp
+import re
+
+# Local imports
+from spyder.utils.encoding import is_text_file
+
+
+# Files with ignore patterns, in the format used by Git
+IGNORE_FILES = ['.gitignore', '.ignore']
+
+# Extensions of files that are known to be binary, so it's not necessary to
+# read them to know it
+BINARY_EXTENSIONS = {
+    '.7z', '.a', '.avi', '.bin', '.bmp', '.bz2', '.class', '.db', '.dll',
+    '.dmg', '.doc', '.docx', '.dylib', '.egg', '.eot', '.exe', '.flac',
+    '.gif', '.gz', '.h5', '.hdf5', '.icns', '.ico', '.iso', '.jar', '.jpeg',
+    '.jpg', '.lib', '.mat', '.mkv', '.mo', '.mov', '.mp3', '.mp4', '.npy',
+    '.npz', '.o', '.obj', '.ogg', '.otf', '.parquet', '.pdf', '.pickle',
+    '.pkl', '.png', '.ppt', '.pptx', '.pyc', '.pyd', '.pyo', '.so',
+    '.sqlite', '.tar', '.tgz', '.tif', '.tiff', '.ttf', '.wav', '.webm',
+    '.webp', '.whl', '.woff', '.woff2', '.xls', '.xlsx', '.xz', '.zip',
+}
+
+# Maximum number of files whose binary checks are cached
+MAX_CACHED_FILES = 100000
+
+# Path -> (mtime, size, whether it's a text file)
+_text_files_cache = {}
+
+# Ignore file path -> (mtime, size, patterns)
+_ignore_files_cache = {}
+
+
+# ---- Ignore files
+# -----------------------------------------------------------------------------
+def translate_ignore_pattern(pattern):
+    """
+    Translate a pattern of an ignore file to a regular expression.
+
+    Parameters
+    ----------
+    pattern: str
+        Line of the ignore file.
+
+    Returns
+    -------
+    pattern: tuple or None
+        A (regexp, negated, dirs_only) tuple, where regexp must match paths
+        relative to the directory of the ignore file with `/` as separator.
+        None if the line is empty or a comment.
+    """
+    pattern = pattern.rstrip('\n\r')
+
+    # Trailing spaces are ignored unless they're escaped
+    while pattern.endswith(' ') and not pattern.endswith('\\ '):
+        pattern = pattern[:-1]
+
+    if not pattern or pattern.startswith('#'):
+        return None
+
+    negated = pattern.startswith('!')
+    if negated:
+        pattern = pattern[1:]
+
+    dirs_only = pattern.endswith('/')
+    pattern = pattern.rstrip('/')
+
+    # Patterns with a slash at the beginning or middle are relative to the
+    # ignore file directory, and the rest can match at any level below it.
+    anchored = '/' in pattern
+    pattern = pattern.lstrip('/')
+    if not pattern:
+        return None
+
+    regexp = ''
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**', i):
+            at_start = i == 0 or pattern[i - 1] == '/'
+            if at_start and pattern.startswith('**/', i):
+                # Zero or more directories
+                regexp += '(?:.*/)?'
+                i += 3
+                continue
+            elif at_start and i + 2 == n:
+                # Everything inside
+                regexp += '.*'
+                i += 2
+                continue
+            regexp += '[^/]*'
+            i += 2
+            continue
+        elif c == '*':
+            regexp += '[^/]*'
+        elif c == '?':
+            regexp += '[^/]'
+        elif c == '[':
+            end = pattern.find(']', i + 2)
+            if end < 0:
+                regexp += re.escape(c)
+            else:
+                chars = pattern[i + 1:end]
+                if chars.startswith('!'):
+                    chars = '^' + chars[1:]
+                regexp += '[' + chars.replace('\\', '\\\\') + ']'
+                i = end
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            regexp += re.escape(pattern[i])
+        else:
+            regexp += re.escape(c)
+        i += 1
+
+    if not anchored:
+        regexp = '(?:.*/)?' + regexp
+
+    try:
+        return re.compile(regexp + r'\Z', re.DOTALL), negated, dirs_only
+    except re.error:
+        return None
+
+
+def get_ignore_patterns(dirpath):
+    """
+    Get the patterns of the ignore files in dirpath.
+
+    They're cached until the files change.
+    """
+    patterns = []
+    for name in IGNORE_FILES:
+        filename = osp.join(dirpath, name)
+        try:
+            st = os.stat(filename)
+        except OSError:
+            continue
+
+        cached = _ignore_files_cache.get(filename)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            patterns.extend(cached[2])
+            continue
+
+        file_patterns = []
+        try:
+            with open(filename, encoding='utf-8', errors='replace') as f:
+                for line in f:
+                    pattern = translate_ignore_pattern(line)
+                    if pattern is not None:
+                        file_patterns.append(pattern)
+        except OSError:
+            continue
+
+        _ignore_files_cache[filename] = (
+            st.st_mtime_ns, st.st_size, file_patterns
+        )
+        patterns.extend(file_patterns)
+
+    return patterns
+
+
+def is_ignored(path, is_dir, ignore_patterns):
+    """
+    Check if path is ignored.
+
+    Parameters
+    ----------
+    path: str
+        Absolute path.
+    is_dir: bool
+        Whether path is a directory.
+    ignore_patterns: list
+        List of (dirpath, patterns) tuples with the patterns of the ignore
+        files that apply to path, from the outermost to the innermost
+        directory.
+    """
+    # The last pattern that matches decides if path is ignored
+    for dirpath, patterns in reversed(ignore_patterns):
+        relpath = path[len(dirpath):].lstrip(os.sep)
+        if os.sep != '/':
+            relpath = relpath.replace(os.sep, '/')
+
+        for regexp, negated, dirs_only in reversed(patterns):
+            if dirs_only and not is_dir:
+                continue
+            if regexp.match(relpath):
+                return not negated
+
+    return False
+
+
+def get_parent_ignore_patterns(path):
+    """
+    Get the patterns of the ignore files in the parent directories of path
+    that are part of the same Git repository.
+    """
+    parents = []
+    dirpath = path
+    while not osp.exists(osp.join(dirpath, '.git')):
+        parent = osp.dirname(dirpath)
+        if parent == dirpath:
+            # path is not in a repository
+            return []
+        dirpath = parent
+        parents.append(dirpath)
+
+    ignore_patterns = []
+    for dirpath in reversed(parents):
+        patterns = get_ignore_patterns(dirpath)
+        if patterns:
+            ignore_patterns.append((dirpath, patterns))
+
+    return ignore_patterns
+
+
+# ---- Binary files
+# -----------------------------------------------------------------------------
+def is_binary_extension(filename):
+    """Check if filename has the extension of a known binary format."""
+    return osp.splitext(filename)[1].lower() in BINARY_EXTENSIONS
+
+
+def is_text_file_cached(filename, st=None):
+    """
+    Check if filename is a text file, caching the result until it changes.
+
+    Parameters
+    ----------
+    filename: str
+        Path of the file.
+    st: os.stat_result, optional
+        Status of the file, if it's already known.
+    """
+    if is_binary_extension(filename):
+        return False
+
+    if st is None:
+        try:
+            st = os.stat(filename)
+        except OSError:
+            return False
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _text_files_cache.get(filename)
+    if cached is not None and cached[:2] == key:
+        return cached[2]
+
+    result = is_text_file(filename)
+    if len(_text_files_cache) >= MAX_CACHED_FILES:
+        _text_files_cache.clear()
+    _text_files_cache[filename] = key + (result,)
+
+    return result
+
+
+# ---- Enumeration
+# -----------------------------------------------------------------------------
+def walk_files(path, exclude=None, is_stopped=None, use_ignore_files=True,
+               excluded_dirnames=None):
+    """
+    Iterate over the regular files in path and its subdirectories.
+
+    Hidden directories are always skipped. Files are yielded before the
+    ones in subdirectories, in the same order as `os.walk`.
+
+    Parameters
+    ----------
+    path: str
+        Directory to walk.
+    exclude: re.Pattern, optional
+        Pattern of the directories and files to skip. Directories are
+        matched with a trailing path separator.
+    is_stopped: callable, optional
+        Function to check if the iteration was stopped.
+    use_ignore_files: bool, optional
+        Whether to skip the files and directories ignored by `.gitignore`
+        and `.ignore` files, including the ones in the parent directories
+        of path inside the same Git repository.
+    excluded_dirnames: list, optional
+        Names of directories to skip.
+    """
+    path = osp.normpath(path)
+    ignore_patterns = (
+        get_parent_ignore_patterns(path) if use_ignore_files else []
+    )
+
+    stack = [(path, ignore_patterns)]
+    while stack:
+        if is_stopped is not None and is_stopped():
+            return
+
+        dirpath, ignore_patterns = stack.pop()
+        if use_ignore_files:
+            patterns = get_ignore_patterns(dirpath)
+            if patterns:
+                ignore_patterns = ignore_patterns + [(dirpath, patterns)]
+
+        try:
+            with os.scandir(dirpath) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if is_stopped is not None and is_stopped():
+                return
+
+            # The try/except is necessary to catch an error when Python
+            # can't access a directory with junctions on Windows or there
+            # are too many levels of symbolic links.
+            # Fixes spyder-ide/spyder#24898 and spyder-ide/spyder#20798
+            try:
+                is_dir = entry.is_dir()
+                is_file = not is_dir and entry.is_file()
+            except OSError:
+                continue
+
+            if is_dir:
+                if (
+                    entry.name.startswith('.')
+                    or (
+                        excluded_dirnames is not None
+                        and entry.name in excluded_dirnames
+                    )
+                    or (exclude and re.search(exclude, entry.path + os.sep))
+                    or (
+                        ignore_patterns
+                        and is_ignored(entry.path, True, ignore_patterns)
+                    )
+                ):
+                    continue
+                subdirs.append(entry.path)
+            elif is_file:
+                if (
+                    (exclude and re.search(exclude, entry.path))
+                    or (
+                        ignore_patterns
+                        and is_ignored(entry.path, False, ignore_patterns)
+                    )
+                ):
+                    continue
+                yield entry.path
+
+        for subdir in reversed(subdirs):
+            stack.append((subdir, ignore_patterns))
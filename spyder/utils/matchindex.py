@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Index of the matches of a search pattern in a QTextDocument.
+
+The index is shared by match counting, navigation and highlighting in the
+find/replace widget, so the document is searched only once per pattern. It
+is kept up to date while the document is edited by rescanning only the
+blocks touched by each change.
+"""
+
+# Standard library imports
+from bisect import bisect_right
+from itertools import accumulate
+import re
+
+# Local imports
+from spyder.utils.qstringhelpers import qstring_length
+
+
+def compile_search_pattern(pattern, case=False, regexp=False, word=False):
+    """
+    Compile pattern with the same options used by the find/replace widget.
+
+    Returns None if pattern is not a valid regular expression.
+    """
+    pattern = str(pattern)
+    if not regexp:
+        pattern = re.escape(pattern)
+    if word:
+        pattern = r'\b{pattern}\b'.format(pattern=pattern)
+
+    re_flags = re.MULTILINE if case else re.IGNORECASE | re.MULTILINE
+    try:
+        return re.compile(pattern, flags=re_flags)
+    except re.error:
+        return None
+
+
+def _to_utf16_spans(text, spans):
+    """Convert Python string spans of text to QString (UTF-16) spans."""
+    if text.isascii() or len(text) == qstring_length(text):
+        return spans
+
+    utf16_spans = []
+    last = last16 = 0
+    for start, end in spans:
+        start16 = last16 + qstring_length(text[last:start])
+        end16 = start16 + qstring_length(text[start:end])
+        utf16_spans.append((start16, end16))
+        last, last16 = end, end16
+    return utf16_spans
+
+
+def find_in_line(regobj, text):
+    """
+    Find the matches of a compiled pattern in a line of text.
+
+    Returns a tuple with the (start, end) columns of the matches in QString
+    (UTF-16) units.
+    """
+    # Non-breaking spaces are turned into regular ones by toPlainText, so do
+    # the same here to find the same matches.
+    text = text.replace('\xa0', ' ')
+    spans = [match.span() for match in regobj.finditer(text)]
+    if not spans:
+        return ()
+    return tuple(_to_utf16_spans(text, spans))
+
+
+class MatchIndex:
+    """
+    Matches of a search pattern in a QTextDocument.
+
+    Matches are found per block (i.e. per line), like QTextDocument.find does,
+    and stored as (start, end) columns for each block. That allows to update
+    the index for the blocks affected by an edit only.
+
+    Regular expressions that contain a new line can match several blocks.
+    For them, matches are searched in the whole text and the index is
+    recomputed the next time it's queried after the document changes.
+
+    All positions are given in QString (UTF-16) units, as used by QTextCursor.
+    """
+
+    def __init__(self, document):
+        self.document = document
+        self.key = None
+        self.multiline = False
+        self.revision = 0
+
+        self._regobj = None
+        self._connected = False
+
+        # Matches per block, used when the pattern can't match several lines
+        self._blocks = []
+        self._offsets = None
+
+        # Absolute match spans and the revision they were computed for, used
+        # for multiline patterns
+        self._spans = []
+        self._spans_revision = None
+
+    # ---- Public API
+    # -------------------------------------------------------------------------
+    def set_pattern(self, pattern, case=False, regexp=False, word=False):
+        """
+        Set the pattern to index.
+
+        The document is only searched if the pattern or its options changed.
+        Returns False if pattern is not a valid regular expression.
+        """
+        key = (str(pattern), case, regexp, word)
+        if key == self.key:
+            return self._regobj is not None
+
+        self.key = key
+        self._regobj = compile_search_pattern(pattern, case, regexp, word)
+        if self._regobj is None:
+            self._reset()
+            return False
+
+        self.multiline = regexp and '\\n' in str(pattern)
+        if not self._connected:
+            self.document.contentsChange.connect(self._on_contents_change)
+            self._connected = True
+
+        if self.multiline:
+            self._blocks = []
+            self._offsets = None
+            self._spans_revision = None
+        else:
+            self._spans = []
+            self._index_document()
+
+        return True
+
+    def clear(self):
+        """Drop the indexed pattern and stop following document changes."""
+        if self._connected:
+            try:
+                self.document.contentsChange.disconnect(
+                    self._on_contents_change
+                )
+            except (TypeError, RuntimeError):
+                # The document was already destroyed
+                pass
+            self._connected = False
+
+        self.key = None
+        self._regobj = None
+        self._reset()
+
+    def count(self):
+        """Return the total number of matches."""
+        if self.multiline:
+            return len(self._get_spans())
+        return self._get_offsets()[-1]
+
+    def match_number(self, position):
+        """Return the number of matches that end before or at position."""
+        if self.multiline:
+            ends = [end for __, end in self._get_spans()]
+            return bisect_right(ends, position)
+
+        if self.count() == 0:
+            return 0
+
+        block_number, column = self._locate(position)
+        number = self._get_offsets()[block_number]
+        for __, end in self._blocks[block_number]:
+            if end > column:
+                break
+            number += 1
+        return number
+
+    def find_next(self, position):
+        """
+        Return the span of the first match that starts at or after position.
+
+        The search wraps around the end of the document. None is returned if
+        there are no matches.
+        """
+        if self.multiline:
+            spans = self._get_spans()
+            if not spans:
+                return None
+            starts = [start for start, __ in spans]
+            index = bisect_right(starts, position - 1)
+            return spans[index] if index < len(spans) else spans[0]
+
+        total = self.count()
+        if total == 0:
+            return None
+
+        block_number, column = self._locate(position)
+        offsets = self._get_offsets()
+        number = offsets[block_number]
+        for start, __ in self._blocks[block_number]:
+            if start >= column:
+                break
+            number += 1
+
+        return self._get_match(number % total)
+
+    def find_previous(self, position):
+        """
+        Return the span of the last match that starts before position.
+
+        The search wraps around the start of the document. None is returned if
+        there are no matches.
+        """
+        if self.multiline:
+            spans = self._get_spans()
+            if not spans:
+                return None
+            starts = [start for start, __ in spans]
+            index = bisect_right(starts, position - 1) - 1
+            return spans[index]
+
+        total = self.count()
+        if total == 0:
+            return None
+
+        block_number, column = self._locate(position)
+        number = self._get_offsets()[block_number]
+        for start, __ in self._blocks[block_number]:
+            if start >= column:
+                break
+            number += 1
+
+        return self._get_match((number - 1) % total)
+
+    def get_matches_in_range(self, first_block, last_block):
+        """Return the spans of the matches between two block numbers."""
+        document = self.document
+        if self.multiline:
+            first = document.findBlockByNumber(first_block).position()
+            block = document.findBlockByNumber(last_block)
+            if not block.isValid():
+                block = document.lastBlock()
+            last = block.position() + block.length()
+            return [
+                (start, end) for start, end in self._get_spans()
+                if end >= first and start < last
+            ]
+
+        self._get_offsets()
+        last_block = min(last_block, len(self._blocks) - 1)
+        spans = []
+        block = document.findBlockByNumber(first_block)
+        for block_number in range(first_block, last_block + 1):
+            if not block.isValid():
+                break
+            block_matches = self._blocks[block_number]
+            if block_matches:
+                position = block.position()
+                spans += [
+                    (position + start, position + end)
+                    for start, end in block_matches
+                ]
+            block = block.next()
+        return spans
+
+    def get_lines(self):
+        """Return the sorted numbers of the lines that contain matches."""
+        if self.multiline:
+            document = self.document
+            lines = []
+            for start, __ in self._get_spans():
+                line = document.findBlock(start).blockNumber()
+                if not lines or lines[-1] != line:
+                    lines.append(line)
+            return lines
+
+        self._get_offsets()
+        return [
+            block_number
+            for block_number, block_matches in enumerate(self._blocks)
+            if block_matches
+        ]
+
+    # ---- Private API
+    # -------------------------------------------------------------------------
+    def _reset(self):
+        self.multiline = False
+        self._blocks = []
+        self._offsets = None
+        self._spans = []
+        self._spans_revision = None
+
+    def _index_document(self):
+        """Search all blocks of the document."""
+        document = self.document
+        lines = document.toPlainText().split('\n')
+        if len(lines) != document.blockCount():
+            # Line separators inside a block were converted to new lines by
+            # toPlainText, so we need to get the text of each block
+            lines = []
+            block = document.begin()
+            while block.isValid():
+                lines.append(block.text())
+                block = block.next()
+
+        regobj = self._regobj
+        self._blocks = [find_in_line(regobj, line) for line in lines]
+        self._offsets = None
+
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """Update the index for the blocks touched by a document change."""
+        self.revision += 1
+        if self._regobj is None or self.multiline:
+            return
+
+        document = self.document
+        first_block = document.findBlock(position)
+        last_block = document.findBlock(position + chars_added)
+        if not last_block.isValid():
+            last_block = document.lastBlock()
+
+        first = first_block.blockNumber()
+        last = last_block.blockNumber()
+        added_blocks = document.blockCount() - len(self._blocks)
+        old_last = last - added_blocks
+
+        if first < 0 or old_last < first - 1 or old_last >= len(self._blocks):
+            self._index_document()
+            return
+
+        new_matches = []
+        block = first_block
+        for __ in range(first, last + 1):
+            new_matches.append(find_in_line(self._regobj, block.text()))
+            block = block.next()
+
+        self._blocks[first:old_last + 1] = new_matches
+        self._offsets = None
+
+    def _get_offsets(self):
+        """
+        Return the number of matches before each block.
+
+        The last element is the total number of matches.
+        """
+        if self._offsets is None:
+            self._offsets = list(
+                accumulate(map(len, self._blocks), initial=0)
+            )
+        return self._offsets
+
+    def _get_spans(self):
+        """Return the match spans of a multiline pattern."""
+        if self._spans_revision != self.revision:
+            text = self.document.toPlainText()
+            spans = [match.span() for match in self._regobj.finditer(text)]
+            self._spans = _to_utf16_spans(text, spans)
+            self._spans_revision = self.revision
+        return self._spans
+
+    def _get_match(self, number):
+        """Return the absolute span of the match with the given number."""
+        offsets = self._get_offsets()
+        block_number = bisect_right(offsets, number) - 1
+        start, end = self._blocks[block_number][number - offsets[block_number]]
+        position = self.document.findBlockByNumber(block_number).position()
+        return (position + start, position + end)
+
+    def _locate(self, position):
+        """Return the block number and column of position."""
+        block = self.document.findBlock(position)
+        if not block.isValid():
+            block = self.document.lastBlock()
+        return block.blockNumber(), position - block.position()
@@ -16,6 +16,7 @@
 import socket
 
 from spyder.config.base import get_home_dir
+from spyder.utils.filewalk import walk_files
 
 
 logger = logging.getLogger(__name__)
@@ -98,7 +99,8 @@ def select_port(default_port=20128):
 def count_lines(path, extensions=None, excluded_dirnames=None):
     """Return number of source code lines for all filenames in subdirectories
     of *path* with names ending with *extensions*
-    Directory names *excluded_dirnames* will be ignored"""
+    Directory names *excluded_dirnames*, hidden directories and files
+    ignored by Git will be ignored"""
     if extensions is None:
         extensions = ['.py', '.pyw', '.ipy', '.enaml', '.c', '.h', '.cpp',
                       '.hpp', '.inc', '.', '.hh', '.hxx', '.cc', '.cxx',
@@ -117,16 +119,12 @@ def get_filelines(path):
     lines = 0
     files = 0
     if osp.isdir(path):
-        for dirpath, dirnames, filenames in os.walk(path):
-            for d in dirnames[:]:
-                if d in excluded_dirnames:
-                    dirnames.remove(d)
-            if excluded_dirnames is None or \
-               osp.dirname(dirpath) not in excluded_dirnames:
-                for fname in filenames:
-                    dfiles, dlines = get_filelines(osp.join(dirpath, fname))
-                    files += dfiles
-                    lines += dlines
+        for filename in walk_files(
+            path, excluded_dirnames=excluded_dirnames
+        ):
+            dfiles, dlines = get_filelines(filename)
+            files += dfiles
+            lines += dlines
     else:
         dfiles, dlines = get_filelines(path)
         files += dfiles
@@ -13,6 +13,12 @@
 NOT_FOUND_SCORE = -1
 NO_SCORE = 0
 
+# Characters used in the masks of texts for their matched letters and the
+# rest of them, except spaces and `_SEP`, which are kept.
+_SEP = '-'
+_LET = 'x'
+_LET_RE = re.compile(r'[^ \-]')
+
 
 def get_search_regex(query, ignore_case=True):
     """Returns a compiled regex pattern to search for query letters in order.
@@ -46,6 +52,38 @@ def get_search_regex(query, ignore_case=True):
     return pattern
 
 
+def _get_mask(text):
+    """Get the mask of text before replacing its matched letters."""
+    return _LET_RE.sub(_LET, text)
+
+
+def _get_mask_score(mask, query_length):
+    """
+    Get the score given to the matched letters of a query according to the
+    mask of the text they were found in.
+    """
+    score = 0
+    for i in range(1, query_length + 1):
+        count = mask.count(_SEP * i)
+        if count == 0:
+            # Longer runs of matches can't be found either
+            score += (query_length - i + 1) * query_length * 100000
+            break
+        score += (query_length - count) * 100000
+
+    # Letters and spaces between the matches
+    parts = [part for part in mask.split(_SEP) if part]
+    if not mask.startswith(_SEP):
+        parts = parts[1:]
+    if not mask.endswith(_SEP):
+        parts = parts[:-1]
+    between = ''.join(parts)
+    spaces = between.count(' ')
+    score += spaces * 10000 + (len(between) - spaces) * 100
+
+    return score
+
+
 def get_search_score(query, choice, ignore_case=True, apply_regex=True,
                      template='{}'):
     """Returns a tuple with the enriched text (if a template is provided) and
@@ -204,27 +242,23 @@ def get_search_scores(query, choices, ignore_case=True, template='{}',
         List of tuples where the first item is the text (enriched if a
         template was used) and a search score. Lower scores means better match.
     """
-    # First remove spaces from query
-    query = query.replace(' ', '')
-    pattern = get_search_regex(query, ignore_case)
+    scorer = SearchScorer(ignore_case=ignore_case)
+    scores = scorer.get_scores(query, choices)
     results = []
 
-    for choice in choices:
-        r = re.search(pattern, choice)
-        if query and r:
-            result = get_search_score(query, choice, ignore_case=ignore_case,
-                                      apply_regex=False, template=template)
-        else:
-            if query:
-                result = (choice, choice, NOT_FOUND_SCORE)
-            else:
-                result = (choice, choice, NO_SCORE)
+    for choice, score in zip(choices, scores):
+        if valid_only and score == NOT_FOUND_SCORE:
+            continue
 
-        if valid_only:
-            if result[-1] != NOT_FOUND_SCORE:
-                results.append(result)
+        if score == NOT_FOUND_SCORE or not scorer.query:
+            result = (choice, choice, score)
         else:
-            results.append(result)
+            result = (
+                str(choice),
+                scorer.get_enriched_text(choice, template=template),
+                score
+            )
+        results.append(result)
 
     if sort:
         results = sorted(results, key=lambda row: row[-1])
@@ -232,6 +266,179 @@ def get_search_scores(query, choices, ignore_case=True, template='{}',
     return results
 
 
+class SearchScorer:
+    """
+    Scorer of choices for queries that are typed one character at a time.
+
+    It gives the same scores as `get_search_scores`, but caches what is
+    computed for every choice independently of the query. Besides, when a
+    query extends the previous one, the choices that didn't match it are not
+    checked again, and the enriched texts of the matches are only computed
+    when they're requested, e.g. for the choices that are shown.
+    """
+
+    # Maximum number of choices whose preprocessed texts are cached
+    MAX_CACHED_CHOICES = 100000
+
+    def __init__(self, ignore_case=True):
+        self.ignore_case = ignore_case
+        self.query = ''
+
+        # Choice -> (text to search in, text to search letter by letter in
+        # or None if it can't be used, mask of the text, mask of the choice)
+        self._choices_cache = {}
+
+        # Choice -> (span, positions) of the matches of the last query
+        self._matches = {}
+
+        # Choices that didn't match the last query
+        self._not_found = set()
+
+    def get_scores(self, query, choices):
+        """
+        Get the scores of choices for query.
+
+        Parameters
+        ----------
+        query : str
+            String with letters to search in each choice. Spaces are ignored.
+        choices : list of str
+            Sentences/words in which to search for the 'query' letters.
+
+        Returns
+        -------
+        scores : list of int
+            Score of every choice, where lower scores mean better matches.
+            It's NOT_FOUND_SCORE for the choices that don't match and
+            NO_SCORE for all of them if query is empty.
+        """
+        query = query.replace(' ', '')
+
+        # Only the choices that matched the previous query can match this
+        # one if it extends it
+        if self.query and query.startswith(self.query):
+            not_found = self._not_found
+        else:
+            not_found = set()
+
+        self.query = query
+        self._matches = {}
+        self._not_found = set()
+        if not query:
+            return [NO_SCORE] * len(choices)
+
+        search = get_search_regex(query, self.ignore_case).search
+        lower_query = query.lower() if self.ignore_case else query
+        scores = []
+        for choice in choices:
+            if choice in not_found or search(choice) is None:
+                self._not_found.add(choice)
+                scores.append(NOT_FOUND_SCORE)
+                continue
+
+            score, match = self._get_score(lower_query, choice)
+            self._matches[choice] = match
+            scores.append(score)
+
+        return scores
+
+    def get_enriched_text(self, choice, template='{}'):
+        """
+        Get choice with the letters that matched the last query surrounded
+        by template.
+        """
+        if choice not in self._matches:
+            return choice
+
+        match = self._matches[choice]
+        if match is None:
+            return get_search_score(
+                self.query,
+                choice,
+                ignore_case=self.ignore_case,
+                apply_regex=False,
+                template=template
+            )[1]
+
+        span, positions = match
+        choice = str(choice)
+        if span is not None:
+            start, end = span
+            return (
+                choice[:start]
+                + template.format(choice[start:end])
+                + choice[end:]
+            )
+
+        enriched_text = list(choice)
+        for position in positions:
+            enriched_text[position] = template.format(choice[position])
+        return ''.join(enriched_text)
+
+    def _preprocess(self, choice):
+        """Compute the texts of choice that don't depend on the query."""
+        original_choice = str(choice)
+        if self.ignore_case:
+            text = original_choice.lower()
+            letters = ''.join([char.lower() for char in original_choice])
+            if len(letters) != len(original_choice):
+                # Some letters are lowered to several characters, so letter
+                # positions can't be found in a string
+                letters = None
+        else:
+            text = letters = original_choice
+
+        data = (text, letters, _get_mask(text), _get_mask(original_choice))
+        if len(self._choices_cache) >= self.MAX_CACHED_CHOICES:
+            self._choices_cache.clear()
+        self._choices_cache[choice] = data
+        return data
+
+    def _get_score(self, query, choice):
+        """
+        Get the score and match of choice for query, which must be lower case
+        if case is ignored.
+
+        This computes the same score as `get_search_score`.
+        """
+        data = self._choices_cache.get(choice)
+        if data is None:
+            data = self._preprocess(choice)
+        text, letters, text_mask, choice_mask = data
+
+        start = text.find(query)
+        if start >= 0:
+            # The query is in a word because it has no spaces
+            end = start + len(query)
+            exact = query in text.split(' ')
+            score = start + (1 if exact else 100)
+            mask = text_mask[:start] + _SEP * len(query) + text_mask[end:]
+            match = ((start, end), None)
+        elif letters is None:
+            __, __, score = get_search_score(
+                query, choice, ignore_case=self.ignore_case, apply_regex=False
+            )
+            return score, None
+        else:
+            # Check letter by letter
+            score = letters.index(query[0])
+            positions = []
+            position = -1
+            for char in query:
+                index = letters.find(char, position + 1)
+                if index >= 0:
+                    positions.append(index)
+                    position = index
+
+            mask = list(choice_mask)
+            for position in positions:
+                mask[position] = _SEP
+            mask = ''.join(mask)
+            match = (None, positions)
+
+        return score + _get_mask_score(mask, len(query)), match
+
+
 def test():
     template = '<b>{0}</b>'
     names = ['close pane', 'debug continue', 'debug exit', 'debug step into',
@@ -12,24 +12,28 @@
 # Standard library imports
 from __future__ import annotations
 import builtins
+import inspect
 import keyword
 import os
 import re
 
 # Third party imports
-from pygments.lexer import RegexLexer, bygroups
+from pygments.lexer import ExtendedRegexLexer, RegexLexer, bygroups
 from pygments.lexers import get_lexer_by_name
 from pygments.token import (Text, Other, Keyword, Name, String, Number,
-                            Comment, Generic, Token)
+                            Comment, Generic, Token, Error, Whitespace,
+                            _TokenType)
 from qtpy.QtCore import Qt, QTimer, Signal
 from qtpy.QtGui import (QColor, QCursor, QFont, QSyntaxHighlighter,
-                        QTextCharFormat, QTextOption)
+                        QTextCharFormat, QTextCursor, QTextOption)
 from qtpy.QtWidgets import QApplication
 
 # Local imports
+from spyder.plugins.editor.utils.cells import CellIndex
 from spyder.plugins.editor.utils.languages import CELL_LANGUAGES
 from spyder.plugins.editor.utils.editor import TextBlockHelper as tbh
-from spyder.plugins.editor.utils.editor import BlockUserData
+from spyder.plugins.editor.utils.editor import BlockUserData, LinesIndex
+from spyder.plugins.editor.utils.findtasks import find_tasks
 from spyder.utils.workers import WorkerManager
 from spyder.plugins.outlineexplorer.api import OutlineExplorerData
 from spyder.utils.qstringhelpers import qstring_length
@@ -160,8 +164,31 @@ def __init__(self, parent, font=None, color_scheme='Spyder'):
         self.editor = None
         self.patterns = DEFAULT_COMPILED_PATTERNS
 
-        # List of cells
-        self._cell_list = []
+        # Indexes of cells and tasks for performance reasons. They have to be
+        # notified of document changes before the highlighter, so the
+        # document is set again after connecting them.
+        self.cell_index = CellIndex()
+        self.todo_index = LinesIndex()
+        document = self.document()
+        if document is not None:
+            QSyntaxHighlighter.setDocument(self, None)
+            self.setDocument(document)
+
+    def setDocument(self, document):
+        """Reimplemented to keep the indexes of cells and tasks in sync."""
+        self.cell_index.set_document(document)
+        self.todo_index.set_document(document)
+        QSyntaxHighlighter.setDocument(self, document)
+
+    def get_todo_results(self):
+        """Get the (message, line number) of the tasks found in comments."""
+        results = []
+        document = self.document()
+        for line in self.todo_index.get_lines():
+            data = document.findBlockByNumber(line).userData()
+            if data:
+                results += [(message, line + 1) for message in data.todo]
+        return results
 
     def get_background_color(self):
         return QColor(self.background_color)
@@ -246,6 +273,15 @@ def set_color_scheme(self, color_scheme):
             self.color_scheme = color_scheme
 
         self.setup_formats()
+        self.reformat()
+
+    def reformat(self):
+        """
+        Apply the current formats to the document.
+
+        Highlighters that keep the format keys of each block can reimplement
+        this to only reapply them, instead of highlighting everything again.
+        """
         self.rehighlight()
 
     @staticmethod
@@ -500,6 +536,11 @@ def __init__(self, parent, font=None, color_scheme='Spyder'):
         self.outline_explorer_data_update_timer = QTimer()
         self.outline_explorer_data_update_timer.setSingleShot(True)
 
+        # Runs of format keys of the block being highlighted, to reapply them
+        # when formats change without highlighting the block again.
+        self._format_runs = []
+        self._reformatting = False
+
     def select_formats(self, start: int, inline_completion_start: int | None):
         """Decide if we need to use inline formats for highlighting."""
         formats = self.formats
@@ -532,24 +573,24 @@ def highlight_match(
         formats = self.select_formats(start, inline_completion_start)
 
         if key == "uf_sq3string":
-            self.setFormat(start, length, formats["string"])
+            self._set_format(start, length, formats, "string")
             state = self.INSIDE_SQ3STRING
         elif key == "uf_dq3string":
-            self.setFormat(start, length, formats["string"])
+            self._set_format(start, length, formats, "string")
             state = self.INSIDE_DQ3STRING
         elif key == "uf_sqstring":
-            self.setFormat(start, length, formats["string"])
+            self._set_format(start, length, formats, "string")
             state = self.INSIDE_SQSTRING
         elif key == "uf_dqstring":
-            self.setFormat(start, length, formats["string"])
+            self._set_format(start, length, formats, "string")
             state = self.INSIDE_DQSTRING
         elif key in ["ufe_sqstring", "ufe_dqstring"]:
-            self.setFormat(start, length, formats["string"])
+            self._set_format(start, length, formats, "string")
             state = self.INSIDE_NON_MULTILINE_STRING
         elif key in ["match_kw", "case_kw"]:
-            self.setFormat(start, length, formats["keyword"])
+            self._set_format(start, length, formats, "keyword")
         else:
-            self.setFormat(start, length, formats[key])
+            self._set_format(start, length, formats, key)
             if key == "comment":
                 if text.lstrip().startswith(self.cell_separators):
                     oedata = OutlineExplorerData(self.currentBlock())
@@ -565,8 +606,6 @@ def highlight_match(
                     oedata.def_type = OutlineExplorerData.CELL
                     def_name = get_code_cell_name(text)
                     oedata.def_name = def_name
-                    # Keep list of cells for performence reasons
-                    self._cell_list.append(oedata)
                 elif self.OECOMMENT.match(text.lstrip()):
                     oedata = OutlineExplorerData(self.currentBlock())
                     oedata.text = str(text).strip()
@@ -582,8 +621,8 @@ def highlight_match(
                         def_formats = self.select_formats(
                             start1, inline_completion_start
                         )
-                        self.setFormat(
-                            start1, end1 - start1, def_formats["definition"]
+                        self._set_format(
+                            start1, end1 - start1, def_formats, "definition"
                         )
 
                         oedata = OutlineExplorerData(self.currentBlock())
@@ -624,32 +663,70 @@ def highlight_match(
                         kw_formats = self.select_formats(
                             start2, inline_completion_start
                         )
-                        self.setFormat(start, length, kw_formats["keyword"])
+                        self._set_format(start, length, kw_formats, "keyword")
 
         return state, import_stmt, oedata
 
-    def highlight_block(self, text):
-        """Implement specific highlight for Python."""
-        text = str(text)
-        block = self.currentBlock()
-        data = block.userData()
+    def _set_format(self, start, length, formats, key):
+        """Set the format `key` of `formats` and record it in the runs."""
+        self.setFormat(start, length, formats[key])
+        self._format_runs.append(
+            (start, length, key, formats is self.inline_formats)
+        )
+
+    def _get_string_prefix(self, block):
+        """
+        Get the prefix to continue a string left open in the previous block.
 
+        Return the prefix and the state of the previous block.
+        """
         prev_state = tbh.get_state(block.previous())
         if prev_state == self.INSIDE_DQ3STRING:
-            offset = -4
-            text = r'""" '+text
+            return r'""" ', prev_state
         elif prev_state == self.INSIDE_SQ3STRING:
-            offset = -4
-            text = r"''' "+text
+            return r"''' ", prev_state
         elif prev_state == self.INSIDE_DQSTRING:
-            offset = -2
-            text = r'" '+text
+            return r'" ', prev_state
         elif prev_state == self.INSIDE_SQSTRING:
-            offset = -2
-            text = r"' "+text
+            return r"' ", prev_state
         else:
-            offset = 0
-            prev_state = self.NORMAL
+            return '', self.NORMAL
+
+    def _highlight_extras(self, text, offset, prev_state, state):
+        """Highlight spaces and patterns according to the string states."""
+        # Use normal format for indentation and trailing spaces
+        # Unless we are in a string
+        states_multiline_string = [
+            self.INSIDE_DQ3STRING, self.INSIDE_SQ3STRING,
+            self.INSIDE_DQSTRING, self.INSIDE_SQSTRING]
+        states_string = states_multiline_string + [
+            self.INSIDE_NON_MULTILINE_STRING]
+        self.formats['leading'] = self.formats['normal']
+        if prev_state in states_multiline_string:
+            self.formats['leading'] = self.formats["string"]
+        self.formats['trailing'] = self.formats['normal']
+        if state in states_string:
+            self.formats['trailing'] = self.formats['string']
+        self.highlight_extras(text, offset)
+
+    def highlight_block(self, text):
+        """Implement specific highlight for Python."""
+        text = str(text)
+        block = self.currentBlock()
+        data = block.userData()
+
+        if (
+            self._reformatting
+            and data is not None
+            and data.format_runs is not None
+        ):
+            self._reformat_block(text, block, data)
+            return
+
+        prefix, prev_state = self._get_string_prefix(block)
+        offset = -qstring_length(prefix)
+        text = prefix + text
+        self._format_runs = []
 
         # Get start column for inline completions
         inline_completion_start = (
@@ -658,28 +735,31 @@ def highlight_block(self, text):
 
         # Set normal format for all text
         if inline_completion_start is None:
-            self.setFormat(0, qstring_length(text), self.formats["normal"])
+            self._set_format(0, qstring_length(text), self.formats, "normal")
         else:
             if inline_completion_start == 0:
-                self.setFormat(
-                    0, qstring_length(text), self.inline_formats["normal"]
+                self._set_format(
+                    0, qstring_length(text), self.inline_formats, "normal"
                 )
             else:
-                self.setFormat(
+                self._set_format(
                     0,
                     qstring_length(text[:inline_completion_start]),
-                    self.formats["normal"]
+                    self.formats,
+                    "normal"
                 )
-                self.setFormat(
+                self._set_format(
                     inline_completion_start,
                     qstring_length(text),
-                    self.inline_formats["normal"]
+                    self.inline_formats,
+                    "normal"
                 )
 
         # Set format for matches
         state = self.NORMAL
         oedata = None
         import_stmt = None
+        todo = []
         for match in self.PROG.finditer(text):
             for key, value in list(match.groupdict().items()):
                 if value:
@@ -694,42 +774,74 @@ def highlight_block(self, text):
                         oedata,
                         inline_completion_start,
                     )
+                    if key == "comment":
+                        todo = find_tasks(value)
 
         tbh.set_state(block, state)
+        self._highlight_extras(text, offset, prev_state, state)
 
-        # Use normal format for indentation and trailing spaces
-        # Unless we are in a string
-        states_multiline_string = [
-            self.INSIDE_DQ3STRING, self.INSIDE_SQ3STRING,
-            self.INSIDE_DQSTRING, self.INSIDE_SQSTRING]
-        states_string = states_multiline_string + [
-            self.INSIDE_NON_MULTILINE_STRING]
-        self.formats['leading'] = self.formats['normal']
-        if prev_state in states_multiline_string:
-            self.formats['leading'] = self.formats["string"]
-        self.formats['trailing'] = self.formats['normal']
-        if state in states_string:
-            self.formats['trailing'] = self.formats['string']
-        self.highlight_extras(text, offset)
-
-        need_data = (oedata or import_stmt)
-        if need_data and not data:
+        # All blocks need data to keep their runs of formats
+        need_data = oedata or import_stmt or todo
+        if data is None:
             data = BlockUserData(self.editor)
+            data.only_cache = not need_data
+        elif need_data:
+            data.only_cache = False
+
+        was_cell = self._is_cell(data)
+        was_todo = bool(data.todo)
 
         # Try updating
         update = False
-        if oedata and data and data.oedata:
+        if oedata and data.oedata:
             update = data.oedata.update(oedata)
 
-        if data and not update:
+        if not update and (oedata or data.oedata):
             data.oedata = oedata
             self.outline_explorer_data_update_timer.start(500)
 
-        if (import_stmt) or (data and data.import_statement):
+        if import_stmt or data.import_statement:
             data.import_statement = import_stmt
 
+        if todo or was_todo:
+            data.todo = todo
+
+        data.format_runs = self._format_runs
         block.setUserData(data)
 
+        is_cell = self._is_cell(data)
+        if was_cell or is_cell:
+            self.cell_index.update(block.blockNumber(), is_cell)
+        if was_todo or todo:
+            self.todo_index.update(block.blockNumber(), bool(todo))
+
+    def _reformat_block(self, text, block, data):
+        """Apply the current formats to the runs of format keys of a block."""
+        for start, length, key, inline in data.format_runs:
+            formats = self.inline_formats if inline else self.formats
+            self.setFormat(start, length, formats[key])
+
+        prefix, prev_state = self._get_string_prefix(block)
+        self._highlight_extras(
+            prefix + text,
+            -qstring_length(prefix),
+            prev_state,
+            tbh.get_state(block)
+        )
+
+        oedata = data.oedata
+        if oedata is not None and oedata.def_type in self.DEF_TYPES.values():
+            oedata.color = self.formats["definition"]
+
+    @staticmethod
+    def _is_cell(data):
+        """Check if the user data of a block is for a cell header."""
+        return bool(
+            data
+            and data.oedata
+            and data.oedata.def_type == OutlineExplorerData.CELL
+        )
+
     def get_import_statements(self):
         """Get import statment list."""
         block = self.document().firstBlock()
@@ -744,6 +856,23 @@ def get_import_statements(self):
     def rehighlight(self):
         BaseSH.rehighlight(self)
 
+    def reformat(self):
+        """
+        Apply the current formats to the document.
+
+        This reuses the runs of format keys of each block, so the text is not
+        tokenized again when only the color scheme or font change.
+        """
+        self._reformatting = True
+        try:
+            if self.editor is not None:
+                with self.editor.enable_qt_undo_redo():
+                    QSyntaxHighlighter.rehighlight(self)
+            else:
+                QSyntaxHighlighter.rehighlight(self)
+        finally:
+            self._reformatting = False
+
 
 # =============================================================================
 # IPython syntax highlighter
@@ -1290,8 +1419,319 @@ def setup_formats(self, font=None):
 # highlighter based on PygmentsSH would be 2 to 3 times slower than the
 # current native PythonSH syntax highlighter.
 
+# Ways in which PygmentsSH can run a lexer (see get_lexer_mode)
+LEXER_INCREMENTAL = 'incremental'
+LEXER_WRAPPED = 'wrapped'
+LEXER_DOCUMENT = 'document'
+
+# Number of blocks after an error token whose lexer states are not stable.
+# Errors are usually unclosed strings or comments whose regex looks past them
+# (e.g. for a closing quote), so adding text in those blocks can change how
+# the error is lexed.
+ERROR_UNSTABLE_BLOCKS = 100
+
+
+def get_lexer_mode(lexer):
+    """
+    Return how PygmentsSH can run `lexer`.
+
+    * LEXER_INCREMENTAL: The lexer uses the RegexLexer machinery unchanged,
+      so its state stack can be tracked and lexing restarted from any block
+      whose state is known.
+    * LEXER_WRAPPED: Same as above, but the lexer post-processes the tokens
+      generated by RegexLexer (e.g. the C family lexers), so it has to be run
+      alongside the tracking one to get the right token types.
+    * LEXER_DOCUMENT: Any other lexer, which needs to go over the whole
+      document.
+    """
+    if (
+        not isinstance(lexer, RegexLexer)
+        or isinstance(lexer, ExtendedRegexLexer)
+    ):
+        return LEXER_DOCUMENT
+
+    method = type(lexer).get_tokens_unprocessed
+    if method is RegexLexer.get_tokens_unprocessed:
+        return LEXER_INCREMENTAL
+
+    try:
+        parameters = inspect.signature(method).parameters
+    except (TypeError, ValueError):
+        return LEXER_DOCUMENT
+
+    if 'stack' in parameters:
+        return LEXER_WRAPPED
+
+    return LEXER_DOCUMENT
+
+
+def iter_lexer_matches(lexer, text, stack=('root',), wrapped=False):
+    """
+    Run a RegexLexer over `text`, tracking its state stack.
+
+    This mirrors `RegexLexer.get_tokens_unprocessed`, but instead of single
+    tokens it yields a `(start, end, stack, tokens)` tuple per regex match,
+    where `stack` is the state stack in effect after the match and `tokens`
+    the `(index, tokentype, value)` tuples generated by it.
+
+    If `wrapped` is True, token types are taken from the lexer's own
+    `get_tokens_unprocessed`, which is run in lockstep. A ValueError is
+    raised if both of them don't produce the same tokens.
+    """
+    tokendefs = lexer._tokens
+    statestack = list(stack)
+    statetokens = tokendefs[statestack[-1]]
+    real_tokens = (
+        lexer.get_tokens_unprocessed(text, stack) if wrapped else None
+    )
+    pos = 0
+    text_length = len(text)
+
+    while pos < text_length:
+        start = pos
+        for rexmatch, action, new_state in statetokens:
+            m = rexmatch(text, pos)
+            if m:
+                if action is None:
+                    tokens = []
+                elif type(action) is _TokenType:
+                    tokens = [(pos, action, m.group())]
+                else:
+                    tokens = list(action(lexer, m))
+                pos = m.end()
+
+                if new_state is not None:
+                    # State transition
+                    if isinstance(new_state, tuple):
+                        for state in new_state:
+                            if state == '#pop':
+                                if len(statestack) > 1:
+                                    statestack.pop()
+                            elif state == '#push':
+                                statestack.append(statestack[-1])
+                            else:
+                                statestack.append(state)
+                    elif isinstance(new_state, int):
+                        if abs(new_state) >= len(statestack):
+                            del statestack[1:]
+                        else:
+                            del statestack[new_state:]
+                    elif new_state == '#push':
+                        statestack.append(statestack[-1])
+                    statetokens = tokendefs[statestack[-1]]
+                break
+        else:
+            # No rule matched
+            if text[pos] == '\n':
+                # At EOL, reset state to "root"
+                statestack = ['root']
+                statetokens = tokendefs['root']
+                tokens = [(pos, Whitespace, '\n')]
+            else:
+                tokens = [(pos, Error, text[pos])]
+            pos += 1
+
+        if real_tokens is not None and tokens:
+            checked_tokens = []
+            for index, __, value in tokens:
+                real_token = next(real_tokens, None)
+                if (
+                    real_token is None
+                    or real_token[0] != index
+                    or real_token[2] != value
+                ):
+                    raise ValueError("Lexer tokens can't be tracked")
+                checked_tokens.append(real_token)
+            tokens = checked_tokens
+
+        yield start, pos, tuple(statestack), tokens
+
+
+def split_token_runs(tokens, lines, get_key):
+    """
+    Split `tokens` into runs of formats for each one of `lines`.
+
+    `tokens` are `(index, tokentype, value)` tuples and runs are
+    `(start, length, format key)` tuples relative to the start of each
+    line, with adjacent runs of the same format merged together.
+    """
+    runs_per_line = []
+    tokens = iter(tokens)
+    token = next(tokens, None)
+    line_start = 0
+
+    for line in lines:
+        line_end = line_start + len(line)
+        runs = []
+        while token is not None and token[0] < line_end:
+            index, ttype, value = token
+            token_end = index + len(value)
+            run_start = max(index, line_start) - line_start
+            run_end = min(token_end, line_end) - line_start
+            if run_end > run_start:
+                _add_run(runs, run_start, run_end - run_start, get_key(ttype))
+
+            if token_end > line_end:
+                break
+            token = next(tokens, None)
+        runs_per_line.append(runs)
+        line_start = line_end + 1
+
+    return runs_per_line
+
+
+def _add_run(runs, start, length, key):
+    """Add a run to `runs`, merging it with the last one if possible."""
+    if runs:
+        last_start, last_length, last_key = runs[-1]
+        if last_key == key and last_start + last_length == start:
+            runs[-1] = (last_start, last_length + length, key)
+            return
+    runs.append((start, length, key))
+
+
+class PygmentsLexSession:
+    """
+    Lazy lexing pass over the text that follows a block with a stable state.
+
+    Consecutive calls to highlightBlock share the same session, so the text
+    is lexed only once and only as far as Qt keeps asking for blocks (i.e.
+    until lexer states converge again).
+    """
+
+    def __init__(self, matches, stack, get_key):
+        self._matches = matches
+        self._match = None
+        self._get_key = get_key
+        self.stack = tuple(stack)
+
+        # Lexer state at the end of the last lexed block, which is the one
+        # the next block starts with
+        self.state = (self.stack, ())
+
+        # Number of blocks left whose states are not stable because of the
+        # last error token
+        self._error_blocks = 0
+
+        # Offset of the next block in the lexed text
+        self.pos = 0
+
+        # Data used by the highlighter to check that the session still
+        # corresponds to the document.
+        self.text = ''
+        self.block_number = 0
+        self.block_position = 0
+        self.character_count = 0
+
+    def _peek(self):
+        if self._match is None:
+            self._match = next(self._matches, None)
+        return self._match
+
+    def accepts(self, block, text):
+        """Check if `block`, with contents `text`, is the next one to lex."""
+        # toPlainText replaces non-breaking spaces by regular ones
+        text = text.replace('\u00a0', ' ')
+        return (
+            self.block_number == block.blockNumber()
+            and self.block_position == block.position()
+            and self.character_count == block.document().characterCount()
+            and self.text.startswith(text, self.pos)
+            and self.text[self.pos + len(text):self.pos + len(text) + 1]
+            in ('', '\n')
+        )
+
+    def next_block(self, text):
+        """
+        Lex the next block and return its runs and the lexer state after it.
+
+        The state before the block is available in `self.state` before
+        calling this method.
+
+        The state is a `(stack, pending)` tuple, where `pending` contains the
+        `(offset, length, format key)` runs of a regex match that continues
+        past the end of the block (e.g. a multiline comment). Blocks can only
+        be lexed again from states without pending runs.
+
+        Matches that go past the end of the block up to the end of the text
+        (e.g. an unclosed multiline comment) could continue if text is added
+        after them, so their state is never stable either. The same goes for
+        the ERROR_UNSTABLE_BLOCKS blocks after an error token.
+        """
+        start = self.pos
+        end = start + len(text)
+        next_start = end + 1
+        runs = []
+
+        while True:
+            match = self._peek()
+            if match is None or match[0] >= next_start:
+                break
+
+            __, match_end, match_stack, tokens = match
+            for index, ttype, value in tokens:
+                if ttype in Error and start <= index < next_start:
+                    self._error_blocks = ERROR_UNSTABLE_BLOCKS + 1
+                run_start = max(index, start)
+                run_end = min(index + len(value), end)
+                if run_end > run_start:
+                    _add_run(
+                        runs,
+                        run_start - start,
+                        run_end - run_start,
+                        self._get_key(ttype)
+                    )
+
+            if match_end > next_start or (
+                match_end == next_start == len(self.text)
+            ):
+                # The match continues in the next block
+                break
+
+            self.stack = match_stack
+            self._match = None
+
+        match = self._match
+        if match is not None and match[0] < next_start:
+            pending = []
+            for index, ttype, value in match[3]:
+                run_start = max(index, next_start)
+                run_end = index + len(value)
+                if run_end > run_start:
+                    pending.append(
+                        (
+                            run_start - next_start,
+                            run_end - run_start,
+                            self._get_key(ttype)
+                        )
+                    )
+            state = (match[2], tuple(pending) or (None,))
+        elif self._error_blocks:
+            state = (self.stack, (None,))
+        else:
+            state = (self.stack, ())
+
+        if self._error_blocks:
+            self._error_blocks -= 1
+
+        self.pos = next_start
+        self.block_number += 1
+        self.block_position += qstring_length(text) + 1
+        self.state = state
+
+        return runs, state
+
+
 class PygmentsSH(BaseSH):
-    """Generic Pygments syntax highlighter."""
+    """
+    Generic Pygments syntax highlighter.
+
+    Formats are stored per block as runs of tokens. For lexers based on
+    RegexLexer (most of them), the lexer state is saved at the end of every
+    block, so that after an edit the text is lexed again only from the
+    nearest block with a stable state and until states converge. Other lexers
+    are run over the whole document in a worker thread.
+    """
     # Store the language name and a ref to the lexer
     _lang_name = None
     _lexer = None
@@ -1313,96 +1753,289 @@ def __init__(self, parent, font=None, color_scheme=None):
         # Load Pygments' Lexer
         if self._lang_name is not None:
             self._lexer = get_lexer_by_name(self._lang_name)
+        self._lexer_mode = get_lexer_mode(self._lexer)
+
+        # Cache of Spyder format names per Pygments token type
+        self._format_keys = {}
 
         BaseSH.__init__(self, parent, font, color_scheme)
 
+        # Lexing pass in progress for incremental lexers
+        self._session = None
+
+        # Numbers of the blocks that need to be highlighted again due to
+        # edits in blocks after them
+        self._stale_blocks = []
+
+        # Number of blocks in the document the last time a block was
+        # highlighted
+        self._block_count = 0
+        if self.document() is not None:
+            self.document().contentsChange.connect(self._reset_session)
+
         # This worker runs in a thread to avoid blocking when doing full file
         # parsing
         self._worker_manager = WorkerManager()
 
-        # Store the format for all the tokens after Pygments parsing
-        self._charlist = []
+        # Runs of formats per block, for lexers that are run over the whole
+        # document
+        self._document_runs = []
 
         # Flag variable to avoid unnecessary highlights if the worker has not
         # yet finished processing
         self._allow_highlight = True
 
+    @property
+    def incremental(self):
+        """Whether the lexer is run incrementally as the text changes."""
+        return self._lexer_mode != LEXER_DOCUMENT
+
     def stop(self):
         self._worker_manager.terminate_all()
 
-    def make_charlist(self):
-        """Parses the complete text and stores format for each character."""
+    def get_format_key(self, ttype):
+        """Get the Spyder format name for the given Pygments token type."""
+        key = self._format_keys.get(ttype)
+        if key is None:
+            key = 'normal'
+            # Exact matches first
+            if ttype in self._tokmap:
+                key = self._tokmap[ttype]
+            else:
+                # Partial (parent-> child) matches
+                for token, value in self._tokmap.items():
+                    # Checks if ttype is a subtype of token
+                    if ttype in token:
+                        key = value
+                        break
+            self._format_keys[ttype] = key
+        return key
+
+    # ---- Whole document lexing
+    def lex_document(self):
+        """Lex the complete text and store the runs of formats per block."""
 
         def worker_output(worker, output, error):
             """Worker finished callback."""
-            self._charlist = output
             if error is None and output:
+                self._document_runs = output
                 self._allow_highlight = True
                 BaseSH.rehighlight(self)
             self._allow_highlight = False
 
         text = str(self.document().toPlainText())
-        tokens = self._lexer.get_tokens(text)
 
         # Before starting a new worker process make sure to end previous
         # incarnations
         self._worker_manager.terminate_all()
 
         worker = self._worker_manager.create_python_worker(
-            self._make_charlist,
-            tokens,
-            self._tokmap,
-            self.formats,
+            self._lex_document,
+            text,
         )
         worker.sig_finished.connect(worker_output)
         worker.start()
 
-    def _make_charlist(self, tokens, tokmap, formats):
-        """
-        Parses the complete text and stores format for each character.
+    def _lex_document(self, text):
+        """Lex `text` and split its tokens in runs of formats per line."""
+        tokens = self._lexer.get_tokens_unprocessed(text)
+        return split_token_runs(
+            tokens, text.split('\n'), self.get_format_key
+        )
 
-        Uses the attached lexer to parse into a list of tokens and Pygments
-        token types.  Then breaks tokens into individual letters, each with a
-        Spyder token type attached.  Stores this list as self._charlist.
+    # ---- Incremental lexing
+    def _reset_session(self, *args):
+        """Drop the current lexing pass so it can't be used after edits."""
+        self._session = None
 
-        It's attached to the contentsChange signal of the parent QTextDocument
-        so that the charlist is updated whenever the document changes.
+    def _get_previous_state(self, block):
         """
+        Get the lexer state at the end of the block before `block`.
 
-        def _get_fmt(typ):
-            """Get the Spyder format code for the given Pygments token type."""
-            # Exact matches first
-            if typ in tokmap:
-                return tokmap[typ]
-            # Partial (parent-> child) matches
-            for key, val in tokmap.items():
-                if typ in key: # Checks if typ is a subtype of key.
-                    return val
+        Return None if `block` is the first one, and a state with pending
+        runs (i.e. not stable) if it's not known.
+        """
+        previous = block.previous()
+        if not previous.isValid():
+            return None
+
+        data = previous.userData()
+        if data is None or getattr(data, 'lexer_state', None) is None:
+            return ((), (None,))
+
+        return data.lexer_state
+
+    def _start_session(self, block):
+        """Start a lexing pass from the nearest stable block before `block`."""
+        # Regexes can look past the end of the block where they match (e.g.
+        # with lookaheads), so the previous block is always lexed again.
+        start_block = block
+        if block.previous().isValid():
+            start_block = block.previous()
+
+        while True:
+            state = self._get_previous_state(start_block)
+            if state is None:
+                stack = ('root',)
+                break
+
+            stack, pending = state
+            if not pending:
+                break
+            start_block = start_block.previous()
+
+        # Only get the text from the start block on, converted as
+        # toPlainText does
+        document = self.document()
+        cursor = QTextCursor(start_block)
+        cursor.movePosition(QTextCursor.End, QTextCursor.KeepAnchor)
+        text = (
+            cursor.selectedText()
+            .replace('\u2029', '\n')
+            .replace('\u2028', '\n')
+            .replace('\u00a0', ' ')
+        )
 
-            return 'normal'
+        session = PygmentsLexSession(
+            iter_lexer_matches(
+                self._lexer,
+                text,
+                stack,
+                wrapped=(self._lexer_mode == LEXER_WRAPPED)
+            ),
+            stack,
+            self.get_format_key
+        )
+        session.text = text
+        session.block_number = start_block.blockNumber()
+        session.block_position = start_block.position()
+        session.character_count = document.characterCount()
+
+        # Skip the blocks before the current one. Qt won't highlight them
+        # again, so we need to do it later if their formats changed.
+        while start_block.blockNumber() < block.blockNumber():
+            entry_state = session.state
+            runs, state = session.next_block(start_block.text())
+            data = start_block.userData()
+            if data is not None:
+                data.lexer_entry_state = entry_state
+                data.lexer_state = state
+            if data is None or data.token_runs != runs:
+                if not self._stale_blocks:
+                    QTimer.singleShot(0, self._rehighlight_stale_blocks)
+                self._stale_blocks.append(start_block.blockNumber())
+            start_block = start_block.next()
+
+        self._session = session
+        return session
+
+    def _rehighlight_stale_blocks(self):
+        """Highlight blocks whose formats changed by edits after them."""
+        block_numbers, self._stale_blocks = self._stale_blocks, []
+        document = self.document()
+        if document is None:
+            return
+
+        for block_number in block_numbers:
+            block = document.findBlockByNumber(block_number)
+            if block.isValid():
+                if self.editor is not None:
+                    with self.editor.enable_qt_undo_redo():
+                        self.rehighlightBlock(block)
+                else:
+                    self.rehighlightBlock(block)
 
-        charlist = []
-        for typ, token in tokens:
-            fmt = formats[_get_fmt(typ)]
-            for letter in token:
-                charlist.append((fmt, letter))
+    def _lex_block(self, block, text):
+        """
+        Get runs of formats and the lexer states at the start and end of
+        `block`.
+        """
+        session = self._session
+        if session is None or not session.accepts(block, text):
+            session = self._start_session(block)
+        entry_state = session.state
+        runs, state = session.next_block(text)
+        return runs, entry_state, state
+
+    def _apply_runs(self, text, runs):
+        """Apply runs of formats to the current block."""
+        if qstring_length(text) != len(text):
+            # Convert offsets to UTF-16 code units
+            positions = [0]
+            for char in text:
+                positions.append(
+                    positions[-1] + (2 if ord(char) > 0xFFFF else 1)
+                )
+            runs = [
+                (positions[start], positions[start + length]
+                 - positions[start], key)
+                for start, length, key in runs
+            ]
 
-        return charlist
+        for start, length, key in runs:
+            self.setFormat(start, length, self.formats[key])
 
     def highlightBlock(self, text):
         """ Actually highlight the block"""
-        # Note that an undefined blockstate is equal to -1, so the first block
-        # will have the correct behaviour of starting at 0.
-        if self._allow_highlight:
-            start = self.previousBlockState() + 1
-            end = start + qstring_length(text)
-            for i, (fmt, letter) in enumerate(self._charlist[start:end]):
-                self.setFormat(i, 1, fmt)
-            self.setCurrentBlockState(end)
-            self.highlight_extras(text)
+        text = str(text)
+
+        if self._lexer_mode == LEXER_DOCUMENT:
+            if self._allow_highlight:
+                block_number = self.currentBlock().blockNumber()
+                if block_number < len(self._document_runs):
+                    self._apply_runs(text, self._document_runs[block_number])
+                self.highlight_extras(text)
+            return
+
+        block = self.currentBlock()
+        try:
+            runs, entry_state, state = self._lex_block(block, text)
+        except ValueError:
+            # The lexer can't be tracked, so fall back to lex the whole
+            # document.
+            self._lexer_mode = LEXER_DOCUMENT
+            self._session = None
+            QTimer.singleShot(0, self.lex_document)
+            return
+
+        data = block.userData()
+        if data is None:
+            data = BlockUserData(self.editor)
+            data.only_cache = True
+
+        # Only change the block state when the next block needs to be
+        # highlighted again, so that Qt stops highlighting once states
+        # converge. That's the case if the lexer state changes, or if the
+        # next block was lexed from another state (e.g. because lines were
+        # joined or split).
+        next_block = block.next()
+        next_data = next_block.userData() if next_block.isValid() else None
+        block_count = self.document().blockCount()
+        if (
+            data.lexer_state != state
+            or (
+                next_block.isValid()
+                and getattr(next_data, 'lexer_entry_state', None) != state
+            )
+            or block_count != self._block_count
+        ):
+            tbh.set_state(block, (tbh.get_state(block) + 1) % 0xFFFF)
+        self._block_count = block_count
+        data.lexer_entry_state = entry_state
+        data.lexer_state = state
+        data.token_runs = runs
+        block.setUserData(data)
+
+        self._apply_runs(text, runs)
+        self.highlight_extras(text)
 
     def rehighlight(self):
-        self.make_charlist()
+        if self.incremental:
+            self._session = None
+            BaseSH.rehighlight(self)
+            self._session = None
+        else:
+            self.lex_document()
 
 
 class PythonLoggingLexer(RegexLexer):
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for filewalk.py
+"""
+
+# Standard library imports
+import os.path as osp
+import re
+
+# Test library imports
+import pytest
+
+# Local imports
+from spyder.utils import filewalk
+from spyder.utils.filewalk import (
+    is_text_file_cached, translate_ignore_pattern, walk_files)
+
+
+def walk(path, **kwargs):
+    """Get the sorted relative paths of the files walked in path."""
+    return sorted(
+        osp.relpath(filename, path).replace(osp.sep, '/')
+        for filename in walk_files(str(path), **kwargs)
+    )
+
+
+@pytest.mark.parametrize(
+    'pattern,path,matches',
+    [
+        ('*.log', 'debug.log', True),
+        ('*.log', 'logs/debug.log', True),
+        ('*.log', 'debug.log.txt', False),
+        ('/build', 'build', True),
+        ('/build', 'src/build', False),
+        ('doc/*.txt', 'doc/notes.txt', True),
+        ('doc/*.txt', 'doc/api/notes.txt', False),
+        ('**/cache', 'a/b/cache', True),
+        ('**/cache', 'cache', True),
+        ('a/**/b', 'a/x/y/b', True),
+        ('a/**/b', 'a/b', True),
+        ('out/**', 'out/x/y', True),
+        ('file?.py', 'file1.py', True),
+        ('file[0-2].py', 'file3.py', False),
+        ('file[!0-2].py', 'file3.py', True),
+        ('\\#hash', '#hash', True),
+    ]
+)
+def test_translate_ignore_pattern(pattern, path, matches):
+    """Test translating patterns of ignore files."""
+    regexp, negated, dirs_only = translate_ignore_pattern(pattern)
+    assert not negated
+    assert not dirs_only
+    assert bool(regexp.match(path)) == matches
+
+
+def test_translate_ignore_pattern_flags():
+    """Test comments, negated and directory patterns."""
+    assert translate_ignore_pattern('# comment') is None
+    assert translate_ignore_pattern('   \n') is None
+    assert translate_ignore_pattern('!keep.log')[1]
+    assert translate_ignore_pattern('build/')[2]
+
+
+def test_walk_files(tmp_path):
+    """Test walking files while skipping ignored ones."""
+    (tmp_path / '.git').mkdir()
+    (tmp_path / '.git' / 'config').write_text('')
+    (tmp_path / '.gitignore').write_text(
+        "*.log\n!keep.log\nbuild/\n/top.txt\n"
+    )
+    (tmp_path / 'top.txt').write_text('')
+    (tmp_path / 'debug.log').write_text('')
+    (tmp_path / 'keep.log').write_text('')
+    (tmp_path / 'build').mkdir()
+    (tmp_path / 'build' / 'lib.py').write_text('')
+    (tmp_path / 'src' / 'node_modules').mkdir(parents=True)
+    (tmp_path / 'src' / 'top.txt').write_text('')
+    (tmp_path / 'src' / 'build').write_text('')
+    (tmp_path / 'src' / 'main.py').write_text('')
+    (tmp_path / 'src' / '.ignore').write_text("node_modules\n")
+    (tmp_path / 'src' / 'node_modules' / 'mod.js').write_text('')
+
+    assert walk(tmp_path) == [
+        '.gitignore', 'keep.log', 'src/.ignore', 'src/build', 'src/main.py',
+        'src/top.txt'
+    ]
+
+    # The ignore files of parent directories in the repo are used too
+    assert walk(tmp_path / 'src') == ['.ignore', 'build', 'main.py', 'top.txt']
+
+    # Walk without ignore files, but skipping some directories
+    assert walk(
+        tmp_path,
+        use_ignore_files=False,
+        excluded_dirnames=['node_modules'],
+        exclude=re.compile(r'\.log$')
+    ) == [
+        '.gitignore', 'build/lib.py', 'src/.ignore', 'src/build',
+        'src/main.py', 'src/top.txt', 'top.txt'
+    ]
+
+
+def test_is_text_file_cached(tmp_path, mocker):
+    """Test that binary checks are cached until files change."""
+    text_file = tmp_path / 'text.dat'
+    text_file.write_text('spam')
+    binary_file = tmp_path / 'image.png'
+    binary_file.write_text('not really an image')
+
+    is_text_file = mocker.spy(filewalk, 'is_text_file')
+
+    # Files with binary extensions are not read
+    assert not is_text_file_cached(str(binary_file))
+    assert is_text_file.call_count == 0
+
+    assert is_text_file_cached(str(text_file))
+    assert is_text_file_cached(str(text_file))
+    assert is_text_file.call_count == 1
+
+    text_file.write_bytes(b'\x00\x01\x02\x03' * 100)
+    assert not is_text_file_cached(str(text_file))
+    assert is_text_file.call_count == 2
+
+
+if __name__ == "__main__":
+    pytest.main()
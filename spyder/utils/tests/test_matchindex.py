@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright © Spyder Project Contributors
+# Licensed under the terms of the MIT License
+#
+
+"""
+Tests for matchindex.py
+"""
+
+# Standard library imports
+import random
+
+# Third party imports
+import pytest
+from qtpy.QtGui import QTextCursor
+from qtpy.QtWidgets import QPlainTextEdit
+
+# Local imports
+from spyder.utils.matchindex import MatchIndex, compile_search_pattern
+
+
+TEXT = ('class C():\n'
+        '    def __init__(self):\n'
+        '        pass\n'
+        '    def f(self, a, b):\n'
+        '        pass\n')
+
+
+@pytest.fixture
+def editor(qtbot):
+    widget = QPlainTextEdit()
+    qtbot.addWidget(widget)
+    widget.setPlainText(TEXT)
+    return widget
+
+
+def get_spans(text, pattern, **kwargs):
+    """Get the spans of the matches of a pattern in text, line by line."""
+    regobj = compile_search_pattern(pattern, **kwargs)
+    spans = []
+    position = 0
+    for line in text.split('\n'):
+        spans += [
+            (position + match.start(), position + match.end())
+            for match in regobj.finditer(line)
+        ]
+        position += len(line) + 1
+    return spans
+
+
+def test_match_index(editor):
+    """Test counting and navigating matches."""
+    index = MatchIndex(editor.document())
+    assert index.set_pattern('self')
+    assert index.count() == 2
+    assert index.get_lines() == [1, 3]
+
+    first = TEXT.index('self')
+    second = TEXT.index('self', first + 1)
+    assert index.find_next(0) == (first, first + 4)
+    assert index.find_next(first) == (first, first + 4)
+    assert index.find_next(first + 1) == (second, second + 4)
+    assert index.find_next(second + 1) == (first, first + 4)
+    assert index.find_previous(second) == (first, first + 4)
+    assert index.find_previous(first) == (second, second + 4)
+
+    assert index.match_number(0) == 0
+    assert index.match_number(first + 4) == 1
+    assert index.match_number(len(TEXT)) == 2
+
+    # Options
+    assert index.set_pattern('C', case=True)
+    assert index.count() == 1
+    assert index.set_pattern('e[A-Z]?f', regexp=True, word=True)
+    assert index.count() == 0
+    assert not index.set_pattern('(', regexp=True)
+    assert index.set_pattern('(')
+    assert index.count() == 3
+
+    # Multiline patterns
+    assert index.set_pattern(r'\):\n', regexp=True)
+    assert index.multiline
+    assert index.count() == 3
+    assert index.get_lines() == [0, 1, 3]
+
+
+def test_match_index_unicode(editor):
+    """Test that match positions are given in UTF-16 units."""
+    editor.setPlainText('😀 foo\nfoo 😀 foo\n')
+    index = MatchIndex(editor.document())
+    index.set_pattern('foo')
+    assert index.get_matches_in_range(0, 1) == [(3, 6), (7, 10), (14, 17)]
+
+    cursor = editor.textCursor()
+    cursor.setPosition(14)
+    cursor.setPosition(17, QTextCursor.KeepAnchor)
+    assert cursor.selectedText() == 'foo'
+
+
+@pytest.mark.parametrize('pattern', ['a', 'ab', r'\bb\w*', r'^\s*a'])
+def test_match_index_edits(editor, pattern):
+    """Test that the index is kept up to date while editing."""
+    editor.setPlainText('')
+    index = MatchIndex(editor.document())
+    index.set_pattern(pattern, regexp=True)
+
+    random.seed(pattern)
+    for __ in range(200):
+        text = editor.toPlainText()
+        cursor = editor.textCursor()
+        start = random.randint(0, len(text))
+        end = min(start + random.randint(0, 6), len(text))
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        cursor.insertText(
+            ''.join(
+                random.choice('ab \n') for __ in range(random.randint(0, 8))
+            )
+        )
+
+        text = editor.toPlainText()
+        spans = get_spans(text, pattern, regexp=True)
+        assert index.count() == len(spans)
+        assert index.get_matches_in_range(0, editor.blockCount()) == spans
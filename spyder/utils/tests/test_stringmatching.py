@@ -15,7 +15,7 @@
 import pytest
 
 # Local imports
-from spyder.utils.stringmatching import get_search_scores
+from spyder.utils.stringmatching import SearchScorer, get_search_scores
 
 TEST_FILE = os.path.join(os.path.dirname(__file__), 'data/example.py')
 
@@ -216,5 +216,35 @@ def test_stringmatching_order_filter():
                                      'use previous <b>lay</b>out', 400113)]
 
 
+def test_search_scorer():
+    """Test scoring choices for queries that extend the previous ones."""
+    choices = ['layout preferences', 'save current layout', 'close pane',
+               'lock unlock panes']
+    scorer = SearchScorer()
+
+    for query in ['l', 'la', 'lay', 'la', 'lo']:
+        results = get_search_scores(query, choices, template='<b>{0}</b>')
+        assert scorer.get_scores(query, choices) == [
+            score for __, __, score in results
+        ]
+        assert [
+            scorer.get_enriched_text(choice, template='<b>{0}</b>')
+            for choice in choices
+        ] == [enriched for __, enriched, __ in results]
+
+    # Choices that didn't match are not checked for queries that extend the
+    # previous one
+    scorer.get_scores('lay', choices)
+    assert scorer._not_found == {'close pane', 'lock unlock panes'}
+    assert scorer.get_scores('layo', choices + ['play on']) == [
+        800100, 800113, -1, -1, 1010001
+    ]
+    assert scorer._not_found == {'close pane', 'lock unlock panes'}
+
+    # Empty queries
+    assert scorer.get_scores(' ', choices) == [0, 0, 0, 0]
+    assert scorer.get_enriched_text('close pane') == 'close pane'
+
+
 if __name__ == "__main__":
     pytest.main()
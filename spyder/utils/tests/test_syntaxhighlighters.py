@@ -6,10 +6,11 @@
 """Tests for syntaxhighlighters.py"""
 
 import pytest
-from qtpy.QtWidgets import QApplication
-from qtpy.QtGui import QTextDocument
+from qtpy.QtWidgets import QApplication, QPlainTextEdit
+from qtpy.QtGui import QTextCursor, QTextDocument
 
-from spyder.utils.syntaxhighlighters import HtmlSH, PythonSH, MarkdownSH
+from spyder.utils.syntaxhighlighters import (
+    guess_pygments_highlighter, HtmlSH, PythonSH, MarkdownSH)
 
 def compare_formats(actualFormats, expectedFormats, sh):
     assert len(actualFormats) == len(expectedFormats)
@@ -118,6 +119,98 @@ def test_Markdown_basic():
     compare_formats(doc.firstBlock().layout().formats(), res, sh)
 
 
+def test_PygmentsSH_incremental(qtbot):
+    """Check that PygmentsSH only lexes again the blocks that need it."""
+    txt = ('int a = 1;\n'
+           '/* multiline\n'
+           'comment */\n'
+           'int b = 2;\n'
+           'int c = 3;')
+    doc = QTextDocument(txt)
+    doc.documentLayout()  # Needed to emit contentsChange on edits
+    sh = guess_pygments_highlighter('test.c')(doc, color_scheme='Spyder')
+    assert sh.incremental
+    QApplication.processEvents()  # Run the first highlighting pass
+
+    block = doc.findBlockByNumber(2)
+    compare_formats(block.layout().formats(), [(0, 10, 'comment')], sh)
+
+    # Close the comment in the second line
+    cursor = QTextCursor(doc.findBlockByNumber(1))
+    cursor.movePosition(QTextCursor.EndOfBlock)
+    cursor.insertText(' */')
+
+    block = doc.findBlockByNumber(2)
+    assert block.layout().formats()[0].format.foreground().color().name() \
+        != sh.formats['comment'].foreground().color().name()
+
+    # Lexer states are stable again after the comment
+    assert doc.findBlockByNumber(2).userData().lexer_state[1] == ()
+    assert doc.findBlockByNumber(3).userData().lexer_state[1] == ()
+
+
+def get_formats(doc):
+    """Get the formats of all the blocks in doc."""
+    formats = []
+    block = doc.firstBlock()
+    while block.isValid():
+        formats.append(
+            [
+                (f.start, f.length, f.format.foreground().color().name())
+                for f in block.layout().formats()
+            ]
+        )
+        block = block.next()
+    return formats
+
+
+@pytest.mark.parametrize(
+    "filename, text, start, end, new_text",
+    [
+        # Join a line comment with the line that opens a multiline one
+        ('test.c', 'int a; //\n/* start\nint c; */\nint d;\n', 9, 10, ''),
+        # Split the line that opens a multiline comment
+        ('test.c', 'int a; /* start\nint c; */\nint d;\n', 9, 9, '\n'),
+        # Split and join lines at the same time
+        ('test.c', 'a /* b\nc */ d\ne\n', 2, 8, 'x\ny\n'),
+        # Add text after an unclosed comment
+        ('test.c', 'i\n/* c\nd\n', 9, 9, ' '),
+        # Close a string that is not closed several lines above
+        ('test.css', "p { c: r'e; /* c\n */\n }\na { x\"s\" }\n", 29, 29,
+         "'"),
+        # Break the closing tag a lookahead in the line above depends on
+        ('test.html', '<script>var a = "x";\n</script>\n', 27, 27, '/!'),
+    ]
+)
+def test_PygmentsSH_incremental_edits(
+    qtbot, filename, text, start, end, new_text
+):
+    """
+    Check that editing a document highlighted by PygmentsSH gives the same
+    formats as highlighting it from scratch.
+    """
+    highlighter_class = guess_pygments_highlighter(filename)
+
+    doc = QTextDocument(text)
+    doc.documentLayout()  # Needed to emit contentsChange on edits
+    sh = highlighter_class(doc, color_scheme='Spyder')
+    assert sh.incremental
+    QApplication.processEvents()
+
+    cursor = QTextCursor(doc)
+    cursor.setPosition(start)
+    cursor.setPosition(end, QTextCursor.KeepAnchor)
+    cursor.insertText(new_text)
+    QApplication.processEvents()
+
+    new_doc = QTextDocument(doc.toPlainText())
+    new_doc.documentLayout()
+    new_sh = highlighter_class(new_doc, color_scheme='Spyder')
+    QApplication.processEvents()
+
+    assert get_formats(doc) == get_formats(new_doc)
+
+
 @pytest.mark.parametrize('line', ['# --- First variant',
                                   '#------ 2nd variant',
                                   '### 3rd variant'])
@@ -129,5 +222,84 @@ def test_python_not_an_outline_explorer_comment(line):
     assert not PythonSH.OECOMMENT.match(line)
 
 
+def test_python_tasks(qtbot):
+    """Test that tasks are found in comments while highlighting."""
+    txt = ("x = 1  # TODO: fix this\n"
+           "s = '# TODO: not a comment'\n"
+           "# fixme\n"
+           "#XXX first # HACK: second\n")
+    editor = QPlainTextEdit()
+    qtbot.addWidget(editor)
+    doc = editor.document()
+    sh = PythonSH(doc, color_scheme='Spyder')
+
+    # Wait for the first (delayed) highlighting of the empty document
+    qtbot.wait(10)
+    editor.setPlainText(txt)
+    assert sh.get_todo_results() == [
+        ('Fix this', 1), ('fixme', 3), ('First', 4), ('Second', 4)]
+
+    # Only edited blocks are updated and following tasks are shifted
+    cursor = QTextCursor(doc)
+    cursor.insertText('# TODO: new\n\n')
+    assert sh.todo_index.get_lines() == [0, 2, 4, 5]
+
+    cursor.setPosition(doc.findBlockByNumber(4).position())
+    cursor.insertText("'")
+    assert sh.todo_index.get_lines() == [0, 2, 5]
+    assert doc.findBlockByNumber(4).userData().todo == []
+
+
+def test_python_reformat(qtbot, monkeypatch):
+    """Test that changing formats doesn't tokenize the text again."""
+    txt = ("import os as o  # TODO: check\n"
+           "def f(x):\n"
+           "    '''Docstring\n"
+           "    continued'''\n"
+           "    return x + 1  \n")
+
+    def highlight(color_scheme):
+        editor = QPlainTextEdit()
+        qtbot.addWidget(editor)
+        sh = PythonSH(editor.document(), color_scheme=color_scheme)
+        qtbot.wait(10)
+        editor.setPlainText(txt)
+        return editor, sh
+
+    def get_formats(doc):
+        formats = []
+        block = doc.firstBlock()
+        while block.isValid():
+            formats.append([
+                (r.start, r.length, r.format.foreground().color().name(),
+                 r.format.fontWeight())
+                for r in block.layout().formats()
+            ])
+            block = block.next()
+        return formats
+
+    def fail(*args):
+        raise AssertionError("The text was tokenized again")
+
+    editor, sh = highlight('Spyder')
+    doc = editor.document()
+    monkeypatch.setattr(sh, 'highlight_match', fail)
+    sh.set_color_scheme('spyder_themes.spyder/light')
+    monkeypatch.undo()
+
+    # Formats are the same as highlighting the text with the new scheme
+    expected_editor, __ = highlight('spyder_themes.spyder/light')
+    assert get_formats(doc) == get_formats(expected_editor.document())
+    old_editor, __ = highlight('Spyder')
+    assert get_formats(doc) != get_formats(old_editor.document())
+
+    # Data of the blocks is kept
+    assert sh.get_todo_results() == [('Check', 1)]
+    assert doc.firstBlock().userData().import_statement
+    oedata = doc.findBlockByNumber(1).userData().oedata
+    assert oedata.def_name == 'f'
+    assert oedata.color == sh.formats['definition']
+
+
 if __name__ == '__main__':
     pytest.main()
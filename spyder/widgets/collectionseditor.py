@@ -76,6 +76,8 @@
     CollectionsDelegate,
     SELECT_ROW_BUTTON_SIZE,
 )
+from spyder.plugins.variableexplorer.widgets.dataframeeditor import (
+    LARGE_SIZE, RemoteDataFrame)
 from spyder.plugins.variableexplorer.widgets.importwizard import ImportWizard
 from spyder.widgets.emptymessage import EmptyMessageWidget
 from spyder.widgets.helperwidgets import CustomSortFilterProxy, MessageCheckBox
@@ -2195,6 +2197,12 @@ def set_value(self, index, value):
             name = source_index.model().keys[source_index.row()]
             self.parent().new_value(name, value)
 
+    def get_remote_data_frame(self, index):
+        if index.isValid():
+            source_index = index.model().mapToSource(index)
+            name = source_index.model().keys[source_index.row()]
+            return self.parent().get_remote_data_frame(name)
+
     def make_data_function(
         self,
         index: QModelIndex
@@ -2280,9 +2288,36 @@ def __init__(self, parent, data, shellwidget=None, remote_editing=False,
     # ------ Remote/local API -------------------------------------------------
     def get_value(self, name):
         """Get the value of a variable"""
+        properties = self.var_properties.get(name)
+        if properties and (
+            properties['is_array'] or properties['is_data_frame']
+        ):
+            # Their memory can be sent without pickling it
+            return self.shellwidget.get_value(name, bufferable=True)
+
         value = self.shellwidget.get_value(name)
         return value
 
+    def get_remote_data_frame(self, name):
+        """
+        Get a large DataFrame without transferring its data.
+
+        Return None for other variables and small DataFrames, which are
+        faster to transfer at once, or if the kernel doesn't support it.
+        """
+        properties = self.var_properties.get(name)
+        if not properties or not properties['is_data_frame']:
+            return None
+
+        rows, cols = properties['len']
+        if rows * cols <= LARGE_SIZE:
+            return None
+
+        try:
+            return RemoteDataFrame(name, self.shellwidget)
+        except Exception:
+            return None
+
     def new_value(self, name, value):
         """Create new value in data"""
         try:
@@ -422,6 +422,8 @@ def hide(self):
         if self.editor is not None:
             self.editor.setFocus()
             self.clear_matches()
+            if hasattr(self.editor, 'clear_match_index'):
+                self.editor.clear_match_index()
 
     def show_replace(self):
         """Show replace widgets"""
@@ -466,6 +468,14 @@ def set_editor(self, editor, refresh=True):
         if self.editor is not None and self.is_code_editor:
             self.editor.textChanged.disconnect(self.update_matches)
 
+        # Stop updating the matches index of the previous editor
+        if (
+            self.editor is not None
+            and self.editor is not editor
+            and hasattr(self.editor, 'clear_match_index')
+        ):
+            self.editor.clear_match_index()
+
         # Set current editor
         self.editor = editor
 
@@ -34,6 +34,7 @@
 # Local imports
 from spyder.utils import encoding, sourcecode
 from spyder.utils import syntaxhighlighters as sh
+from spyder.utils.matchindex import MatchIndex, compile_search_pattern
 from spyder.utils.misc import get_error_match
 from spyder.utils.palette import SpyderPalette
 from spyder.widgets.arraybuilder import ArrayBuilderDialog
@@ -98,6 +99,7 @@ class BaseEditMixin(object):
 
     def __init__(self):
         self.eol_chars = None
+        self._match_index = None
 
     # ---- Line number area
     # -------------------------------------------------------------------------
@@ -1399,6 +1401,26 @@ def find_text(self, text, changed=True, forward=True, case=False,
         else:
             moves += [QTextCursor.End]
 
+        index = None
+        if text:
+            index = self.get_match_index(text, case=case, regexp=regexp,
+                                         word=word)
+        if index is not None:
+            if forward:
+                span = index.find_next(cursor.selectionEnd())
+            else:
+                span = index.find_previous(cursor.selectionStart())
+            if span is None:
+                return False
+
+            found_cursor = self.textCursor()
+            found_cursor.setPosition(span[0])
+            found_cursor.setPosition(span[1], QTextCursor.KeepAnchor)
+            self._set_found_cursor(found_cursor, current_visible_region)
+            return True
+
+        # Fall back to Qt for patterns that are only valid for
+        # QRegularExpression.
         if regexp:
             text = str(text)
         else:
@@ -1420,23 +1442,50 @@ def find_text(self, text, changed=True, forward=True, case=False,
                 # probably much more efficient than ours
                 found_cursor = self.document().find(pattern, cursor, findflag)
             if found_cursor is not None and not found_cursor.isNull():
-                self.setTextCursor(found_cursor)
-
-                # Center cursor if we move out of the visible region.
-                if current_visible_region is not None:
-                    found_visible_region = self.get_visible_block_numbers()
-                    if current_visible_region != found_visible_region:
-                        current_visible_region = found_visible_region
-                        self.centerCursor()
-
+                self._set_found_cursor(found_cursor, current_visible_region)
                 return True
 
         return False
 
+    def _set_found_cursor(self, found_cursor, current_visible_region):
+        """Select a found match and center it if it's not visible."""
+        self.setTextCursor(found_cursor)
+
+        # Center cursor if we move out of the visible region.
+        if current_visible_region is not None:
+            found_visible_region = self.get_visible_block_numbers()
+            if current_visible_region != found_visible_region:
+                self.centerCursor()
+
     def is_editor(self):
         """Needs to be overloaded in the codeeditor where it will be True"""
         return False
 
+    def get_match_index(self, pattern, case=False, regexp=False, word=False):
+        """
+        Get the index of matches for the searched text in the document.
+
+        The index is kept up to date while the document is edited, so it can
+        be queried repeatedly without searching the document again. Returns
+        None if pattern is not a valid regular expression.
+        """
+        index = self._match_index
+        if index is None or index.document is not self.document():
+            if index is not None:
+                index.clear()
+            index = self._match_index = MatchIndex(self.document())
+
+        if not index.set_pattern(pattern, case=case, regexp=regexp,
+                                 word=word):
+            return None
+        return index
+
+    def clear_match_index(self):
+        """Drop the index of matches for the searched text."""
+        if self._match_index is not None:
+            self._match_index.clear()
+            self._match_index = None
+
     def get_number_matches(self, pattern, source_text='', case=False,
                            regexp=False, word=False):
         """Get the number of matches for the searched text."""
@@ -1444,18 +1493,14 @@ def get_number_matches(self, pattern, source_text='', case=False,
         if not pattern:
             return 0
 
-        if not regexp:
-            pattern = re.escape(pattern)
-
         if not source_text:
-            source_text = str(self.toPlainText())
+            index = self.get_match_index(pattern, case=case, regexp=regexp,
+                                         word=word)
+            return None if index is None else index.count()
 
-        if word:  # match whole words only
-            pattern = r'\b{pattern}\b'.format(pattern=pattern)
-        try:
-            re_flags = re.MULTILINE if case else re.IGNORECASE | re.MULTILINE
-            regobj = re.compile(pattern, flags=re_flags)
-        except re.error:
+        regobj = compile_search_pattern(pattern, case=case, regexp=regexp,
+                                        word=word)
+        if regobj is None:
             return None
 
         number_matches = 0
@@ -1466,13 +1511,14 @@ def get_number_matches(self, pattern, source_text='', case=False,
 
     def get_match_number(self, pattern, case=False, regexp=False, word=False):
         """Get number of the match for the searched text."""
-        position = self.textCursor().position()
-        source_text = self.get_text(position_from='sof', position_to=position)
-        match_number = self.get_number_matches(pattern,
-                                               source_text=source_text,
-                                               case=case, regexp=regexp,
-                                               word=word)
-        return match_number
+        if not str(pattern):
+            return 0
+
+        index = self.get_match_index(pattern, case=case, regexp=regexp,
+                                     word=word)
+        if index is None:
+            return None
+        return index.match_number(self.textCursor().position())
 
     # ---- Array builder helper methods
     # -------------------------------------------------------------------------
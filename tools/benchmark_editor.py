@@ -0,0 +1,415 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2009- Spyder Project Contributors
+#
+# Distributed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Benchmarks of the editor on synthetic Python, JSON and C documents.
+
+Each benchmark creates offscreen CodeEditor instances, times an operation on
+documents of different sizes and reports the results as JSON, so that they
+can be compared between revisions.
+
+Examples
+--------
+python tools/benchmark_editor.py
+python tools/benchmark_editor.py --lines 1000 10000 --languages python
+python tools/benchmark_editor.py --output results.json --repeat 5
+"""
+
+# Standard library imports
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+# This needs to be set before creating the application
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Third party imports
+from lsprotocol import types as lsp  # noqa: E402
+from qtpy import API_NAME, QT_VERSION  # noqa: E402
+from qtpy.QtCore import Qt  # noqa: E402
+from qtpy.QtGui import QFont, QTextCursor  # noqa: E402
+from qtpy.QtTest import QTest  # noqa: E402
+from qtpy.QtWidgets import QApplication  # noqa: E402
+
+# Local imports
+from spyder import __version__  # noqa: E402
+from spyder.plugins.editor.utils.editor import get_file_language  # noqa: E402
+from spyder.plugins.editor.widgets.codeeditor import CodeEditor  # noqa: E402
+from spyder.utils.qthelpers import qapplication  # noqa: E402
+
+
+DEFAULT_LINES = [1000, 10000, 50000, 200000]
+LANGUAGES = ['python', 'json', 'c']
+EXTENSIONS = {'python': 'py', 'json': 'json', 'c': 'c'}
+
+# Number of keystrokes and scrolled pages per sample
+KEYSTROKES = 20
+PAGES = 20
+
+# Maximum time to wait for highlighters that work in a thread
+TIMEOUT = 120  # seconds
+
+
+# ---- Synthetic documents
+# -----------------------------------------------------------------------------
+def python_block(i):
+    """Return the lines of a class with some methods."""
+    return [
+        "class Model{0}(Base):".format(i),
+        "    \"\"\"Docstring of model {0}.\"\"\"".format(i),
+        "",
+        "    def __init__(self, value={0}):".format(i),
+        "        # Store the value",
+        "        self.value = value",
+        "        self.name = 'model_{0}'".format(i),
+        "",
+        "    def compute(self, x):",
+        "        if x > {0}:".format(i),
+        "            return self.value * x + {0}.5".format(i),
+        "        return [self.value, \"text {0}\", None]".format(i),
+        "",
+        "",
+    ]
+
+
+def json_block(i):
+    """Return the lines of an object in a list."""
+    return [
+        "  {",
+        "    \"id\": {0},".format(i),
+        "    \"name\": \"item {0}\",".format(i),
+        "    \"active\": true,",
+        "    \"values\": [{0}, {0}.5, null],".format(i),
+        "    \"nested\": {",
+        "      \"key\": \"value {0}\"".format(i),
+        "    }",
+        "  },",
+    ]
+
+
+def c_block(i):
+    """Return the lines of a function."""
+    return [
+        "/* Function {0} */".format(i),
+        "static int function_{0}(int x, const char *name)".format(i),
+        "{",
+        "    int total = {0};".format(i),
+        "    for (int j = 0; j < x; j++) {",
+        "        total += j * 2;  // accumulate",
+        "    }",
+        "    printf(\"%s: %d\\n\", name, total);",
+        "    return total;",
+        "}",
+        "",
+    ]
+
+
+def generate_text(language, nlines):
+    """Generate a document of nlines lines for language."""
+    block = {'python': python_block, 'json': json_block, 'c': c_block}
+    lines = ['['] if language == 'json' else []
+
+    i = 0
+    while len(lines) < nlines:
+        lines.extend(block[language](i))
+        i += 1
+
+    lines = lines[:nlines]
+    if language == 'json':
+        lines[-1] = ']'
+
+    return '\n'.join(lines) + '\n'
+
+
+def indentation_ranges(text):
+    """
+    Get folding ranges from indentation, as a language server would return.
+
+    Each range goes from a line to the last of the following lines with more
+    indentation.
+    """
+    ranges = []
+    stack = []
+    last_line = 0
+    for number, line in enumerate(text.splitlines()):
+        if not line.strip():
+            continue
+
+        indent = len(line) - len(line.lstrip())
+        while stack and stack[-1][1] >= indent:
+            start, __ = stack.pop()
+            if last_line > start:
+                ranges.append(
+                    lsp.FoldingRange(start_line=start, end_line=last_line)
+                )
+
+        stack.append((number, indent))
+        last_line = number
+
+    for start, __ in stack:
+        if last_line > start:
+            ranges.append(
+                lsp.FoldingRange(start_line=start, end_line=last_line)
+            )
+
+    return ranges
+
+
+# ---- Editor
+# -----------------------------------------------------------------------------
+def create_editor(language, full_features=False):
+    """Create an editor set up as the editorstack does it."""
+    filename = 'benchmark.{0}'.format(EXTENSIONS[language])
+    editor = CodeEditor(None)
+    if full_features:
+        editor.LARGE_FILE_SIZE = editor.LARGE_FILE_LINES = sys.maxsize
+
+    editor.setup_editor(
+        language=get_file_language(filename),
+        filename=filename,
+        font=QFont('Monospace', 10),
+        color_scheme='spyder_themes.spyder/dark',
+        linenumbers=True,
+        markers=True,
+        folding=True,
+        indent_guides=True,
+        scrollflagarea=True,
+        show_class_func_dropdown=False,
+    )
+    editor.resize(1000, 800)
+    editor.show()
+    return editor
+
+
+def rehighlight(editor):
+    """Highlight the whole document and wait for that to finish."""
+    highlighter = editor.highlighter
+    if editor._pygments_lexes_document():
+        # The document is lexed in a thread and highlighted after that
+        runs = highlighter._document_runs
+        deadline = time.perf_counter() + TIMEOUT
+        highlighter.rehighlight()
+        while (
+            highlighter._document_runs is runs
+            and time.perf_counter() < deadline
+        ):
+            QApplication.processEvents()
+    else:
+        highlighter.rehighlight()
+
+
+def load(editor, text):
+    """Set the text of an editor and wait for it to be completely loaded."""
+    editor.set_text(text)
+    while editor.is_loading():
+        QApplication.processEvents()
+
+    # This is what the editorstack does after setting the text
+    rehighlight(editor)
+    QApplication.processEvents()
+
+
+def timed(function, *args):
+    """Return the time it takes to call function."""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+# ---- Benchmarks
+# -----------------------------------------------------------------------------
+# Each benchmark receives an editor with the text already loaded and returns
+# the time it took, except for the load ones, which get an empty editor.
+def bench_load(editor, text):
+    """Time setting the text, i.e. until the editor is usable."""
+    return timed(editor.set_text, text)
+
+
+def bench_load_total(editor, text):
+    """Time setting the text and loading all of it."""
+    return timed(load, editor, text)
+
+
+def bench_rehighlight(editor, text):
+    """Time highlighting the whole document again."""
+    return timed(rehighlight, editor)
+
+
+def bench_keystroke(editor, text):
+    """Time typing in the middle of the document (mean per keystroke)."""
+    block = editor.document().findBlockByNumber(editor.blockCount() // 2)
+    cursor = QTextCursor(block)
+    cursor.movePosition(QTextCursor.EndOfBlock)
+    editor.setTextCursor(cursor)
+
+    def type_keys():
+        for __ in range(KEYSTROKES):
+            QTest.keyClick(editor, Qt.Key_X)
+            QApplication.processEvents()
+
+    elapsed = timed(type_keys)
+    for __ in range(KEYSTROKES):
+        QTest.keyClick(editor, Qt.Key_Backspace)
+    QApplication.processEvents()
+
+    return elapsed / KEYSTROKES
+
+
+def bench_folding(editor, text):
+    """Time computing and applying folding ranges from a server response."""
+    ranges = indentation_ranges(text)
+    editor.folding_supported = True
+
+    def fold():
+        editor._update_folding_info(ranges)
+        editor.apply_code_folding(editor._folding_info)
+
+    return timed(fold)
+
+
+def bench_decorations(editor, text):
+    """Time updating decorations after scrolling to the middle."""
+    editor.highlight_found_results('value', word=True)
+    editor.go_to_line(editor.blockCount() // 2)
+    return timed(editor.update_decorations)
+
+
+def bench_find_all(editor, text):
+    """Time finding and highlighting all the matches of a word."""
+    editor.clear_found_results()
+    editor.clear_match_index()
+    return timed(editor.highlight_found_results, 'total', False, False, True)
+
+
+def bench_scroll_paint(editor, text):
+    """Time scrolling through the document and painting (mean per page)."""
+    scrollbar = editor.verticalScrollBar()
+    maximum = scrollbar.maximum()
+
+    def scroll():
+        for page in range(PAGES):
+            scrollbar.setValue(maximum * page // (PAGES - 1))
+            editor.grab()
+
+    return timed(scroll) / PAGES
+
+
+BENCHMARKS = {
+    'load': bench_load,
+    'load_total': bench_load_total,
+    'rehighlight': bench_rehighlight,
+    'find_all': bench_find_all,
+    'folding': bench_folding,
+    'decorations': bench_decorations,
+    'scroll_paint': bench_scroll_paint,
+    'keystroke': bench_keystroke,
+}
+
+
+def run_benchmark(name, language, nlines, repeat, full_features=False):
+    """Run a benchmark repeat times and return its result."""
+    text = generate_text(language, nlines)
+    times = []
+    large_file = False
+    for __ in range(repeat):
+        editor = create_editor(language, full_features)
+        if name not in ('load', 'load_total'):
+            load(editor, text)
+
+        times.append(BENCHMARKS[name](editor, text))
+        large_file = editor.large_file
+
+        editor.finish_loading()
+        editor.close()
+        editor.deleteLater()
+        QApplication.processEvents()
+
+    return {
+        'benchmark': name,
+        'language': language,
+        'lines': nlines,
+        'large_file': large_file,
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+    }
+
+
+def get_metadata():
+    """Get information about the environment the benchmarks were run in."""
+    return {
+        'spyder': __version__,
+        'python': platform.python_version(),
+        'qt': QT_VERSION,
+        'qt_api': API_NAME,
+        'platform': platform.platform(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Time editor operations on synthetic documents."
+    )
+    parser.add_argument(
+        '--lines', nargs='+', type=int, default=DEFAULT_LINES,
+        help="Number of lines of the documents (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--languages', nargs='+', choices=LANGUAGES, default=LANGUAGES,
+        help="Languages of the documents (default: all)"
+    )
+    parser.add_argument(
+        '--benchmarks', nargs='+', choices=list(BENCHMARKS),
+        default=list(BENCHMARKS), help="Benchmarks to run (default: all)"
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help="Number of times each benchmark is run (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--full-features', action='store_true',
+        help="Don't use large file mode for big documents"
+    )
+    parser.add_argument(
+        '--output', help="File to save the results to (default: stdout)"
+    )
+    args = parser.parse_args(args)
+
+    _ = qapplication()
+
+    results = []
+    for language in args.languages:
+        for nlines in args.lines:
+            for name in args.benchmarks:
+                result = run_benchmark(
+                    name, language, nlines, args.repeat, args.full_features
+                )
+                results.append(result)
+                print(
+                    "{language:>6} {lines:>7} lines  {benchmark:<12} "
+                    "{min:.4f} s".format(**result),
+                    file=sys.stderr
+                )
+
+    report = json.dumps(
+        {'metadata': get_metadata(), 'results': results}, indent=2
+    )
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright (c) 2009- Spyder Project Contributors
+#
+# Distributed under the terms of the MIT License
+# (see spyder/__init__.py for details)
+
+"""
+Benchmarks of the scoring done by the switcher while a query is typed.
+
+Each benchmark types a query one character at a time on synthetic file
+names and reports the time it took for the whole query as JSON, so that
+results can be compared between revisions.
+
+Examples
+--------
+python tools/benchmark_switcher.py
+python tools/benchmark_switcher.py --choices 1000 10000 --query mwid
+python tools/benchmark_switcher.py --output results.json --repeat 5
+"""
+
+# Standard library imports
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+
+# This needs to be set before creating the application
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+# Third party imports
+from qtpy import API_NAME, QT_VERSION  # noqa: E402
+from qtpy.QtWidgets import QApplication  # noqa: E402
+from superqt.utils import signals_blocked  # noqa: E402
+
+# Local imports
+from spyder import __version__  # noqa: E402
+from spyder.plugins.switcher.widgets.switcher import Switcher  # noqa: E402
+from spyder.utils.qthelpers import qapplication  # noqa: E402
+from spyder.utils.stringmatching import (  # noqa: E402
+    SearchScorer, get_search_scores
+)
+
+
+DEFAULT_CHOICES = [1000, 10000, 50000]
+DEFAULT_QUERY = 'mainwidget'
+
+# Number of results that are enriched, as if they were shown
+SHOWN_RESULTS = 15
+
+WORDS = [
+    'main', 'widget', 'plugin', 'utils', 'api', 'config', 'editor', 'tests',
+    'panels', 'models', 'window', 'console', 'kernel', 'manager', 'base',
+    'projects', 'explorer', 'helper', 'container', 'confpage',
+]
+
+
+# ---- Synthetic choices
+# -----------------------------------------------------------------------------
+def generate_choices(nchoices):
+    """Return nchoices file names with paths, like the ones of projects."""
+    rng = random.Random(nchoices)
+    choices = []
+    for i in range(nchoices):
+        parts = [
+            rng.choice(WORDS) for __ in range(rng.randint(1, 4))
+        ]
+        name = '_'.join(rng.sample(WORDS, rng.randint(1, 2)))
+        choices.append('{0}{1}.py {2}'.format(name, i, '/'.join(parts)))
+    return choices
+
+
+def timed(function, *args):
+    """Return the time it takes to call function."""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+# ---- Benchmarks
+# -----------------------------------------------------------------------------
+# Each benchmark receives the choices and the query, and returns the time it
+# took to score the choices for every prefix of the query.
+def bench_search_scores(choices, query):
+    """Time scoring and enriching all choices for every prefix."""
+    def run():
+        for i in range(1, len(query) + 1):
+            get_search_scores(query[:i], choices, template='<b>{0}</b>')
+
+    return timed(run)
+
+
+def bench_scorer(choices, query):
+    """Time scoring choices incrementally and enriching the best ones."""
+    def run():
+        scorer = SearchScorer()
+        for i in range(1, len(query) + 1):
+            scores = scorer.get_scores(query[:i], choices)
+            best = sorted(
+                (score, choice) for score, choice in zip(scores, choices)
+                if score >= 0
+            )
+            for __, choice in best[:SHOWN_RESULTS]:
+                scorer.get_enriched_text(choice, template='<b>{0}</b>')
+
+    return timed(run)
+
+
+def bench_switcher(choices, query):
+    """Time setting up a switcher widget for every prefix."""
+    switcher = Switcher(None)
+    for choice in choices:
+        name, __, path = choice.partition(' ')
+        switcher.add_item(title=name, description=path, last_item=False)
+    switcher.show()
+    QApplication.processEvents()
+
+    def run():
+        for i in range(1, len(query) + 1):
+            # Set up the switcher directly, without waiting for the timer
+            # used to do it when the search text changes
+            with signals_blocked(switcher.edit):
+                switcher.edit.setText(query[:i])
+            switcher.setup()
+            QApplication.processEvents()
+
+    elapsed = timed(run)
+    switcher.close()
+    switcher.deleteLater()
+    QApplication.processEvents()
+    return elapsed
+
+
+BENCHMARKS = {
+    'search_scores': bench_search_scores,
+    'scorer': bench_scorer,
+    'switcher': bench_switcher,
+}
+
+
+def run_benchmark(name, nchoices, query, repeat):
+    """Run a benchmark repeat times and return its result."""
+    choices = generate_choices(nchoices)
+    times = [BENCHMARKS[name](choices, query) for __ in range(repeat)]
+
+    return {
+        'benchmark': name,
+        'choices': nchoices,
+        'query': query,
+        'times': times,
+        'min': min(times),
+        'median': statistics.median(times),
+    }
+
+
+def get_metadata():
+    """Get information about the environment the benchmarks were run in."""
+    return {
+        'spyder': __version__,
+        'python': platform.python_version(),
+        'qt': QT_VERSION,
+        'qt_api': API_NAME,
+        'platform': platform.platform(),
+        'date': datetime.datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(
+        description="Time the switcher scoring while a query is typed."
+    )
+    parser.add_argument(
+        '--choices', nargs='+', type=int, default=DEFAULT_CHOICES,
+        help="Number of choices to score (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--query', default=DEFAULT_QUERY,
+        help="Query that is typed (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--benchmarks', nargs='+', choices=list(BENCHMARKS),
+        default=list(BENCHMARKS), help="Benchmarks to run (default: all)"
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=3,
+        help="Number of times each benchmark is run (default: %(default)s)"
+    )
+    parser.add_argument(
+        '--output', help="File to save the results to (default: stdout)"
+    )
+    args = parser.parse_args(args)
+
+    _ = qapplication()
+
+    results = []
+    for nchoices in args.choices:
+        for name in args.benchmarks:
+            result = run_benchmark(name, nchoices, args.query, args.repeat)
+            results.append(result)
+            print(
+                "{choices:>7} choices  {benchmark:<14} {min:.4f} s".format(
+                    **result
+                ),
+                file=sys.stderr
+            )
+
+    report = json.dumps(
+        {'metadata': get_metadata(), 'results': results}, indent=2
+    )
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(report)
+    else:
+        print(report)
+
+
+if __name__ == '__main__':
+    main()